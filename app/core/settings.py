@@ -46,6 +46,7 @@ def _local_storage_fallback(field_name: str) -> Path:
         "images_base_dir": data_dir / "images",
         "content_body_local_root": data_dir / "content_bodies",
         "podcast_scratch_dir": data_dir / "scratch",
+        "raw_page_cache_dir": data_dir / "raw_pages",
         "personal_markdown_root": data_dir / "personal_markdown",
     }
     return fallbacks[field_name]
@@ -123,6 +124,7 @@ class StorageSettingsView(BaseModel):
     content_body_storage_secret_key_configured: bool
     content_body_storage_timeout_seconds: int
     podcast_scratch_dir: Path
+    raw_page_cache_dir: Path
     personal_markdown_enabled: bool
     personal_markdown_root: Path
 
@@ -260,8 +262,19 @@ class Settings(BaseSettings):
 
     # Content processing
     max_content_length: int = 100_000
+    stats_counter_max_age_seconds: int = Field(default=120, ge=0, le=86_400)
     max_retry_attempts: int = 3
     max_retries: int = 3
+    # Agreeing LLM analyses of one host/path shape before later URLs skip the LLM;
+    # 0 disables learned shortcuts.
+    url_analysis_pattern_min_streak: int = Field(default=10, ge=0, le=100)
+    # Total analyses of a shape before its streak is trusted at all.
+    url_analysis_pattern_min_observations: int = Field(default=20, ge=0, le=10_000)
+    # Share of learned shortcut hits still sent to the LLM and recorded, so a shape
+    # that starts publishing something else breaks its streak.
+    url_analysis_pattern_verify_rate: float = Field(default=0.1, ge=0.0, le=1.0)
+    # Learned shortcuts expire so a site that changes what it publishes is re-learned.
+    url_analysis_pattern_max_age_days: int = Field(default=30, ge=1, le=365)
 
     # News-native digest pipeline
     news_embedding_model: str = "Qwen/Qwen3-Embedding-0.6B"
@@ -273,6 +286,10 @@ class Settings(BaseSettings):
     news_list_reranker_batch_size: int = Field(default=4, ge=1, le=16)
     news_list_reranker_max_length: int = Field(default=2048, ge=256, le=8192)
     news_list_reranker_similarity_threshold: float = Field(default=0.45, ge=0.0, le=1.0)
+    news_list_reranker_cpu_quantization: Literal["none", "int8"] = "none"
+    news_list_reranker_coalesce_window_ms: float = Field(default=15.0, ge=0.0, le=1000.0)
+    news_list_reranker_score_cache_size: int = Field(default=20_000, ge=0, le=1_000_000)
+    news_list_reranker_persist_scores: bool = True
     news_group_model: str = CHEAP_MODEL_SPEC
     news_header_model: str = CHEAP_MODEL_SPEC
     news_list_warm_embeddings: bool = True
@@ -280,6 +297,7 @@ class Settings(BaseSettings):
     news_list_max_related_candidates: int = Field(default=150, ge=1)
     news_list_primary_similarity_threshold: float = Field(default=0.85, ge=0.0, le=1.0)
     news_list_secondary_similarity_threshold: float = Field(default=0.75, ge=0.0, le=1.0)
+    news_visibility_cache_ttl_seconds: int = Field(default=60, ge=0, le=3600)
 
     # External services
     openai_api_key: str | None = None
@@ -310,6 +328,12 @@ class Settings(BaseSettings):
     exa_content_result_cost_usd: float | None = Field(default=0.001, ge=0.0)
     exa_summary_result_cost_usd: float | None = Field(default=0.001, ge=0.0)
     exa_search_included_results: int = Field(default=10, ge=0)
+    # Process-wide Exa gateway: concurrent requests, request starts per second (0 = no
+    # pacing) and the shared search result cache (0 disables it).
+    exa_max_concurrent_requests: int = Field(default=4, ge=1, le=32)
+    exa_requests_per_second: float = Field(default=5.0, ge=0.0)
+    exa_search_cache_ttl_seconds: int = Field(default=900, ge=0)
+    exa_search_cache_max_entries: int = Field(default=512, ge=0)
 
     # Langfuse tracing
     langfuse_enabled: bool = True
@@ -351,6 +375,8 @@ class Settings(BaseSettings):
     podcast_search_provider_timeout_seconds: int = Field(default=6, ge=1, le=30)
     podcast_search_circuit_breaker_failures: int = Field(default=3, ge=1, le=10)
     podcast_search_circuit_breaker_cooldown_seconds: int = Field(default=120, ge=10, le=1800)
+    podcast_search_deadline_seconds: float = Field(default=8.0, ge=1.0, le=30.0)
+    podcast_search_early_return_min_score: float = Field(default=1.05, ge=0.0, le=2.0)
 
     # Twitter (tweet share scraping)
     twitter_auth_token: str | None = None
@@ -384,12 +410,35 @@ class Settings(BaseSettings):
     # Whisper transcription settings
     whisper_model_size: str = "base"  # tiny, base, small, medium, large
     whisper_device: str = "auto"  # auto, cpu, cuda, mps
+    # Segment length for checkpointed media transcription; 0 transcribes in one pass.
+    whisper_segment_seconds: int = Field(default=600, ge=0, le=3_600)
+    # Subprocesses that transcribe segments in parallel; 0 keeps them in the worker.
+    whisper_pool_processes: int = Field(default=0, ge=0, le=64)
+    # Torch threads per pool process; 0 splits the available cores evenly.
+    whisper_pool_threads_per_process: int = Field(default=0, ge=0, le=64)
     tweet_video_enabled: bool = True
     tweet_video_max_duration_seconds: int = Field(default=600, ge=1)
 
     # HTTP client
     http_timeout_seconds: int = 30
     http_max_retries: int = 3
+    http_pool_max_connections: int = Field(default=100, ge=1, le=1000)
+    http_pool_max_keepalive_connections: int = Field(default=40, ge=0, le=1000)
+    http_pool_keepalive_expiry_seconds: float = Field(default=30.0, ge=1.0, le=600.0)
+    http_pool_per_host_limit: int = Field(default=8, ge=1, le=64)
+    http_pool_http2_enabled: bool = True
+
+    # RSS/Atom feed fetching
+    feed_fetch_max_workers: int = Field(default=8, ge=1, le=64)
+    feed_fetch_per_host_limit: int = Field(default=2, ge=1, le=16)
+    feed_poll_min_interval_minutes: int = Field(default=10, ge=1, le=1440)
+    feed_poll_default_interval_minutes: int = Field(default=60, ge=1, le=1440)
+    feed_poll_max_interval_minutes: int = Field(default=1440, ge=10, le=10080)
+
+    # Hacker News discussion fetching
+    hn_discussion_fetch_concurrency: int = Field(default=8, ge=1, le=64)
+    # Optional whole-tree endpoint, e.g. "https://hn.algolia.com/api/v1/items/{item_id}"
+    hn_comment_tree_url: str | None = None
 
     # Firecrawl fallback extraction
     firecrawl_api_key: str | None = None
@@ -435,6 +484,16 @@ class Settings(BaseSettings):
     chat_sandbox_library_root: str = "/workspace/personal_markdown"
     chat_sandbox_max_output_chars: int = Field(default=12_000, ge=1_000, le=100_000)
 
+    # Plain GET + trafilatura before browser rendering in HTML extraction
+    html_static_fetch_enabled: bool = True
+    html_static_min_text_chars: int = Field(default=500, ge=0)
+
+    # Raw page responses shared by URL analysis, feed detection and HTML extraction
+    raw_page_cache_enabled: bool = True
+    raw_page_cache_dir: Path = Field(default_factory=lambda: Path.cwd() / "data" / "raw_pages")
+    raw_page_cache_ttl_seconds: int = Field(default=3_600, ge=0, le=86_400)
+    raw_page_cache_max_bytes: int = Field(default=256 * 1024 * 1024, ge=0)
+
     # crawl4ai table extraction
     crawl4ai_enable_table_extraction: bool = False
     crawl4ai_table_provider: str | None = None
@@ -444,6 +503,12 @@ class Settings(BaseSettings):
     crawl4ai_table_min_rows_per_chunk: int = 10
     crawl4ai_table_max_parallel_chunks: int = 5
     crawl4ai_table_verbose: bool = False
+    # Long-lived crawl4ai browser owned by CONTENT workers
+    crawl4ai_browser_pool_enabled: bool = True
+    crawl4ai_browser_pool_max_pages: int = Field(default=4, ge=1, le=32)
+    crawl4ai_browser_pool_recycle_after_pages: int = Field(default=200, ge=1)
+    # Recycle once the worker's process tree grows this much; 0 disables the check.
+    crawl4ai_browser_pool_max_rss_growth_mb: int = Field(default=1024, ge=0)
 
     @field_validator("database_url", mode="before")
     @classmethod
@@ -505,6 +570,7 @@ class Settings(BaseSettings):
         "images_base_dir",
         "content_body_local_root",
         "podcast_scratch_dir",
+        "raw_page_cache_dir",
         "personal_markdown_root",
         mode="after",
     )
@@ -558,6 +624,7 @@ class Settings(BaseSettings):
             content_body_storage_secret_key_configured=bool(self.content_body_storage_secret_key),
             content_body_storage_timeout_seconds=self.content_body_storage_timeout_seconds,
             podcast_scratch_dir=self.podcast_scratch_dir,
+            raw_page_cache_dir=self.raw_page_cache_dir,
             personal_markdown_enabled=self.personal_markdown_enabled,
             personal_markdown_root=self.personal_markdown_root,
         )
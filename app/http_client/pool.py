@@ -0,0 +1,167 @@
+"""Process-wide keep-alive HTTP clients shared by HttpService and RobustHttpClient."""
+
+from __future__ import annotations
+
+import atexit
+import importlib.util
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+
+from app.core.logging import get_logger
+from app.core.settings import get_settings
+
+logger = get_logger(__name__)
+
+# Slot waits longer than this proceed unthrottled so a leaked stream cannot wedge a host.
+HOST_SLOT_TIMEOUT_SECONDS = 30.0
+
+_clients: dict[bool, httpx.Client] = {}
+_clients_pid: int | None = None
+_clients_lock = threading.Lock()
+
+
+class _SlotReleasingStream(httpx.SyncByteStream):
+    """Response stream that frees its host slot once the body is closed."""
+
+    def __init__(self, stream: Iterable[bytes], release) -> None:
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            close = getattr(self._stream, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._release()
+
+
+class _HostLimitedTransport(httpx.BaseTransport):
+    """Transport wrapper capping concurrent in-flight requests per host."""
+
+    def __init__(self, transport: httpx.BaseTransport, per_host_limit: int) -> None:
+        self._transport = transport
+        self._per_host_limit = per_host_limit
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._slots_lock = threading.Lock()
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._slots_lock:
+            slot = self._slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self._per_host_limit)
+                self._slots[host] = slot
+            return slot
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        slot = self._slot(request.url.host)
+        acquired = slot.acquire(timeout=HOST_SLOT_TIMEOUT_SECONDS)
+        if not acquired:
+            logger.warning(
+                "Host slot wait timed out; sending request unthrottled",
+                extra={
+                    "component": "http_pool",
+                    "operation": "acquire_host_slot",
+                    "context_data": {"host": request.url.host},
+                },
+            )
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if acquired and not released:
+                released = True
+                slot.release()
+
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_SlotReleasingStream(response.stream, release),
+            extensions=response.extensions,
+            request=request,
+        )
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+def http2_available() -> bool:
+    """Return whether HTTP/2 is enabled and the ``h2`` package is importable."""
+    settings = get_settings()
+    return settings.http_pool_http2_enabled and importlib.util.find_spec("h2") is not None
+
+
+def _build_client(verify: bool) -> httpx.Client:
+    settings = get_settings()
+    transport = httpx.HTTPTransport(
+        verify=verify,
+        http2=http2_available(),
+        limits=httpx.Limits(
+            max_connections=settings.http_pool_max_connections,
+            max_keepalive_connections=settings.http_pool_max_keepalive_connections,
+            keepalive_expiry=settings.http_pool_keepalive_expiry_seconds,
+        ),
+    )
+    return httpx.Client(
+        transport=_HostLimitedTransport(transport, settings.http_pool_per_host_limit),
+        timeout=httpx.Timeout(timeout=settings.http_timeout_seconds, connect=10.0),
+        follow_redirects=True,
+        cookies=_reject_all_cookie_jar(),
+    )
+
+
+def _reject_all_cookie_jar() -> CookieJar:
+    """Return a jar that never stores cookies.
+
+    The shared clients serve unrelated callers and users, so a ``Set-Cookie`` from
+    one response must never be replayed on another caller's request.
+    """
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+def get_shared_http_client(*, verify: bool = True) -> httpx.Client:
+    """Return the process-wide pooled client for the given SSL verification mode.
+
+    Clients are rebuilt after ``fork`` so worker processes never share sockets with
+    their parent. Callers pass headers and per-request timeouts on each call and must
+    not close the returned client; use ``close_shared_http_clients`` on shutdown.
+    """
+    global _clients_pid
+    with _clients_lock:
+        pid = os.getpid()
+        if _clients_pid != pid:
+            # Inherited clients belong to the parent process; drop them without closing.
+            _clients.clear()
+            _clients_pid = pid
+        client = _clients.get(verify)
+        if client is None or client.is_closed:
+            client = _build_client(verify)
+            _clients[verify] = client
+        return client
+
+
+def close_shared_http_clients() -> None:
+    """Close every pooled client owned by this process."""
+    with _clients_lock:
+        clients = list(_clients.values()) if _clients_pid == os.getpid() else []
+        _clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:  # noqa: BLE001
+            logger.debug("Failed to close pooled HTTP client", exc_info=True)
+
+
+atexit.register(close_shared_http_clients)
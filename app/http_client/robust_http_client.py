@@ -9,6 +9,7 @@ import httpx
 
 from app.core.logging import get_logger
 from app.core.settings import get_settings
+from app.http_client.pool import get_shared_http_client
 
 settings = get_settings()
 logger = get_logger(__name__)
@@ -50,13 +51,9 @@ class RobustHttpClient:
         self._client: httpx.Client | None = None
 
     def _get_client(self) -> httpx.Client:
-        """Initializes and returns the httpx.Client instance."""
+        """Returns the shared pooled httpx.Client; headers and timeouts go on each request."""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.Client(
-                headers=self.default_headers,
-                timeout=self.default_timeout,
-                follow_redirects=True,  # Default to follow redirects
-            )
+            self._client = get_shared_http_client()
         return self._client
 
     def _build_host_variant(self, url: str, host: str) -> str:
@@ -139,6 +136,7 @@ class RobustHttpClient:
         timeout: float | None = None,
         stream: bool = False,
         follow_redirects: bool = True,
+        log_http_errors: bool = True,
     ) -> httpx.Response:
         """
         Performs a synchronous GET request.
@@ -149,6 +147,8 @@ class RobustHttpClient:
             timeout: Optional timeout for this specific request, overriding default.
             stream: Whether to stream the response content.
             follow_redirects: Whether this request should follow redirects.
+            log_http_errors: Whether failures are logged here; callers that treat a
+                failure as an expected miss pass False and handle it themselves.
 
         Returns:
             An httpx.Response object.
@@ -204,6 +204,8 @@ class RobustHttpClient:
                     )
             return response
         except httpx.HTTPStatusError as e:
+            if not log_http_errors:
+                raise
             logger.error(
                 "HTTP error %s for GET %s: %s",
                 e.response.status_code,
@@ -241,6 +243,8 @@ class RobustHttpClient:
                             "context_data": {"url": url, "retry_error": str(retry_exc)},
                         },
                     )
+            if not log_http_errors:
+                raise
             logger.exception(
                 "Request error for GET %s: %s",
                 url,
@@ -346,12 +350,12 @@ class RobustHttpClient:
 
     def close(self) -> None:
         """
-        Closes the underlying httpx.Client.
-        Should be called when the client is no longer needed, e.g., at application shutdown.
+        Releases this instance's reference to the shared pooled client.
+        The pool itself stays open for other callers; it is closed by
+        ``close_shared_http_clients`` at process shutdown.
         """
-        if self._client and not self._client.is_closed:
-            logger.info("Closing RobustHttpClient")
-            self._client.close()
+        if self._client is not None:
+            logger.info("Releasing RobustHttpClient pooled connection handle")
             self._client = None
         else:
             logger.info("RobustHttpClient already closed or not initialized.")
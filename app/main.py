@@ -21,6 +21,7 @@ from app.core.observability import (
     summarize_request_payload,
 )
 from app.core.settings import get_settings
+from app.http_client.pool import close_shared_http_clients
 from app.openapi import build_operation_id
 from app.routers import admin, api_content, auth, logs
 from app.routers.api import (
@@ -65,6 +66,7 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     try:
         yield
     finally:
+        close_shared_http_clients()
         flush_langfuse_tracing()
 
 
@@ -31,6 +31,7 @@ PROCESSING_FIELD_NAMES: set[str] = {
     "canonical_content_id",
     "tweet_enrichment",
     "tweet_only",
+    "transcript_checkpoint",
 }
 
 
@@ -7,16 +7,19 @@ from sqlalchemy import (
     JSON,
     Boolean,
     Column,
+    Computed,
     DateTime,
     Float,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
     text,
 )
-from sqlalchemy.orm import validates
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, validates
 
 from app.core.db import Base
 from app.core.logging import get_logger
@@ -43,6 +46,16 @@ from app.utils.summary_utils import extract_short_summary
 logger = get_logger(__name__)
 
 
+# Weighted full-text document stored in ``contents.search_document`` (generated column).
+CONTENT_SEARCH_DOCUMENT_SQL = (
+    "setweight(to_tsvector('english', "
+    "COALESCE(content_metadata -> 'summary' ->> 'title', '')), 'A')"
+    " || setweight(to_tsvector('english', COALESCE(title, '')), 'B')"
+    " || setweight(to_tsvector('english', COALESCE(source, '')), 'C')"
+    " || setweight(to_tsvector('english', COALESCE(search_text, '')), 'D')"
+)
+
+
 def _utcnow() -> datetime:
     """Return a timezone-naive UTC timestamp for DB defaults."""
     return datetime.now(UTC).replace(tzinfo=None)
@@ -78,6 +91,9 @@ class Content(Base):
     # For podcasts: audio_url, transcript, duration, episode_number
     content_metadata = Column(JSON, default=dict, nullable=False)
     search_text = Column(Text, nullable=True)
+    search_document = deferred(
+        Column(TSVECTOR, Computed(CONTENT_SEARCH_DOCUMENT_SQL, persisted=True), nullable=True)
+    )
 
     # Common timestamps
     created_at = Column(DateTime, default=_utcnow, nullable=False)
@@ -94,6 +110,7 @@ class Content(Base):
         Index("idx_url_content_type", "url", "content_type", unique=True),
         # Performance index for visibility queries (classification + status + content_type)
         Index("idx_contents_classification_status", "classification", "status", "content_type"),
+        Index("idx_contents_search_document", "search_document", postgresql_using="gin"),
     )
 
     @validates("content_metadata")
@@ -254,6 +271,24 @@ class ProcessingTask(Base):
     )
 
 
+class ContentCard(Base):
+    """Denormalized list-card projection for one content row.
+
+    ``card`` holds the user-independent fields of ``ContentSummaryResponse``. A row is
+    current while ``source_updated_at`` matches ``contents.updated_at`` and
+    ``projection_version`` matches the version the card builder writes.
+    """
+
+    __tablename__ = "content_cards"
+
+    content_id = Column(Integer, primary_key=True)
+    card = Column(JSON, nullable=False)
+    long_form_ready = Column(Boolean, default=True, nullable=False)
+    projection_version = Column(Integer, default=1, nullable=False)
+    source_updated_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, default=_utcnow, onupdate=_utcnow, nullable=False)
+
+
 class ContentReadStatus(Base):
     """Track which content has been read by which user."""
 
@@ -268,6 +303,18 @@ class ContentReadStatus(Base):
     __table_args__ = (Index("idx_content_read_user_content", "user_id", "content_id", unique=True),)
 
 
+class UserStatCounter(Base):
+    """Per-user badge counter kept current by read/inbox writes and periodic reconciliation."""
+
+    __tablename__ = "user_stat_counters"
+
+    user_id = Column(Integer, primary_key=True)
+    counter_key = Column(String(40), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+    refreshed_at = Column(DateTime, nullable=False, index=True)
+    updated_at = Column(DateTime, default=_utcnow, nullable=False)
+
+
 class ContentKnowledgeSave(Base):
     """Track which content has been saved to knowledge by which user."""
 
@@ -383,6 +430,44 @@ class NewsItemReadStatus(Base):
     )
 
 
+class NewsItemEmbedding(Base):
+    """Persisted per-view embedding vector for one news item text."""
+
+    __tablename__ = "news_item_embeddings"
+
+    id = Column(Integer, primary_key=True)
+    news_item_id = Column(Integer, nullable=False, index=True)
+    view = Column(String(20), nullable=False)
+    model_name = Column(String(255), nullable=False)
+    text_sha256 = Column(String(64), nullable=False)
+    dimensions = Column(Integer, nullable=False)
+    vector = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=_utcnow, nullable=False)
+    updated_at = Column(DateTime, default=_utcnow, onupdate=_utcnow, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "news_item_id",
+            "view",
+            "model_name",
+            "text_sha256",
+            name="uq_news_item_embeddings_item_view_model_text",
+        ),
+        Index("idx_news_item_embeddings_model_view", "model_name", "view", "news_item_id"),
+    )
+
+
+class NewsRerankerScore(Base):
+    """Persisted reranker yes-probability for one hashed (query, document) pair."""
+
+    __tablename__ = "news_reranker_scores"
+
+    pair_sha256 = Column(String(64), primary_key=True)
+    model_name = Column(String(255), nullable=False)
+    score = Column(Float, nullable=False)
+    created_at = Column(DateTime, default=_utcnow, nullable=False)
+
+
 class FeedDiscoveryRun(Base):
     """Track a feed discovery run for a user."""
 
@@ -633,6 +718,67 @@ class UserScraperConfig(Base):
     )
 
 
+class FeedFetchState(Base):
+    """Conditional-GET validators and fetch history for one feed URL."""
+
+    __tablename__ = "feed_fetch_states"
+
+    id = Column(Integer, primary_key=True)
+    feed_url = Column(String(2048), nullable=False, unique=True)
+    etag = Column(String(512), nullable=True)
+    last_modified = Column(String(128), nullable=True)
+    validators_saved_at = Column(DateTime, nullable=True)
+    last_status_code = Column(Integer, nullable=True)
+    last_fetched_at = Column(DateTime, nullable=True)
+    last_changed_at = Column(DateTime, nullable=True)
+    recent_published_at = Column(JSON, nullable=True)
+    fetch_count = Column(Integer, default=0, nullable=False)
+    not_modified_count = Column(Integer, default=0, nullable=False)
+    consecutive_failures = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=_utcnow, nullable=False)
+    updated_at = Column(DateTime, default=_utcnow, onupdate=_utcnow)
+
+
+class PodcastSearchCacheEntry(Base):
+    """Ranked podcast episode search hits shared across API workers until ``expires_at``."""
+
+    __tablename__ = "podcast_search_cache"
+
+    cache_key = Column(String(64), primary_key=True)
+    query = Column(String(500), nullable=False)
+    hits = Column(JSON, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, default=_utcnow, nullable=False)
+
+
+class PodcastSearchProviderState(Base):
+    """Circuit-breaker state for one podcast search provider."""
+
+    __tablename__ = "podcast_search_provider_states"
+
+    provider = Column(String(50), primary_key=True)
+    failures = Column(Integer, default=0, nullable=False)
+    open_until = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    updated_at = Column(DateTime, default=_utcnow, onupdate=_utcnow, nullable=False)
+
+
+class UrlAnalysisPattern(Base):
+    """Latest LLM URL-analysis outcome for a host and path shape, with its agreement run."""
+
+    __tablename__ = "url_analysis_patterns"
+
+    host = Column(String(255), primary_key=True)
+    path_shape = Column(String(255), primary_key=True)
+    content_type = Column(String(20), nullable=False)
+    platform = Column(String(50), nullable=True)
+    has_media_url = Column(Boolean, default=False, nullable=False)
+    streak = Column(Integer, default=1, nullable=False)
+    observations = Column(Integer, default=1, nullable=False)
+    updated_at = Column(DateTime, default=_utcnow, nullable=False, index=True)
+
+
 class UserIntegrationConnection(Base):
     """OAuth/API connection metadata for external providers per user."""
 
@@ -32,11 +32,13 @@ from app.services.gateways.llm_gateway import get_llm_gateway
 from app.services.instruction_links import create_contents_from_instruction_links
 from app.services.long_form_images import enqueue_visible_long_form_image_if_needed
 from app.services.queue import TaskType
+from app.services.raw_page_cache import STAGE_FEED_DETECTION
 from app.services.scraper_configs import ensure_inbox_status
 from app.services.twitter_share import (
     canonical_tweet_url,
     extract_tweet_id,
 )
+from app.services.url_analysis_shortcuts import find_url_analysis_shortcut, record_url_analysis
 from app.services.url_detection import (
     PODCAST_HOST_PLATFORMS,
     infer_content_type_and_platform,
@@ -264,7 +266,7 @@ class FeedSubscriptionFlow:
             html_content: str | None = None
             try:
                 http_gateway = get_http_gateway()
-                body, _headers = http_gateway.fetch_content(url)
+                body, _headers = http_gateway.fetch_content(url, cache_stage=STAGE_FEED_DETECTION)
                 if isinstance(body, str):
                     html_content = body
             except Exception as exc:  # noqa: BLE001
@@ -938,6 +940,29 @@ class UrlAnalysisFlow:
             db.commit()
             return None
 
+        # Instructions need the LLM's link extraction, so only plain analyses short-circuit.
+        shortcut = None if analysis_instruction else find_url_analysis_shortcut(db, url)
+        if shortcut is not None:
+            logger.info(
+                "Analysis shortcut for %s: type=%s, platform=%s, source=%s",
+                content.id,
+                shortcut.content_type.value,
+                shortcut.platform,
+                shortcut.source,
+            )
+            content.content_type = shortcut.content_type.value
+            if shortcut.platform:
+                content.platform = shortcut.platform
+                metadata["platform"] = shortcut.platform
+            content.content_metadata = refresh_merge_content_metadata(
+                db,
+                content_id=content.id,
+                base_metadata=base_metadata,
+                updated_metadata=metadata,
+            )
+            db.commit()
+            return None
+
         llm_gateway = get_llm_gateway()
         result = llm_gateway.analyze_url(
             url,
@@ -969,6 +994,7 @@ class UrlAnalysisFlow:
                 metadata.setdefault("youtube_video", True)
         else:
             analysis = result.analysis
+            record_url_analysis(url, analysis)
             if analysis.content_type == "article":
                 content.content_type = ContentType.ARTICLE.value
             elif analysis.content_type in ("podcast", "video"):
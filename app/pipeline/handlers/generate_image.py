@@ -9,6 +9,7 @@ from app.models.metadata import ContentType
 from app.models.schema import Content
 from app.pipeline.task_context import TaskContext
 from app.pipeline.task_models import TaskEnvelope, TaskResult
+from app.repositories.stat_counter_repository import invalidate_counters_for_content
 from app.services.content_metadata_merge import refresh_merge_content_metadata
 from app.services.content_status_state_machine import ContentStatusStateMachine
 from app.services.queue import TaskType
@@ -78,6 +79,7 @@ class GenerateImageHandler:
                         current_status=content.status,
                     ).value
                     content.processed_at = datetime.now(UTC).replace(tzinfo=None)
+                    invalidate_counters_for_content(db, content_id=content.id)
                     db.commit()
 
                     logger.info(
@@ -21,13 +21,17 @@ class ScrapeHandler:
         try:
             payload = task.payload or {}
             sources = payload.get("sources", ["all"])
+            feed_urls = payload.get("feed_urls") or None
             runner = ScraperRunner()
 
             if sources == ["all"]:
                 runner.run_all()
             else:
                 for source in sources:
-                    runner.run_scraper(source)
+                    if feed_urls:
+                        runner.run_scraper(source, feed_urls=feed_urls)
+                    else:
+                        runner.run_scraper(source)
             return TaskResult.ok()
         except Exception as exc:  # noqa: BLE001
             logger.error("Scraper error: %s", exc, exc_info=True)
@@ -33,6 +33,7 @@ from app.models.metadata_state import (
 from app.models.schema import Content
 from app.pipeline.task_context import TaskContext
 from app.pipeline.task_models import TaskEnvelope, TaskResult
+from app.repositories.stat_counter_repository import invalidate_counters_for_content
 from app.services.content_bodies import get_content_body_resolver, sync_content_body_storage
 from app.services.content_lifecycle import build_content_lifecycle_log_extra
 from app.services.content_metadata_merge import refresh_merge_content_metadata
@@ -341,6 +342,7 @@ class SummarizeHandler:
                         artwork_ready=has_generated_long_form_image(content),
                     ).value
                     content.processed_at = datetime.now(UTC)
+                    invalidate_counters_for_content(db, content_id=content.id)
                     db.commit()
                     logger.info(
                         "Skipping summarize task for content %s; summarization input unchanged",
@@ -549,6 +551,7 @@ class SummarizeHandler:
                         artwork_ready=has_generated_long_form_image(content),
                     ).value
                     content.processed_at = datetime.now(UTC)
+                    invalidate_counters_for_content(db, content_id=content.id)
                     db.commit()
                     _log_lifecycle_event(
                         "content.summary_completed",
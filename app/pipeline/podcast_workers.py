@@ -14,11 +14,13 @@ from app.core.logging import get_logger
 from app.core.observability import build_log_extra, sanitize_url_for_logs
 from app.core.settings import get_settings
 from app.models.content_mapper import content_to_domain, domain_to_content
+from app.models.metadata_state import update_processing_state
 from app.models.schema import Content, ContentStatus
 from app.scraping.youtube_unified import YouTubeClientConfig
 from app.services.apple_podcasts import resolve_apple_podcast_episode
 from app.services.audio_pipeline import (
     download_audio_via_ytdlp,
+    transcribe_audio_file_in_segments,
     transcribe_audio_file_with_metadata,
 )
 from app.services.content_bodies import sync_content_body_storage
@@ -31,6 +33,8 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 logger = get_logger(__name__)
 settings = get_settings()
 
+TRANSCRIPT_CHECKPOINT_KEY = "transcript_checkpoint"
+
 
 def sanitize_filename(title: str) -> str:
     """Sanitizes a title to be a valid filename."""
@@ -697,6 +701,75 @@ class PodcastMediaWorker:
             return audio_path
         return normalized_path
 
+    def _transcribe_with_checkpoints(
+        self,
+        db,  # noqa: ANN001
+        db_content: Content,
+        *,
+        content_id: int,
+        audio_url: str,
+        audio_path: Path,
+        stored_checkpoint: object,
+    ) -> tuple[str, str | None]:
+        """Transcribe in segments, committing each segment so a retry resumes after it.
+
+        A stored checkpoint is only reused when it was produced for the same audio URL
+        and segment length; anything else restarts from the first segment.
+        """
+        segment_seconds = settings.whisper_segment_seconds
+        if segment_seconds <= 0:
+            return transcribe_audio_file_with_metadata(audio_path)
+
+        completed_segments: list[str] = []
+        language: str | None = None
+        if (
+            isinstance(stored_checkpoint, dict)
+            and stored_checkpoint.get("audio_url") == audio_url
+            and stored_checkpoint.get("segment_seconds") == segment_seconds
+            and isinstance(stored_checkpoint.get("segments"), list)
+        ):
+            completed_segments = [str(text) for text in stored_checkpoint["segments"]]
+            language = stored_checkpoint.get("language") or None
+            logger.info(
+                "Resuming podcast transcription from checkpoint",
+                extra=self._log_extra(
+                    operation="resume_transcription",
+                    content_id=content_id,
+                    context_data={"completed_segments": len(completed_segments)},
+                ),
+            )
+
+        segments = list(completed_segments)
+
+        def _persist_segment(index: int, text: str, detected_language: str | None) -> None:
+            segments.append(text)
+            db_content.content_metadata = update_processing_state(
+                db_content.content_metadata,
+                **{
+                    TRANSCRIPT_CHECKPOINT_KEY: {
+                        "audio_url": audio_url,
+                        "segment_seconds": segment_seconds,
+                        "language": detected_language,
+                        "segments": list(segments),
+                        "updated_at": datetime.now(UTC).isoformat(),
+                    }
+                },
+            )
+            db.commit()
+            logger.debug(
+                "Podcast transcription segment %s checkpointed for content %s",
+                index,
+                content_id,
+            )
+
+        return transcribe_audio_file_in_segments(
+            audio_path,
+            segment_seconds=segment_seconds,
+            completed_segments=completed_segments,
+            language=language,
+            on_segment=_persist_segment,
+        )
+
     def process_media_task(self, content_id: int) -> bool:
         """Run podcast download + local normalization + transcription in one task."""
         started_at = datetime.now(UTC)
@@ -746,8 +819,13 @@ class PodcastMediaWorker:
                     )
                     normalized_audio_path = self._normalize_audio_file(audio_path)
                     self.transcribe_worker._get_transcription_service()
-                    transcript_text, detected_language = transcribe_audio_file_with_metadata(
-                        normalized_audio_path
+                    transcript_text, detected_language = self._transcribe_with_checkpoints(
+                        db,
+                        db_content,
+                        content_id=content_id,
+                        audio_url=audio_url,
+                        audio_path=normalized_audio_path,
+                        stored_checkpoint=content.metadata.pop(TRANSCRIPT_CHECKPOINT_KEY, None),
                     )
 
                 content.metadata["transcription_date"] = datetime.now(UTC).isoformat()
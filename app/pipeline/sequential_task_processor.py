@@ -4,6 +4,7 @@ import signal
 import sys
 import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from types import ModuleType
 from typing import Any
@@ -16,6 +17,7 @@ from app.core.db import dispose_db_engine
 from app.core.logging import get_logger, setup_logging
 from app.core.observability import bound_log_context, build_log_extra, get_task_event_name
 from app.core.settings import get_settings
+from app.http_client.pool import close_shared_http_clients
 from app.pipeline.dispatcher import TaskDispatcher
 from app.pipeline.handlers.analyze_url import AnalyzeUrlHandler
 from app.pipeline.handlers.backfill_feeds import BackfillFeedsHandler
@@ -41,10 +43,15 @@ from app.pipeline.task_handler import TaskHandler
 from app.pipeline.task_models import TaskEnvelope, TaskResult
 from app.pipeline.task_specs import get_task_spec
 from app.pipeline.worker import get_llm_service
+from app.processing_strategies.browser_pool import (
+    close_shared_browser_pool,
+    start_shared_browser_pool,
+)
 from app.services.gateways.task_queue_gateway import TaskQueueGateway
 from app.services.langfuse_tracing import langfuse_trace_context
 from app.services.news_embeddings import warm_news_embedding_model
-from app.services.queue import QueueService, TaskQueue, TaskType
+from app.services.queue import QueueService, TaskOutcome, TaskQueue, TaskType
+from app.services.whisper_pool import shutdown_whisper_pool, warm_whisper_pool
 
 try:
     import psycopg as _psycopg
@@ -115,12 +122,17 @@ def _is_transient_database_operational_error(exc: OperationalError) -> bool:
 
 
 class SequentialTaskProcessor:
-    """Sequential task processor - processes tasks one at a time."""
+    """Sequential task processor - processes tasks one at a time.
+
+    With `concurrency > 1` the same process claims up to that many tasks and
+    runs them on a thread pool, which suits the I/O-bound CONTENT queue.
+    """
 
     def __init__(
         self,
         queue_name: TaskQueue | str = TaskQueue.CONTENT,
         worker_slot: int = 1,
+        concurrency: int = 1,
     ) -> None:
         logger.debug("Initializing SequentialTaskProcessor...")
         self.queue_service = QueueService()
@@ -136,8 +148,14 @@ class SequentialTaskProcessor:
                 warm_news_embedding_model()
             except Exception:  # noqa: BLE001
                 logger.exception("Failed to warm news embedding model")
+        if self.queue_name == TaskQueue.MEDIA.value and self.settings.whisper_pool_processes:
+            try:
+                warm_whisper_pool()
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to start whisper transcription pool")
         self.running = True
         self.worker_slot = worker_slot
+        self.concurrency = max(int(concurrency), 1)
         self.worker_id = f"{self.queue_name}-processor-{self.worker_slot}"
         self._queue_listener: Any | None = None
         logger.debug(
@@ -231,10 +249,20 @@ class SequentialTaskProcessor:
         finally:
             self._queue_listener = None
 
-    def _recover_from_operational_error(self, exc: OperationalError) -> float:
-        """Dispose pooled DB state and drop the listener after a DB operational error."""
+    def _recover_from_operational_error(
+        self,
+        exc: OperationalError,
+        *,
+        dispose_engine: bool = True,
+    ) -> float:
+        """Drop the listener and, unless disabled, pooled DB state after a DB error.
+
+        Concurrent mode passes ``dispose_engine=False`` while other slots hold checked-out
+        connections; the pool's pre-ping replaces dead connections on their next checkout.
+        """
         transient = _is_transient_database_operational_error(exc)
-        dispose_db_engine()
+        if dispose_engine:
+            dispose_db_engine()
         self._close_queue_listener()
         logger_method = logger.warning if transient else logger.error
         logger_method(
@@ -251,6 +279,7 @@ class SequentialTaskProcessor:
                 context_data={
                     "failure_class": type(exc).__name__,
                     "transient": transient,
+                    "engine_disposed": dispose_engine,
                 },
             ),
         )
@@ -311,6 +340,11 @@ class SequentialTaskProcessor:
             finalization = self._finalize_processed_task(task=task, result=result)
         return result, finalization
 
+    def _process_task_under_lease(self, task: TaskEnvelope) -> TaskResult:
+        """Run one task under a lease heartbeat, leaving finalization to the caller."""
+        with self._lease_heartbeat(task.id):
+            return self.process_task(task)
+
     def process_task(self, task: TaskEnvelope) -> TaskResult:
         """Process a single task."""
         start_time = time.perf_counter()
@@ -434,12 +468,11 @@ class SequentialTaskProcessor:
         result: TaskResult,
     ) -> dict[str, object] | None:
         """Persist task completion/retry state without crashing the worker loop."""
+        outcome = self._task_outcome(task, result)
         retry_count = task.retry_count
         max_retries = self.settings.queue.max_retries
-        should_retry = not result.success and result.retryable and retry_count < max_retries
-        retry_delay_seconds = None
-        if should_retry:
-            retry_delay_seconds = result.retry_delay_seconds or min(60 * (2**retry_count), 3600)
+        retry_delay_seconds = outcome.retry_delay_seconds
+        should_retry = retry_delay_seconds is not None
 
         try:
             finalization = None
@@ -496,20 +529,164 @@ class SequentialTaskProcessor:
             )
             return None
 
-    def run(self, max_tasks: int | None = None) -> None:
-        """
-        Run the task processor.
+    def _task_outcome(self, task: TaskEnvelope, result: TaskResult) -> TaskOutcome:
+        """Build the queue outcome for a processed task, including any retry delay."""
+        retry_count = task.retry_count
+        should_retry = (
+            not result.success
+            and result.retryable
+            and retry_count < self.settings.queue.max_retries
+        )
+        retry_delay_seconds = None
+        if should_retry:
+            retry_delay_seconds = result.retry_delay_seconds or min(60 * (2**retry_count), 3600)
+        return TaskOutcome(
+            task_id=task.id,
+            success=result.success,
+            error_message=result.error_message,
+            retryable=result.retryable,
+            current_retry_count=retry_count,
+            retry_delay_seconds=retry_delay_seconds,
+        )
 
-        Args:
-            max_tasks: Maximum number of tasks to process. None for unlimited.
+    def _finalize_processed_tasks(
+        self,
+        finished: list[tuple[TaskEnvelope, TaskResult]],
+    ) -> dict[int, dict[str, object] | None]:
+        """Persist outcomes for tasks that finished together in one queue transaction.
+
+        Queue doubles without ``finalize_batch`` semantics fall back to per-task
+        finalization. A database error leaves every task in the batch unfinalized, the
+        same as a failed single finalize; their leases expire and they are reclaimed.
         """
-        logger.debug("Entering run method with max_tasks=%s", max_tasks)
-        logger.info(
-            "Starting sequential task processor (worker_id: %s, queue=%s)",
-            self.worker_id,
-            self.queue_name,
-        )
+        if not finished:
+            return {}
+        if not isinstance(self.queue_service, QueueService):
+            return {
+                task.id: self._finalize_processed_task(task=task, result=result)
+                for task, result in finished
+            }
+        try:
+            return self.queue_service.finalize_batch(
+                [self._task_outcome(task, result) for task, result in finished],
+                max_retries=self.settings.queue.max_retries,
+            )
+        except OperationalError as exc:
+            logger.exception(
+                "Batch task finalization hit a database write error",
+                extra=build_log_extra(
+                    component="task_processor",
+                    operation="finalize_batch",
+                    status="failed",
+                    queue_name=self.queue_name,
+                    worker_id=self.worker_id,
+                    context_data={
+                        "failure_class": type(exc).__name__,
+                        "task_ids": [task.id for task, _result in finished],
+                    },
+                ),
+            )
+            return {}
+
+    def _parse_claimed_task(self, task_data: dict[str, Any]) -> TaskEnvelope | None:
+        """Validate a claimed queue row, failing it permanently when malformed."""
+        try:
+            return TaskEnvelope.from_queue_data(task_data)
+        except ValidationError as exc:
+            task_id = task_data.get("id")
+            logger.error(
+                "Invalid task payload",
+                extra=build_log_extra(
+                    component="task_processor",
+                    operation="task_parse",
+                    event_name="task.invalid_payload",
+                    status="failed",
+                    item_id=task_id,
+                    task_id=task_id,
+                    queue_name=self.queue_name,
+                    worker_id=self.worker_id,
+                    source="queue",
+                    context_data={
+                        "failure_class": type(exc).__name__,
+                        "task_data": task_data,
+                    },
+                ),
+            )
+            if task_id is not None:
+                invalid_task = TaskEnvelope(
+                    id=int(task_id),
+                    task_type=TaskType.SCRAPE,
+                    retry_count=0,
+                    payload={},
+                )
+                self._finalize_processed_task(
+                    task=invalid_task,
+                    result=TaskResult.fail("Invalid task payload", retryable=False),
+                )
+            return None
+
+    def _log_task_outcome(
+        self,
+        task: TaskEnvelope,
+        result: TaskResult,
+        finalization: dict[str, object] | None,
+        *,
+        processed_count: int,
+    ) -> None:
+        """Log the terminal or retry outcome of one processed task."""
+        if result.success:
+            logger.info(
+                "Successfully completed task %s (total processed: %s)",
+                task.id,
+                processed_count,
+            )
+            return
+
+        max_retries = self.settings.queue.max_retries
+        if finalization and finalization.get("status") == "pending":
+            logger.info(
+                "Task retry requested by processor",
+                extra=_task_extra(
+                    task,
+                    processor=self,
+                    operation="retry_task",
+                    event_name="task.retry_scheduled",
+                    status="retry_scheduled",
+                    context_data={
+                        "retry_count": finalization.get("retry_count"),
+                        "max_retries": max_retries,
+                        "delay_seconds": finalization.get("retry_delay_seconds"),
+                    },
+                ),
+            )
+        elif not result.retryable:
+            logger.info(
+                "Task failed with non-retryable error",
+                extra=_task_extra(
+                    task,
+                    processor=self,
+                    operation="process_task",
+                    status="failed",
+                    context_data={
+                        "retryable": False,
+                        "error_message": result.error_message or "unknown error",
+                    },
+                ),
+            )
+        else:
+            logger.error(
+                "Task exceeded max retries",
+                extra=_task_extra(
+                    task,
+                    processor=self,
+                    operation="process_task",
+                    status="failed",
+                    context_data={"max_retries": max_retries},
+                ),
+            )
 
+    def _install_signal_handlers(self) -> None:
+        """Stop claiming on the first SIGINT/SIGTERM and exit hard on the second."""
         self._shutdown_requested = False
 
         def signal_handler(_signum, _frame):
@@ -524,6 +701,29 @@ class SequentialTaskProcessor:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
+    def run(self, max_tasks: int | None = None) -> None:
+        """
+        Run the task processor.
+
+        Args:
+            max_tasks: Maximum number of tasks to process. None for unlimited.
+        """
+        logger.debug("Entering run method with max_tasks=%s", max_tasks)
+        logger.info(
+            "Starting sequential task processor (worker_id: %s, queue=%s, concurrency=%s)",
+            self.worker_id,
+            self.queue_name,
+            self.concurrency,
+        )
+
+        self._install_signal_handlers()
+        if self.queue_name == TaskQueue.CONTENT.value:
+            start_shared_browser_pool()
+
+        if self.concurrency > 1:
+            self._shutdown(self._run_concurrent(max_tasks=max_tasks))
+            return
+
         processed_count = 0
         consecutive_empty_polls = 0
         max_empty_polls = 5
@@ -568,92 +768,19 @@ class SequentialTaskProcessor:
                 if startup_polls > 0 and startup_polls <= startup_phase_polls:
                     logger.info("Exiting startup phase - found first task")
 
-                try:
-                    task = TaskEnvelope.from_queue_data(task_data)
-                except ValidationError as exc:
-                    task_id = task_data.get("id")
-                    logger.error(
-                        "Invalid task payload",
-                        extra=build_log_extra(
-                            component="task_processor",
-                            operation="task_parse",
-                            event_name="task.invalid_payload",
-                            status="failed",
-                            item_id=task_id,
-                            task_id=task_id,
-                            queue_name=self.queue_name,
-                            worker_id=self.worker_id,
-                            source="queue",
-                            context_data={
-                                "failure_class": type(exc).__name__,
-                                "task_data": task_data,
-                            },
-                        ),
-                    )
-                    if task_id is not None:
-                        invalid_task = TaskEnvelope(
-                            id=int(task_id),
-                            task_type=TaskType.SCRAPE,
-                            retry_count=0,
-                            payload={},
-                        )
-                        self._finalize_processed_task(
-                            task=invalid_task,
-                            result=TaskResult.fail("Invalid task payload", retryable=False),
-                        )
+                task = self._parse_claimed_task(task_data)
+                if task is None:
                     continue
                 result, finalization = self._process_and_finalize_task(task)
 
                 if result.success:
                     processed_count += 1
-                    logger.info(
-                        "Successfully completed task %s (total processed: %s)",
-                        task.id,
-                        processed_count,
-                    )
-                else:
-                    max_retries = self.settings.queue.max_retries
-                    if finalization and finalization.get("status") == "pending":
-                        logger.info(
-                            "Task retry requested by processor",
-                            extra=_task_extra(
-                                task,
-                                processor=self,
-                                operation="retry_task",
-                                event_name="task.retry_scheduled",
-                                status="retry_scheduled",
-                                context_data={
-                                    "retry_count": finalization.get("retry_count"),
-                                    "max_retries": max_retries,
-                                    "delay_seconds": finalization.get("retry_delay_seconds"),
-                                },
-                            ),
-                        )
-                    elif not result.retryable:
-                        logger.info(
-                            "Task failed with non-retryable error",
-                            extra=_task_extra(
-                                task,
-                                processor=self,
-                                operation="process_task",
-                                status="failed",
-                                context_data={
-                                    "retryable": False,
-                                    "error_message": result.error_message or "unknown error",
-                                },
-                            ),
-                        )
-                    else:
-                        logger.error(
-                            "Task exceeded max retries",
-                            extra=_task_extra(
-                                task,
-                                processor=self,
-                                operation="process_task",
-                                status="failed",
-                                context_data={"max_retries": max_retries},
-                            ),
-                        )
+                self._log_task_outcome(
+                    task,
+                    result,
+                    finalization,
+                    processed_count=processed_count,
+                )
 
                 if max_tasks and processed_count >= max_tasks:
                     logger.info("Reached max tasks limit (%s), stopping", max_tasks)
@@ -665,9 +792,136 @@ class SequentialTaskProcessor:
                 logger.error("Error in main loop: %s", exc, exc_info=True)
                 time.sleep(5)
 
+        self._shutdown(processed_count)
+
+    def _shutdown(self, processed_count: int) -> None:
+        """Release worker-wide resources once the run loop has stopped."""
         self._close_queue_listener()
+        close_shared_http_clients()
+        close_shared_browser_pool()
+        shutdown_whisper_pool()
         logger.info("Processor shutting down (processed %s tasks)", processed_count)
 
+    def _collect_finished_tasks(
+        self,
+        in_flight: dict[Future, TaskEnvelope],
+        *,
+        processed_count: int,
+    ) -> int:
+        """Finalize and log finished concurrent tasks; return the updated success count.
+
+        Tasks that finished since the last poll are finalized together with one
+        ``finalize_batch`` call.
+        """
+        finished: list[tuple[TaskEnvelope, TaskResult]] = []
+        for future in [future for future in in_flight if future.done()]:
+            task = in_flight.pop(future)
+            try:
+                finished.append((task, future.result()))
+            except Exception as exc:  # noqa: BLE001
+                logger.error(
+                    "Task slot raised outside task processing",
+                    exc_info=True,
+                    extra=_task_extra(
+                        task,
+                        processor=self,
+                        operation="process_task",
+                        status="failed",
+                        context_data={"failure_class": type(exc).__name__},
+                    ),
+                )
+
+        finalizations = self._finalize_processed_tasks(finished)
+        for task, result in finished:
+            if result.success:
+                processed_count += 1
+            self._log_task_outcome(
+                task,
+                result,
+                finalizations.get(task.id),
+                processed_count=processed_count,
+            )
+        return processed_count
+
+    def _run_concurrent(self, *, max_tasks: int | None) -> int:
+        """Claim and run up to `concurrency` tasks at once on a thread pool.
+
+        Free slots are filled with one `dequeue_batch` claim per poll. Every slot
+        shares this processor's `TaskContext` and keeps its own lease heartbeat. A
+        shutdown signal stops new claims; in-flight tasks are drained to completion
+        before the pool is torn down.
+        """
+        processed_count = 0
+        consecutive_empty_polls = 0
+        max_empty_polls = 5
+        in_flight: dict[Future, TaskEnvelope] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix=self.worker_id,
+        ) as executor:
+            while self.running:
+                try:
+                    processed_count = self._collect_finished_tasks(
+                        in_flight,
+                        processed_count=processed_count,
+                    )
+                    if max_tasks and processed_count >= max_tasks:
+                        logger.info("Reached max tasks limit (%s), stopping", max_tasks)
+                        break
+                    if len(in_flight) >= self.concurrency:
+                        wait(in_flight, timeout=1.0, return_when=FIRST_COMPLETED)
+                        continue
+
+                    free_slots = self.concurrency - len(in_flight)
+                    if max_tasks:
+                        free_slots = min(free_slots, max_tasks - processed_count - len(in_flight))
+                    if free_slots <= 0:
+                        wait(in_flight, timeout=1.0, return_when=FIRST_COMPLETED)
+                        continue
+
+                    claimed = self.queue_service.dequeue_batch(
+                        self.worker_id,
+                        self.queue_name,
+                        free_slots,
+                    )
+                    if not claimed:
+                        consecutive_empty_polls += 1
+                        if in_flight:
+                            wait(in_flight, timeout=1.0, return_when=FIRST_COMPLETED)
+                        elif consecutive_empty_polls >= max_empty_polls:
+                            self._idle_wait(5.0)
+                        else:
+                            self._idle_wait(1.0)
+                        continue
+
+                    consecutive_empty_polls = 0
+                    for task_data in claimed:
+                        task = self._parse_claimed_task(task_data)
+                        if task is None:
+                            continue
+                        in_flight[executor.submit(self._process_task_under_lease, task)] = task
+
+                except OperationalError as exc:
+                    delay = self._recover_from_operational_error(
+                        exc,
+                        dispose_engine=not in_flight,
+                    )
+                    time.sleep(delay)
+                except Exception as exc:  # noqa: BLE001
+                    logger.error("Error in main loop: %s", exc, exc_info=True)
+                    time.sleep(5)
+
+            if in_flight:
+                logger.info("Draining %s in-flight tasks before shutdown", len(in_flight))
+                wait(in_flight)
+            processed_count = self._collect_finished_tasks(
+                in_flight,
+                processed_count=processed_count,
+            )
+
+        return processed_count
+
     def run_single_task(self, task_data: dict[str, object]) -> bool:
         """
         Process a single task without the main loop.
@@ -676,40 +930,8 @@ class SequentialTaskProcessor:
         setup_logging()
         logger.info("Processing single task: %s", task_data.get("id", "unknown"))
 
-        try:
-            task = TaskEnvelope.from_queue_data(task_data)
-        except ValidationError as exc:
-            task_id = task_data.get("id")
-            log_task_id = task_id if isinstance(task_id, (str, int)) else None
-            logger.error(
-                "Invalid task payload",
-                extra=build_log_extra(
-                    component="task_processor",
-                    operation="task_parse",
-                    event_name="task.invalid_payload",
-                    status="failed",
-                    item_id=log_task_id,
-                    task_id=log_task_id,
-                    queue_name=self.queue_name,
-                    worker_id=self.worker_id,
-                    source="queue",
-                    context_data={
-                        "failure_class": type(exc).__name__,
-                        "task_data": task_data,
-                    },
-                ),
-            )
-            if log_task_id is not None:
-                invalid_task = TaskEnvelope(
-                    id=int(log_task_id),
-                    task_type=TaskType.SCRAPE,
-                    retry_count=0,
-                    payload={},
-                )
-                self._finalize_processed_task(
-                    task=invalid_task,
-                    result=TaskResult.fail("Invalid task payload", retryable=False),
-                )
+        task = self._parse_claimed_task(task_data)
+        if task is None:
             return False
 
         result, finalization = self._process_and_finalize_task(task)
@@ -483,6 +483,8 @@ class ContentWorker:
                 metadata_update["firecrawl_fallback_length"] = extracted_data.get(
                     "firecrawl_fallback_length"
                 )
+            if extracted_data.get("extraction_tier"):
+                metadata_update["extraction_tier"] = extracted_data.get("extraction_tier")
             if "has_video" in extracted_data:
                 metadata_update["has_video"] = bool(extracted_data.get("has_video"))
             if extracted_data.get("video_duration_ms") is not None:
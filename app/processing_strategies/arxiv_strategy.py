@@ -28,6 +28,8 @@ class ArxivProcessorStrategy(UrlProcessorStrategy):
     Abstract links are normalized to their PDF counterparts before download.
     """
 
+    analysis_content_type = "article"
+
     def __init__(self, http_client: RobustHttpClient):
         super().__init__(http_client)
         self._logger_prefix = "ArxivStrategy"
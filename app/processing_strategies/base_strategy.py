@@ -4,7 +4,7 @@ This module defines the abstract base class for URL processing strategies.
 
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable
-from typing import Any
+from typing import Any, ClassVar
 
 import httpx  # For type hinting httpx.Headers
 
@@ -17,6 +17,11 @@ class UrlProcessorStrategy(ABC):
     Each concrete strategy will handle a specific type of URL or content.
     """
 
+    # Content type a URL match alone settles, letting URL analysis skip the LLM.
+    # ``None`` means matching this strategy says nothing about the content type.
+    analysis_content_type: ClassVar[str | None] = None
+    analysis_platform: ClassVar[str | None] = None
+
     def __init__(self, http_client: RobustHttpClient):
         """
         Initializes the strategy with a RobustHttpClient instance.
@@ -0,0 +1,245 @@
+"""Process-wide headless browser shared by crawl4ai article extractions.
+
+Launching Chromium for every URL dominates extraction time, so CONTENT workers start
+one pool per process. The browser lives on a dedicated event-loop thread; callers on
+any worker thread submit crawl operations to it and at most ``max_pages`` run at
+once. The browser is recycled after ``recycle_after_pages`` crawls, when the worker's
+process tree has grown by more than ``max_rss_growth_mb``, or after a crawl fails in
+a way that suggests the browser itself died. Strategies fall back to a per-call
+crawler when no pool has been started, which keeps API processes and tests unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import os
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+from app.core.logging import get_logger
+from app.core.settings import get_settings
+
+logger = get_logger(__name__)
+
+CLOSE_TIMEOUT_SECONDS = 30.0
+BROWSER_FAILURE_MARKERS: tuple[str, ...] = (
+    "target page, context or browser has been closed",
+    "browser has been closed",
+    "browser closed",
+    "connection closed",
+    "browser has disconnected",
+    "playwright connection",
+)
+
+_pool: BrowserPool | None = None
+_pool_lock = threading.Lock()
+
+
+def build_browser_config() -> BrowserConfig:
+    """Return the headless browser configuration used for article extraction."""
+    return BrowserConfig(
+        headless=True,
+        viewport_width=1920,
+        viewport_height=1080,
+        text_mode=False,
+        light_mode=True,
+        ignore_https_errors=True,
+        java_script_enabled=True,
+        extra_args=["--disable-blink-features=AutomationControlled"],
+        verbose=False,
+    )
+
+
+def _default_crawler_factory() -> Any:
+    return AsyncWebCrawler(config=build_browser_config())
+
+
+def _is_browser_failure(error: BaseException) -> bool:
+    message = str(error).lower()
+    return any(marker in message for marker in BROWSER_FAILURE_MARKERS)
+
+
+def _process_tree_rss_mb(root_pid: int) -> float | None:
+    """Return resident memory of ``root_pid`` and its descendants, or ``None`` off Linux."""
+    proc_root = Path("/proc")
+    if not proc_root.is_dir():
+        return None
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    children: dict[int, list[int]] = {}
+    rss_pages: dict[int, int] = {}
+    for entry in proc_root.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # Fields after the parenthesised command name start at ``state`` (field 3).
+        fields = stat.rsplit(")", 1)[-1].split()
+        if len(fields) < 22:
+            continue
+        pid = int(entry.name)
+        children.setdefault(int(fields[1]), []).append(pid)
+        rss_pages[pid] = int(fields[21])
+
+    total_pages = 0
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        total_pages += rss_pages.get(pid, 0)
+        pending.extend(children.get(pid, []))
+    return total_pages * page_size / (1024 * 1024)
+
+
+class BrowserPool:
+    """One long-lived crawler serving bounded concurrent crawls from sync code."""
+
+    def __init__(
+        self,
+        *,
+        max_pages: int,
+        recycle_after_pages: int,
+        max_rss_growth_mb: int,
+        crawler_factory: Callable[[], Any] = _default_crawler_factory,
+    ) -> None:
+        self.max_pages = max(int(max_pages), 1)
+        self.recycle_after_pages = max(int(recycle_after_pages), 1)
+        self.max_rss_growth_mb = max(int(max_rss_growth_mb), 0)
+        self._crawler_factory = crawler_factory
+        self._crawler: Any | None = None
+        self._in_flight = 0
+        self._pages_served = 0
+        self._baseline_rss_mb: float | None = None
+        self._needs_recycle = False
+        self._closed = False
+        self._condition = asyncio.Condition()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="crawl4ai-browser-pool",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def submit[T](self, operation: Callable[[Any], Awaitable[T]]) -> Future[T]:
+        """Schedule ``operation(crawler)`` on the pool's loop and return its future."""
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+        return asyncio.run_coroutine_threadsafe(self._run(operation), self._loop)
+
+    def close(self) -> None:
+        """Close the browser and stop the loop thread; pending crawls fail."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_crawler(), self._loop).result(
+                CLOSE_TIMEOUT_SECONDS
+            )
+        except Exception:  # noqa: BLE001
+            logger.debug("Error closing pooled browser (non-critical)", exc_info=True)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(CLOSE_TIMEOUT_SECONDS)
+        if not self._thread.is_alive():
+            self._loop.close()
+
+    async def _run[T](self, operation: Callable[[Any], Awaitable[T]]) -> T:
+        crawler = await self._acquire()
+        try:
+            return await operation(crawler)
+        except Exception as exc:
+            if _is_browser_failure(exc):
+                logger.warning("Pooled browser looks unhealthy; recycling: %s", exc)
+                self._needs_recycle = True
+            raise
+        finally:
+            await self._release()
+
+    async def _acquire(self) -> Any:
+        async with self._condition:
+            # A pending recycle lets in-flight crawls drain before the browser closes.
+            while self._in_flight >= self.max_pages or (self._needs_recycle and self._in_flight):
+                await self._condition.wait()
+            if self._crawler is not None and not getattr(self._crawler, "ready", True):
+                self._needs_recycle = True
+            if self._needs_recycle:
+                await self._close_crawler()
+            if self._crawler is None:
+                await self._start_crawler()
+            self._in_flight += 1
+            return self._crawler
+
+    async def _release(self) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._pages_served += 1
+            if self._pages_served >= self.recycle_after_pages:
+                self._needs_recycle = True
+            elif self.max_rss_growth_mb and self._baseline_rss_mb is not None:
+                rss_mb = _process_tree_rss_mb(os.getpid())
+                if rss_mb is not None and rss_mb - self._baseline_rss_mb > self.max_rss_growth_mb:
+                    logger.info(
+                        "Recycling pooled browser after memory growth (%.0f MB over baseline)",
+                        rss_mb - self._baseline_rss_mb,
+                    )
+                    self._needs_recycle = True
+            self._condition.notify_all()
+
+    async def _start_crawler(self) -> None:
+        crawler = self._crawler_factory()
+        await crawler.__aenter__()
+        self._crawler = crawler
+        self._pages_served = 0
+        self._needs_recycle = False
+        self._baseline_rss_mb = _process_tree_rss_mb(os.getpid())
+        logger.info("Pooled browser started (max_pages=%s)", self.max_pages)
+
+    async def _close_crawler(self) -> None:
+        crawler, self._crawler = self._crawler, None
+        self._needs_recycle = False
+        if crawler is None:
+            return
+        try:
+            await crawler.__aexit__(None, None, None)
+        except Exception as close_error:  # noqa: BLE001
+            logger.debug("Error closing pooled browser (non-critical): %s", close_error)
+        logger.info("Pooled browser closed after %s pages", self._pages_served)
+
+
+def start_shared_browser_pool() -> BrowserPool | None:
+    """Start this process's browser pool if enabled; the browser launches on first use."""
+    global _pool
+    settings = get_settings()
+    if not settings.crawl4ai_browser_pool_enabled:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(
+                max_pages=settings.crawl4ai_browser_pool_max_pages,
+                recycle_after_pages=settings.crawl4ai_browser_pool_recycle_after_pages,
+                max_rss_growth_mb=settings.crawl4ai_browser_pool_max_rss_growth_mb,
+            )
+        return _pool
+
+
+def get_shared_browser_pool() -> BrowserPool | None:
+    """Return the pool started by this worker process, if any."""
+    return _pool
+
+
+def close_shared_browser_pool() -> None:
+    """Close this process's browser pool."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(close_shared_browser_pool)
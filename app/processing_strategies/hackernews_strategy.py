@@ -70,6 +70,9 @@ class HackerNewsProcessorStrategy(UrlProcessorStrategy):
     Handles HN item URLs, fetches comments, and includes them in the summary.
     """
 
+    analysis_content_type = "article"
+    analysis_platform = "hackernews"
+
     def __init__(self, http_client: RobustHttpClient):
         super().__init__(http_client)
         self.settings = get_settings()
@@ -12,9 +12,9 @@ from typing import Any
 from urllib.parse import urlparse
 
 import httpx
+import trafilatura
 from crawl4ai import (
     AsyncWebCrawler,
-    BrowserConfig,
     CacheMode,
     CrawlerRunConfig,
     LLMConfig,
@@ -26,7 +26,12 @@ from app.core.logging import get_logger
 from app.core.settings import get_settings
 from app.http_client.robust_http_client import RobustHttpClient
 from app.processing_strategies.base_strategy import UrlProcessorStrategy
+from app.processing_strategies.browser_pool import (
+    build_browser_config,
+    get_shared_browser_pool,
+)
 from app.services.firecrawl_client import FirecrawlClientError, scrape_url_with_firecrawl
+from app.services.raw_page_cache import STAGE_HTML_EXTRACTION, get_raw_page_cache
 from app.utils.dates import parse_date_with_tz
 from app.utils.title_utils import clean_title
 
@@ -109,6 +114,7 @@ DISCUSSION_LEDE_MARKERS: tuple[str, ...] = (
     "discussion about this post",
     "commentsrestacks",
 )
+STATIC_FETCH_TIMEOUT_SECONDS = 15.0
 DISCUSSION_TAIL_MARKERS: tuple[str, ...] = (
     "\n#### Discussion about this post",
     "\n### Discussion about this post",
@@ -621,6 +627,132 @@ class HtmlProcessorStrategy(UrlProcessorStrategy):
 
         return trimmed_text
 
+    @staticmethod
+    def _record_extraction_tier(
+        url: str,
+        *,
+        tier: str,
+        outcome: str,
+        reason: str | None = None,
+    ) -> None:
+        """Log one tier attempt so hit rates can be aggregated per tier and host."""
+
+        logger.info(
+            "HtmlStrategy: %s tier %s for %s%s",
+            tier,
+            outcome,
+            url,
+            f" ({reason})" if reason else "",
+            extra={
+                "component": "html_strategy",
+                "operation": "html_extraction_tier",
+                "context_data": {
+                    "tier": tier,
+                    "outcome": outcome,
+                    "reason": reason,
+                    "host": HtmlProcessorStrategy._host_for_url(url),
+                },
+            },
+        )
+
+    def _should_try_static_fetch(
+        self,
+        url: str,
+        source_config: dict[str, Any],
+        table_strategy: LLMTableExtraction | None,
+    ) -> bool:
+        """Return True when a plain GET might be enough for this URL."""
+
+        if not self.settings.html_static_fetch_enabled:
+            return False
+        # Domains with crawl overrides are known to need the browser's wait handling.
+        if self._get_domain_overrides(url):
+            return False
+        # PDFs and LLM table extraction are only available through crawl4ai.
+        return not source_config.get("pdf") and table_strategy is None
+
+    def _static_fetch(self, url: str, source: str) -> dict[str, Any] | None:
+        """Extract server-rendered HTML without a browser, or return None to escalate."""
+
+        page_cache = get_raw_page_cache()
+        cached_page = page_cache.get(url, stage=STAGE_HTML_EXTRACTION) if page_cache else None
+        if cached_page is not None:
+            content_type = cached_page.content_type.lower()
+            html_content: Any = cached_page.text
+            final_url = cached_page.final_url or url
+        else:
+            try:
+                response = self.http_client.get(
+                    url,
+                    timeout=STATIC_FETCH_TIMEOUT_SECONDS,
+                    log_http_errors=False,
+                )
+            except httpx.HTTPError as exc:
+                self._record_extraction_tier(
+                    url, tier="static", outcome="miss", reason=f"http_error: {type(exc).__name__}"
+                )
+                return None
+            if page_cache is not None:
+                page_cache.put_response(response, url=url)
+            content_type = str(response.headers.get("content-type") or "").lower()
+            html_content = response.text
+            final_url = str(response.url or url)
+
+        if "text/html" not in content_type or not isinstance(html_content, str):
+            self._record_extraction_tier(url, tier="static", outcome="miss", reason="not_html")
+            return None
+
+        text_content = self._trim_discussion_tail(
+            final_url,
+            trafilatura.extract(
+                html_content,
+                url=final_url,
+                output_format="markdown",
+                include_links=True,
+                include_images=False,
+                include_tables=True,
+            ),
+        )
+        if len(text_content.strip()) < self.settings.html_static_min_text_chars:
+            self._record_extraction_tier(url, tier="static", outcome="miss", reason="short_body")
+            return None
+
+        page_metadata = trafilatura.extract_metadata(html_content, default_url=final_url)
+        title = (
+            clean_title(page_metadata.title if page_metadata else None)
+            or self._extract_title_from_html(html_content)
+            or "Untitled"
+        )
+        extraction_issue = self._detect_extraction_issue(
+            url=final_url,
+            title=title,
+            text_content=text_content,
+            html_content=html_content,
+        )
+        if extraction_issue:
+            self._record_extraction_tier(
+                url, tier="static", outcome="miss", reason=extraction_issue
+            )
+            return None
+
+        from app.services.feed_detection import extract_feed_links
+
+        self._record_extraction_tier(url, tier="static", outcome="hit")
+        published = page_metadata.date if page_metadata else None
+        return {
+            "title": title,
+            "author": page_metadata.author if page_metadata else None,
+            "publication_date": parse_date_with_tz(published) if published else None,
+            "text_content": text_content,
+            "content_type": "html",
+            "source": self._host_for_url(final_url) or source,
+            "final_url_after_redirects": final_url,
+            "table_markdown": None,
+            "feed_links": extract_feed_links(html_content, final_url) or None,
+            "extraction_error": None,
+            "extraction_tier": "static",
+        }
+
     def _firecrawl_fallback_fetch(
         self,
         url: str,
@@ -665,6 +797,7 @@ class HtmlProcessorStrategy(UrlProcessorStrategy):
             final_url,
             len(text_content),
         )
+        self._record_extraction_tier(url, tier="firecrawl", outcome="hit")
         return {
             "title": title,
             "author": None,
@@ -679,6 +812,7 @@ class HtmlProcessorStrategy(UrlProcessorStrategy):
             "extraction_error": None,
             "used_firecrawl_fallback": True,
             "firecrawl_fallback_length": len(text_content),
+            "extraction_tier": "firecrawl",
         }
 
     def extract_data(
@@ -700,18 +834,7 @@ class HtmlProcessorStrategy(UrlProcessorStrategy):
         table_strategy = self._build_table_extraction_strategy()
 
         try:
-            # Configure browser
-            browser_config = BrowserConfig(
-                headless=True,
-                viewport_width=1920,
-                viewport_height=1080,
-                text_mode=False,
-                light_mode=True,
-                ignore_https_errors=True,
-                java_script_enabled=True,
-                extra_args=["--disable-blink-features=AutomationControlled"],
-                verbose=False,
-            )
+            browser_pool = get_shared_browser_pool()
 
             # Get source-specific configuration
             source_config = self._get_source_specific_config(source)
@@ -721,6 +844,24 @@ class HtmlProcessorStrategy(UrlProcessorStrategy):
             max_crawl_attempts = max(1, int(source_config.get("max_crawl_attempts", 3)))
             retry_delay_seconds = float(source_config.get("crawl_retry_delay_seconds", 1.5))
 
+            if self._should_try_static_fetch(url, source_config, table_strategy):
+                try:
+                    static_data = self._static_fetch(url, source)
+                except Exception as exc:
+                    # The static tier is an optimisation; any failure falls back to crawl4ai.
+                    logger.warning(
+                        "HtmlStrategy: Static fetch failed for %s, escalating to browser: %s",
+                        url,
+                        exc,
+                        exc_info=True,
+                    )
+                    self._record_extraction_tier(
+                        url, tier="static", outcome="miss", reason=f"error: {type(exc).__name__}"
+                    )
+                    static_data = None
+                if static_data is not None:
+                    return static_data
+
             # Configure crawler run
             run_config = CrawlerRunConfig(
                 # Content filtering
@@ -780,9 +921,16 @@ class HtmlProcessorStrategy(UrlProcessorStrategy):
                         crawler = None
                         should_retry = False
                         try:
-                            crawler = AsyncWebCrawler(config=browser_config)
-                            await crawler.__aenter__()
-                            result = await crawler.arun(url=url, config=run_config)
+                            if browser_pool is not None:
+                                result = await asyncio.wrap_future(
+                                    browser_pool.submit(
+                                        lambda pooled: pooled.arun(url=url, config=run_config)
+                                    )
+                                )
+                            else:
+                                crawler = AsyncWebCrawler(config=build_browser_config())
+                                await crawler.__aenter__()
+                                result = await crawler.arun(url=url, config=run_config)
                             logger.debug(
                                 "HtmlStrategy: Crawl finished "
                                 "(url=%s, success=%s, status=%s, redirected=%s)",
@@ -1001,6 +1149,8 @@ class HtmlProcessorStrategy(UrlProcessorStrategy):
                     )
                     return fallback_data
 
+            self._record_extraction_tier(final_url, tier="browser", outcome="hit")
+
             # Extract feed links from HTML for potential feed detection
             feed_links = None
             if result.cleaned_html:
@@ -1025,6 +1175,7 @@ class HtmlProcessorStrategy(UrlProcessorStrategy):
                 "table_markdown": table_markdown or None,
                 "feed_links": feed_links,  # For feed detection in worker
                 "extraction_error": extraction_issue,
+                "extraction_tier": "browser",
             }
 
         except Exception as e:
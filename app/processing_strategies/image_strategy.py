@@ -21,6 +21,8 @@ class ImageProcessorStrategy(UrlProcessorStrategy):
     allowing the article detail view to render the image directly.
     """
 
+    analysis_content_type = "article"
+
     # Common image file extensions
     IMAGE_EXTENSIONS = {
         ".jpg",
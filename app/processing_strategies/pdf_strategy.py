@@ -23,6 +23,8 @@ settings = get_settings()
 class PdfProcessorStrategy(UrlProcessorStrategy):
     """Strategy for processing PDF documents."""
 
+    analysis_content_type = "article"
+
     def __init__(self, http_client: RobustHttpClient):
         super().__init__(http_client)
         google_api_key = getattr(settings, "google_api_key", None)
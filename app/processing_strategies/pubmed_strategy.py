@@ -26,6 +26,8 @@ class PubMedProcessorStrategy(UrlProcessorStrategy):
     to process the actual full-text content.
     """
 
+    analysis_content_type = "article"
+
     def __init__(self, http_client: RobustHttpClient):
         super().__init__(http_client)
 
@@ -67,6 +67,13 @@ class StrategyRegistry:
         logger.warning(f"No strategy found for URL: {url}")
         return None
 
+    def get_analysis_strategy(self, url: str) -> UrlProcessorStrategy | None:
+        """Return the strategy for a URL when its match alone settles URL analysis."""
+        for strategy in self.strategies:
+            if strategy.can_handle_url(url):
+                return strategy if strategy.analysis_content_type else None
+        return None
+
     def list_strategies(self) -> list[str]:
         """List all registered strategy names."""
         return [s.__class__.__name__ for s in self.strategies]
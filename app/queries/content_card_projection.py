@@ -0,0 +1,162 @@
+"""Read-through card projections shared by the list and search card queries."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.core.logging import get_logger
+from app.models.api.common import ContentSummaryResponse
+from app.models.content_display import is_ready_for_long_form_summary, resolve_image_urls
+from app.models.content_mapper import content_to_domain
+from app.models.schema import Content
+from app.repositories.content_card_repository import (
+    load_current_content_cards,
+    load_full_contents,
+    upsert_content_cards,
+)
+from app.routers.api.content_responses import (
+    build_content_summary_response,
+    build_fallback_content_summary_response,
+)
+
+logger = get_logger(__name__)
+
+# Per-user flags are filled in on read and never stored in the projection.
+USER_CARD_FIELDS = {"is_read", "is_saved_to_knowledge"}
+# Bump when the stored card shape or the builders behind it change; stored cards
+# from another version are rebuilt on their next read.
+CONTENT_CARD_PROJECTION_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CardRow:
+    """One content row plus the per-user flags a card needs."""
+
+    content: Content
+    is_read: bool
+    is_saved_to_knowledge: bool
+
+
+def build_card_responses(
+    db: Session,
+    rows: Sequence[CardRow],
+    *,
+    component: str,
+    long_form_ready_only: bool = False,
+    use_fallback: bool = False,
+) -> list[ContentSummaryResponse]:
+    """Return card responses for ``rows`` in order, served from ``content_cards``.
+
+    Rows whose projection is missing, older than ``contents.updated_at`` or from
+    another ``CONTENT_CARD_PROJECTION_VERSION`` are built from the full content row
+    and written back, so the next page read skips metadata decoding and domain
+    mapping for them.
+
+    Args:
+        db: Active session used for the page query.
+        rows: Page rows in response order.
+        component: Logging component name of the calling query.
+        long_form_ready_only: Drop cards whose summary is not ready for feed display.
+        use_fallback: Build a minimal card when domain mapping fails instead of skipping.
+    """
+    cards = load_current_content_cards(
+        db,
+        [row.content for row in rows],
+        projection_version=CONTENT_CARD_PROJECTION_VERSION,
+    )
+    stale_ids = [
+        int(row.content.id)
+        for row in rows
+        if row.content.id is not None and int(row.content.id) not in cards
+    ]
+    load_full_contents(db, stale_ids)
+
+    responses: list[ContentSummaryResponse] = []
+    projections: list[dict] = []
+    for row in rows:
+        content = row.content
+        card = cards.get(int(content.id)) if content.id is not None else None
+        if card is not None:
+            if long_form_ready_only and not card.long_form_ready:
+                continue
+            responses.append(
+                ContentSummaryResponse.model_validate(
+                    {
+                        **card.card,
+                        "is_read": row.is_read,
+                        "is_saved_to_knowledge": row.is_saved_to_knowledge,
+                    }
+                )
+            )
+            continue
+
+        try:
+            domain_content = content_to_domain(content)
+        except Exception:
+            logger.exception(
+                "Skipping invalid content row in card projection",
+                extra={
+                    "component": component,
+                    "operation": "content_to_domain",
+                    "item_id": content.id,
+                },
+            )
+            if use_fallback:
+                fallback = build_fallback_content_summary_response(
+                    content,
+                    is_read=row.is_read,
+                    is_saved_to_knowledge=row.is_saved_to_knowledge,
+                )
+                if fallback is not None:
+                    responses.append(fallback)
+            continue
+
+        image_url, thumbnail_url = resolve_image_urls(domain_content)
+        response = build_content_summary_response(
+            content=content,
+            domain_content=domain_content,
+            is_read=row.is_read,
+            is_saved_to_knowledge=row.is_saved_to_knowledge,
+            image_url=image_url,
+            thumbnail_url=thumbnail_url,
+        )
+        long_form_ready = is_ready_for_long_form_summary(domain_content)
+        if content.updated_at is not None:
+            projections.append(
+                {
+                    "content_id": int(content.id),
+                    "card": response.model_dump(mode="json", exclude=USER_CARD_FIELDS),
+                    "long_form_ready": long_form_ready,
+                    "projection_version": CONTENT_CARD_PROJECTION_VERSION,
+                    "source_updated_at": content.updated_at,
+                }
+            )
+        if long_form_ready_only and not long_form_ready:
+            continue
+        responses.append(response)
+
+    _store_card_projections(projections, component=component)
+    return responses
+
+
+def _store_card_projections(projections: list[dict], *, component: str) -> None:
+    """Persist rebuilt projections in a short-lived session; list reads stay read-only."""
+    if not projections:
+        return
+    try:
+        with get_db() as db:
+            upsert_content_cards(db, projections)
+    except SQLAlchemyError:
+        logger.warning(
+            "Failed to store content card projections; serving rebuilt cards only",
+            extra={
+                "component": component,
+                "operation": "store_content_cards",
+                "context_data": {"count": len(projections)},
+            },
+        )
@@ -5,22 +5,14 @@ from __future__ import annotations
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
-from app.core.logging import get_logger
 from app.models.api.common import ContentListResponse
-from app.models.content_display import resolve_image_urls
-from app.models.content_mapper import content_to_domain
 from app.models.metadata import ContentType
 from app.models.pagination import PaginationMetadata
+from app.queries.content_card_projection import CardRow, build_card_responses
 from app.repositories.content_card_repository import list_content_types, list_contents
 from app.repositories.content_feed_query import resolve_content_sort_timestamp
-from app.routers.api.content_responses import (
-    build_content_summary_response,
-    build_fallback_content_summary_response,
-)
 from app.utils.pagination import PaginationCursor
 
-logger = get_logger(__name__)
-
 
 def execute(
     db: Session,
@@ -69,38 +61,19 @@ def execute(
     if has_more:
         rows = rows[:limit]
 
-    contents = []
-    for content, is_read, is_saved_to_knowledge in rows:
-        try:
-            domain_content = content_to_domain(content)
-        except Exception:
-            logger.exception(
-                "Skipping invalid content row in list_contents",
-                extra={
-                    "component": "list_content_cards",
-                    "operation": "content_to_domain",
-                    "item_id": content.id,
-                },
-            )
-            fallback = build_fallback_content_summary_response(
-                content,
-                is_read=bool(is_read),
-                is_saved_to_knowledge=bool(is_saved_to_knowledge),
-            )
-            if fallback is not None:
-                contents.append(fallback)
-            continue
-        image_url, thumbnail_url = resolve_image_urls(domain_content)
-        contents.append(
-            build_content_summary_response(
+    contents = build_card_responses(
+        db,
+        [
+            CardRow(
                 content=content,
-                domain_content=domain_content,
                 is_read=bool(is_read),
                 is_saved_to_knowledge=bool(is_saved_to_knowledge),
-                image_url=image_url,
-                thumbnail_url=thumbnail_url,
             )
-        )
+            for content, is_read, is_saved_to_knowledge in rows
+        ],
+        component="list_content_cards",
+        use_fallback=True,
+    )
 
     next_cursor = None
     if has_more and rows:
@@ -8,19 +8,14 @@ import json
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
-from app.core.logging import get_logger
 from app.models.api.common import ContentListResponse
-from app.models.content_display import is_ready_for_long_form_summary, resolve_image_urls
-from app.models.content_mapper import content_to_domain
 from app.models.metadata import ContentType
 from app.models.pagination import PaginationMetadata
+from app.queries.content_card_projection import CardRow, build_card_responses
 from app.repositories.content_card_repository import list_content_types
 from app.repositories.search_repository import search_content_page
-from app.routers.api.content_responses import build_content_summary_response
 from app.utils.pagination import PaginationCursor
 
-logger = get_logger(__name__)
-
 
 def _encode_search_cursor(
     *,
@@ -92,34 +87,19 @@ def execute(
     if has_more:
         rows = rows[:limit]
 
-    contents = []
-    for row in rows:
-        content, is_read, is_saved_to_knowledge = row[:3]
-        try:
-            domain_content = content_to_domain(content)
-        except Exception:
-            logger.exception(
-                "Skipping invalid content row in search_contents",
-                extra={
-                    "component": "search_content_cards",
-                    "operation": "content_to_domain",
-                    "item_id": content.id,
-                },
-            )
-            continue
-        image_url, thumbnail_url = resolve_image_urls(domain_content)
-        if not is_ready_for_long_form_summary(domain_content):
-            continue
-        contents.append(
-            build_content_summary_response(
-                content=content,
-                domain_content=domain_content,
-                is_read=bool(is_read),
-                is_saved_to_knowledge=bool(is_saved_to_knowledge),
-                image_url=image_url,
-                thumbnail_url=thumbnail_url,
+    contents = build_card_responses(
+        db,
+        [
+            CardRow(
+                content=row[0],
+                is_read=bool(row[1]),
+                is_saved_to_knowledge=bool(row[2]),
             )
-        )
+            for row in rows
+        ],
+        component="search_content_cards",
+        long_form_ready_only=True,
+    )
 
     next_cursor = None
     if has_more and rows:
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 from sqlalchemy import and_, exists, func, or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.orm import Session, undefer
 
 from app.models.contracts import ContentStatus
 from app.models.metadata import ContentType
 from app.models.schema import (
     Content,
+    ContentCard,
     ContentKnowledgeSave,
     ContentReadStatus,
     ContentStatusEntry,
 )
 from app.repositories.content_feed_query import (
+    CARD_DEFERRED_COLUMNS,
     apply_sort_timestamp_cursor,
     build_user_feed_query,
     content_sort_timestamp_expr,
@@ -148,6 +153,7 @@ def _list_long_form_contents(
             ),
         )
         .filter(Content.id.in_(ordered_content_ids))
+        .options(*CARD_DEFERRED_COLUMNS)
         .all()
     )
     rows_by_id = {
@@ -222,7 +228,12 @@ def list_contents(
         query = query.filter(ContentReadStatus.id.is_not(None))
 
     query = apply_sort_timestamp_cursor(query, last_sort_timestamp, last_id, sort_expr=sort_expr)
-    rows = query.order_by(sort_expr.desc(), Content.id.desc()).limit(limit + 1).all()
+    rows = (
+        query.options(*CARD_DEFERRED_COLUMNS)
+        .order_by(sort_expr.desc(), Content.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
     return rows, available_dates
 
 
@@ -264,6 +275,66 @@ def get_recently_read(
     )
 
 
+def load_current_content_cards(
+    db: Session,
+    contents: Sequence[Content],
+    *,
+    projection_version: int,
+) -> dict[int, ContentCard]:
+    """Return stored card projections that still match their content row and version."""
+    updated_at_by_id = {
+        int(content.id): content.updated_at
+        for content in contents
+        if content.id is not None and content.updated_at is not None
+    }
+    if not updated_at_by_id:
+        return {}
+    rows = (
+        db.query(ContentCard)
+        .filter(ContentCard.content_id.in_(updated_at_by_id))
+        .filter(ContentCard.projection_version == projection_version)
+        .all()
+    )
+    return {
+        int(row.content_id): row
+        for row in rows
+        if row.source_updated_at == updated_at_by_id.get(int(row.content_id))
+    }
+
+
+def load_full_contents(db: Session, content_ids: Sequence[int]) -> None:
+    """Load deferred card columns for ``content_ids`` in one query."""
+    if not content_ids:
+        return
+    (
+        db.query(Content)
+        .options(undefer(Content.content_metadata), undefer(Content.search_text))
+        .populate_existing()
+        .filter(Content.id.in_(list(content_ids)))
+        .all()
+    )
+
+
+def upsert_content_cards(db: Session, entries: Sequence[dict[str, Any]]) -> None:
+    """Insert or replace card projections keyed by ``content_id``."""
+    if not entries:
+        return
+    stmt = postgresql_insert(ContentCard).values(
+        [{**entry, "updated_at": datetime.now(UTC).replace(tzinfo=None)} for entry in entries]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ContentCard.content_id],
+        set_={
+            "card": stmt.excluded.card,
+            "long_form_ready": stmt.excluded.long_form_ready,
+            "projection_version": stmt.excluded.projection_version,
+            "source_updated_at": stmt.excluded.source_updated_at,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    db.execute(stmt)
+
+
 def list_content_types() -> list[str]:
     """Return public content type filters for card endpoints."""
     return [content_type.value for content_type in ContentType]
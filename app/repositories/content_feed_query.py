@@ -7,12 +7,16 @@ from datetime import datetime
 from typing import Literal
 
 from sqlalchemy import and_, func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 
 from app.constants import CONTENT_DIGEST_VISIBILITY_DIGEST_ONLY
 from app.models.contracts import ContentStatus, ContentType
 from app.models.schema import Content, ContentKnowledgeSave, ContentReadStatus, ContentStatusEntry
 
+# List/search card pages read ``content_cards``; these heavy columns are only loaded
+# for rows whose card projection has to be rebuilt.
+CARD_DEFERRED_COLUMNS = (defer(Content.content_metadata), defer(Content.search_text))
+
 
 @dataclass(frozen=True)
 class FeedQueryRows:
@@ -4,13 +4,17 @@ from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, update
 from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
 from app.core.logging import get_logger
 from app.models.schema import ContentReadStatus
+from app.repositories.stat_counter_repository import (
+    apply_content_unread_deltas,
+    invalidate_user_counters,
+)
 
 logger = get_logger(__name__)
 
@@ -33,6 +37,7 @@ def mark_content_as_read(db: Session, content_id: int, user_id: int) -> ContentR
     )
     try:
         read_at = datetime.now(UTC).replace(tzinfo=None)
+        # Insert and update are separate so only a first read moves the unread counters.
         stmt = (
             postgresql_insert(ContentReadStatus)
             .values(
@@ -43,18 +48,34 @@ def mark_content_as_read(db: Session, content_id: int, user_id: int) -> ContentR
                     "created_at": read_at,
                 }
             )
-            .on_conflict_do_update(
+            .on_conflict_do_nothing(
                 index_elements=[
                     ContentReadStatus.user_id,
                     ContentReadStatus.content_id,
                 ],
-                set_={"read_at": read_at},
             )
             .returning(ContentReadStatus.id)
         )
-        raw_read_status_id = db.execute(stmt).scalar_one()
+        raw_read_status_id = db.execute(stmt).scalar_one_or_none()
         if raw_read_status_id is None:
-            raise RuntimeError("Read status insert returned no id")
+            raw_read_status_id = db.execute(
+                update(ContentReadStatus)
+                .where(
+                    ContentReadStatus.user_id == user_id,
+                    ContentReadStatus.content_id == content_id,
+                )
+                .values(read_at=read_at)
+                .returning(ContentReadStatus.id)
+            ).scalar_one_or_none()
+            if raw_read_status_id is None:
+                raise RuntimeError("Read status insert returned no id")
+        else:
+            apply_content_unread_deltas(
+                db,
+                user_id=user_id,
+                content_ids=[content_id],
+                delta=-1,
+            )
         read_status_id = int(raw_read_status_id)
         db.commit()
         return db.execute(
@@ -112,15 +133,31 @@ def mark_contents_as_read(
                     for content_id in sorted(unique_ids)
                 ]
             )
-            .on_conflict_do_update(
+            .on_conflict_do_nothing(
                 index_elements=[
                     ContentReadStatus.user_id,
                     ContentReadStatus.content_id,
                 ],
-                set_={"read_at": timestamp},
             )
+            .returning(ContentReadStatus.content_id)
+        )
+        newly_read_ids = set(db.execute(stmt).scalars().all())
+        already_read_ids = unique_ids - newly_read_ids
+        if already_read_ids:
+            db.execute(
+                update(ContentReadStatus)
+                .where(
+                    ContentReadStatus.user_id == user_id,
+                    ContentReadStatus.content_id.in_(sorted(already_read_ids)),
+                )
+                .values(read_at=timestamp)
+            )
+        apply_content_unread_deltas(
+            db,
+            user_id=user_id,
+            content_ids=newly_read_ids,
+            delta=-1,
         )
-        db.execute(stmt)
         db.commit()
         return len(unique_ids), []
     except OperationalError as exc:
@@ -176,8 +213,15 @@ def mark_content_as_unread(db: Session, content_id: int, user_id: int) -> bool:
                 ContentReadStatus.user_id == user_id,
             )
         )
-        db.commit()
         rowcount = getattr(result, "rowcount", 0)
+        if rowcount:
+            apply_content_unread_deltas(
+                db,
+                user_id=user_id,
+                content_ids=[content_id],
+                delta=1,
+            )
+        db.commit()
         return bool(rowcount)
     except Exception as exc:  # noqa: BLE001
         logger.exception(
@@ -196,6 +240,7 @@ def mark_content_as_unread(db: Session, content_id: int, user_id: int) -> bool:
 def clear_read_status(db: Session, user_id: int) -> int:
     """Clear all read status rows for a user."""
     result = db.execute(delete(ContentReadStatus).where(ContentReadStatus.user_id == user_id))
+    invalidate_user_counters(db, user_ids=[user_id])
     db.commit()
     rowcount = getattr(result, "rowcount", 0)
     return int(rowcount or 0)
@@ -4,14 +4,28 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
-from typing import Any
-
-from sqlalchemy import String, and_, cast, func, literal, literal_column, or_
+from typing import Any, Literal
+
+from sqlalchemy import (
+    String,
+    and_,
+    cast,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    union,
+)
 from sqlalchemy.orm import Session
 
 from app.models.contracts import NewsItemStatus, NewsItemVisibilityScope
 from app.models.schema import Content, NewsItem, NewsItemReadStatus, UserScraperConfig
-from app.repositories.content_feed_query import apply_sort_timestamp_cursor, build_user_feed_query
+from app.repositories.content_feed_query import (
+    CARD_DEFERRED_COLUMNS,
+    apply_sort_timestamp_cursor,
+    build_user_feed_query,
+)
 
 SUBSCRIPTION_QUERY_STOPWORDS = {
     "a",
@@ -90,52 +104,44 @@ def _content_search_text_expr():
     return func.coalesce(cast(Content.search_text, String), "")
 
 
+def _content_summary_title_index_expr():
+    # Matches the idx_contents_summary_title_trgm expression index.
+    return func.coalesce(Content.content_metadata["summary"]["title"].as_string(), "")
+
+
+def _trigram_match(column, normalized: str):
+    """Return ``column % query OR query <% column``; both use the column's trigram index."""
+    return or_(
+        column.bool_op("OPERATOR(public.%)")(normalized),
+        literal(normalized).bool_op("OPERATOR(public.<%)")(column),
+    )
+
+
 def _apply_postgres_content_search(query, query_text: str, *, context: dict[str, Any]):
     normalized = " ".join(query_text.split()).strip()
     if not normalized:
         return query
 
-    summary_title_vector = func.setweight(
-        func.to_tsvector("english", _content_summary_title_expr()),
-        literal_column("'A'"),
-    )
-    stored_title_vector = func.setweight(
-        func.to_tsvector("english", _content_title_expr()),
-        literal_column("'B'"),
-    )
-    source_vector = func.setweight(
-        func.to_tsvector("english", _content_source_expr()),
-        literal_column("'C'"),
-    )
-    search_text_vector = func.setweight(
-        func.to_tsvector("english", _content_search_text_expr()),
-        literal_column("'D'"),
-    )
-    search_document = (
-        summary_title_vector.op("||")(stored_title_vector)
-        .op("||")(source_vector)
-        .op("||")(search_text_vector)
-    )
+    # Stored generated column (see CONTENT_SEARCH_DOCUMENT_SQL) backed by a GIN index.
+    search_document = Content.search_document
 
     search_query = func.websearch_to_tsquery("english", normalized)
     search_rank = func.ts_rank_cd(search_document, search_query)
-    summary_title_match = _content_summary_title_expr().bool_op("OPERATOR(public.%)")(normalized)
-    stored_title_match = _content_title_expr().bool_op("OPERATOR(public.%)")(normalized)
-    source_match = _content_source_expr().bool_op("OPERATOR(public.%)")(normalized)
     trigram_rank = func.greatest(
         func.public.word_similarity(normalized, _content_summary_title_expr()),
         func.public.word_similarity(normalized, _content_title_expr()),
         func.public.word_similarity(normalized, _content_source_expr()),
     )
-    combined_filter = or_(
-        search_document.op("@@")(search_query),
-        summary_title_match,
-        stored_title_match,
-        source_match,
-        trigram_rank >= 0.5,
+    # One index-backed branch per condition: ORing them in a single WHERE clause
+    # across different expressions forces a sequential scan of contents.
+    matching_ids = union(
+        select(Content.id).where(search_document.op("@@")(search_query)),
+        select(Content.id).where(_trigram_match(Content.title, normalized)),
+        select(Content.id).where(_trigram_match(Content.source, normalized)),
+        select(Content.id).where(_trigram_match(_content_summary_title_index_expr(), normalized)),
     )
     context["rank_expr"] = func.greatest(search_rank, trigram_rank * 0.25)
-    return query.filter(combined_filter)
+    return query.filter(Content.id.in_(select(matching_ids.subquery().c.id)))
 
 
 def _apply_generic_content_search(query, query_text: str, *, context: dict[str, Any]):
@@ -216,7 +222,7 @@ def search_content_page(
     elif offset > 0:
         query = query.offset(offset)
 
-    return query.limit(limit + 1).all()
+    return query.options(*CARD_DEFERRED_COLUMNS).limit(limit + 1).all()
 
 
 def search_content(
@@ -225,8 +231,13 @@ def search_content(
     user_id: int,
     query_text: str,
     limit: int,
+    count_mode: Literal["exact", "estimated"] = "exact",
 ):
-    """Return matching visible content rows plus a total count, or recent rows when none match."""
+    """Return matching visible content rows plus a total count, or recent rows when none match.
+
+    ``count_mode="estimated"`` takes the total from the PostgreSQL planner instead of running
+    a full ``COUNT(*)`` over every match; it is never lower than the rows returned.
+    """
     base_query = build_user_feed_query(db, user_id, mode="inbox")
     normalized_query = query_text.strip()
     if not normalized_query:
@@ -237,7 +248,10 @@ def search_content(
     matched_query = _apply_content_search(
         base_query, normalized_query, db=db, context=search_context
     )
-    total_matches = matched_query.order_by(None).count()
+    estimated_matches = (
+        _estimate_query_rows(db, matched_query) if count_mode == "estimated" else None
+    )
+    total_matches = matched_query.order_by(None).count() if estimated_matches is None else None
     search_rank_expr = search_context.get("rank_expr")
     if search_rank_expr is None:
         matched_query = matched_query.order_by(Content.created_at.desc(), Content.id.desc())
@@ -249,6 +263,8 @@ def search_content(
         )
     rows = matched_query.limit(limit).all()
     if rows:
+        if total_matches is None:
+            total_matches = max(estimated_matches or 0, len(rows))
         return rows, total_matches
 
     fallback_rows = (
@@ -257,6 +273,26 @@ def search_content(
     return fallback_rows, 0
 
 
+def _estimate_query_rows(db: Session, query) -> int | None:
+    """Return the planner's row estimate for ``query``, or None when unavailable."""
+    if not _uses_postgres(db):
+        return None
+    statement = query.order_by(None).statement
+    compiled = statement.compile(
+        dialect=db.get_bind().dialect,
+        compile_kwargs={"render_postcompile": True},
+    )
+    plan = (
+        db.connection()
+        .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+        .scalar()
+    )
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
 def _visible_news_item_query(
     db: Session,
     *,
@@ -0,0 +1,233 @@
+"""Repository for incrementally maintained per-user badge counters.
+
+Counter rows are written in full by reconciliation (``store_reconciled_counters``) and
+adjusted by deltas inside the same transaction as read-state and inbox writes. A row
+whose ``refreshed_at`` is older than ``stats_counter_max_age_seconds`` is treated as
+missing, which bounds drift from writes that do not apply deltas (global news
+ingestion, pipeline status changes in other processes).
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import and_, delete, exists, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.core.logging import get_logger
+from app.core.settings import get_settings
+from app.models.metadata import ContentStatus, ContentType
+from app.models.schema import Content, ContentReadStatus, ContentStatusEntry, UserStatCounter
+
+logger = get_logger(__name__)
+
+UNREAD_ARTICLE_COUNTER = "unread:article"
+UNREAD_PODCAST_COUNTER = "unread:podcast"
+UNREAD_NEWS_COUNTER = "unread:news"
+LONG_FORM_UNREAD_COUNTER = "long_form:unread"
+UNREAD_COUNT_COUNTERS = (UNREAD_ARTICLE_COUNTER, UNREAD_PODCAST_COUNTER, UNREAD_NEWS_COUNTER)
+
+_UNREAD_TYPE_COUNTERS = {
+    ContentType.ARTICLE.value: UNREAD_ARTICLE_COUNTER,
+    ContentType.PODCAST.value: UNREAD_PODCAST_COUNTER,
+}
+_LONG_FORM_TYPES = {ContentType.ARTICLE.value, ContentType.PODCAST.value}
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def counters_enabled() -> bool:
+    return get_settings().stats_counter_max_age_seconds > 0
+
+
+def counter_keys_for_content(content_type: str | None, platform: str | None) -> list[str]:
+    """Return the counters an unread, visible inbox item of this shape contributes to."""
+    keys: list[str] = []
+    type_counter = _UNREAD_TYPE_COUNTERS.get(content_type or "")
+    if type_counter is not None:
+        keys.append(type_counter)
+    if content_type in _LONG_FORM_TYPES or (
+        platform == "youtube" and content_type != ContentType.NEWS.value
+    ):
+        keys.append(LONG_FORM_UNREAD_COUNTER)
+    return keys
+
+
+def load_fresh_counters(db: Session, *, user_id: int, keys: Iterable[str]) -> dict[str, int] | None:
+    """Return counter values when every key exists and was reconciled recently."""
+    if not counters_enabled():
+        return None
+    wanted = list(keys)
+    cutoff = _utcnow() - timedelta(seconds=get_settings().stats_counter_max_age_seconds)
+    rows = (
+        db.query(UserStatCounter.counter_key, UserStatCounter.value)
+        .filter(UserStatCounter.user_id == user_id)
+        .filter(UserStatCounter.counter_key.in_(wanted))
+        .filter(UserStatCounter.refreshed_at >= cutoff)
+        .all()
+    )
+    values = {str(key): max(int(value or 0), 0) for key, value in rows}
+    if len(values) != len(wanted):
+        return None
+    return values
+
+
+def store_reconciled_counters(
+    *,
+    user_id: int,
+    values: dict[str, int],
+    computed_at: datetime,
+) -> None:
+    """Persist freshly computed counters in their own transaction.
+
+    Stats endpoints read through read-only sessions, so this always opens a new one. A
+    row that received a delta after ``computed_at`` is left alone; its value already
+    reflects a write the computation may have missed.
+    """
+    if not values or not counters_enabled():
+        return
+    now = _utcnow()
+    stmt = postgresql_insert(UserStatCounter).values(
+        [
+            {
+                "user_id": user_id,
+                "counter_key": key,
+                "value": int(value),
+                "refreshed_at": now,
+                "updated_at": computed_at,
+            }
+            for key, value in values.items()
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserStatCounter.user_id, UserStatCounter.counter_key],
+        set_={
+            "value": stmt.excluded.value,
+            "refreshed_at": stmt.excluded.refreshed_at,
+            "updated_at": stmt.excluded.updated_at,
+        },
+        where=UserStatCounter.updated_at <= computed_at,
+    )
+    try:
+        with get_db() as db:
+            db.execute(stmt)
+    except SQLAlchemyError:
+        logger.warning(
+            "Failed to store reconciled stat counters",
+            exc_info=True,
+            extra={
+                "component": "stat_counters",
+                "operation": "store_reconciled",
+                "context_data": {"user_id": user_id},
+            },
+        )
+
+
+def apply_counter_deltas(db: Session, *, user_id: int, deltas: dict[str, int]) -> None:
+    """Adjust existing counters in the caller's transaction; missing rows are left missing."""
+    if not counters_enabled():
+        return
+    now = _utcnow()
+    for key, delta in deltas.items():
+        if not delta:
+            continue
+        db.execute(
+            update(UserStatCounter)
+            .where(UserStatCounter.user_id == user_id, UserStatCounter.counter_key == key)
+            .values(
+                value=func.greatest(UserStatCounter.value + delta, 0),
+                updated_at=now,
+            )
+        )
+
+
+def apply_content_unread_deltas(
+    db: Session,
+    *,
+    user_id: int,
+    content_ids: Iterable[int],
+    delta: int,
+    require_unread: bool = False,
+) -> None:
+    """Apply ``delta`` for each listed content item that counts toward the user's badges.
+
+    An item counts when it is completed, not classified ``skip``, and in the user's
+    inbox; ``require_unread`` additionally excludes items the user has already read.
+    """
+    ids = sorted({content_id for content_id in content_ids if content_id is not None})
+    if not ids or not counters_enabled():
+        return
+    query = (
+        db.query(Content.content_type, Content.platform)
+        .join(ContentStatusEntry, ContentStatusEntry.content_id == Content.id)
+        .filter(Content.id.in_(ids))
+        .filter(ContentStatusEntry.user_id == user_id)
+        .filter(ContentStatusEntry.status == "inbox")
+        .filter(Content.status == ContentStatus.COMPLETED.value)
+        .filter(or_(Content.classification != "skip", Content.classification.is_(None)))
+    )
+    if require_unread:
+        query = query.filter(
+            ~exists(
+                select(ContentReadStatus.id).where(
+                    and_(
+                        ContentReadStatus.user_id == user_id,
+                        ContentReadStatus.content_id == Content.id,
+                    )
+                )
+            )
+        )
+    deltas: Counter[str] = Counter()
+    for content_type, platform in query.all():
+        for key in counter_keys_for_content(content_type, platform):
+            deltas[key] += delta
+    apply_counter_deltas(db, user_id=user_id, deltas=dict(deltas))
+
+
+def invalidate_user_counters(db: Session, *, user_ids: Iterable[int]) -> None:
+    """Drop counters so the next read recomputes them; runs in the caller's transaction."""
+    ids = sorted(set(user_ids))
+    if not ids or not counters_enabled():
+        return
+    db.execute(delete(UserStatCounter).where(UserStatCounter.user_id.in_(ids)))
+
+
+def invalidate_counters_for_content(db: Session, *, content_id: int) -> None:
+    """Drop counters of every user whose inbox holds ``content_id``.
+
+    Used on pipeline status transitions, which can change visibility for several users
+    at once.
+    """
+    if not counters_enabled():
+        return
+    db.execute(
+        delete(UserStatCounter).where(
+            UserStatCounter.user_id.in_(
+                select(ContentStatusEntry.user_id).where(
+                    ContentStatusEntry.content_id == content_id,
+                    ContentStatusEntry.status == "inbox",
+                )
+            )
+        )
+    )
+
+
+def list_stale_counter_user_ids(db: Session, *, limit: int) -> list[int]:
+    """Return users whose oldest counter is past the max age, oldest first."""
+    cutoff = _utcnow() - timedelta(seconds=get_settings().stats_counter_max_age_seconds)
+    rows = (
+        db.query(UserStatCounter.user_id, func.min(UserStatCounter.refreshed_at))
+        .group_by(UserStatCounter.user_id)
+        .having(func.min(UserStatCounter.refreshed_at) < cutoff)
+        .order_by(func.min(UserStatCounter.refreshed_at))
+        .limit(limit)
+        .all()
+    )
+    return [int(user_id) for user_id, _refreshed_at in rows]
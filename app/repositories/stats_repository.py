@@ -18,6 +18,7 @@ from app.models.schema import (
     NewsItem,
     ProcessingTask,
 )
+from app.repositories import stat_counter_repository
 from app.repositories.content_repository import apply_visibility_filters, build_visibility_context
 from app.services.news_feed import build_visible_news_item_filter, count_unread_news_items
 
@@ -60,7 +61,34 @@ def _build_active_generate_image_filter() -> ColumnElement[bool]:
 
 
 def get_unread_counts(db: Session, *, user_id: int) -> dict[str, int]:
-    """Return unread counts by content type."""
+    """Return unread counts by content type, from counters when they are fresh."""
+    cached = stat_counter_repository.load_fresh_counters(
+        db,
+        user_id=user_id,
+        keys=stat_counter_repository.UNREAD_COUNT_COUNTERS,
+    )
+    if cached is not None:
+        return {
+            "article": cached[stat_counter_repository.UNREAD_ARTICLE_COUNTER],
+            "podcast": cached[stat_counter_repository.UNREAD_PODCAST_COUNTER],
+            "news": cached[stat_counter_repository.UNREAD_NEWS_COUNTER],
+        }
+
+    computed_at = datetime.now(UTC).replace(tzinfo=None)
+    counts = _compute_unread_counts(db, user_id=user_id)
+    stat_counter_repository.store_reconciled_counters(
+        user_id=user_id,
+        values={
+            stat_counter_repository.UNREAD_ARTICLE_COUNTER: counts["article"],
+            stat_counter_repository.UNREAD_PODCAST_COUNTER: counts["podcast"],
+            stat_counter_repository.UNREAD_NEWS_COUNTER: counts["news"],
+        },
+        computed_at=computed_at,
+    )
+    return counts
+
+
+def _compute_unread_counts(db: Session, *, user_id: int) -> dict[str, int]:
     context = build_visibility_context(user_id)
     count_query = db.query(Content.content_type, func.count(Content.id))
     count_query = apply_visibility_filters(count_query, context)
@@ -137,7 +165,43 @@ def get_processing_count(db: Session, *, user_id: int) -> dict[str, int]:
 
 
 def get_long_form_stats(db: Session, *, user_id: int) -> dict[str, int]:
-    """Return unread long-form stats for the user."""
+    """Return unread long-form stats for the user, from counters when they are fresh."""
+    cached = stat_counter_repository.load_fresh_counters(
+        db,
+        user_id=user_id,
+        keys=[stat_counter_repository.LONG_FORM_UNREAD_COUNTER],
+    )
+    if cached is not None:
+        return {"unread_count": cached[stat_counter_repository.LONG_FORM_UNREAD_COUNTER]}
+
+    computed_at = datetime.now(UTC).replace(tzinfo=None)
+    stats = _compute_long_form_stats(db, user_id=user_id)
+    stat_counter_repository.store_reconciled_counters(
+        user_id=user_id,
+        values={stat_counter_repository.LONG_FORM_UNREAD_COUNTER: stats["unread_count"]},
+        computed_at=computed_at,
+    )
+    return stats
+
+
+def reconcile_stat_counters(db: Session, *, user_id: int) -> None:
+    """Recompute and store every counter for one user, correcting any drift."""
+    computed_at = datetime.now(UTC).replace(tzinfo=None)
+    counts = _compute_unread_counts(db, user_id=user_id)
+    long_form = _compute_long_form_stats(db, user_id=user_id)
+    stat_counter_repository.store_reconciled_counters(
+        user_id=user_id,
+        values={
+            stat_counter_repository.UNREAD_ARTICLE_COUNTER: counts["article"],
+            stat_counter_repository.UNREAD_PODCAST_COUNTER: counts["podcast"],
+            stat_counter_repository.UNREAD_NEWS_COUNTER: counts["news"],
+            stat_counter_repository.LONG_FORM_UNREAD_COUNTER: long_form["unread_count"],
+        },
+        computed_at=computed_at,
+    )
+
+
+def _compute_long_form_stats(db: Session, *, user_id: int) -> dict[str, int]:
     long_form_types = {ContentType.ARTICLE.value, ContentType.PODCAST.value}
     inbox_filter = (
         ContentStatusEntry.user_id == user_id,
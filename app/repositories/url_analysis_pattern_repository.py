@@ -0,0 +1,93 @@
+"""Repository for learned host/path-shape URL analysis outcomes.
+
+Each row keeps the most recent LLM outcome for one host and path shape, plus how many
+consecutive analyses agreed with it (``streak``). A disagreeing analysis replaces the
+outcome and restarts the streak, so mixed shapes never become confident.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import and_, case
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.core.logging import get_logger
+from app.models.schema import UrlAnalysisPattern
+
+logger = get_logger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def get_url_analysis_pattern(
+    db: Session,
+    *,
+    host: str,
+    path_shape: str,
+) -> UrlAnalysisPattern | None:
+    """Return the learned outcome for a host and path shape, if any."""
+    return (
+        db.query(UrlAnalysisPattern)
+        .filter(UrlAnalysisPattern.host == host, UrlAnalysisPattern.path_shape == path_shape)
+        .first()
+    )
+
+
+def record_url_analysis_observation(
+    *,
+    host: str,
+    path_shape: str,
+    content_type: str,
+    platform: str | None,
+    has_media_url: bool,
+) -> None:
+    """Fold one LLM analysis into its pattern row in its own transaction.
+
+    Analysis flows commit content updates separately, so a failed or conflicting write
+    here never rolls back the analysis result.
+    """
+    stmt = postgresql_insert(UrlAnalysisPattern).values(
+        host=host,
+        path_shape=path_shape,
+        content_type=content_type,
+        platform=platform,
+        has_media_url=has_media_url,
+        streak=1,
+        observations=1,
+        updated_at=_utcnow(),
+    )
+    same_outcome = and_(
+        UrlAnalysisPattern.content_type == stmt.excluded.content_type,
+        UrlAnalysisPattern.platform.is_not_distinct_from(stmt.excluded.platform),
+        UrlAnalysisPattern.has_media_url == stmt.excluded.has_media_url,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UrlAnalysisPattern.host, UrlAnalysisPattern.path_shape],
+        set_={
+            "streak": case((same_outcome, UrlAnalysisPattern.streak + 1), else_=1),
+            "observations": UrlAnalysisPattern.observations + 1,
+            "content_type": stmt.excluded.content_type,
+            "platform": stmt.excluded.platform,
+            "has_media_url": stmt.excluded.has_media_url,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    try:
+        with get_db() as db:
+            db.execute(stmt)
+    except SQLAlchemyError:
+        logger.warning(
+            "Failed to record URL analysis pattern",
+            exc_info=True,
+            extra={
+                "component": "url_analysis_patterns",
+                "operation": "record_observation",
+                "context_data": {"host": host, "path_shape": path_shape},
+            },
+        )
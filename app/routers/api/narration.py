@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.db import get_readonly_db_session
@@ -12,10 +13,16 @@ from app.core.deps import get_current_user, require_user_id
 from app.models.api.common import NarrationResponse
 from app.models.user import User
 from app.queries import get_narration as get_narration_query
-from app.services.voice.narration_tts import get_digest_narration_tts_service
+from app.services.voice.narration_audio_cache import (
+    NARRATION_AUDIO_CONTENT_TYPE,
+    get_narration_audio_cache,
+)
 
 router = APIRouter()
 
+# Audio is addressed by text and voice settings, so a cached object never changes.
+CACHED_AUDIO_CACHE_CONTROL = "private, max-age=86400"
+
 
 def _prefers_audio(request: Request) -> bool:
     """Return whether the client explicitly asked for audio bytes."""
@@ -24,6 +31,44 @@ def _prefers_audio(request: Request) -> bool:
     return "audio/mpeg" in accept_header.lower()
 
 
+def _parse_byte_range(range_header: str | None, size_bytes: int) -> tuple[int, int] | None:
+    """Return the inclusive byte range requested by a single-range ``Range`` header.
+
+    Returns ``None`` when the header is absent, malformed or multi-range, in which case
+    the full body is served. Raises 416 when the range starts past the end of the file.
+    """
+
+    if not range_header:
+        return None
+    unit, _, spec = range_header.strip().partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_text, separator, end_text = spec.strip().partition("-")
+    if not separator:
+        return None
+    try:
+        if start_text:
+            start = int(start_text)
+            end = int(end_text) if end_text else size_bytes - 1
+        else:
+            suffix_length = int(end_text)
+            if suffix_length <= 0:
+                return None
+            start = max(size_bytes - suffix_length, 0)
+            end = size_bytes - 1
+    except ValueError:
+        return None
+    if start < 0 or end < start:
+        return None
+    if start >= size_bytes:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size_bytes}"},
+        )
+    return start, min(end, size_bytes - 1)
+
+
 @router.get(
     "/narration/{target_type}/{target_id}",
     response_model=NarrationResponse,
@@ -56,8 +101,36 @@ def get_narration(
     )
 
     if _prefers_audio(request):
+        audio_cache = get_narration_audio_cache()
+        cache_key = audio_cache.cache_key(payload.narration_text)
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": f'inline; filename="{payload.audio_filename}"',
+        }
+
+        cached = audio_cache.lookup(cache_key)
+        if cached is not None:
+            headers["Cache-Control"] = CACHED_AUDIO_CACHE_CONTROL
+            headers["ETag"] = f'"{cache_key.rsplit("/", 1)[-1].removesuffix(".mp3")}"'
+            byte_range = _parse_byte_range(request.headers.get("range"), cached.size_bytes)
+            if byte_range is None:
+                return Response(
+                    content=audio_cache.read(cached.key),
+                    media_type=NARRATION_AUDIO_CONTENT_TYPE,
+                    headers=headers,
+                )
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{cached.size_bytes}"
+            return Response(
+                content=audio_cache.read(cached.key, start=start, end=end),
+                status_code=206,
+                media_type=NARRATION_AUDIO_CONTENT_TYPE,
+                headers=headers,
+            )
+
         try:
-            audio_bytes = get_digest_narration_tts_service().synthesize_mp3(
+            audio_chunks = audio_cache.stream_and_store(
+                key=cache_key,
                 text=payload.narration_text,
                 item_id=payload.target_id,
                 user_id=user_id,
@@ -67,13 +140,12 @@ def get_narration(
         except RuntimeError as exc:
             raise HTTPException(status_code=503, detail=str(exc)) from exc
 
-        return Response(
-            content=audio_bytes,
-            media_type="audio/mpeg",
-            headers={
-                "Cache-Control": "no-store",
-                "Content-Disposition": f'inline; filename="{payload.audio_filename}"',
-            },
+        # Length is unknown until synthesis finishes, so a miss is always a full 200.
+        headers["Cache-Control"] = "no-store"
+        return StreamingResponse(
+            audio_chunks,
+            media_type=NARRATION_AUDIO_CONTENT_TYPE,
+            headers=headers,
         )
 
     return NarrationResponse(
@@ -2,11 +2,15 @@ from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from typing import Any
 
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
 from app.core.db import get_db
 from app.core.logging import get_logger
 from app.models.metadata import ContentStatus, ContentType
 from app.models.schema import Content
 from app.models.scraper_runs import ScraperStats
+from app.scraping.feed_fetcher import FeedFetchResult, commit_feed_validators, fetch_feeds
 from app.services.long_form_images import enqueue_visible_long_form_image_if_needed
 from app.services.news_ingestion import (
     build_news_item_upsert_input_from_scraped_item,
@@ -16,8 +20,7 @@ from app.services.news_ingestion import (
 from app.services.queue import TaskType, get_queue_service
 from app.services.scraper_configs import (
     ensure_inbox_status,
-    list_active_user_ids,
-    should_add_to_inbox,
+    ensure_inbox_statuses,
 )
 from app.utils.url_utils import is_http_url, normalize_http_url
 
@@ -52,6 +55,10 @@ class BaseScraper(ABC):
     def __init__(self, name: str):
         self.name = name
         self.queue_service = get_queue_service()
+        # When set, feed-based scrapers only fetch these feed URLs (scheduled scrapes).
+        self.feed_url_filter: set[str] | None = None
+        # Feed responses whose validators are committed once their items are saved.
+        self._pending_feed_results: dict[str, FeedFetchResult] = {}
 
     @abstractmethod
     def scrape(self) -> list[dict[str, Any]]:
@@ -76,6 +83,7 @@ class BaseScraper(ABC):
         logger.info(f"Running {self.name} scraper")
 
         stats = ScraperStats()
+        self._pending_feed_results = {}
 
         try:
             # Scrape items
@@ -89,6 +97,8 @@ class BaseScraper(ABC):
             stats.duplicates = save_stats["duplicates"]
             stats.errors = save_stats["errors"]
             stats.error_details = save_stats["error_details"]
+            # Feeds with failed item saves were dropped from the pending results.
+            commit_feed_validators(self._pending_feed_results.values())
 
             logger.info(
                 f"Saved {stats.saved} new items from {self.name} "
@@ -102,25 +112,71 @@ class BaseScraper(ABC):
 
         return stats
 
+    def _filter_feeds(self, feeds: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Restrict feed payloads to ``feed_url_filter`` when one is set."""
+        if self.feed_url_filter is None:
+            return feeds
+        return [
+            feed
+            for feed in feeds
+            if isinstance(feed, dict) and feed.get("url") in self.feed_url_filter
+        ]
+
+    def _fetch_feeds(self, feeds: list[dict[str, Any]]) -> dict[str, FeedFetchResult]:
+        """Fetch feed payloads, deferring their validators until items are saved."""
+        subscribed_at: dict[str, datetime | None] = {}
+        for feed in feeds:
+            if not isinstance(feed, dict) or not feed.get("url"):
+                continue
+            feed_url = feed["url"]
+            current = subscribed_at.get(feed_url)
+            candidate = feed.get("subscribed_at")
+            if current is None or (candidate is not None and candidate > current):
+                subscribed_at[feed_url] = candidate
+        results = fetch_feeds(list(subscribed_at), subscribed_at=subscribed_at)
+        self._pending_feed_results = dict(results)
+        return results
+
+    def _discard_feed_validators(self, feed_url: str | None) -> None:
+        """Keep a feed's previous validators when scraping its entries failed."""
+        if feed_url:
+            self._pending_feed_results.pop(feed_url, None)
+
+    def _discard_item_feed_validators(self, item: dict[str, Any]) -> None:
+        """Keep the previous validators of the feed an unsaved item came from."""
+        metadata = item.get("metadata")
+        if isinstance(metadata, dict):
+            self._discard_feed_validators(metadata.get("feed_url"))
+
     def _save_items(self, items: list[dict[str, Any]]) -> int:
         """Save scraped items to database. Returns saved count for backward compatibility."""
         stats = self._save_items_with_stats(items)
         return stats["saved"]
 
     def _save_items_with_stats(self, items: list[dict[str, Any]]) -> dict[str, Any]:
-        """Save scraped items to database and return detailed statistics."""
-        saved_count = 0
-        duplicate_count = 0
-        error_count = 0
-        error_details = []
+        """Save scraped items to database and return detailed statistics.
+
+        Content items are saved set-based: one lookup for existing rows, one
+        ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` and one multi-row task
+        enqueue per batch. If the bulk write fails, items are retried one at a
+        time so errors are still reported per item.
+
+        Only user-scoped items get ``content_status`` inbox rows. Items without a
+        ``user_id`` are global and reach every inbox through the visibility rule in
+        ``build_user_feed_query``, so no per-user rows are written for them.
+        """
+        stats: dict[str, Any] = {
+            "saved": 0,
+            "duplicates": 0,
+            "errors": 0,
+            "error_details": [],
+        }
 
         with get_db() as db:
-            active_user_ids: list[int] | None = None
+            prepared_items: list[dict[str, Any]] = []
             for item in items:
                 try:
-                    user_id = item.get("user_id")
                     content_type_value = item["content_type"].value
-                    metadata = item.get("metadata", {})
 
                     if content_type_value == ContentType.NEWS.value:
                         payload = build_news_item_upsert_input_from_scraped_item(item)
@@ -137,139 +193,286 @@ class BaseScraper(ABC):
                                 dedupe=False,
                             )
                         if was_created:
-                            saved_count += 1
+                            stats["saved"] += 1
                         else:
-                            duplicate_count += 1
+                            stats["duplicates"] += 1
                         continue
 
-                    raw_url = item.get("source_url") or item["url"]
-                    canonical_url = normalize_http_url(item["url"]) or normalize_http_url(raw_url)
-
-                    if not canonical_url and content_type_value == ContentType.NEWS.value:
-                        article = metadata.get("article")
-                        if isinstance(article, dict):
-                            canonical_url = normalize_http_url(article.get("url"))
-
-                    if not is_http_url(canonical_url):
-                        logger.warning(
-                            "Skipping scraped item with invalid URL: %s",
-                            raw_url,
-                            extra={
-                                "component": "scraper_base",
-                                "operation": "save_item",
-                                "context_data": {
-                                    "raw_url": raw_url,
-                                    "content_type": content_type_value,
-                                },
-                            },
-                        )
-                        error_count += 1
-                        error_details.append(f"Invalid URL: {raw_url}")
-                        continue
-                    # Check if already exists
-                    existing = (
-                        db.query(Content)
-                        .filter(
-                            Content.url == canonical_url,
-                            Content.content_type == content_type_value,
-                        )
-                        .first()
-                    )
-
-                    if existing:
-                        existing_id = existing.id
-                        inbox_created = False
-                        if should_add_to_inbox(content_type_value) and existing_id is not None:
-                            if user_id is not None:
-                                inbox_created = ensure_inbox_status(
-                                    db,
-                                    user_id=user_id,
-                                    content_id=existing_id,
-                                    content_type=content_type_value,
-                                )
-                            elif content_type_value == ContentType.NEWS.value:
-                                if active_user_ids is None:
-                                    active_user_ids = list_active_user_ids(db)
-                                for active_user_id in active_user_ids:
-                                    if ensure_inbox_status(
-                                        db,
-                                        user_id=active_user_id,
-                                        content_id=existing_id,
-                                        content_type=content_type_value,
-                                    ):
-                                        inbox_created = True
-                        if inbox_created:
-                            db.commit()
-                            enqueue_visible_long_form_image_if_needed(db, existing)
-                        logger.debug(f"URL already exists: {item['url']}")
-                        duplicate_count += 1
+                    prepared = self._prepare_content_item(item)
+                    if prepared is None:
+                        raw_url = item.get("source_url") or item["url"]
+                        stats["errors"] += 1
+                        stats["error_details"].append(f"Invalid URL: {raw_url}")
+                        self._discard_item_feed_validators(item)
                         continue
-
-                    # Create new content
-                    content = Content(
-                        content_type=content_type_value,
-                        url=canonical_url,
-                        source_url=raw_url,
-                        title=item.get("title"),
-                        source=metadata.get("source"),  # Extract source from metadata
-                        platform=metadata.get("platform"),  # Extract platform from metadata
-                        is_aggregate=bool(item.get("is_aggregate", False)),
-                        status=ContentStatus.NEW.value,
-                        content_metadata=metadata,
-                        created_at=datetime.now(UTC),
-                    )
-
-                    db.add(content)
-                    db.flush()
-                    content_id = content.id
-
-                    if should_add_to_inbox(content_type_value) and content_id is not None:
-                        if user_id is not None:
-                            ensure_inbox_status(
-                                db,
-                                user_id=user_id,
-                                content_id=content_id,
-                                content_type=content_type_value,
-                            )
-                        elif content_type_value == ContentType.NEWS.value:
-                            if active_user_ids is None:
-                                active_user_ids = list_active_user_ids(db)
-                            for active_user_id in active_user_ids:
-                                ensure_inbox_status(
-                                    db,
-                                    user_id=active_user_id,
-                                    content_id=content_id,
-                                    content_type=content_type_value,
-                                )
-
-                    db.commit()
-                    db.refresh(content)
-
-                    # Queue for processing
-                    self.queue_service.enqueue(TaskType.PROCESS_CONTENT, content_id=content.id)
-                    if content_type_value == ContentType.NEWS.value:
-                        self.queue_service.enqueue(TaskType.FETCH_DISCUSSION, content_id=content.id)
-
-                    saved_count += 1
+                    prepared_items.append(prepared)
 
                 except Exception as e:
                     db.rollback()
-                    if "UNIQUE constraint failed" in str(e) or "duplicate key value" in str(e):
-                        logger.debug(f"URL already exists (race condition): {item['url']}")
-                        duplicate_count += 1
-                    else:
-                        logger.error(f"Error saving item {item['url']}: {e}")
-                        error_count += 1
-                        error_details.append(f"Error saving {item.get('url', 'unknown')}: {str(e)}")
+                    self._record_save_error(item, e, stats)
                     continue
 
+            if not prepared_items:
+                return stats
+
+            try:
+                saved, duplicates, tasks, inbox_updated = self._bulk_save_content_items(
+                    db,
+                    prepared_items,
+                )
+            except Exception as e:
+                db.rollback()
+                logger.warning(
+                    "Bulk save failed for %s items; saving individually: %s",
+                    len(prepared_items),
+                    e,
+                    extra={
+                        "component": "scraper_base",
+                        "operation": "bulk_save_items",
+                        "context_data": {"scraper": self.name, "item_count": len(prepared_items)},
+                    },
+                )
+                for prepared in prepared_items:
+                    try:
+                        if self._save_content_item(db, prepared):
+                            stats["saved"] += 1
+                        else:
+                            stats["duplicates"] += 1
+                    except Exception as item_error:
+                        db.rollback()
+                        self._record_save_error(prepared["item"], item_error, stats)
+                return stats
+
+            stats["saved"] += saved
+            stats["duplicates"] += duplicates
+            for existing in inbox_updated:
+                enqueue_visible_long_form_image_if_needed(db, existing)
+            if tasks:
+                self.queue_service.enqueue_content_tasks(tasks)
+
+        return stats
+
+    def _prepare_content_item(self, item: dict[str, Any]) -> dict[str, Any] | None:
+        """Normalize one scraped content item, or return None when its URL is invalid.
+
+        News items never reach this point; they are upserted as news items first.
+        """
+        content_type_value = item["content_type"].value
+        metadata = item.get("metadata", {})
+        raw_url = item.get("source_url") or item["url"]
+        canonical_url = normalize_http_url(item["url"]) or normalize_http_url(raw_url)
+
+        if not is_http_url(canonical_url):
+            logger.warning(
+                "Skipping scraped item with invalid URL: %s",
+                raw_url,
+                extra={
+                    "component": "scraper_base",
+                    "operation": "save_item",
+                    "context_data": {
+                        "raw_url": raw_url,
+                        "content_type": content_type_value,
+                    },
+                },
+            )
+            return None
+
         return {
-            "saved": saved_count,
-            "duplicates": duplicate_count,
-            "errors": error_count,
-            "error_details": error_details,
+            "item": item,
+            "user_id": item.get("user_id"),
+            "content_type": content_type_value,
+            "canonical_url": canonical_url,
+            "raw_url": raw_url,
+            "metadata": metadata,
+        }
+
+    def _bulk_save_content_items(
+        self,
+        db,
+        prepared_items: list[dict[str, Any]],
+    ) -> tuple[int, int, list[tuple[TaskType, int]], list[Content]]:
+        """Insert new content rows for a batch in one transaction.
+
+        Returns saved and duplicate counts, the processing tasks to enqueue and
+        the existing rows that gained inbox entries.
+        """
+        keys = list(
+            dict.fromkeys(
+                (prepared["canonical_url"], prepared["content_type"]) for prepared in prepared_items
+            )
+        )
+        existing_by_key = {
+            (content.url, content.content_type): content
+            for content in db.query(Content)
+            .filter(tuple_(Content.url, Content.content_type).in_(keys))
+            .all()
         }
 
+        new_by_key: dict[tuple[str, str], dict[str, Any]] = {}
+        for prepared in prepared_items:
+            key = (prepared["canonical_url"], prepared["content_type"])
+            if key not in existing_by_key and key not in new_by_key:
+                new_by_key[key] = prepared
+
+        inserted_ids: dict[tuple[str, str], int] = {}
+        if new_by_key:
+            created_at = datetime.now(UTC)
+            insert_stmt = (
+                postgresql_insert(Content)
+                .values(
+                    [
+                        {
+                            "content_type": prepared["content_type"],
+                            "url": prepared["canonical_url"],
+                            "source_url": prepared["raw_url"],
+                            "title": prepared["item"].get("title"),
+                            "source": prepared["metadata"].get("source"),
+                            "platform": prepared["metadata"].get("platform"),
+                            "is_aggregate": bool(prepared["item"].get("is_aggregate", False)),
+                            "status": ContentStatus.NEW.value,
+                            "content_metadata": prepared["metadata"],
+                            "created_at": created_at,
+                        }
+                        for prepared in new_by_key.values()
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=[Content.url, Content.content_type])
+                .returning(Content.id, Content.url, Content.content_type)
+            )
+            inserted_ids = {
+                (row.url, row.content_type): row.id for row in db.execute(insert_stmt).all()
+            }
+
+        inbox_entries: list[tuple[int | None, int, str]] = []
+        for prepared in prepared_items:
+            target_id = self._saved_content_id(prepared, inserted_ids, existing_by_key)
+            if target_id is not None:
+                inbox_entries.append((prepared["user_id"], target_id, prepared["content_type"]))
+        inbox_added = ensure_inbox_statuses(db, inbox_entries)
+
+        saved = 0
+        duplicates = 0
+        tasks: list[tuple[TaskType, int]] = []
+        inbox_updated_existing: dict[int, Content] = {}
+        for prepared in prepared_items:
+            key = (prepared["canonical_url"], prepared["content_type"])
+            content_id = inserted_ids.get(key)
+            existing = existing_by_key.get(key)
+
+            if content_id is not None and new_by_key.get(key) is prepared:
+                tasks.append((TaskType.PROCESS_CONTENT, content_id))
+                if prepared["content_type"] == ContentType.NEWS.value:
+                    tasks.append((TaskType.FETCH_DISCUSSION, content_id))
+                saved += 1
+                continue
+
+            if existing is not None and (prepared["user_id"], existing.id) in inbox_added:
+                inbox_updated_existing[existing.id] = existing
+            logger.debug(f"URL already exists: {prepared['item']['url']}")
+            duplicates += 1
+
+        db.commit()
+        return saved, duplicates, tasks, list(inbox_updated_existing.values())
+
+    @staticmethod
+    def _saved_content_id(
+        prepared: dict[str, Any],
+        inserted_ids: dict[tuple[str, str], int],
+        existing_by_key: dict[tuple[str, str], Content],
+    ) -> int | None:
+        """Return the content row id a prepared item resolved to after the bulk insert."""
+        key = (prepared["canonical_url"], prepared["content_type"])
+        content_id = inserted_ids.get(key)
+        if content_id is not None:
+            return content_id
+        existing = existing_by_key.get(key)
+        return existing.id if existing is not None else None
+
+    def _save_content_item(
+        self,
+        db,
+        prepared: dict[str, Any],
+    ) -> bool:
+        """Save one prepared content item. Returns False when it already exists."""
+        item = prepared["item"]
+        content_type_value = prepared["content_type"]
+        metadata = prepared["metadata"]
+
+        existing = (
+            db.query(Content)
+            .filter(
+                Content.url == prepared["canonical_url"],
+                Content.content_type == content_type_value,
+            )
+            .first()
+        )
+
+        if existing:
+            existing_id = existing.id
+            inbox_created = False
+            if existing_id is not None:
+                inbox_created = ensure_inbox_status(
+                    db,
+                    user_id=prepared["user_id"],
+                    content_id=existing_id,
+                    content_type=content_type_value,
+                )
+            if inbox_created:
+                db.commit()
+                enqueue_visible_long_form_image_if_needed(db, existing)
+            logger.debug(f"URL already exists: {item['url']}")
+            return False
+
+        content = Content(
+            content_type=content_type_value,
+            url=prepared["canonical_url"],
+            source_url=prepared["raw_url"],
+            title=item.get("title"),
+            source=metadata.get("source"),  # Extract source from metadata
+            platform=metadata.get("platform"),  # Extract platform from metadata
+            is_aggregate=bool(item.get("is_aggregate", False)),
+            status=ContentStatus.NEW.value,
+            content_metadata=metadata,
+            created_at=datetime.now(UTC),
+        )
+
+        db.add(content)
+        db.flush()
+        content_id = content.id
+
+        if content_id is not None:
+            ensure_inbox_status(
+                db,
+                user_id=prepared["user_id"],
+                content_id=content_id,
+                content_type=content_type_value,
+            )
+
+        db.commit()
+        db.refresh(content)
+
+        # Queue for processing
+        self.queue_service.enqueue(TaskType.PROCESS_CONTENT, content_id=content.id)
+        if content_type_value == ContentType.NEWS.value:
+            self.queue_service.enqueue(TaskType.FETCH_DISCUSSION, content_id=content.id)
+        return True
+
+    def _record_save_error(
+        self,
+        item: dict[str, Any],
+        error: Exception,
+        stats: dict[str, Any],
+    ) -> None:
+        """Count one failed item save as a duplicate or an error."""
+        if "UNIQUE constraint failed" in str(error) or "duplicate key value" in str(error):
+            logger.debug(f"URL already exists (race condition): {item['url']}")
+            stats["duplicates"] += 1
+        else:
+            logger.error(f"Error saving item {item['url']}: {error}")
+            stats["errors"] += 1
+            stats["error_details"].append(f"Error saving {item.get('url', 'unknown')}: {error!s}")
+            self._discard_item_feed_validators(item)
+
     def _normalize_url(self, url: str) -> str:
         """Normalize URL for consistency."""
         # Remove trailing slashes
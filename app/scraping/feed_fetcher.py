@@ -0,0 +1,289 @@
+"""Parallel, conditional-GET feed fetching shared by the RSS/Atom scrapers."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import urlparse
+
+import feedparser
+
+from app.core.db import get_db
+from app.core.logging import get_logger
+from app.core.settings import get_settings
+from app.models.schema import FeedFetchState
+
+logger = get_logger(__name__)
+
+HTTP_NOT_MODIFIED = 304
+MAX_ERROR_LENGTH = 1000
+# Newest entry publication dates kept per feed for the poll scheduler.
+PUBLISHED_AT_SAMPLE_SIZE = 6
+
+
+@dataclass
+class FeedFetchResult:
+    """Outcome of fetching one feed URL."""
+
+    feed_url: str
+    parsed_feed: Any | None = None
+    not_modified: bool = False
+    status_code: int | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    published_at: list[datetime] = field(default_factory=list)
+    error: Exception | None = None
+
+    def feed_or_raise(self) -> Any | None:
+        """Return the parsed feed, ``None`` when unchanged, or raise the fetch error."""
+        if self.error is not None:
+            raise self.error
+        if self.not_modified:
+            return None
+        return self.parsed_feed
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _string_or_none(value: Any, *, max_length: int) -> str | None:
+    if isinstance(value, str) and value.strip():
+        return value.strip()[:max_length]
+    return None
+
+
+def _feed_host(feed_url: str) -> str:
+    try:
+        return urlparse(feed_url).netloc.lower()
+    except ValueError:
+        return ""
+
+
+def _entry_publication_dates(parsed_feed: Any) -> list[datetime]:
+    """Return the newest entry publication dates advertised by a parsed feed."""
+    dates: set[datetime] = set()
+    for entry in getattr(parsed_feed, "entries", None) or []:
+        published = entry.get("published_parsed") or entry.get("updated_parsed")
+        if not published:
+            continue
+        try:
+            dates.add(datetime(*published[:6]))
+        except (TypeError, ValueError):
+            continue
+    return sorted(dates, reverse=True)[:PUBLISHED_AT_SAMPLE_SIZE]
+
+
+def _load_validators(
+    feed_urls: Sequence[str],
+    subscribed_at: Mapping[str, datetime | None],
+) -> dict[str, tuple[str | None, str | None]]:
+    """Return committed ``(etag, last_modified)`` validators keyed by feed URL.
+
+    Validators are skipped for feeds that gained a subscriber after they were
+    committed, so the new subscriber's first scrape backfills from a full response.
+    """
+    try:
+        with get_db() as db:
+            rows = (
+                db.query(
+                    FeedFetchState.feed_url,
+                    FeedFetchState.etag,
+                    FeedFetchState.last_modified,
+                    FeedFetchState.validators_saved_at,
+                )
+                .filter(FeedFetchState.feed_url.in_(feed_urls))
+                .all()
+            )
+    except Exception:
+        logger.warning(
+            "Unable to load feed validators; fetching feeds unconditionally",
+            exc_info=True,
+            extra={"component": "feed_fetcher", "operation": "load_validators"},
+        )
+        return {}
+
+    validators: dict[str, tuple[str | None, str | None]] = {}
+    for row in rows:
+        if row.validators_saved_at is None:
+            continue
+        newest_subscription = subscribed_at.get(row.feed_url)
+        if newest_subscription is not None and newest_subscription >= row.validators_saved_at:
+            continue
+        validators[row.feed_url] = (row.etag, row.last_modified)
+    return validators
+
+
+def _save_fetch_states(results: Sequence[FeedFetchResult]) -> None:
+    """Persist fetch counters and entry publication dates for a batch of fetches.
+
+    Validators are not written here; see ``commit_feed_validators``.
+    """
+    if not results:
+        return
+    now = _utc_now()
+    try:
+        with get_db() as db:
+            states = {
+                state.feed_url: state
+                for state in db.query(FeedFetchState)
+                .filter(FeedFetchState.feed_url.in_([result.feed_url for result in results]))
+                .all()
+            }
+            for result in results:
+                state = states.get(result.feed_url)
+                if state is None:
+                    state = FeedFetchState(
+                        feed_url=result.feed_url,
+                        fetch_count=0,
+                        not_modified_count=0,
+                        consecutive_failures=0,
+                    )
+                    db.add(state)
+
+                state.fetch_count = (state.fetch_count or 0) + 1
+                state.last_fetched_at = now
+                state.last_status_code = result.status_code
+                if result.error is not None:
+                    state.consecutive_failures = (state.consecutive_failures or 0) + 1
+                    state.last_error = str(result.error)[:MAX_ERROR_LENGTH]
+                    continue
+
+                state.consecutive_failures = 0
+                state.last_error = None
+                if result.not_modified:
+                    state.not_modified_count = (state.not_modified_count or 0) + 1
+                    continue
+
+                state.last_changed_at = now
+                if result.published_at:
+                    state.recent_published_at = [value.isoformat() for value in result.published_at]
+    except Exception:
+        logger.warning(
+            "Unable to persist feed fetch state",
+            exc_info=True,
+            extra={
+                "component": "feed_fetcher",
+                "operation": "save_fetch_states",
+                "context_data": {"feed_count": len(results)},
+            },
+        )
+
+
+def commit_feed_validators(results: Iterable[FeedFetchResult]) -> None:
+    """Store ETag/Last-Modified validators for feeds whose items were saved.
+
+    Call this only after the items parsed from these responses are committed: once
+    validators are stored the next fetch can get a 304 and never see the entries
+    again. Results without a parsed feed (errors, 304s) are ignored.
+    """
+    changed = {
+        result.feed_url: result
+        for result in results
+        if result.error is None and not result.not_modified and result.parsed_feed is not None
+    }
+    if not changed:
+        return
+    now = _utc_now()
+    try:
+        with get_db() as db:
+            states = (
+                db.query(FeedFetchState).filter(FeedFetchState.feed_url.in_(list(changed))).all()
+            )
+            for state in states:
+                result = changed[state.feed_url]
+                state.etag = result.etag
+                state.last_modified = result.last_modified
+                state.validators_saved_at = now
+    except Exception:
+        logger.warning(
+            "Unable to persist feed validators",
+            exc_info=True,
+            extra={
+                "component": "feed_fetcher",
+                "operation": "commit_feed_validators",
+                "context_data": {"feed_count": len(changed)},
+            },
+        )
+
+
+def _fetch_feed(
+    feed_url: str,
+    validators: tuple[str | None, str | None] | None,
+    host_slot: threading.Semaphore,
+) -> FeedFetchResult:
+    """Fetch and parse one feed, sending stored validators when present."""
+    etag, last_modified = validators or (None, None)
+    with host_slot:
+        try:
+            parsed_feed = feedparser.parse(feed_url, etag=etag, modified=last_modified)
+        except Exception as exc:  # noqa: BLE001
+            return FeedFetchResult(feed_url=feed_url, error=exc)
+
+    status = getattr(parsed_feed, "status", None)
+    status_code = status if isinstance(status, int) else None
+    if status_code == HTTP_NOT_MODIFIED:
+        logger.debug("Feed %s not modified since last fetch", feed_url)
+        return FeedFetchResult(feed_url=feed_url, not_modified=True, status_code=status_code)
+
+    return FeedFetchResult(
+        feed_url=feed_url,
+        parsed_feed=parsed_feed,
+        status_code=status_code,
+        etag=_string_or_none(getattr(parsed_feed, "etag", None), max_length=512),
+        last_modified=_string_or_none(getattr(parsed_feed, "modified", None), max_length=128),
+        published_at=_entry_publication_dates(parsed_feed),
+    )
+
+
+def fetch_feeds(
+    feed_urls: Sequence[str],
+    *,
+    subscribed_at: Mapping[str, datetime | None] | None = None,
+    max_workers: int | None = None,
+    per_host_limit: int | None = None,
+) -> dict[str, FeedFetchResult]:
+    """Fetch feeds concurrently with per-host politeness and conditional GETs.
+
+    Committed ETag/Last-Modified validators are sent with each request; a 304 yields
+    a result with ``not_modified=True`` and no parsed feed. Fetch counters are written
+    back in one transaction after the batch completes. Validators from changed
+    responses are only stored once the caller passes the results to
+    ``commit_feed_validators`` after saving their items.
+
+    Args:
+        feed_urls: Feed URLs to fetch; duplicates are fetched once.
+        subscribed_at: Newest subscription time per feed URL; feeds subscribed after
+            their validators were committed are fetched unconditionally.
+        max_workers: Global fetch concurrency (defaults to settings).
+        per_host_limit: Concurrent requests allowed per host (defaults to settings).
+
+    Returns:
+        Fetch results keyed by feed URL.
+    """
+    unique_urls = list(dict.fromkeys(url for url in feed_urls if url))
+    if not unique_urls:
+        return {}
+
+    settings = get_settings()
+    worker_count = min(max_workers or settings.feed_fetch_max_workers, len(unique_urls))
+    host_limit = max(per_host_limit or settings.feed_fetch_per_host_limit, 1)
+    host_slots = {
+        host: threading.BoundedSemaphore(host_limit)
+        for host in {_feed_host(url) for url in unique_urls}
+    }
+    validators = _load_validators(unique_urls, subscribed_at or {})
+
+    with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="feed-fetch") as executor:
+        futures = {
+            url: executor.submit(_fetch_feed, url, validators.get(url), host_slots[_feed_host(url)])
+            for url in unique_urls
+        }
+        results = {url: future.result() for url, future in futures.items()}
+
+    _save_fetch_states(list(results.values()))
+    return results
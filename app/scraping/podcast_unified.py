@@ -6,8 +6,6 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
-import feedparser
-
 from app.core.db import get_db
 from app.core.logging import get_logger
 from app.models.metadata import ContentType
@@ -60,13 +58,15 @@ class PodcastUnifiedScraper(BaseScraper):
 
     def scrape(self) -> list[dict[str, Any]]:
         """Scrape all configured podcast feeds with comprehensive error logging."""
-        feeds = self._load_podcast_feeds()
+        feeds = self._filter_feeds(self._load_podcast_feeds())
         if not feeds:
             logger.warning("No podcast feeds configured")
             return []
 
         items = []
 
+        fetched_feeds = self._fetch_feeds(feeds)
+
         for feed_config in feeds:
             if not isinstance(feed_config, dict):
                 logger.warning("Invalid feed configuration, skipping")
@@ -85,8 +85,10 @@ class PodcastUnifiedScraper(BaseScraper):
             logger.info(f"Scraping podcast feed: {feed_name} (limit: {limit})")
 
             try:
-                # Parse RSS feed with better encoding handling
-                parsed_feed = feedparser.parse(feed_url)
+                parsed_feed = fetched_feeds[feed_url].feed_or_raise()
+                if parsed_feed is None:
+                    logger.info("Feed %s not modified since last fetch; skipping", feed_url)
+                    continue
 
                 # Check for parsing issues
                 if parsed_feed.bozo:
@@ -181,6 +183,7 @@ class PodcastUnifiedScraper(BaseScraper):
                 logger.info(f"Successfully processed {processed_entries} episodes from {feed_name}")
 
             except Exception as e:
+                self._discard_feed_validators(feed_url)
                 # Log comprehensive error details
                 logger.exception(
                     "Error scraping feed %s: %s",
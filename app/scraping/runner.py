@@ -1,4 +1,5 @@
 import re
+from collections.abc import Sequence
 
 from app.core.logging import get_logger
 from app.core.observability import build_log_extra
@@ -119,16 +120,26 @@ class ScraperRunner:
 
         return results
 
-    def run_scraper(self, name: str) -> int | None:
+    def run_scraper(self, name: str, *, feed_urls: Sequence[str] | None = None) -> int | None:
         """Run a specific scraper by name. Returns count for backward compatibility."""
-        stats = self.run_scraper_with_stats(name)
+        stats = self.run_scraper_with_stats(name, feed_urls=feed_urls)
         return stats.saved if stats else None
 
-    def run_scraper_with_stats(self, name: str) -> ScraperStats | None:
-        """Run a specific scraper by name and return detailed statistics."""
+    def run_scraper_with_stats(
+        self,
+        name: str,
+        *,
+        feed_urls: Sequence[str] | None = None,
+    ) -> ScraperStats | None:
+        """Run a specific scraper by name and return detailed statistics.
+
+        ``feed_urls`` restricts feed-based scrapers (Substack, Atom, Podcast) to
+        those feeds for this run; other scrapers ignore it.
+        """
         requested_name = _normalize_scraper_name(name)
         for scraper in self.scrapers:
             if requested_name in _scraper_lookup_keys(scraper):
+                scraper.feed_url_filter = set(feed_urls) if feed_urls else None
                 try:
                     stats = scraper.run_with_stats()
 
@@ -165,6 +176,8 @@ class ScraperRunner:
                     )
 
                     return ScraperStats(errors=1, error_details=[str(e)])
+                finally:
+                    scraper.feed_url_filter = None
 
         logger.error(
             "Scraper not found",
@@ -118,11 +118,13 @@ class SubstackScraper(BaseScraper):
         """Scrape all configured Substack feeds with comprehensive error logging."""
         items: list[dict[str, Any]] = []
 
-        feeds = self._load_feeds()
+        feeds = self._filter_feeds(self._load_feeds())
         if not feeds:
             logger.warning("No Substack feeds configured for users. Skipping scrape.")
             return items
 
+        fetched_feeds = self._fetch_feeds(feeds)
+
         for feed_info in feeds:
             feed_url = feed_info.get("url")
             source_name = feed_info.get("name", "Unknown Substack")
@@ -139,7 +141,10 @@ class SubstackScraper(BaseScraper):
                 f"Scraping Substack feed: {feed_url} (source: {source_name}, limit: {limit})"
             )
             try:
-                parsed_feed = feedparser.parse(feed_url)
+                parsed_feed = fetched_feeds[feed_url].feed_or_raise()
+                if parsed_feed is None:
+                    logger.info("Feed %s not modified since last fetch; skipping", feed_url)
+                    continue
 
                 logger.debug(
                     "Parsed feed %s (entries=%s, bozo=%s, feed_title=%s)",
@@ -208,6 +213,7 @@ class SubstackScraper(BaseScraper):
                 )
 
             except Exception as e:
+                self._discard_feed_validators(feed_url)
                 # Log comprehensive error details
                 logger.exception(
                     "Error scraping feed %s: %s",
@@ -45,7 +45,7 @@ from app.services.chat_agent import (
     update_message_failed,
 )
 from app.services.content_submission import submit_user_content
-from app.services.exa_client import exa_search
+from app.services.gateways.exa_gateway import get_exa_gateway
 from app.services.knowledge_search import search_knowledge as search_knowledge_hits
 from app.services.langfuse_tracing import langfuse_trace_context
 from app.services.llm_models import (
@@ -575,7 +575,7 @@ def _get_or_create_agent(
     ) -> str:
         """Search the web for current context or discovery."""
         normalized_limit = max(1, min(limit, 8))
-        results = exa_search(
+        results = get_exa_gateway().search(
             query=query,
             num_results=normalized_limit,
             telemetry={
@@ -688,6 +688,7 @@ def _get_or_create_agent(
                 user_id=ctx.deps.user_id,
                 query_text=normalized_query,
                 limit=normalized_limit,
+                count_mode="estimated",
             )
 
         return _format_content_hits(
@@ -7,7 +7,8 @@ from typing import Any
 
 from app.core.logging import get_logger
 from app.scraping.youtube_unified import load_youtube_client_config
-from app.services.whisper_local import get_whisper_local_service
+from app.services.whisper_local import SegmentCallback, get_whisper_local_service
+from app.services.whisper_pool import transcribe_segments_in_pool
 
 try:  # pragma: no cover - optional dependency in tests
     import yt_dlp
@@ -120,6 +121,28 @@ def transcribe_audio_file_with_metadata(path: Path) -> tuple[str, str | None]:
     return transcript_text.strip(), detected_language
 
 
+def transcribe_audio_file_in_segments(
+    path: Path,
+    *,
+    segment_seconds: int,
+    completed_segments: list[str] | None = None,
+    language: str | None = None,
+    on_segment: SegmentCallback | None = None,
+) -> tuple[str, str | None]:
+    """Transcribe an audio file segment by segment, resuming after completed segments.
+
+    Segments run on the whisper process pool when it is enabled.
+    """
+    transcript_text, detected_language = transcribe_segments_in_pool(
+        path,
+        segment_seconds=segment_seconds,
+        completed_segments=completed_segments,
+        language=language,
+        on_segment=on_segment,
+    )
+    return transcript_text.strip(), detected_language
+
+
 def transcribe_audio_file(path: Path) -> str:
     """Transcribe an audio file and return transcript text."""
     transcript_text, _detected_language = transcribe_audio_file_with_metadata(path)
@@ -18,7 +18,8 @@ from app.core.observability import build_log_extra
 from app.core.settings import get_settings
 from app.models.chat_message_metadata import ChatMessageRenderMetadata
 from app.models.schema import ChatMessage, ChatSession, Content, MessageProcessingStatus
-from app.services.exa_client import exa_search, get_exa_client
+from app.services.exa_client import get_exa_client
+from app.services.gateways.exa_gateway import get_exa_gateway
 from app.services.langfuse_tracing import langfuse_trace_context
 from app.services.llm_models import (
     DEFAULT_MODEL,
@@ -455,7 +456,7 @@ def get_chat_agent(
         # Execute search with enhanced options
         tool_start = perf_counter()
         try:
-            results = exa_search(
+            results = get_exa_gateway().search(
                 query,
                 num_results=num_results,
                 category=category,
@@ -30,6 +30,7 @@ from app.models.internal.content_analyzer import (
 from app.services.feed_detection import extract_feed_links
 from app.services.langfuse_tracing import langfuse_trace_context
 from app.services.llm_models import build_pydantic_model
+from app.services.raw_page_cache import STAGE_ANALYZE_URL, get_raw_page_cache
 from app.services.vendor_usage import record_model_usage
 
 logger = get_logger(__name__)
@@ -128,6 +129,12 @@ def _fetch_page_content(url: str) -> tuple[str | None, str | None]:
     Returns:
         Tuple of (raw_html, extracted_text). Either may be None on failure.
     """
+    page_cache = get_raw_page_cache()
+    cached_page = page_cache.get(url, stage=STAGE_ANALYZE_URL) if page_cache else None
+    if cached_page is not None:
+        html = cached_page.text
+        return html, trafilatura.extract(html, include_links=True) or ""
+
     try:
         with httpx.Client(timeout=15.0, follow_redirects=True) as client:
             response = client.get(
@@ -141,6 +148,8 @@ def _fetch_page_content(url: str) -> tuple[str | None, str | None]:
                 },
             )
             response.raise_for_status()
+            if page_cache is not None:
+                page_cache.put_response(response, url=url)
             html = response.text
             # Extract readable text using trafilatura
             text = trafilatura.extract(html, include_links=True) or ""
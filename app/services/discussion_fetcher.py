@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from collections import defaultdict, deque
 from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from html import unescape
@@ -19,6 +20,7 @@ from sqlalchemy.orm import Session
 
 from app.core.logging import get_logger
 from app.core.settings import get_settings
+from app.http_client.pool import get_shared_http_client
 from app.models.schema import Content, ContentDiscussion, NewsItem
 from app.services.content_metadata_merge import refresh_merge_content_metadata
 from app.utils.url_utils import normalize_http_url
@@ -333,15 +335,33 @@ def _build_hackernews_payload(discussion_url: str, comment_cap: int) -> Discussi
             error_message="Unable to parse Hacker News item id",
         )
 
-    timeout = httpx.Timeout(timeout=settings.http_timeout_seconds, connect=10.0)
     comments: list[dict[str, Any]] = []
     url_titles: dict[str, str] = {}
     fetched_count = 0
     cap_reached = False
     total_seen = 0
+    concurrency = settings.hn_discussion_fetch_concurrency
+
+    client = _get_hn_http_client()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="hn-discussion") as pool:
+        tree_items = _fetch_hn_comment_tree(client, item_id)
+        if tree_items is not None:
+            root_item = tree_items.get(int(item_id))
+
+            def fetch_items(comment_ids: list[int]) -> list[dict[str, Any] | None]:
+                return [tree_items.get(comment_id) for comment_id in comment_ids]
+
+        else:
+            root_item = _fetch_hn_item(client, item_id)
+
+            def fetch_items(comment_ids: list[int]) -> list[dict[str, Any] | None]:
+                return list(
+                    pool.map(
+                        lambda comment_id: _fetch_hn_item(client, str(comment_id)),
+                        comment_ids,
+                    )
+                )
 
-    with httpx.Client(timeout=timeout) as client:
-        root_item = _fetch_hn_item(client, item_id)
         if not isinstance(root_item, dict):
             return DiscussionPayload(
                 status="partial",
@@ -367,45 +387,61 @@ def _build_hackernews_payload(discussion_url: str, comment_cap: int) -> Discussi
             (int(child_id), 0, None) for child_id in root_item.get("kids", [])
         )
 
+        # Breadth-first walk. Each round fetches the front of the queue (at most the
+        # remaining cap) concurrently, then processes it in queue order so ordering,
+        # depth and cap accounting match a one-at-a-time walk.
         while queue:
-            comment_id, depth, parent_id = queue.popleft()
-            total_seen += 1
-
-            if fetched_count >= comment_cap:
+            remaining = comment_cap - fetched_count
+            if remaining <= 0:
+                total_seen += 1
                 cap_reached = True
                 break
 
-            comment_item = _fetch_hn_item(client, str(comment_id))
-            if not isinstance(comment_item, dict):
-                continue
-            if comment_item.get("type") != "comment":
-                continue
-            if comment_item.get("deleted") or comment_item.get("dead"):
-                continue
+            batch = [queue.popleft() for _ in range(min(len(queue), remaining))]
+            batch_items = fetch_items([comment_id for comment_id, _, _ in batch])
 
-            raw_html = str(comment_item.get("text") or "")
-            url_titles.update(_extract_anchor_titles_from_html(raw_html))
-            text = _clean_html_text(raw_html)
-            if not text:
-                continue
+            for (comment_id, depth, parent_id), comment_item in zip(
+                batch, batch_items, strict=True
+            ):
+                total_seen += 1
 
-            comments.append(
-                {
-                    "comment_id": str(comment_item.get("id") or comment_id),
-                    "parent_id": str(parent_id) if parent_id is not None else None,
-                    "author": comment_item.get("by") or "unknown",
-                    "text": text,
-                    "compact_text": _compact_text(text),
-                    "depth": depth,
-                    "created_at": _unix_to_iso(comment_item.get("time")),
-                    "source_url": discussion_url,
-                }
-            )
-            fetched_count += 1
+                if fetched_count >= comment_cap:
+                    cap_reached = True
+                    break
+
+                if not isinstance(comment_item, dict):
+                    continue
+                if comment_item.get("type") != "comment":
+                    continue
+                if comment_item.get("deleted") or comment_item.get("dead"):
+                    continue
+
+                raw_html = str(comment_item.get("text") or "")
+                url_titles.update(_extract_anchor_titles_from_html(raw_html))
+                text = _clean_html_text(raw_html)
+                if not text:
+                    continue
+
+                comments.append(
+                    {
+                        "comment_id": str(comment_item.get("id") or comment_id),
+                        "parent_id": str(parent_id) if parent_id is not None else None,
+                        "author": comment_item.get("by") or "unknown",
+                        "text": text,
+                        "compact_text": _compact_text(text),
+                        "depth": depth,
+                        "created_at": _unix_to_iso(comment_item.get("time")),
+                        "source_url": discussion_url,
+                    }
+                )
+                fetched_count += 1
 
-            for child_id in comment_item.get("kids", []):
-                with_id = int(child_id)
-                queue.append((with_id, depth + 1, int(comment_item.get("id") or comment_id)))
+                for child_id in comment_item.get("kids", []):
+                    with_id = int(child_id)
+                    queue.append((with_id, depth + 1, int(comment_item.get("id") or comment_id)))
+
+            if cap_reached:
+                break
 
     links = _extract_links_from_comments(comments, url_titles=url_titles)
     status = "completed" if comments else "partial"
@@ -550,6 +586,56 @@ def _fetch_hn_item(client: httpx.Client, item_id: str) -> dict[str, Any] | None:
     return None
 
 
+def _get_hn_http_client() -> httpx.Client:
+    """Return the shared pooled client so item fetches reuse keep-alive connections."""
+    return get_shared_http_client()
+
+
+def _fetch_hn_comment_tree(client: httpx.Client, item_id: str) -> dict[int, dict[str, Any]] | None:
+    """Load a whole story tree in one request when a tree endpoint is configured.
+
+    The endpoint (``hn_comment_tree_url``, Algolia's ``/items/{item_id}`` shape) returns
+    nested ``children``. Nodes are flattened into Firebase-style items keyed by id so the
+    regular breadth-first walk can consume them. Returns ``None`` when tree mode is off
+    or the request fails, so callers fall back to per-item fetches.
+    """
+    template = settings.hn_comment_tree_url
+    if not template:
+        return None
+
+    try:
+        response = client.get(template.format(item_id=item_id))
+        response.raise_for_status()
+        tree = response.json()
+    except (httpx.HTTPError, ValueError) as exc:
+        logger.warning(
+            "Hacker News tree fetch failed for %s; falling back to item fetches: %s",
+            item_id,
+            exc,
+        )
+        return None
+    if not isinstance(tree, dict) or tree.get("id") is None:
+        return None
+
+    items: dict[int, dict[str, Any]] = {}
+    stack: list[dict[str, Any]] = [tree]
+    while stack:
+        node = stack.pop()
+        children = [child for child in node.get("children") or [] if isinstance(child, dict)]
+        items[int(node["id"])] = {
+            "id": node["id"],
+            "type": node.get("type"),
+            "by": node.get("author"),
+            "text": node.get("text"),
+            "time": node.get("created_at_i"),
+            "kids": [child["id"] for child in children if child.get("id") is not None],
+        }
+        stack.extend(child for child in children if child.get("id") is not None)
+
+    items[int(tree["id"])]["descendants"] = len(items) - 1
+    return items
+
+
 def _fetch_techmeme_discussion_groups(
     discussion_url: str,
     metadata: dict[str, Any],
@@ -38,8 +38,9 @@ from app.models.schema import (
     UserScraperConfig,
 )
 from app.services.content_submission import normalize_url
-from app.services.exa_client import ExaSearchResult, exa_search
+from app.services.exa_client import ExaSearchResult
 from app.services.feed_detection import FeedDetector
+from app.services.gateways.exa_gateway import get_exa_gateway
 from app.services.http import HttpService
 from app.services.llm_agents import get_basic_agent
 from app.services.llm_models import build_pydantic_model
@@ -761,7 +762,7 @@ def _extract_candidates_llm(
 
 
 def _run_exa_search(query: str, num_results: int) -> list[ExaSearchResult]:
-    return exa_search(query, num_results=num_results)
+    return get_exa_gateway().search(query, num_results=num_results)
 
 
 def _collect_candidates(
@@ -776,35 +777,36 @@ def _collect_candidates(
     settings = get_settings()
     all_candidates: list[DiscoveryCandidate] = []
 
-    for lane in lane_plan.lanes:
+    # Search every lane's queries up front so they run concurrently under the gateway's
+    # rate limit; candidate extraction below still walks lanes in plan order.
+    lane_queries = [
+        (lane_index, query.query)
+        for lane_index, lane in enumerate(lane_plan.lanes)
+        for query in lane.queries
+    ]
+    query_results = get_exa_gateway().map_concurrently(
+        lambda item: exa_search_fn(item[1], settings.discovery_exa_results),
+        lane_queries,
+    )
+    results_by_lane: list[list[ExaSearchResult]] = [[] for _ in lane_plan.lanes]
+    for (lane_index, query), results in zip(lane_queries, query_results, strict=True):
+        lane = lane_plan.lanes[lane_index]
+        results_by_lane[lane_index].extend(results)
         logger.debug(
-            "Running lane searches",
+            "Exa results collected",
             extra={
                 "component": "feed_discovery",
-                "operation": "lane_search",
+                "operation": "exa_search",
                 "context_data": {
                     "lane": lane.name,
                     "target": lane.target,
-                    "query_count": len(lane.queries),
+                    "query": query,
+                    "result_count": len(results),
                 },
             },
         )
-        lane_results: list[ExaSearchResult] = []
-        for query in lane.queries:
-            results = exa_search_fn(query.query, settings.discovery_exa_results)
-            lane_results.extend(results)
-            logger.debug(
-                "Exa results collected",
-                extra={
-                    "component": "feed_discovery",
-                    "operation": "exa_search",
-                    "context_data": {
-                        "lane": lane.name,
-                        "query": query.query,
-                        "result_count": len(results),
-                    },
-                },
-            )
+
+    for lane, lane_results in zip(lane_plan.lanes, results_by_lane, strict=True):
         if not lane_results:
             continue
         logger.debug(
@@ -0,0 +1,224 @@
+"""Adaptive per-feed polling for the RSS/Atom/podcast scrapers.
+
+Instead of scraping every configured feed on a fixed cron, each feed gets a
+deferred ``SCRAPE`` task whose ``available_at`` reflects how often the feed
+actually publishes, how often recent polls came back ``304 Not Modified`` and
+whether the feed has been failing.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.core.logging import get_logger
+from app.core.observability import build_log_extra
+from app.core.settings import get_settings
+from app.models.contracts import TaskType
+from app.models.schema import FeedFetchState
+from app.services.queue import get_queue_service
+from app.services.scraper_configs import (
+    build_feed_payloads,
+    estimate_next_expected_at,
+    list_active_configs_by_type,
+)
+
+logger = get_logger(__name__)
+
+# Scraper config type -> ScraperRunner source name.
+FEED_SCRAPER_SOURCES: dict[str, str] = {
+    "substack": "Substack",
+    "atom": "Atom",
+    "podcast_rss": "Podcast",
+}
+
+# Poll roughly this many times per observed publishing interval.
+POLLS_PER_PUBLISH_INTERVAL = 4
+# Fetches needed before the 304 ratio is trusted.
+NOT_MODIFIED_MIN_SAMPLES = 4
+MAX_BACKOFF_EXPONENT = 6
+
+
+@dataclass(frozen=True)
+class FeedPollPlan:
+    """Next scheduled poll for one feed."""
+
+    scraper_type: str
+    feed_url: str
+    interval: timedelta
+    next_poll_at: datetime
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def compute_poll_interval(
+    *,
+    average_interval_hours: float | None,
+    fetch_count: int = 0,
+    not_modified_count: int = 0,
+    consecutive_failures: int = 0,
+) -> timedelta:
+    """Return the polling interval for a feed.
+
+    Args:
+        average_interval_hours: Observed hours between publications, if known.
+        fetch_count: Total conditional fetches recorded for the feed.
+        not_modified_count: How many of those fetches returned 304.
+        consecutive_failures: Fetch failures since the last success.
+
+    Returns:
+        Interval clamped to the configured min/max poll interval.
+    """
+    settings = get_settings()
+    min_interval = timedelta(minutes=settings.feed_poll_min_interval_minutes)
+    max_interval = timedelta(minutes=settings.feed_poll_max_interval_minutes)
+
+    if average_interval_hours and average_interval_hours > 0:
+        interval = timedelta(hours=average_interval_hours) / POLLS_PER_PUBLISH_INTERVAL
+    else:
+        interval = timedelta(minutes=settings.feed_poll_default_interval_minutes)
+
+    if fetch_count >= NOT_MODIFIED_MIN_SAMPLES:
+        not_modified_ratio = min(max(not_modified_count / fetch_count, 0.0), 1.0)
+        interval *= 1 + not_modified_ratio
+
+    if consecutive_failures > 0:
+        interval *= 2 ** min(consecutive_failures, MAX_BACKOFF_EXPONENT)
+
+    return min(max(interval, min_interval), max_interval)
+
+
+def plan_next_poll(
+    *,
+    now: datetime,
+    interval: timedelta,
+    last_fetched_at: datetime | None,
+    next_expected_at: datetime | None,
+    consecutive_failures: int = 0,
+) -> datetime:
+    """Return when a feed should next be polled.
+
+    A feed is polled ``interval`` after its last fetch. When the next publication
+    is predicted before that and has not been checked for yet, the poll is pulled
+    forward to the predicted time (never sooner than the minimum interval).
+    """
+    if last_fetched_at is None:
+        return now
+
+    next_poll_at = last_fetched_at + interval
+    if (
+        consecutive_failures == 0
+        and next_expected_at is not None
+        and last_fetched_at < next_expected_at < next_poll_at
+    ):
+        min_interval = timedelta(minutes=get_settings().feed_poll_min_interval_minutes)
+        next_poll_at = max(next_expected_at, last_fetched_at + min_interval)
+    return max(now, next_poll_at)
+
+
+def _publication_dates(state: FeedFetchState | None) -> list[datetime]:
+    """Return the entry publication dates recorded from the feed's last full response."""
+    if state is None or not isinstance(state.recent_published_at, list):
+        return []
+    dates: list[datetime] = []
+    for value in state.recent_published_at:
+        if not isinstance(value, str):
+            continue
+        try:
+            dates.append(datetime.fromisoformat(value))
+        except ValueError:
+            continue
+    return dates
+
+
+def plan_feed_polls(db: Session, *, now: datetime | None = None) -> list[FeedPollPlan]:
+    """Compute the next poll for every actively configured feed."""
+    current_time = now or _utc_now()
+    feeds_by_type: dict[str, list[str]] = {}
+    for scraper_type in FEED_SCRAPER_SOURCES:
+        payloads = build_feed_payloads(list_active_configs_by_type(db, scraper_type))
+        feeds_by_type[scraper_type] = list(
+            dict.fromkeys(payload["url"] for payload in payloads if payload.get("url"))
+        )
+
+    all_urls = sorted({url for urls in feeds_by_type.values() for url in urls})
+    if not all_urls:
+        return []
+
+    states = {
+        state.feed_url: state
+        for state in db.query(FeedFetchState).filter(FeedFetchState.feed_url.in_(all_urls)).all()
+    }
+
+    plans: list[FeedPollPlan] = []
+    for scraper_type, feed_urls in feeds_by_type.items():
+        for feed_url in feed_urls:
+            state = states.get(feed_url)
+            next_expected_at, average_interval_hours, _ = estimate_next_expected_at(
+                _publication_dates(state)
+            )
+            consecutive_failures = (state.consecutive_failures or 0) if state else 0
+            interval = compute_poll_interval(
+                average_interval_hours=average_interval_hours,
+                fetch_count=(state.fetch_count or 0) if state else 0,
+                not_modified_count=(state.not_modified_count or 0) if state else 0,
+                consecutive_failures=consecutive_failures,
+            )
+            plans.append(
+                FeedPollPlan(
+                    scraper_type=scraper_type,
+                    feed_url=feed_url,
+                    interval=interval,
+                    next_poll_at=plan_next_poll(
+                        now=current_time,
+                        interval=interval,
+                        last_fetched_at=state.last_fetched_at if state else None,
+                        next_expected_at=next_expected_at,
+                        consecutive_failures=consecutive_failures,
+                    ),
+                )
+            )
+    return plans
+
+
+def schedule_feed_scrapes(*, now: datetime | None = None) -> list[FeedPollPlan]:
+    """Enqueue one deferred ``SCRAPE`` task per configured feed.
+
+    Tasks are deduplicated on their payload, so re-running the scheduler while a
+    feed's task is still pending leaves the existing task in place.
+
+    Returns:
+        The poll plans that were submitted to the queue.
+    """
+    with get_db() as db:
+        plans = plan_feed_polls(db, now=now)
+
+    queue_service = get_queue_service()
+    for plan in plans:
+        queue_service.enqueue(
+            TaskType.SCRAPE,
+            payload={
+                "sources": [FEED_SCRAPER_SOURCES[plan.scraper_type]],
+                "feed_urls": [plan.feed_url],
+            },
+            dedupe=True,
+            available_at=plan.next_poll_at,
+        )
+
+    logger.info(
+        "Scheduled %d feed polls",
+        len(plans),
+        extra=build_log_extra(
+            component="feed_scheduler",
+            operation="schedule_feed_scrapes",
+            event_name="feed_scheduler.scheduled",
+            status="completed",
+            context_data={"feed_count": len(plans)},
+        ),
+    )
+    return plans
@@ -1,15 +1,17 @@
 """Infrastructure gateways used by pipeline and service orchestration."""
 
+from app.services.gateways.exa_gateway import ExaGateway, get_exa_gateway
 from app.services.gateways.http_gateway import HttpGateway, get_http_gateway
 from app.services.gateways.llm_gateway import LlmGateway, get_llm_gateway
 from app.services.gateways.task_queue_gateway import TaskQueueGateway, get_task_queue_gateway
 
 __all__ = [
+    "ExaGateway",
     "HttpGateway",
     "LlmGateway",
     "TaskQueueGateway",
+    "get_exa_gateway",
     "get_http_gateway",
     "get_llm_gateway",
     "get_task_queue_gateway",
 ]
-
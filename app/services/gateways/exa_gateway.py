@@ -0,0 +1,258 @@
+"""Shared gateway for Exa web searches.
+
+Callers that fan out several searches (discovery lanes, onboarding, insight report
+themes, chat tools) go through one process-wide gateway so that:
+
+- batches run concurrently, bounded by a global concurrency and request-rate limit,
+- identical searches already in flight are coalesced onto the first request,
+- successful results are reused from a short-lived cache keyed by the search options.
+
+Vendor usage is recorded by ``exa_search`` itself, so it is written once per request
+that actually reaches Exa. Cache hits and coalesced callers record nothing; their
+telemetry context is dropped in favour of the request that was sent.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from app.core.logging import get_logger
+from app.core.settings import get_settings
+from app.services.exa_client import (
+    ExaClientError,
+    ExaSearchResult,
+    exa_search,
+    get_exa_client,
+)
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+SearchKey = tuple[Any, ...]
+
+
+def _search_key(
+    query: str,
+    *,
+    num_results: int,
+    max_characters: int,
+    category: str | None,
+    include_domains: Sequence[str] | None,
+    exclude_domains: Sequence[str] | None,
+) -> SearchKey:
+    return (
+        " ".join(query.split()),
+        num_results,
+        category,
+        max_characters,
+        tuple(include_domains) if include_domains is not None else None,
+        tuple(exclude_domains) if exclude_domains is not None else None,
+    )
+
+
+class ExaGateway:
+    """Concurrent, coalescing and cached facade over ``exa_search``."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrent_requests: int | None = None,
+        requests_per_second: float | None = None,
+    ) -> None:
+        settings = get_settings()
+        self._max_concurrent = max_concurrent_requests or settings.exa_max_concurrent_requests
+        rate = (
+            settings.exa_requests_per_second if requests_per_second is None else requests_per_second
+        )
+        self._min_interval = 1.0 / rate if rate > 0 else 0.0
+        self._slots = threading.BoundedSemaphore(self._max_concurrent)
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+        self._cache: OrderedDict[SearchKey, tuple[float, list[ExaSearchResult]]] = OrderedDict()
+        self._in_flight: dict[SearchKey, Future[list[ExaSearchResult]]] = {}
+
+    def search(
+        self,
+        query: str,
+        *,
+        num_results: int = 5,
+        max_characters: int = 2000,
+        category: str | None = None,
+        include_domains: list[str] | None = None,
+        exclude_domains: list[str] | None = None,
+        raise_on_error: bool = False,
+        telemetry: dict[str, Any] | None = None,
+    ) -> list[ExaSearchResult]:
+        """Search Exa, reusing cached or in-flight results for identical searches.
+
+        Accepts the same options as ``exa_search``. Failed searches are never cached;
+        they return ``[]`` or raise ``ExaClientError`` subclasses per ``raise_on_error``.
+        """
+        options: dict[str, Any] = {
+            "num_results": num_results,
+            "max_characters": max_characters,
+            "category": category,
+            "include_domains": include_domains,
+            "exclude_domains": exclude_domains,
+        }
+        if get_exa_client() is None:
+            # Nothing to share; let exa_search report the missing client as before.
+            return exa_search(query, **options, raise_on_error=raise_on_error)
+
+        key = _search_key(
+            query,
+            num_results=num_results,
+            max_characters=max_characters,
+            category=category,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains,
+        )
+        with self._lock:
+            cached = self._cached(key)
+            if cached is not None:
+                self._record_lookup(query, outcome="hit")
+                return list(cached)
+            pending = self._in_flight.get(key)
+            if pending is None:
+                pending = Future()
+                self._in_flight[key] = pending
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            self._record_lookup(query, outcome="coalesced")
+            try:
+                return list(pending.result())
+            except ExaClientError:
+                if raise_on_error:
+                    raise
+                return []
+
+        self._record_lookup(query, outcome="miss")
+        try:
+            with self._slots:
+                self._wait_for_rate_limit()
+                results = exa_search(
+                    query,
+                    **options,
+                    raise_on_error=True,
+                    telemetry=telemetry,
+                )
+        except ExaClientError as exc:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            pending.set_exception(exc)
+            if raise_on_error:
+                raise
+            return []
+        except BaseException as exc:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            pending.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._store(key, results)
+            self._in_flight.pop(key, None)
+        pending.set_result(results)
+        return list(results)
+
+    def search_many(
+        self,
+        queries: Sequence[str],
+        **search_options: Any,
+    ) -> list[list[ExaSearchResult]]:
+        """Run ``search`` for each query concurrently; results follow query order."""
+        return self.map_concurrently(
+            lambda query: self.search(query, **search_options),
+            queries,
+        )
+
+    def map_concurrently(self, fn: Callable[[T], R], items: Sequence[T]) -> list[R]:
+        """Apply ``fn`` to ``items`` on worker threads sized to the request limit.
+
+        Intended for callers whose search function is injected but still routes through
+        this gateway, so the global limit applies inside ``fn``. Results follow ``items``
+        and each call runs in a copy of the caller's context.
+        """
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        context = contextvars.copy_context()
+        max_workers = min(self._max_concurrent, len(items))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="exa") as executor:
+            return list(executor.map(lambda item: context.copy().run(fn, item), items))
+
+    def clear_cache(self) -> None:
+        """Drop all cached search results."""
+        with self._lock:
+            self._cache.clear()
+
+    def _cached(self, key: SearchKey) -> list[ExaSearchResult] | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return results
+
+    def _store(self, key: SearchKey, results: list[ExaSearchResult]) -> None:
+        settings = get_settings()
+        ttl_seconds = settings.exa_search_cache_ttl_seconds
+        max_entries = settings.exa_search_cache_max_entries
+        if ttl_seconds <= 0 or max_entries <= 0:
+            return
+        self._cache[key] = (time.monotonic() + ttl_seconds, list(results))
+        self._cache.move_to_end(key)
+        while len(self._cache) > max_entries:
+            self._cache.popitem(last=False)
+
+    def _wait_for_rate_limit(self) -> None:
+        """Space request starts at least ``1 / requests_per_second`` apart."""
+        if self._min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self._min_interval
+        delay = start_at - now
+        if delay > 0:
+            time.sleep(delay)
+
+    @staticmethod
+    def _record_lookup(query: str, *, outcome: str) -> None:
+        logger.debug(
+            "Exa search %s for '%s'",
+            outcome,
+            query[:100],
+            extra={
+                "component": "exa_gateway",
+                "operation": "exa_search_lookup",
+                "context_data": {"outcome": outcome},
+            },
+        )
+
+
+_exa_gateway: ExaGateway | None = None
+_exa_gateway_lock = threading.Lock()
+
+
+def get_exa_gateway() -> ExaGateway:
+    """Return the process-wide Exa gateway."""
+    global _exa_gateway
+    if _exa_gateway is None:
+        with _exa_gateway_lock:
+            if _exa_gateway is None:
+                _exa_gateway = ExaGateway()
+    return _exa_gateway
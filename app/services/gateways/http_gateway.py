@@ -23,9 +23,10 @@ class HttpGateway:
         self,
         url: str,
         headers: dict[str, str] | None = None,
+        cache_stage: str | None = None,
     ) -> tuple[str | bytes, dict[str, str]]:
-        """Fetch URL content and response headers."""
-        return self._http_service.fetch_content(url, headers=headers)
+        """Fetch URL content and response headers, via the raw page cache when staged."""
+        return self._http_service.fetch_content(url, headers=headers, cache_stage=cache_stage)
 
     def fetch(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
         """Perform GET request with retry semantics."""
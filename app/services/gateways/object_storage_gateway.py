@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
 from abc import ABC, abstractmethod
+from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
@@ -42,6 +45,14 @@ class ObjectStorageGateway(ABC):
     def get_text(self, *, key: str) -> str:
         """Fetch UTF-8 text."""
 
+    @abstractmethod
+    def put_bytes(self, *, key: str, data: bytes, content_type: str) -> StoredObjectMetadata:
+        """Persist binary data."""
+
+    @abstractmethod
+    def get_bytes(self, *, key: str, start: int | None = None, end: int | None = None) -> bytes:
+        """Fetch binary data, optionally limited to the inclusive byte range ``start``-``end``."""
+
     @abstractmethod
     def exists(self, *, key: str) -> bool:
         """Return whether the key exists."""
@@ -86,6 +97,38 @@ class LocalObjectStorageGateway(ObjectStorageGateway):
     def get_text(self, *, key: str) -> str:
         return self._resolve_path(key).read_text(encoding="utf-8")
 
+    def put_bytes(self, *, key: str, data: bytes, content_type: str) -> StoredObjectMetadata:
+        del content_type
+        path = self._resolve_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent,
+            prefix=f"{path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as handle:
+            handle.write(data)
+        try:
+            os.replace(handle.name, path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(handle.name)
+            raise
+        return StoredObjectMetadata(
+            provider=self.provider,
+            bucket=None,
+            key=key,
+            size_bytes=len(data),
+        )
+
+    def get_bytes(self, *, key: str, start: int | None = None, end: int | None = None) -> bytes:
+        with self._resolve_path(key).open("rb") as handle:
+            offset = start or 0
+            handle.seek(offset)
+            if end is None:
+                return handle.read()
+            return handle.read(max(end - offset + 1, 0))
+
     def exists(self, *, key: str) -> bool:
         return self._resolve_path(key).exists()
 
@@ -202,6 +245,40 @@ class S3CompatibleObjectStorageGateway(ObjectStorageGateway):
         )
         return body.decode("utf-8")
 
+    def put_bytes(self, *, key: str, data: bytes, content_type: str) -> StoredObjectMetadata:
+        self._client.put_object(
+            Bucket=self._bucket,
+            Key=key,
+            Body=data,
+            ContentType=content_type,
+        )
+        self._record_usage(
+            model="put_object",
+            operation="object_storage.put_bytes",
+            key=key,
+            size_bytes=len(data),
+        )
+        return StoredObjectMetadata(
+            provider=self.provider,
+            bucket=self._bucket,
+            key=key,
+            size_bytes=len(data),
+        )
+
+    def get_bytes(self, *, key: str, start: int | None = None, end: int | None = None) -> bytes:
+        request: dict[str, str] = {"Bucket": self._bucket, "Key": key}
+        if start is not None or end is not None:
+            request["Range"] = f"bytes={start or 0}-{'' if end is None else end}"
+        response = self._client.get_object(**request)
+        body = response["Body"].read()
+        self._record_usage(
+            model="get_object",
+            operation="object_storage.get_bytes",
+            key=key,
+            size_bytes=len(body),
+        )
+        return body
+
     def exists(self, *, key: str) -> bool:
         return self.head(key=key) is not None
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Any
 
 from app.models.contracts import TaskQueue, TaskType
-from app.services.queue import QueueService, get_queue_service
+from app.services.queue import QueueService, TaskOutcome, get_queue_service
 
 
 class TaskQueueGateway:
@@ -23,8 +25,9 @@ class TaskQueueGateway:
         queue_name: TaskQueue | str | None = None,
         dedupe: bool | None = None,
         dedupe_key: str | None = None,
+        available_at: datetime | None = None,
     ) -> int:
-        """Enqueue task with optional dedupe and queue override."""
+        """Enqueue task with optional dedupe, queue override and deferred start."""
         enqueue_kwargs: dict[str, Any] = {"task_type": task_type}
         if content_id is not None:
             enqueue_kwargs["content_id"] = content_id
@@ -36,6 +39,8 @@ class TaskQueueGateway:
             enqueue_kwargs["dedupe"] = dedupe
         if dedupe_key is not None:
             enqueue_kwargs["dedupe_key"] = dedupe_key
+        if available_at is not None:
+            enqueue_kwargs["available_at"] = available_at
         return self._queue_service.enqueue(**enqueue_kwargs)
 
     def complete_task(
@@ -87,6 +92,31 @@ class TaskQueueGateway:
             queue_name=queue_name,
         )
 
+    def dequeue_batch(
+        self,
+        *,
+        worker_id: str,
+        queue_name: TaskQueue | str | None,
+        max_tasks: int,
+        task_type: TaskType | None = None,
+    ) -> list[dict[str, Any]]:
+        """Dequeue up to ``max_tasks`` tasks in one claim."""
+        return self._queue_service.dequeue_batch(
+            worker_id,
+            queue_name,
+            max_tasks,
+            task_type=task_type,
+        )
+
+    def finalize_batch(
+        self,
+        outcomes: Sequence[TaskOutcome],
+        *,
+        max_retries: int = 3,
+    ) -> dict[int, dict[str, Any] | None]:
+        """Apply final transitions for several processed tasks."""
+        return self._queue_service.finalize_batch(outcomes, max_retries=max_retries)
+
     def get_queue_stats(self) -> dict[str, Any]:
         """Return queue stats."""
         return self._queue_service.get_queue_stats()
@@ -7,6 +7,8 @@ from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wai
 
 from app.core.logging import get_logger
 from app.core.settings import get_settings
+from app.http_client.pool import get_shared_http_client
+from app.services.raw_page_cache import get_raw_page_cache
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -150,6 +152,10 @@ def head_quiet_compat(
         return http_service.head(url)
 
 
+def _is_text_content_type(content_type: str) -> bool:
+    return "text" in content_type or "html" in content_type or "xml" in content_type
+
+
 class HttpService:
     """HTTP client with intelligent retry logic and SSL handling."""
 
@@ -172,16 +178,18 @@ class HttpService:
         }
 
     def get_client(self, url: str | None = None) -> httpx.Client:
-        """Get an HTTP client with appropriate SSL settings."""
+        """Get the shared pooled client with appropriate SSL settings.
+
+        The client is process-wide and keeps connections alive between calls, so it
+        must not be closed here.
+        """
         # Determine SSL verification settings
         verify_ssl = True
         if url and should_bypass_ssl(url):
             verify_ssl = False
             logger.warning(f"Bypassing SSL verification for {urlparse(url).netloc}")
 
-        return httpx.Client(
-            timeout=self.timeout, follow_redirects=True, headers=self.headers, verify=verify_ssl
-        )
+        return get_shared_http_client(verify=verify_ssl)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -208,119 +216,119 @@ class HttpService:
         Returns:
             httpx.Response object
         """
-        with self.get_client(url) as client:
-            logger.debug(f"Fetching URL: {url}")
+        client = self.get_client(url)
+        logger.debug(f"Fetching URL: {url}")
 
-            request_headers = self.headers.copy()
-            if headers:
-                request_headers.update(headers)
+        request_headers = self.headers.copy()
+        if headers:
+            request_headers.update(headers)
 
-            try:
-                response = client.get(url, headers=request_headers)
-                response.raise_for_status()
+        try:
+            response = client.get(url, headers=request_headers)
+            response.raise_for_status()
 
-                logger.debug(f"Successfully fetched {url}: {response.status_code}")
-                return response
+            logger.debug(f"Successfully fetched {url}: {response.status_code}")
+            return response
+
+        except httpx.HTTPStatusError as e:
+            # Categorize HTTP errors
+            categorized_error = categorize_http_error(e)
+            status_code = e.response.status_code
+
+            if status_code >= 500 or log_client_errors:
+                level = logging.ERROR if status_code >= 500 else logging.DEBUG
+                logger.log(
+                    level,
+                    "HTTP error %s for %s",
+                    status_code,
+                    url,
+                    extra={
+                        "component": "http_service",
+                        "operation": "http_fetch",
+                        "context_data": {"url": url, "status_code": status_code},
+                    },
+                )
+
+            # Raise categorized error (may be NonRetryableError)
+            raise categorized_error from e
+
+        except httpx.ConnectError as e:
+            # Check if this is an SSL error that shouldn't be retried
+            if is_ssl_error(e):
+                logger.warning(
+                    "SSL error for %s: %s",
+                    url,
+                    e,
+                    extra={
+                        "component": "http_service",
+                        "operation": "http_fetch",
+                        "context_data": {"url": url, "error_type": "ssl_error"},
+                    },
+                )
+                raise NonRetryableError(f"SSL error: {e}") from e
 
-            except httpx.HTTPStatusError as e:
-                # Categorize HTTP errors
-                categorized_error = categorize_http_error(e)
-                status_code = e.response.status_code
-
-                if status_code >= 500 or log_client_errors:
-                    level = logging.ERROR if status_code >= 500 else logging.DEBUG
-                    logger.log(
-                        level,
-                        "HTTP error %s for %s",
-                        status_code,
-                        url,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_fetch",
-                            "context_data": {"url": url, "status_code": status_code},
-                        },
-                    )
-
-                # Raise categorized error (may be NonRetryableError)
-                raise categorized_error from e
-
-            except httpx.ConnectError as e:
-                # Check if this is an SSL error that shouldn't be retried
-                if is_ssl_error(e):
-                    logger.warning(
-                        "SSL error for %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_fetch",
-                            "context_data": {"url": url, "error_type": "ssl_error"},
-                        },
-                    )
-                    raise NonRetryableError(f"SSL error: {e}") from e
-
-                if is_dns_resolution_error(e):
-                    log_method = logger.warning if log_exceptions else logger.debug
-                    log_method(
-                        "DNS resolution error for %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_fetch",
-                            "context_data": {"url": url, "error_type": "dns_resolution_error"},
-                        },
-                    )
-                    raise NonRetryableError(f"DNS resolution error: {e}") from e
-
-                if log_exceptions:
-                    logger.exception(
-                        "Connection error for %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_fetch",
-                            "context_data": {"url": url, "error_type": "connection_error"},
-                        },
-                    )
-                else:
-                    logger.debug(
-                        "Connection error for %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_fetch",
-                            "context_data": {"url": url, "error_type": "connection_error"},
-                        },
-                    )
-                raise
-
-            except Exception as e:
-                if log_exceptions:
-                    logger.exception(
-                        "HTTP fetch error for %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_fetch",
-                            "context_data": {"url": url},
-                        },
-                    )
-                else:
-                    logger.debug(
-                        "HTTP fetch error for %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_fetch",
-                            "context_data": {"url": url},
-                        },
-                    )
-                raise
+            if is_dns_resolution_error(e):
+                log_method = logger.warning if log_exceptions else logger.debug
+                log_method(
+                    "DNS resolution error for %s: %s",
+                    url,
+                    e,
+                    extra={
+                        "component": "http_service",
+                        "operation": "http_fetch",
+                        "context_data": {"url": url, "error_type": "dns_resolution_error"},
+                    },
+                )
+                raise NonRetryableError(f"DNS resolution error: {e}") from e
+
+            if log_exceptions:
+                logger.exception(
+                    "Connection error for %s: %s",
+                    url,
+                    e,
+                    extra={
+                        "component": "http_service",
+                        "operation": "http_fetch",
+                        "context_data": {"url": url, "error_type": "connection_error"},
+                    },
+                )
+            else:
+                logger.debug(
+                    "Connection error for %s: %s",
+                    url,
+                    e,
+                    extra={
+                        "component": "http_service",
+                        "operation": "http_fetch",
+                        "context_data": {"url": url, "error_type": "connection_error"},
+                    },
+                )
+            raise
+
+        except Exception as e:
+            if log_exceptions:
+                logger.exception(
+                    "HTTP fetch error for %s: %s",
+                    url,
+                    e,
+                    extra={
+                        "component": "http_service",
+                        "operation": "http_fetch",
+                        "context_data": {"url": url},
+                    },
+                )
+            else:
+                logger.debug(
+                    "HTTP fetch error for %s: %s",
+                    url,
+                    e,
+                    extra={
+                        "component": "http_service",
+                        "operation": "http_fetch",
+                        "context_data": {"url": url},
+                    },
+                )
+            raise
 
     @retry(
         stop=stop_after_attempt(3),
@@ -349,231 +357,240 @@ class HttpService:
         Returns:
             httpx.Response object
         """
-        with self.get_client(url) as client:
-            logger.debug(f"Fetching HEAD: {url}")
-
-            request_headers = self.headers.copy()
-            if headers:
-                request_headers.update(headers)
+        client = self.get_client(url)
+        logger.debug(f"Fetching HEAD: {url}")
 
-            try:
-                response = client.head(url, headers=request_headers)
-                if allow_statuses and response.status_code in allow_statuses:
-                    return response
+        request_headers = self.headers.copy()
+        if headers:
+            request_headers.update(headers)
 
-                response.raise_for_status()
-
-                logger.debug(f"Successfully fetched HEAD {url}: {response.status_code}")
+        try:
+            response = client.head(url, headers=request_headers)
+            if allow_statuses and response.status_code in allow_statuses:
                 return response
 
-            except httpx.HTTPStatusError as e:
-                categorized_error = categorize_http_error(e)
-                status_code = e.response.status_code
-                if status_code >= 500 or log_client_errors:
-                    level = logging.ERROR if status_code >= 500 else logging.DEBUG
-
-                    logger.log(
-                        level,
-                        "HTTP error %s for HEAD %s",
-                        status_code,
-                        url,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_head",
-                            "context_data": {"url": url, "status_code": status_code},
-                        },
-                    )
-
-                raise categorized_error from e
-
-            except httpx.ConnectError as e:
-                if is_ssl_error(e):
-                    logger.warning(
-                        "SSL error for HEAD %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_head",
-                            "context_data": {"url": url, "error_type": "ssl_error"},
-                        },
-                    )
-                    raise NonRetryableError(f"SSL error: {e}") from e
-
-                if is_dns_resolution_error(e):
-                    log_method = logger.warning if log_exceptions else logger.debug
-                    log_method(
-                        "DNS resolution error for HEAD %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_head",
-                            "context_data": {"url": url, "error_type": "dns_resolution_error"},
-                        },
-                    )
-                    raise NonRetryableError(f"DNS resolution error: {e}") from e
-
-                if log_exceptions:
-                    logger.exception(
-                        "Connection error for HEAD %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_head",
-                            "context_data": {"url": url, "error_type": "connection_error"},
-                        },
-                    )
-                else:
-                    logger.debug(
-                        "Connection error for HEAD %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_head",
-                            "context_data": {"url": url, "error_type": "connection_error"},
-                        },
-                    )
-                raise
-
-            except Exception as e:
-                if log_exceptions:
-                    logger.exception(
-                        "HTTP HEAD error for %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_head",
-                            "context_data": {"url": url},
-                        },
-                    )
-                else:
-                    logger.debug(
-                        "HTTP HEAD error for %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_head",
-                            "context_data": {"url": url},
-                        },
-                    )
-                raise
+            response.raise_for_status()
 
-    def fetch_content(
-        self, url: str, headers: dict[str, str] | None = None
-    ) -> tuple[str | bytes, dict[str, str]]:
-        """
-        Fetch content synchronously and return both content and headers.
-
-        Returns:
-            Tuple of (content, response_headers)
-        """
-        # Determine SSL verification settings
-        verify_ssl = True
-        if url and should_bypass_ssl(url):
-            verify_ssl = False
-            logger.warning(f"Bypassing SSL verification for {urlparse(url).netloc}")
+            logger.debug(f"Successfully fetched HEAD {url}: {response.status_code}")
+            return response
 
-        with httpx.Client(
-            timeout=self.timeout, follow_redirects=True, headers=self.headers, verify=verify_ssl
-        ) as client:
-            logger.debug(f"Fetching URL (sync): {url}")
+        except httpx.HTTPStatusError as e:
+            categorized_error = categorize_http_error(e)
+            status_code = e.response.status_code
+            if status_code >= 500 or log_client_errors:
+                level = logging.ERROR if status_code >= 500 else logging.DEBUG
 
-            request_headers = self.headers.copy()
-            if headers:
-                request_headers.update(headers)
-
-            try:
-                response = client.get(url, headers=request_headers)
-                response.raise_for_status()
+                logger.log(
+                    level,
+                    "HTTP error %s for HEAD %s",
+                    status_code,
+                    url,
+                    extra={
+                        "component": "http_service",
+                        "operation": "http_head",
+                        "context_data": {"url": url, "status_code": status_code},
+                    },
+                )
 
-                logger.debug(f"Successfully fetched {url}: {response.status_code}")
+            raise categorized_error from e
 
-                # Try to decode as text
-                content_type = response.headers.get("Content-Type", "")
-                content: str | bytes
-                if "text" in content_type or "html" in content_type or "xml" in content_type:
-                    content = response.text
-                else:
-                    content = response.content
+        except httpx.ConnectError as e:
+            if is_ssl_error(e):
+                logger.warning(
+                    "SSL error for HEAD %s: %s",
+                    url,
+                    e,
+                    extra={
+                        "component": "http_service",
+                        "operation": "http_head",
+                        "context_data": {"url": url, "error_type": "ssl_error"},
+                    },
+                )
+                raise NonRetryableError(f"SSL error: {e}") from e
 
-                return content, dict(response.headers)
+            if is_dns_resolution_error(e):
+                log_method = logger.warning if log_exceptions else logger.debug
+                log_method(
+                    "DNS resolution error for HEAD %s: %s",
+                    url,
+                    e,
+                    extra={
+                        "component": "http_service",
+                        "operation": "http_head",
+                        "context_data": {"url": url, "error_type": "dns_resolution_error"},
+                    },
+                )
+                raise NonRetryableError(f"DNS resolution error: {e}") from e
 
-            except httpx.HTTPStatusError as e:
-                # Categorize HTTP errors
-                categorized_error = categorize_http_error(e)
+            if log_exceptions:
+                logger.exception(
+                    "Connection error for HEAD %s: %s",
+                    url,
+                    e,
+                    extra={
+                        "component": "http_service",
+                        "operation": "http_head",
+                        "context_data": {"url": url, "error_type": "connection_error"},
+                    },
+                )
+            else:
+                logger.debug(
+                    "Connection error for HEAD %s: %s",
+                    url,
+                    e,
+                    extra={
+                        "component": "http_service",
+                        "operation": "http_head",
+                        "context_data": {"url": url, "error_type": "connection_error"},
+                    },
+                )
+            raise
 
-                # Log the error
-                logger.error(
-                    "HTTP error %s for %s",
-                    e.response.status_code,
+        except Exception as e:
+            if log_exceptions:
+                logger.exception(
+                    "HTTP HEAD error for %s: %s",
                     url,
+                    e,
                     extra={
                         "component": "http_service",
-                        "operation": "http_fetch",
-                        "context_data": {"url": url, "status_code": e.response.status_code},
+                        "operation": "http_head",
+                        "context_data": {"url": url},
                     },
                 )
+            else:
+                logger.debug(
+                    "HTTP HEAD error for %s: %s",
+                    url,
+                    e,
+                    extra={
+                        "component": "http_service",
+                        "operation": "http_head",
+                        "context_data": {"url": url},
+                    },
+                )
+            raise
 
-                # Raise categorized error (may be NonRetryableError)
-                raise categorized_error from e
-
-            except httpx.ConnectError as e:
-                # Check if this is an SSL error that shouldn't be retried
-                if is_ssl_error(e):
-                    logger.warning(
-                        "SSL error for %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_fetch",
-                            "context_data": {"url": url, "error_type": "ssl_error"},
-                        },
-                    )
-                    raise NonRetryableError(f"SSL error: {e}") from e
-
-                if is_dns_resolution_error(e):
-                    logger.warning(
-                        "DNS resolution error for %s: %s",
-                        url,
-                        e,
-                        extra={
-                            "component": "http_service",
-                            "operation": "http_fetch",
-                            "context_data": {"url": url, "error_type": "dns_resolution_error"},
-                        },
-                    )
-                    raise NonRetryableError(f"DNS resolution error: {e}") from e
+    def fetch_content(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        cache_stage: str | None = None,
+    ) -> tuple[str | bytes, dict[str, str]]:
+        """
+        Fetch content synchronously and return both content and headers.
 
-                logger.exception(
-                    "Connection error for %s: %s",
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+            cache_stage: Pipeline stage whose freshness policy allows serving the
+                response from, and storing it in, the raw page cache
+
+        Returns:
+            Tuple of (content, response_headers)
+        """
+        page_cache = get_raw_page_cache() if cache_stage else None
+        if page_cache is not None and cache_stage:
+            cached_page = page_cache.get(url, stage=cache_stage, request_headers=headers)
+            if cached_page is not None:
+                if _is_text_content_type(cached_page.content_type):
+                    return cached_page.text, dict(cached_page.headers)
+                return cached_page.body, dict(cached_page.headers)
+
+        client = self.get_client(url)
+        logger.debug(f"Fetching URL (sync): {url}")
+
+        request_headers = self.headers.copy()
+        if headers:
+            request_headers.update(headers)
+
+        try:
+            response = client.get(url, headers=request_headers)
+            response.raise_for_status()
+
+            logger.debug(f"Successfully fetched {url}: {response.status_code}")
+            if page_cache is not None:
+                page_cache.put_response(response, url=url, request_headers=headers)
+
+            # Try to decode as text
+            content_type = response.headers.get("Content-Type", "")
+            content: str | bytes = (
+                response.text if _is_text_content_type(content_type) else response.content
+            )
+
+            return content, dict(response.headers)
+
+        except httpx.HTTPStatusError as e:
+            # Categorize HTTP errors
+            categorized_error = categorize_http_error(e)
+
+            # Log the error
+            logger.error(
+                "HTTP error %s for %s",
+                e.response.status_code,
+                url,
+                extra={
+                    "component": "http_service",
+                    "operation": "http_fetch",
+                    "context_data": {"url": url, "status_code": e.response.status_code},
+                },
+            )
+
+            # Raise categorized error (may be NonRetryableError)
+            raise categorized_error from e
+
+        except httpx.ConnectError as e:
+            # Check if this is an SSL error that shouldn't be retried
+            if is_ssl_error(e):
+                logger.warning(
+                    "SSL error for %s: %s",
                     url,
                     e,
                     extra={
                         "component": "http_service",
                         "operation": "http_fetch",
-                        "context_data": {"url": url, "error_type": "connection_error"},
+                        "context_data": {"url": url, "error_type": "ssl_error"},
                     },
                 )
-                raise
+                raise NonRetryableError(f"SSL error: {e}") from e
 
-            except Exception as e:
-                logger.exception(
-                    "HTTP fetch error for %s: %s",
+            if is_dns_resolution_error(e):
+                logger.warning(
+                    "DNS resolution error for %s: %s",
                     url,
                     e,
                     extra={
                         "component": "http_service",
                         "operation": "http_fetch",
-                        "context_data": {"url": url},
+                        "context_data": {"url": url, "error_type": "dns_resolution_error"},
                     },
                 )
-                raise
+                raise NonRetryableError(f"DNS resolution error: {e}") from e
+
+            logger.exception(
+                "Connection error for %s: %s",
+                url,
+                e,
+                extra={
+                    "component": "http_service",
+                    "operation": "http_fetch",
+                    "context_data": {"url": url, "error_type": "connection_error"},
+                },
+            )
+            raise
+
+        except Exception as e:
+            logger.exception(
+                "HTTP fetch error for %s: %s",
+                url,
+                e,
+                extra={
+                    "component": "http_service",
+                    "operation": "http_fetch",
+                    "context_data": {"url": url},
+                },
+            )
+            raise
 
 
 # Global instance
@@ -3,7 +3,7 @@
 Pipeline:
 1. Load the user's most-recent knowledge saves (title + summary snippets).
 2. Ask an LLM to name 3-4 recurring themes across those items.
-3. For each theme, run an Exa web search to surface fresh perspectives.
+3. Run one Exa web search per theme, concurrently, to surface fresh perspectives.
 4. Synthesize a structured insight report that combines the user's library and
    the web findings.
 5. Persist the result as a ``Content`` row + per-user inbox entry.
@@ -29,7 +29,8 @@ from app.core.logging import get_logger
 from app.core.model_defaults import SMART_ANTHROPIC_MODEL_SPEC, SMART_MODEL_SPEC
 from app.models.contracts import ContentClassification, ContentStatus, ContentType
 from app.models.schema import Content, ContentKnowledgeSave, ContentStatusEntry
-from app.services.exa_client import ExaSearchResult, exa_search, get_exa_client
+from app.services.exa_client import ExaSearchResult, get_exa_client
+from app.services.gateways.exa_gateway import get_exa_gateway
 from app.services.llm_models import build_pydantic_model
 
 logger = get_logger(__name__)
@@ -241,16 +242,15 @@ def extract_themes(knowledge_items: list[KnowledgeItem]) -> list[str]:
 
 
 def search_web_for_themes(themes: list[str]) -> dict[str, list[ExaSearchResult]]:
-    """Run an Exa search per theme; return a theme -> results mapping."""
+    """Run one Exa search per theme concurrently; return a theme -> results mapping."""
     if get_exa_client() is None:
         logger.warning("Exa client unavailable; skipping web augmentation")
         return {theme: [] for theme in themes}
 
-    results: dict[str, list[ExaSearchResult]] = {}
-    for theme in themes:
+    def _search_theme(theme: str) -> list[ExaSearchResult]:
         query = f"Recent developments and analysis of {theme}"
         try:
-            results[theme] = exa_search(
+            return gateway.search(
                 query,
                 num_results=EXA_RESULTS_PER_THEME,
                 max_characters=1200,
@@ -258,8 +258,11 @@ def search_web_for_themes(themes: list[str]) -> dict[str, list[ExaSearchResult]]
             )
         except Exception:
             logger.exception("Exa search failed for theme %r", theme)
-            results[theme] = []
-    return results
+            return []
+
+    gateway = get_exa_gateway()
+    theme_results = gateway.map_concurrently(_search_theme, themes)
+    return dict(zip(themes, theme_results, strict=True))
 
 
 def _format_web_results(theme_results: dict[str, list[ExaSearchResult]]) -> str:
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import hashlib
+from collections.abc import Sequence
+from datetime import UTC, datetime
 from functools import lru_cache
 from typing import Any
 
 import numpy as np
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.orm import Session
 
 from app.core.logging import get_logger
 from app.core.settings import get_settings
+from app.models.schema import NewsItemEmbedding
 
 logger = get_logger(__name__)
 
 
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 def resolve_transformer_device(preferred: str) -> str:
     candidate = preferred.strip().lower()
     if candidate and candidate != "auto":
@@ -73,3 +83,83 @@ def encode_news_texts(texts: list[str]) -> np.ndarray:
 
 def clear_news_embedding_cache() -> None:
     get_news_embedding_model.cache_clear()
+
+
+def news_text_sha256(text: str) -> str:
+    """Return the stable hash used to key stored view vectors."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def load_stored_news_vectors(
+    db: Session,
+    *,
+    view: str,
+    keys: Sequence[tuple[int, str]],
+    model_name: str | None = None,
+) -> dict[tuple[int, str], np.ndarray]:
+    """Load persisted vectors for `(news_item_id, text_sha256)` keys of one view."""
+    if not keys:
+        return {}
+    resolved_model = model_name or get_settings().news_embedding_model
+    item_ids = sorted({item_id for item_id, _text_hash in keys})
+    wanted = set(keys)
+    rows = (
+        db.query(NewsItemEmbedding)
+        .filter(NewsItemEmbedding.model_name == resolved_model)
+        .filter(NewsItemEmbedding.view == view)
+        .filter(NewsItemEmbedding.news_item_id.in_(item_ids))
+        .all()
+    )
+    vectors: dict[tuple[int, str], np.ndarray] = {}
+    for row in rows:
+        key = (int(row.news_item_id), str(row.text_sha256))
+        if key not in wanted:
+            continue
+        vectors[key] = np.frombuffer(row.vector, dtype=np.float32)
+    return vectors
+
+
+def store_news_vectors(
+    db: Session,
+    *,
+    view: str,
+    entries: Sequence[tuple[int, str, np.ndarray]],
+    model_name: str | None = None,
+) -> None:
+    """Persist `(news_item_id, text_sha256, vector)` entries for one view.
+
+    An existing row for the same text hash is overwritten, so vectors re-encoded
+    after an encoder shape change replace the stale ones instead of being
+    re-encoded on every later read.
+    """
+    if not entries:
+        return
+    resolved_model = model_name or get_settings().news_embedding_model
+    deduped: dict[tuple[int, str], np.ndarray] = {}
+    for item_id, text_hash, vector in entries:
+        deduped.setdefault((item_id, text_hash), vector)
+    now = _utcnow()
+    stmt = postgresql_insert(NewsItemEmbedding).values(
+        [
+            {
+                "news_item_id": item_id,
+                "view": view,
+                "model_name": resolved_model,
+                "text_sha256": text_hash,
+                "dimensions": int(vector.shape[0]),
+                "vector": np.asarray(vector, dtype=np.float32).tobytes(),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for (item_id, text_hash), vector in deduped.items()
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_news_item_embeddings_item_view_model_text",
+        set_={
+            "dimensions": stmt.excluded.dimensions,
+            "vector": stmt.excluded.vector,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    db.execute(stmt)
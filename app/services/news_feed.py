@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
@@ -13,6 +16,7 @@ from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
 from app.constants import AGGREGATOR_SCRAPER_TYPE
+from app.core.settings import get_settings
 from app.models.api.common import (
     ContentDetailResponse,
     ContentListResponse,
@@ -28,6 +32,7 @@ from app.queries.news_item_content_adapter import (
     present_news_item_detail,
     present_news_item_summary,
 )
+from app.repositories.stat_counter_repository import UNREAD_NEWS_COUNTER, apply_counter_deltas
 from app.utils.pagination import PaginationCursor
 
 # Brutalist Report is the only aggregator that surfaces topic subscriptions; we
@@ -35,6 +40,21 @@ from app.utils.pagination import PaginationCursor
 # ``raw_metadata.aggregator.topic`` in the JSON column.
 _TOPIC_SCOPED_AGGREGATOR_KEYS: frozenset[str] = frozenset({"brutalist"})
 
+# user_id -> (cached_at, aggregator selections, has user-scoped scraper news). Only a
+# positive scraper-news flag is cached; a negative one is rechecked because the first
+# ingested scraper item happens in another process.
+_VISIBILITY_CACHE: dict[int, tuple[float, dict[str, list[str]], bool]] = {}
+_VISIBILITY_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class NewsVisibilityDescriptor:
+    """Per-user inputs of the news visibility filter, shared by feed, counts and stats."""
+
+    user_id: int
+    aggregator_selections: dict[str, list[str]]
+    has_user_scraper_news: bool
+
 
 def _read_status_insert_for_dialect(db: Session):
     """Return the canonical insert builder for news-item read-status writes."""
@@ -114,14 +134,19 @@ def _user_aggregator_subscriptions(db: Session, *, user_id: int) -> dict[str, li
 
 
 def _aggregator_visibility_clause(selections: dict[str, list[str]]):
-    """Build the GLOBAL-scope OR clause restricted to the user's aggregators."""
+    """Build the GLOBAL-scope clause restricted to the user's aggregators.
+
+    Untopiced aggregators collapse into one ``platform IN (...)`` test so the planner
+    can use the platform index; only topic-scoped picks need a JSON predicate.
+    """
     if not selections:
         return None
 
     aggregator_topic_path = sa_cast(NewsItem.raw_metadata, JSONB)["aggregator"]["topic"].astext
 
+    platform_keys: list[str] = []
     per_key_clauses = []
-    for key, topics in selections.items():
+    for key, topics in sorted(selections.items()):
         if key in _TOPIC_SCOPED_AGGREGATOR_KEYS and topics:
             per_key_clauses.append(
                 and_(
@@ -130,18 +155,68 @@ def _aggregator_visibility_clause(selections: dict[str, list[str]]):
                 )
             )
         else:
-            per_key_clauses.append(NewsItem.platform == key)
+            platform_keys.append(key)
+    if platform_keys:
+        per_key_clauses.insert(0, NewsItem.platform.in_(platform_keys))
 
     return or_(*per_key_clauses)
 
 
-def build_visible_news_item_filter(db: Session, *, user_id: int):
+def get_news_visibility_descriptor(db: Session, *, user_id: int) -> NewsVisibilityDescriptor:
+    """Return the user's visibility inputs, cached for ``news_visibility_cache_ttl_seconds``.
+
+    Scraper-config writes call ``invalidate_news_visibility_descriptor``; the TTL bounds
+    staleness for changes made in other processes.
+    """
+    ttl = get_settings().news_visibility_cache_ttl_seconds
+    now = time.monotonic()
+    with _VISIBILITY_CACHE_LOCK:
+        cached = _VISIBILITY_CACHE.get(user_id)
+    if cached is not None and ttl > 0 and now - cached[0] <= ttl:
+        _cached_at, selections, has_user_scraper_news = cached
+    else:
+        selections = _user_aggregator_subscriptions(db, user_id=user_id)
+        has_user_scraper_news = False
+        if ttl > 0:
+            with _VISIBILITY_CACHE_LOCK:
+                _VISIBILITY_CACHE[user_id] = (now, selections, False)
+
+    if not selections and not has_user_scraper_news:
+        has_user_scraper_news = _has_user_scoped_scraper_news(db, user_id=user_id)
+        if has_user_scraper_news and ttl > 0:
+            with _VISIBILITY_CACHE_LOCK:
+                if user_id in _VISIBILITY_CACHE:
+                    _VISIBILITY_CACHE[user_id] = (now, selections, True)
+
+    return NewsVisibilityDescriptor(
+        user_id=user_id,
+        aggregator_selections=selections,
+        has_user_scraper_news=has_user_scraper_news,
+    )
+
+
+def invalidate_news_visibility_descriptor(user_id: int | None = None) -> None:
+    """Drop one user's cached visibility inputs, or every user's when ``user_id`` is None."""
+    with _VISIBILITY_CACHE_LOCK:
+        if user_id is None:
+            _VISIBILITY_CACHE.clear()
+        else:
+            _VISIBILITY_CACHE.pop(user_id, None)
+
+
+def build_visible_news_item_filter(
+    db: Session,
+    *,
+    user_id: int,
+    descriptor: NewsVisibilityDescriptor | None = None,
+):
+    if descriptor is None:
+        descriptor = get_news_visibility_descriptor(db, user_id=user_id)
     user_clause = and_(
         NewsItem.visibility_scope == NewsItemVisibilityScope.USER.value,
         NewsItem.owner_user_id == user_id,
     )
-    selections = _user_aggregator_subscriptions(db, user_id=user_id)
-    aggregator_clause = _aggregator_visibility_clause(selections)
+    aggregator_clause = _aggregator_visibility_clause(descriptor.aggregator_selections)
 
     if aggregator_clause is not None:
         # User has explicit aggregator picks: GLOBAL rows must match a selected
@@ -154,7 +229,7 @@ def build_visible_news_item_filter(db: Session, *, user_id: int):
         )
         return or_(global_clause, user_clause)
 
-    if _has_user_scoped_scraper_news(db, user_id=user_id):
+    if descriptor.has_user_scraper_news:
         return user_clause
 
     # Backwards-compat fallback for users who haven't picked aggregators yet:
@@ -335,6 +410,11 @@ def bulk_mark_news_items_read(
             .returning(NewsItemReadStatus.news_item_id)
         )
         inserted_ids = db.execute(stmt).scalars().all()
+        apply_counter_deltas(
+            db,
+            user_id=user_id,
+            deltas={UNREAD_NEWS_COUNTER: -len(inserted_ids)},
+        )
         db.commit()
         marked_count = len(inserted_ids)
     except OperationalError:
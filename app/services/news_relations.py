@@ -7,6 +7,7 @@ from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import numpy as np
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
@@ -14,7 +15,12 @@ from app.core.logging import get_logger
 from app.core.settings import get_settings
 from app.models.contracts import NewsItemStatus, NewsItemVisibilityScope
 from app.models.schema import NewsItem
-from app.services.news_embeddings import encode_news_texts
+from app.services.news_embeddings import (
+    encode_news_texts,
+    load_stored_news_vectors,
+    news_text_sha256,
+    store_news_vectors,
+)
 from app.services.news_reranker import rerank_news_documents
 from app.utils.news_titles import (
     get_news_article_title,
@@ -173,7 +179,68 @@ def candidate_title_matching_text(item: NewsItem) -> str:
     )
 
 
+def _encode_with_stored_vectors(
+    db: Session,
+    *,
+    item: NewsItem,
+    item_text: str,
+    view: str,
+    candidate_texts: list[tuple[NewsItem, str]],
+) -> np.ndarray:
+    """Encode the item text and candidate texts, reusing persisted candidate vectors.
+
+    The item text always leads the batch so row 0 is the query vector. Candidate
+    texts that already have a stored vector for the active model are not
+    re-encoded; freshly encoded vectors are persisted so each representative is
+    embedded once per distinct text instead of once per comparison.
+    """
+    candidate_keys = [
+        (_require_news_item_id(candidate), news_text_sha256(text))
+        for candidate, text in candidate_texts
+    ]
+    stored = load_stored_news_vectors(db, view=view, keys=candidate_keys)
+    missing_positions = [
+        position for position, key in enumerate(candidate_keys) if key not in stored
+    ]
+    fresh = encode_news_texts(
+        [item_text, *[candidate_texts[position][1] for position in missing_positions]]
+    )
+    if fresh.size == 0:
+        return fresh
+
+    dimensions = fresh.shape[1]
+    if any(vector.shape[0] != dimensions for vector in stored.values()):
+        # Stored vectors came from a different encoder shape; rebuild the batch.
+        stored = {}
+        missing_positions = list(range(len(candidate_texts)))
+        fresh = encode_news_texts([item_text, *[text for _candidate, text in candidate_texts]])
+        if fresh.size == 0:
+            return fresh
+
+    fresh_by_position = {
+        position: fresh[offset] for offset, position in enumerate(missing_positions, start=1)
+    }
+    rows = [fresh[0]]
+    for position, key in enumerate(candidate_keys):
+        vector = fresh_by_position.get(position)
+        rows.append(vector if vector is not None else stored[key])
+
+    store_news_vectors(
+        db,
+        view=view,
+        entries=[
+            (_require_news_item_id(item), news_text_sha256(item_text), fresh[0]),
+            *[
+                (*candidate_keys[position], vector)
+                for position, vector in fresh_by_position.items()
+            ],
+        ],
+    )
+    return np.vstack(rows)
+
+
 def _candidate_title_similarity_scores(
+    db: Session,
     item: NewsItem,
     candidates: list[NewsItem],
 ) -> list[float | None]:
@@ -181,17 +248,23 @@ def _candidate_title_similarity_scores(
     if not item_text:
         return [None] * len(candidates)
 
-    variant_texts: list[str] = []
+    variant_texts: list[tuple[NewsItem, str]] = []
     variant_candidate_indexes: list[int] = []
     for candidate_index, candidate in enumerate(candidates):
         for title in _cluster_related_titles(candidate):
-            variant_texts.append(f"Title: {title}")
+            variant_texts.append((candidate, f"Title: {title}"))
             variant_candidate_indexes.append(candidate_index)
 
     if not variant_texts:
         return [None] * len(candidates)
 
-    vectors = encode_news_texts([item_text, *variant_texts])
+    vectors = _encode_with_stored_vectors(
+        db,
+        item=item,
+        item_text=item_text,
+        view="title",
+        candidate_texts=variant_texts,
+    )
     if vectors.size == 0:
         return [None] * len(candidates)
 
@@ -429,9 +502,11 @@ def _combine_view_scores(*, view_scores: dict[str, list[float | None]]) -> list[
 
 
 def _view_similarity_scores(
+    db: Session,
     item: NewsItem,
     candidates: list[NewsItem],
     *,
+    view: str,
     item_view_builder: Callable[[NewsItem], str],
     candidate_view_builder: Callable[[NewsItem], str] | None = None,
 ) -> list[float | None]:
@@ -445,8 +520,14 @@ def _view_similarity_scores(
     if not non_empty_indexes:
         return [None] * len(candidates)
 
-    vectors = encode_news_texts(
-        [item_text, *[candidate_texts[index] for index in non_empty_indexes]]
+    vectors = _encode_with_stored_vectors(
+        db,
+        item=item,
+        item_text=item_text,
+        view=view,
+        candidate_texts=[
+            (candidates[index], candidate_texts[index]) for index in non_empty_indexes
+        ],
     )
     if vectors.size == 0:
         return [None] * len(candidates)
@@ -666,15 +747,19 @@ def find_related_representative(
 
     similarity_scores = _combine_view_scores(
         view_scores={
-            "title": _candidate_title_similarity_scores(item, semantic_candidates),
+            "title": _candidate_title_similarity_scores(db, item, semantic_candidates),
             "content": _view_similarity_scores(
+                db,
                 item,
                 semantic_candidates,
+                view="content",
                 item_view_builder=content_matching_text,
             ),
             "provenance": _view_similarity_scores(
+                db,
                 item,
                 semantic_candidates,
+                view="provenance",
                 item_view_builder=provenance_matching_text,
             ),
         },
@@ -1,17 +1,30 @@
-"""Qwen reranker helpers for title-aware news relation matching."""
+"""Qwen reranker helpers for title-aware news relation matching.
+
+Scores are cached by a hash of (model, precision, instruction, query, document) in
+process and in ``news_reranker_scores``, so reprocessed items never rescore known
+pairs. Cache misses from concurrent callers are coalesced into shared model batches.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from functools import lru_cache
 from typing import Any, cast
 
 import torch
 import torch.nn.functional as functional
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.exc import SQLAlchemyError
 from transformers import AutoModelForCausalLM, AutoTokenizer
 
+from app.core.db import get_db
 from app.core.logging import get_logger
 from app.core.settings import get_settings
+from app.models.schema import NewsRerankerScore
 from app.services.news_embeddings import resolve_transformer_device
 
 logger = get_logger(__name__)
@@ -33,6 +46,7 @@ RERANKER_SUFFIX = "<|im_end|>\n<|im_start|>assistant\n<think>\n\n</think>\n\n"
 @dataclass(frozen=True)
 class _NewsRerankerRuntime:
     device: str
+    precision: str
     tokenizer: Any
     model: Any
     prefix_tokens: list[int]
@@ -47,11 +61,20 @@ def _resolve_dtype(device: str) -> torch.dtype:
     return torch.float16
 
 
+def _resolve_precision(device: str) -> str:
+    """Return the weight precision label; it is part of every score cache key."""
+    if device == "cpu" and get_settings().news_list_reranker_cpu_quantization == "int8":
+        return "int8"
+    return str(_resolve_dtype(device)).removeprefix("torch.")
+
+
 @lru_cache(maxsize=1)
 def _get_news_reranker_runtime() -> _NewsRerankerRuntime:
     settings = get_settings()
     device = resolve_transformer_device(settings.news_list_reranker_device)
     model_id = settings.news_list_reranker_model
+    dtype = _resolve_dtype(device)
+    precision = _resolve_precision(device)
     logger.info(
         "Loading news reranker model",
         extra={
@@ -60,16 +83,25 @@ def _get_news_reranker_runtime() -> _NewsRerankerRuntime:
             "context_data": {
                 "model": model_id,
                 "device": device,
+                "precision": precision,
             },
         },
     )
     tokenizer: Any = AutoTokenizer.from_pretrained(model_id, padding_side="left")
     if tokenizer.pad_token is None:
         tokenizer.pad_token = tokenizer.eos_token
-    model: Any = AutoModelForCausalLM.from_pretrained(model_id, dtype=_resolve_dtype(device))
+    model: Any = AutoModelForCausalLM.from_pretrained(model_id, dtype=dtype)
     model = model.to(device).eval()
+    if precision == "int8":
+        # Dynamic int8 quantization of the Linear layers; activations stay float32.
+        model = torch.ao.quantization.quantize_dynamic(
+            model,
+            {torch.nn.Linear},
+            dtype=torch.qint8,
+        )
     return _NewsRerankerRuntime(
         device=device,
+        precision=precision,
         tokenizer=tokenizer,
         model=model,
         prefix_tokens=tokenizer.encode(RERANKER_PREFIX, add_special_tokens=False),
@@ -83,6 +115,196 @@ def _format_reranker_pair(*, instruction: str, query: str, document: str) -> str
     return f"<Instruct>: {instruction}\n<Query>: {query}\n<Document>: {document}"
 
 
+def score_news_reranker_pairs(pairs: list[str]) -> list[float]:
+    """Return yes-probabilities for formatted pairs, bypassing caches and coalescing.
+
+    Pairs are scored in length-sorted batches so each batch pads to similar lengths.
+    """
+    if not pairs:
+        return []
+
+    settings = get_settings()
+    runtime = _get_news_reranker_runtime()
+    tokenizer = runtime.tokenizer
+    prefix_tokens = runtime.prefix_tokens
+    suffix_tokens = runtime.suffix_tokens
+    max_body_length = (
+        settings.news_list_reranker_max_length - len(prefix_tokens) - len(suffix_tokens)
+    )
+    encoded = cast(
+        dict[str, list[list[int]]],
+        tokenizer(
+            pairs,
+            padding=False,
+            truncation="longest_first",
+            return_attention_mask=False,
+            max_length=max_body_length,
+        ),
+    )
+    body_ids = encoded["input_ids"]
+    order = sorted(range(len(pairs)), key=lambda index: len(body_ids[index]))
+    prefix = torch.tensor(prefix_tokens, dtype=torch.long)
+    suffix = torch.tensor(suffix_tokens, dtype=torch.long)
+    pad_token_id = int(tokenizer.pad_token_id)
+    scores = [0.0] * len(pairs)
+    batch_size = settings.news_list_reranker_batch_size
+    with torch.no_grad():
+        for start in range(0, len(order), batch_size):
+            batch_indexes = order[start : start + batch_size]
+            sequences = [
+                torch.cat((prefix, torch.tensor(body_ids[index], dtype=torch.long), suffix))
+                for index in batch_indexes
+            ]
+            width = max(len(sequence) for sequence in sequences)
+            input_ids = torch.full((len(sequences), width), pad_token_id, dtype=torch.long)
+            attention_mask = torch.zeros((len(sequences), width), dtype=torch.long)
+            for row, sequence in enumerate(sequences):
+                # Left padding keeps every row's final position on the answer token.
+                input_ids[row, width - len(sequence) :] = sequence
+                attention_mask[row, width - len(sequence) :] = 1
+            batch_logits = runtime.model(
+                input_ids=input_ids.to(runtime.device),
+                attention_mask=attention_mask.to(runtime.device),
+            ).logits[:, -1, :]
+            score_logits = torch.stack(
+                [
+                    batch_logits[:, runtime.false_token_id],
+                    batch_logits[:, runtime.true_token_id],
+                ],
+                dim=1,
+            )
+            batch_scores = functional.softmax(score_logits.float(), dim=1)[:, 1].tolist()
+            for index, score in zip(batch_indexes, batch_scores, strict=True):
+                scores[index] = float(score)
+    return scores
+
+
+@dataclass
+class _PendingRerank:
+    pairs: list[str]
+    done: threading.Event = field(default_factory=threading.Event)
+    scores: list[float] | None = None
+    error: BaseException | None = None
+
+
+class _RerankCoalescer:
+    """Merge concurrent scoring requests into shared model batches.
+
+    The first caller becomes the leader: it waits one coalescing window, then scores
+    every pending request together and repeats until the queue drains. Other callers
+    block until the leader publishes their scores.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: list[_PendingRerank] = []
+        self._leader_active = False
+
+    def score(self, pairs: list[str]) -> list[float]:
+        request = _PendingRerank(pairs=pairs)
+        with self._lock:
+            self._pending.append(request)
+            lead = not self._leader_active
+            self._leader_active = True
+
+        if lead:
+            window_seconds = get_settings().news_list_reranker_coalesce_window_ms / 1000
+            if window_seconds > 0:
+                time.sleep(window_seconds)
+            self._drain()
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return cast(list[float], request.scores)
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                batch = self._pending
+                self._pending = []
+                if not batch:
+                    self._leader_active = False
+                    return
+            unique_pairs = list(dict.fromkeys(pair for request in batch for pair in request.pairs))
+            try:
+                scored = dict(
+                    zip(unique_pairs, score_news_reranker_pairs(unique_pairs), strict=True)
+                )
+            except BaseException as exc:  # noqa: BLE001 - re-raised in every waiting caller
+                for request in batch:
+                    request.error = exc
+                    request.done.set()
+                continue
+            for request in batch:
+                request.scores = [scored[pair] for pair in request.pairs]
+                request.done.set()
+
+
+_coalescer = _RerankCoalescer()
+_score_cache: OrderedDict[str, float] = OrderedDict()
+_score_cache_lock = threading.Lock()
+
+
+def _pair_sha256(*, model_name: str, precision: str, pair: str) -> str:
+    return hashlib.sha256(f"{model_name}\n{precision}\n{pair}".encode()).hexdigest()
+
+
+def _remember_scores(scores: dict[str, float]) -> None:
+    capacity = get_settings().news_list_reranker_score_cache_size
+    if capacity <= 0:
+        return
+    with _score_cache_lock:
+        for pair_hash, score in scores.items():
+            _score_cache[pair_hash] = score
+            _score_cache.move_to_end(pair_hash)
+        while len(_score_cache) > capacity:
+            _score_cache.popitem(last=False)
+
+
+def _load_persisted_scores(pair_hashes: list[str]) -> dict[str, float]:
+    try:
+        with get_db() as db:
+            rows = (
+                db.query(NewsRerankerScore.pair_sha256, NewsRerankerScore.score)
+                .filter(NewsRerankerScore.pair_sha256.in_(pair_hashes))
+                .all()
+            )
+    except SQLAlchemyError:
+        logger.warning(
+            "Failed to read persisted news reranker scores",
+            exc_info=True,
+            extra={"component": "news_reranker", "operation": "score_cache_read"},
+        )
+        return {}
+    return {str(pair_hash): float(score) for pair_hash, score in rows}
+
+
+def _persist_scores(model_name: str, scores: dict[str, float]) -> None:
+    stmt = (
+        postgresql_insert(NewsRerankerScore)
+        .values(
+            [
+                {"pair_sha256": pair_hash, "model_name": model_name, "score": score}
+                for pair_hash, score in scores.items()
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=[NewsRerankerScore.pair_sha256])
+    )
+    try:
+        with get_db() as db:
+            db.execute(stmt)
+    except SQLAlchemyError:
+        logger.warning(
+            "Failed to persist news reranker scores",
+            exc_info=True,
+            extra={
+                "component": "news_reranker",
+                "operation": "score_cache_write",
+                "context_data": {"pair_count": len(scores)},
+            },
+        )
+
+
 def rerank_news_documents(
     *,
     query: str,
@@ -95,16 +317,8 @@ def rerank_news_documents(
         return [0.0] * len(documents)
 
     settings = get_settings()
-    runtime = _get_news_reranker_runtime()
-    tokenizer = runtime.tokenizer
-    model = runtime.model
-    prefix_tokens = runtime.prefix_tokens
-    suffix_tokens = runtime.suffix_tokens
-    true_token_id = runtime.true_token_id
-    false_token_id = runtime.false_token_id
-    max_body_length = (
-        settings.news_list_reranker_max_length - len(prefix_tokens) - len(suffix_tokens)
-    )
+    model_name = settings.news_list_reranker_model
+    precision = _resolve_precision(resolve_transformer_device(settings.news_list_reranker_device))
     pairs = [
         _format_reranker_pair(
             instruction=instruction,
@@ -113,39 +327,42 @@ def rerank_news_documents(
         )
         for document in documents
     ]
-    scores: list[float] = []
-    batch_size = settings.news_list_reranker_batch_size
-    with torch.no_grad():
-        for start in range(0, len(pairs), batch_size):
-            batch_pairs = pairs[start : start + batch_size]
-            inputs = cast(
-                dict[str, list[list[int]]],
-                tokenizer(
-                    batch_pairs,
-                    padding=False,
-                    truncation="longest_first",
-                    return_attention_mask=False,
-                    max_length=max_body_length,
-                ),
-            )
-            for index, token_ids in enumerate(inputs["input_ids"]):
-                inputs["input_ids"][index] = [*prefix_tokens, *token_ids, *suffix_tokens]
-            padded = cast(
-                dict[str, torch.Tensor],
-                tokenizer.pad(inputs, padding=True, return_tensors="pt"),
-            )
-            model_inputs: dict[str, torch.Tensor] = {}
-            for key, value in padded.items():
-                model_inputs[key] = value.to(runtime.device)
-            batch_logits = model(**model_inputs).logits[:, -1, :]
-            score_logits = torch.stack(
-                [batch_logits[:, false_token_id], batch_logits[:, true_token_id]],
-                dim=1,
+    pair_hashes = [
+        _pair_sha256(model_name=model_name, precision=precision, pair=pair) for pair in pairs
+    ]
+
+    known: dict[str, float] = {}
+    with _score_cache_lock:
+        for pair_hash in pair_hashes:
+            cached = _score_cache.get(pair_hash)
+            if cached is not None:
+                known[pair_hash] = cached
+
+    missing = [pair_hash for pair_hash in dict.fromkeys(pair_hashes) if pair_hash not in known]
+    if missing and settings.news_list_reranker_persist_scores:
+        persisted = _load_persisted_scores(missing)
+        known.update(persisted)
+        _remember_scores(persisted)
+
+    pairs_by_hash = dict(zip(pair_hashes, pairs, strict=True))
+    missing = [pair_hash for pair_hash in dict.fromkeys(pair_hashes) if pair_hash not in known]
+    if missing:
+        fresh = dict(
+            zip(
+                missing,
+                _coalescer.score([pairs_by_hash[pair_hash] for pair_hash in missing]),
+                strict=True,
             )
-            batch_scores = functional.softmax(score_logits, dim=1)[:, 1]
-            scores.extend(float(score) for score in batch_scores.tolist())
-    return scores
+        )
+        known.update(fresh)
+        _remember_scores(fresh)
+        if settings.news_list_reranker_persist_scores:
+            _persist_scores(model_name, fresh)
+
+    return [known[pair_hash] for pair_hash in pair_hashes]
 
 
 def clear_news_reranker_cache() -> None:
     _get_news_reranker_runtime.cache_clear()
+    with _score_cache_lock:
+        _score_cache.clear()
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any, Literal, cast
 
@@ -50,11 +49,13 @@ from app.models.schema import (
 )
 from app.models.user import User
 from app.repositories.content_repository import apply_visibility_filters, build_visibility_context
+from app.repositories.stat_counter_repository import apply_content_unread_deltas
 from app.scraping.atom_unified import load_atom_feeds
 from app.scraping.substack_unified import load_substack_feeds
-from app.services.exa_client import ExaSearchResult, exa_search
+from app.services.exa_client import ExaSearchResult
 from app.services.feed_detection import FeedDetector
 from app.services.feed_resolution import resolve_feed_candidate
+from app.services.gateways.exa_gateway import get_exa_gateway
 from app.services.gateways.task_queue_gateway import get_task_queue_gateway
 from app.services.llm_agents import get_basic_agent
 from app.services.long_form_images import enqueue_visible_long_form_images_for_content_ids
@@ -96,7 +97,6 @@ DISCOVERY_PROMPT_SNIPPET_CHARS = 280
 DISCOVERY_PROMPT_MAX_FILL_IN_FEEDS = 8
 DISCOVERY_PROMPT_MAX_FILL_IN_REDDIT = 8
 ONBOARDING_FEED_SUGGESTION_LIMIT = 5
-EXA_DISCOVERY_MAX_WORKERS = 8
 
 DEFAULT_SOURCE_LIMITS = {
     "substack": 8,
@@ -947,19 +947,15 @@ def _run_exa_queries(
     include_social: bool = False,
     telemetry: dict[str, Any] | None = None,
 ) -> list[ExaSearchResult]:
-    results: list[ExaSearchResult] = []
     exclude_domains: list[str] | None = [] if include_social else None
-    for query in queries:
-        results.extend(
-            exa_search(
-                query,
-                num_results=num_results,
-                max_characters=1200,
-                exclude_domains=exclude_domains,
-                telemetry=telemetry,
-            )
-        )
-    return results
+    query_results = get_exa_gateway().search_many(
+        list(queries),
+        num_results=num_results,
+        max_characters=1200,
+        exclude_domains=exclude_domains,
+        telemetry=telemetry,
+    )
+    return [item for raw_results in query_results for item in raw_results]
 
 
 def _run_discovery_exa_queries(
@@ -980,23 +976,18 @@ def _run_discovery_exa_queries(
     if not cleaned_queries:
         return results
 
-    max_workers = min(EXA_DISCOVERY_MAX_WORKERS, len(cleaned_queries))
-
-    def _search_query(query: str) -> tuple[str, list[ExaSearchResult]]:
-        return (
-            query,
-            exa_search(
-                query,
-                num_results=num_results,
-                max_characters=1200,
-                exclude_domains=exclude_domains,
-                telemetry=telemetry,
-            ),
-        )
-
-    # Preserve query order while still running network-bound Exa calls concurrently.
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        query_results = list(executor.map(_search_query, cleaned_queries))
+    # Preserve query order while the gateway runs network-bound Exa calls concurrently.
+    query_results = zip(
+        cleaned_queries,
+        get_exa_gateway().search_many(
+            cleaned_queries,
+            num_results=num_results,
+            max_characters=1200,
+            exclude_domains=exclude_domains,
+            telemetry=telemetry,
+        ),
+        strict=True,
+    )
 
     for query, raw_results in query_results:
         for item in raw_results:
@@ -2241,6 +2232,13 @@ def _seed_default_feed_content_for_user(
             for (content_id,) in content_ids
         ]
     )
+    apply_content_unread_deltas(
+        db,
+        user_id=user_id,
+        content_ids=[content_id for (content_id,) in content_ids],
+        delta=1,
+        require_unread=True,
+    )
     db.commit()
     enqueue_visible_long_form_images_for_content_ids(
         db,
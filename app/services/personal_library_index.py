@@ -0,0 +1,417 @@
+"""Persistent BM25 inverted index over one user's personal markdown library.
+
+The index lives next to the library as ``.search-index.json`` and stores per-file term
+frequencies plus the first line numbers each term appears on. Library writers update
+it incrementally; search reads it once per process (until the file changes) and only
+opens the handful of top-ranked files to render matching lines.
+"""
+
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_FILENAME = ".search-index.json"
+INDEX_VERSION = 1
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+MAX_LINES_PER_TERM = 8
+MAX_HITS_PER_FILE = 3
+BM25_K1 = 1.2
+BM25_B = 0.75
+PATH_MATCH_WEIGHT = 1.5
+PHRASE_MATCH_BONUS = 2.0
+# Query terms this long also match longer indexed terms ("embed" -> "embedding").
+MIN_PREFIX_LENGTH = 3
+PREFIX_MATCH_WEIGHT = 0.5
+MAX_PREFIX_EXPANSIONS = 50
+
+_cache_lock = threading.Lock()
+_loaded_indexes: dict[Path, tuple[int, PersonalLibraryIndex]] = {}
+_write_locks: dict[Path, threading.RLock] = {}
+
+
+def tokenize(text: str) -> list[str]:
+    """Return lowercase alphanumeric tokens of at least two characters."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if len(token) >= 2]
+
+
+@dataclass
+class IndexedFile:
+    """Term statistics for one markdown file."""
+
+    length: int
+    path_terms: list[str]
+    terms: dict[str, tuple[int, list[int]]]
+
+    def to_json(self) -> dict:
+        return {
+            "length": self.length,
+            "path_terms": self.path_terms,
+            "terms": {term: [tf, lines] for term, (tf, lines) in self.terms.items()},
+        }
+
+    @classmethod
+    def from_json(cls, raw: dict) -> IndexedFile:
+        return cls(
+            length=int(raw.get("length") or 0),
+            path_terms=[str(term) for term in raw.get("path_terms", [])],
+            terms={
+                str(term): (int(value[0]), [int(line) for line in value[1]])
+                for term, value in (raw.get("terms") or {}).items()
+            },
+        )
+
+
+@dataclass(frozen=True)
+class LibrarySearchHit:
+    """One ranked file with the line numbers that matched the query."""
+
+    relative_path: str
+    score: float
+    line_numbers: list[int]
+
+
+@dataclass
+class PersonalLibraryIndex:
+    """In-memory inverted index keyed by library-relative POSIX paths."""
+
+    files: dict[str, IndexedFile] = field(default_factory=dict)
+    _postings: dict[str, dict[str, int]] | None = field(default=None, init=False, repr=False)
+    _path_postings: dict[str, set[str]] = field(default_factory=dict, init=False, repr=False)
+    _vocabulary: list[str] = field(default_factory=list, init=False, repr=False)
+
+    def copy(self) -> PersonalLibraryIndex:
+        """Return an index that can be modified without affecting concurrent readers."""
+        return PersonalLibraryIndex(files=dict(self.files))
+
+    def index_text(self, relative_path: str, text: str) -> None:
+        """Replace the entry for ``relative_path`` with statistics for ``text``."""
+        term_counts: Counter[str] = Counter()
+        term_lines: dict[str, list[int]] = {}
+        for line_number, line in enumerate(text.splitlines(), start=1):
+            for token in tokenize(line):
+                term_counts[token] += 1
+                lines = term_lines.setdefault(token, [])
+                if len(lines) < MAX_LINES_PER_TERM and (not lines or lines[-1] != line_number):
+                    lines.append(line_number)
+        self.files[relative_path] = IndexedFile(
+            length=sum(term_counts.values()),
+            path_terms=sorted(set(tokenize(relative_path))),
+            terms={term: (count, term_lines[term]) for term, count in term_counts.items()},
+        )
+        self._postings = None
+
+    def remove(self, relative_path: str) -> bool:
+        """Drop ``relative_path``; return whether it was indexed."""
+        removed = self.files.pop(relative_path, None) is not None
+        if removed:
+            self._postings = None
+        return removed
+
+    def _get_postings(self) -> dict[str, dict[str, int]]:
+        if self._postings is None:
+            postings: dict[str, dict[str, int]] = {}
+            path_postings: dict[str, set[str]] = {}
+            for relative_path, indexed in self.files.items():
+                for term, (tf, _lines) in indexed.terms.items():
+                    postings.setdefault(term, {})[relative_path] = tf
+                for term in indexed.path_terms:
+                    path_postings.setdefault(term, set()).add(relative_path)
+            # Publish the derived structures before ``_postings``; readers skip the
+            # rebuild as soon as it is set.
+            self._path_postings = path_postings
+            self._vocabulary = sorted(postings.keys() | path_postings.keys())
+            self._postings = postings
+        return self._postings
+
+    def _expand_term(self, term: str) -> dict[str, float]:
+        """Return indexed terms matching ``term`` exactly or by prefix, with weights."""
+        expansions = {term: 1.0}
+        if len(term) < MIN_PREFIX_LENGTH:
+            return expansions
+        vocabulary = self._vocabulary
+        position = bisect.bisect_left(vocabulary, term)
+        while position < len(vocabulary) and len(expansions) <= MAX_PREFIX_EXPANSIONS:
+            candidate = vocabulary[position]
+            if not candidate.startswith(term):
+                break
+            expansions.setdefault(candidate, PREFIX_MATCH_WEIGHT)
+            position += 1
+        return expansions
+
+    def search(
+        self,
+        terms: list[str],
+        *,
+        glob: str = "*.md",
+        limit: int = 20,
+    ) -> list[LibrarySearchHit]:
+        """Rank files for ``terms`` with BM25 over bodies plus a boost for path matches."""
+        if not terms or not self.files:
+            return []
+
+        postings = self._get_postings()
+        file_count = len(self.files)
+        average_length = sum(indexed.length for indexed in self.files.values()) / file_count
+        scores: dict[str, float] = {}
+        matched_terms: set[str] = set()
+        for term in dict.fromkeys(terms):
+            term_frequencies: dict[str, float] = {}
+            path_matches: dict[str, float] = {}
+            for indexed_term, weight in self._expand_term(term).items():
+                for relative_path, tf in postings.get(indexed_term, {}).items():
+                    term_frequencies[relative_path] = (
+                        term_frequencies.get(relative_path, 0.0) + weight * tf
+                    )
+                    matched_terms.add(indexed_term)
+                for relative_path in self._path_postings.get(indexed_term, set()):
+                    path_matches[relative_path] = max(path_matches.get(relative_path, 0.0), weight)
+            document_frequency = len(term_frequencies.keys() | path_matches.keys())
+            if not document_frequency:
+                continue
+            idf = math.log(1 + (file_count - document_frequency + 0.5) / (document_frequency + 0.5))
+            for relative_path, tf in term_frequencies.items():
+                length = self.files[relative_path].length
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * length / max(average_length, 1.0))
+                scores[relative_path] = scores.get(relative_path, 0.0) + idf * (
+                    tf * (BM25_K1 + 1) / (tf + norm)
+                )
+            for relative_path, weight in path_matches.items():
+                scores[relative_path] = (
+                    scores.get(relative_path, 0.0) + idf * PATH_MATCH_WEIGHT * weight
+                )
+
+        ranked = sorted(
+            (
+                (score, relative_path)
+                for relative_path, score in scores.items()
+                if fnmatch.fnmatch(PurePosixPath(relative_path).name, glob)
+            ),
+            key=lambda item: (-item[0], item[1]),
+        )
+        hits: list[LibrarySearchHit] = []
+        for score, relative_path in ranked[:limit]:
+            indexed = self.files[relative_path]
+            line_numbers = sorted(
+                {
+                    line_number
+                    for term in matched_terms
+                    for line_number in indexed.terms.get(term, (0, []))[1]
+                }
+            )
+            hits.append(
+                LibrarySearchHit(
+                    relative_path=relative_path,
+                    score=score,
+                    line_numbers=line_numbers,
+                )
+            )
+        return hits
+
+    def to_json(self) -> dict:
+        return {
+            "version": INDEX_VERSION,
+            "files": {path: self.files[path].to_json() for path in sorted(self.files)},
+        }
+
+    @classmethod
+    def from_json(cls, raw: object) -> PersonalLibraryIndex | None:
+        if not isinstance(raw, dict) or raw.get("version") != INDEX_VERSION:
+            return None
+        files = raw.get("files")
+        if not isinstance(files, dict):
+            return None
+        return cls(
+            files={
+                str(path): IndexedFile.from_json(entry)
+                for path, entry in files.items()
+                if isinstance(entry, dict)
+            }
+        )
+
+
+def _write_lock(user_root: Path) -> threading.RLock:
+    """Return the lock that serializes load/modify/save of one user's index."""
+    index_path = user_root / INDEX_FILENAME
+    with _cache_lock:
+        return _write_locks.setdefault(index_path, threading.RLock())
+
+
+def build_personal_library_index(user_root: Path) -> PersonalLibraryIndex:
+    """Index every markdown file under ``user_root`` and persist the result."""
+    index = PersonalLibraryIndex()
+    if user_root.exists():
+        with _write_lock(user_root):
+            for path in sorted(user_root.rglob("*.md")):
+                if path.is_file():
+                    index.index_text(
+                        path.relative_to(user_root).as_posix(),
+                        path.read_text(encoding="utf-8"),
+                    )
+            _save_index(user_root, index)
+    return index
+
+
+def load_personal_library_index(user_root: Path) -> PersonalLibraryIndex:
+    """Return the user's index, building it once when missing or unreadable.
+
+    The returned index is shared with other readers; writers must modify a ``copy()``.
+    """
+    index_path = user_root / INDEX_FILENAME
+    try:
+        mtime_ns = index_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return build_personal_library_index(user_root)
+
+    with _cache_lock:
+        cached = _loaded_indexes.get(index_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    try:
+        index = PersonalLibraryIndex.from_json(json.loads(index_path.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        index = None
+    if index is None:
+        logger.warning("Rebuilding unreadable personal library index at %s", index_path)
+        return build_personal_library_index(user_root)
+
+    with _cache_lock:
+        _loaded_indexes[index_path] = (mtime_ns, index)
+    return index
+
+
+def update_personal_library_index(
+    user_root: Path,
+    *,
+    written: Iterable[Path] = (),
+    removed: Iterable[Path] = (),
+) -> None:
+    """Apply file writes and deletions to an existing index.
+
+    Without an index on disk nothing happens; the next search builds it in full.
+    """
+    if not (user_root / INDEX_FILENAME).exists():
+        return
+    written_paths = list(written)
+    with _write_lock(user_root):
+        index = load_personal_library_index(user_root).copy()
+        for path in removed:
+            index.remove(_relative_key(user_root, path))
+        for path in written_paths:
+            relative_key = _relative_key(user_root, path)
+            if path.is_file():
+                index.index_text(relative_key, path.read_text(encoding="utf-8"))
+            else:
+                index.remove(relative_key)
+        _save_index(user_root, index)
+
+
+def search_personal_library(
+    user_root: Path,
+    *,
+    query: str,
+    terms: list[str],
+    glob: str = "*.md",
+    limit: int = 20,
+) -> list[str]:
+    """Return up to ``limit`` ``path:line:text`` hits, best files first.
+
+    Only ranked files are opened, to render their best lines; a ranked file that has
+    disappeared since indexing is dropped from the index.
+    """
+    if not user_root.exists():
+        return []
+    index = load_personal_library_index(user_root)
+    lowered_query = query.lower()
+    rendered: list[str] = []
+    missing: list[str] = []
+    for hit in index.search(terms, glob=glob, limit=limit):
+        path = user_root / hit.relative_path
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            missing.append(hit.relative_path)
+            continue
+        line_hits = sorted(
+            (
+                (_line_score(lines[number - 1], lowered_query, terms), number)
+                for number in hit.line_numbers
+                if 0 < number <= len(lines)
+            ),
+            key=lambda item: (-item[0], item[1]),
+        )[:MAX_HITS_PER_FILE]
+        if not line_hits:
+            rendered.append(f"{hit.relative_path}:path-match")
+        for _score, number in line_hits:
+            rendered.append(f"{hit.relative_path}:{number}:{lines[number - 1]}")
+        if len(rendered) >= limit:
+            break
+
+    if missing:
+        with _write_lock(user_root):
+            # Reload so writes saved since this search loaded the index are kept.
+            updated = load_personal_library_index(user_root).copy()
+            dropped = [relative_path for relative_path in missing if updated.remove(relative_path)]
+            if dropped:
+                _save_index(user_root, updated)
+    return rendered[:limit]
+
+
+def _line_score(line: str, lowered_query: str, terms: list[str]) -> float:
+    lowered_line = line.lower()
+    line_terms = set(tokenize(lowered_line))
+    score = float(sum(1 for term in terms if _term_in_line(term, line_terms)))
+    if lowered_query and lowered_query in lowered_line:
+        score += PHRASE_MATCH_BONUS
+    return score
+
+
+def _term_in_line(term: str, line_terms: set[str]) -> bool:
+    if term in line_terms:
+        return True
+    return len(term) >= MIN_PREFIX_LENGTH and any(
+        line_term.startswith(term) for line_term in line_terms
+    )
+
+
+def _relative_key(user_root: Path, path: Path) -> str:
+    candidate = path if path.is_absolute() else user_root / path
+    return candidate.relative_to(user_root).as_posix()
+
+
+def _save_index(user_root: Path, index: PersonalLibraryIndex) -> None:
+    user_root.mkdir(parents=True, exist_ok=True)
+    index_path = user_root / INDEX_FILENAME
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=user_root,
+        prefix=f"{INDEX_FILENAME}.",
+        suffix=".tmp",
+        delete=False,
+    ) as handle:
+        json.dump(index.to_json(), handle)
+    try:
+        os.replace(handle.name, index_path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(handle.name)
+        raise
+    with _cache_lock:
+        _loaded_indexes[index_path] = (index_path.stat().st_mtime_ns, index)
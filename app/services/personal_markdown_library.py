@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import fcntl
 import hashlib
+import json
+import os
 import re
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -15,8 +22,9 @@ from sqlalchemy.orm import Session
 
 from app.core.logging import get_logger
 from app.core.settings import get_settings
-from app.models.schema import ChatSession, Content, ContentKnowledgeSave
+from app.models.schema import ChatSession, Content, ContentBody, ContentKnowledgeSave
 from app.services.content_bodies import ContentBodyVariant, get_content_body_resolver
+from app.services.personal_library_index import update_personal_library_index
 from app.utils.summary_utils import extract_short_summary, extract_summary_text
 
 logger = get_logger(__name__)
@@ -25,6 +33,12 @@ MarkdownVariant = Literal["source", "summary"]
 CONTENT_ID_PATTERN = re.compile(r"__c(?P<content_id>\d+)\.md$")
 VARIANT_SOURCE: MarkdownVariant = "source"
 VARIANT_SUMMARY: MarkdownVariant = "summary"
+MANIFEST_FILENAME = ".manifest.json"
+MANIFEST_VERSION = 1
+LOCK_FILENAME = ".library.lock"
+
+_user_root_locks_guard = threading.Lock()
+_user_root_locks: dict[Path, threading.Lock] = {}
 
 
 @dataclass(frozen=True)
@@ -87,45 +101,131 @@ def get_personal_markdown_user_root(user_id: int) -> Path:
     return (settings.personal_markdown_root_dir / str(user_id)).resolve()
 
 
+@contextmanager
+def _user_root_lock(user_root: Path) -> Iterator[None]:
+    """Serialize manifest and index read-modify-write cycles for one user's library.
+
+    A per-root thread lock orders writers inside this process; an exclusive ``flock``
+    on the library's lock file orders them across the API and worker processes.
+    """
+    with _user_root_locks_guard:
+        thread_lock = _user_root_locks.setdefault(user_root, threading.Lock())
+    with thread_lock, (user_root / LOCK_FILENAME).open("a") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
 def sync_personal_markdown_library_for_user(
     db: Session,
     *,
     user_id: int,
 ) -> PersonalMarkdownSyncResult:
-    """Reconcile one user's markdown library from knowledge saves and chat sessions."""
+    """Reconcile one user's markdown library from knowledge saves and chat sessions.
+
+    Only content whose manifest checksum changed (content row, stored bodies, library
+    reasons) or whose files went missing is reloaded and re-rendered.
+    """
     settings = get_settings()
     if not settings.personal_markdown_enabled:
         return PersonalMarkdownSyncResult(user_id=user_id, written_files=[], deleted_files=[])
 
     user_root = get_personal_markdown_user_root(user_id)
     user_root.mkdir(parents=True, exist_ok=True)
+    with _user_root_lock(user_root):
+        return _sync_library_locked(db, user_id=user_id, user_root=user_root)
 
+
+def _sync_library_locked(
+    db: Session,
+    *,
+    user_id: int,
+    user_root: Path,
+) -> PersonalMarkdownSyncResult:
     qualifying_reasons = _load_qualifying_content_reasons(db, user_id=user_id)
     written_files: list[Path] = []
     deleted_files: list[Path] = []
+    replaced_files: list[Path] = []
+
+    # Without a manifest, one directory scan finds every existing file; with one, content
+    # missing from it falls back to a per-item scan when it has to be rewritten.
+    manifest = _load_manifest(user_root)
+    scanned = manifest is None
+    if manifest is None:
+        manifest = {}
+        existing_files = _scan_existing_content_files(user_root)
+    else:
+        existing_files = {
+            content_id: [user_root / path for path in entry.get("files", [])]
+            for content_id, entry in manifest.items()
+        }
 
-    existing_content_ids = _scan_existing_content_ids(user_root)
     desired_content_ids = set(qualifying_reasons)
-    contents_by_id = _load_contents_by_id(db, desired_content_ids)
-
-    for stale_content_id in sorted(existing_content_ids - desired_content_ids):
-        deleted_files.extend(_delete_content_files(user_root, stale_content_id))
+    checksum_inputs = _load_content_checksum_inputs(db, desired_content_ids)
+
+    for stale_content_id in sorted(set(existing_files) - desired_content_ids):
+        deleted_files.extend(
+            _delete_content_files(
+                user_root,
+                stale_content_id,
+                paths=existing_files[stale_content_id],
+            )
+        )
+        manifest.pop(stale_content_id, None)
 
+    changed_checksums: dict[int, str] = {}
     for content_id, reasons in qualifying_reasons.items():
+        inputs = checksum_inputs.get(content_id)
+        if inputs is None:
+            deleted_files.extend(
+                _delete_content_files(user_root, content_id, paths=existing_files.get(content_id))
+            )
+            manifest.pop(content_id, None)
+            continue
+        checksum = _content_checksum(inputs, reasons)
+        entry = manifest.get(content_id)
+        if (
+            entry is not None
+            and entry.get("checksum") == checksum
+            and all((user_root / path).exists() for path in entry.get("files", []))
+        ):
+            continue
+        changed_checksums[content_id] = checksum
+
+    contents_by_id = _load_contents_by_id(db, set(changed_checksums))
+    for content_id, checksum in changed_checksums.items():
         content = contents_by_id.get(content_id)
         if content is None:
-            deleted_files.extend(_delete_content_files(user_root, content_id))
-            continue
-        written_files.extend(
-            _sync_content_markdown_files(
-                db=db,
-                user_root=user_root,
-                user_id=user_id,
-                content=content,
-                reasons=reasons,
+            deleted_files.extend(
+                _delete_content_files(user_root, content_id, paths=existing_files.get(content_id))
             )
+            manifest.pop(content_id, None)
+            continue
+        content_files = _sync_content_markdown_files(
+            db=db,
+            user_root=user_root,
+            user_id=user_id,
+            content=content,
+            reasons=qualifying_reasons[content_id],
+            existing_files=existing_files.get(content_id, [] if scanned else None),
+        )
+        written_files.extend(content_files)
+        replaced_files.extend(existing_files.get(content_id, []))
+        manifest[content_id] = _manifest_entry(
+            user_root,
+            checksum=checksum,
+            updated_at=content.updated_at,
+            files=content_files,
         )
 
+    _save_manifest(user_root, manifest)
+    update_personal_library_index(
+        user_root,
+        written=written_files,
+        removed=[*deleted_files, *replaced_files],
+    )
     return PersonalMarkdownSyncResult(
         user_id=user_id,
         written_files=written_files,
@@ -169,26 +269,51 @@ def sync_personal_markdown_for_content(
     user_id: int,
     content_id: int,
 ) -> PersonalMarkdownSyncResult:
-    """Reconcile a single content item inside one user's library."""
+    """Reconcile a single content item inside one user's library.
+
+    Called from library mutations (knowledge saves, chats); always re-renders the item
+    and records it in the manifest so the next full sync can skip it.
+    """
     settings = get_settings()
     if not settings.personal_markdown_enabled:
         return PersonalMarkdownSyncResult(user_id=user_id, written_files=[], deleted_files=[])
 
     user_root = get_personal_markdown_user_root(user_id)
     user_root.mkdir(parents=True, exist_ok=True)
-
-    reasons = _load_reasons_for_content(db, user_id=user_id, content_id=content_id)
-    if not reasons.labels:
-        deleted_files = _delete_content_files(user_root, content_id)
-        return PersonalMarkdownSyncResult(
+    with _user_root_lock(user_root):
+        return _sync_content_locked(
+            db,
             user_id=user_id,
-            written_files=[],
-            deleted_files=deleted_files,
+            content_id=content_id,
+            user_root=user_root,
         )
 
-    content = db.query(Content).filter(Content.id == content_id).first()
-    if content is None:
-        deleted_files = _delete_content_files(user_root, content_id)
+
+def _sync_content_locked(
+    db: Session,
+    *,
+    user_id: int,
+    content_id: int,
+    user_root: Path,
+) -> PersonalMarkdownSyncResult:
+    manifest = _load_manifest(user_root)
+    entry = manifest.get(content_id) if manifest is not None else None
+    existing_files = (
+        [user_root / path for path in entry.get("files", [])] if entry is not None else None
+    )
+
+    reasons = _load_reasons_for_content(db, user_id=user_id, content_id=content_id)
+    content = db.query(Content).filter(Content.id == content_id).first() if reasons.labels else None
+    checksum_inputs = (
+        _load_content_checksum_inputs(db, {content_id}).get(content_id)
+        if content is not None
+        else None
+    )
+    if content is None or checksum_inputs is None:
+        deleted_files = _delete_content_files(user_root, content_id, paths=existing_files)
+        if manifest is not None and manifest.pop(content_id, None) is not None:
+            _save_manifest(user_root, manifest)
+        update_personal_library_index(user_root, removed=deleted_files)
         return PersonalMarkdownSyncResult(
             user_id=user_id,
             written_files=[],
@@ -201,6 +326,20 @@ def sync_personal_markdown_for_content(
         user_id=user_id,
         content=content,
         reasons=reasons,
+        existing_files=existing_files,
+    )
+    if manifest is not None:
+        manifest[content_id] = _manifest_entry(
+            user_root,
+            checksum=_content_checksum(checksum_inputs, reasons),
+            updated_at=content.updated_at,
+            files=written_files,
+        )
+        _save_manifest(user_root, manifest)
+    update_personal_library_index(
+        user_root,
+        written=written_files,
+        removed=existing_files or [],
     )
     return PersonalMarkdownSyncResult(
         user_id=user_id,
@@ -270,6 +409,109 @@ def _load_contents_by_id(db: Session, content_ids: set[int]) -> dict[int, Conten
     return {_require_content_id(content): content for content in contents if content.id is not None}
 
 
+def _load_content_checksum_inputs(
+    db: Session,
+    content_ids: set[int],
+) -> dict[int, dict[str, object]]:
+    """Return the cheap per-content change markers used for manifest checksums."""
+    if not content_ids:
+        return {}
+
+    updated_at_by_id = {
+        int(content_id): updated_at
+        for content_id, updated_at in db.query(Content.id, Content.updated_at)
+        .filter(Content.id.in_(content_ids))
+        .all()
+    }
+    bodies_by_id: dict[int, dict[str, str]] = {}
+    for content_id, variant, sha256 in (
+        db.query(ContentBody.content_id, ContentBody.variant, ContentBody.sha256)
+        .filter(ContentBody.content_id.in_(list(updated_at_by_id)))
+        .all()
+    ):
+        bodies_by_id.setdefault(int(content_id), {})[str(variant)] = sha256
+    return {
+        content_id: {
+            "updated_at": _isoformat(updated_at),
+            "bodies": bodies_by_id.get(content_id, {}),
+        }
+        for content_id, updated_at in updated_at_by_id.items()
+    }
+
+
+def _content_checksum(inputs: dict[str, object], reasons: PersonalMarkdownReasons) -> str:
+    payload = {
+        "version": MANIFEST_VERSION,
+        "content": inputs,
+        "reasons": reasons.labels,
+        "chat_session_ids": reasons.chat_session_ids,
+        "saved_at": _isoformat(reasons.saved_at),
+        "max_slug_length": get_settings().personal_markdown_max_slug_length,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _manifest_entry(
+    user_root: Path,
+    *,
+    checksum: str,
+    updated_at: datetime | None,
+    files: list[Path],
+) -> dict[str, object]:
+    return {
+        "checksum": checksum,
+        "updated_at": _isoformat(updated_at),
+        "files": sorted(str(path.relative_to(user_root)) for path in files),
+    }
+
+
+def _load_manifest(user_root: Path) -> dict[int, dict] | None:
+    """Return ``content_id -> entry`` from the user's manifest, or None if unusable."""
+    path = user_root / MANIFEST_FILENAME
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable personal markdown manifest at %s", path)
+        return None
+    if not isinstance(raw, dict) or raw.get("version") != MANIFEST_VERSION:
+        return None
+    contents = raw.get("contents")
+    if not isinstance(contents, dict):
+        return None
+    return {
+        int(content_id): entry
+        for content_id, entry in contents.items()
+        if str(content_id).isdigit() and isinstance(entry, dict)
+    }
+
+
+def _save_manifest(user_root: Path, manifest: dict[int, dict]) -> None:
+    path = user_root / MANIFEST_FILENAME
+    payload = json.dumps(
+        {
+            "version": MANIFEST_VERSION,
+            "contents": {str(content_id): manifest[content_id] for content_id in sorted(manifest)},
+        }
+    )
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=user_root,
+        prefix=f"{MANIFEST_FILENAME}.",
+        suffix=".tmp",
+        delete=False,
+    ) as handle:
+        handle.write(payload)
+    try:
+        os.replace(handle.name, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(handle.name)
+        raise
+
+
 def _load_reasons_for_content(
     db: Session,
     *,
@@ -314,9 +556,10 @@ def _sync_content_markdown_files(
     user_id: int,
     content: Content,
     reasons: PersonalMarkdownReasons,
+    existing_files: list[Path] | None = None,
 ) -> list[Path]:
     content_id = _require_content_id(content)
-    deleted_files = _delete_content_files(user_root, content_id)
+    deleted_files = _delete_content_files(user_root, content_id, paths=existing_files)
     if deleted_files:
         logger.debug(
             "Rewriting personal markdown files for content_id=%s user_id=%s",
@@ -539,24 +782,31 @@ def _slugify_segment(raw: str, *, max_length: int | None = None) -> str:
     return normalized
 
 
-def _scan_existing_content_ids(user_root: Path) -> set[int]:
-    content_ids: set[int] = set()
+def _scan_existing_content_files(user_root: Path) -> dict[int, list[Path]]:
+    content_files: dict[int, list[Path]] = {}
     if not user_root.exists():
-        return content_ids
+        return content_files
 
     for path in user_root.rglob("*.md"):
         match = CONTENT_ID_PATTERN.search(path.name)
         if match:
-            content_ids.add(int(match.group("content_id")))
-    return content_ids
+            content_files.setdefault(int(match.group("content_id")), []).append(path)
+    return content_files
 
 
-def _delete_content_files(user_root: Path, content_id: int) -> list[Path]:
+def _delete_content_files(
+    user_root: Path,
+    content_id: int,
+    *,
+    paths: list[Path] | None = None,
+) -> list[Path]:
+    """Delete one content item's files; ``paths`` skips the directory scan when known."""
     deleted: list[Path] = []
     if not user_root.exists():
         return deleted
 
-    for path in user_root.rglob(f"*__c{content_id}.md"):
+    candidates = paths if paths is not None else user_root.rglob(f"*__c{content_id}.md")
+    for path in candidates:
         if path.exists():
             path.unlink()
             deleted.append(path)
@@ -7,14 +7,21 @@ import re
 import threading
 import time
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime, timedelta
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 import httpx
+from sqlalchemy import case, or_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.db import get_db
 from app.core.logging import get_logger
 from app.core.settings import get_settings
+from app.models.schema import PodcastSearchCacheEntry, PodcastSearchProviderState
 from app.services.apple_podcasts import resolve_apple_podcast_episode
 from app.services.content_submission import normalize_url
 from app.services.exa_client import exa_search
@@ -98,22 +105,15 @@ class PodcastEpisodeSearchHit:
     score: float | None = None
 
 
-@dataclass
-class _ProviderState:
-    failures: int = 0
-    open_until: datetime | None = None
-
-
 @dataclass
 class _SpotifyToken:
     access_token: str
     expires_at_epoch: float
 
 
+# Per-process front for the shared Postgres cache; entries expire on the same TTL.
 _SEARCH_CACHE: dict[str, tuple[float, list[PodcastEpisodeSearchHit]]] = {}
 _SEARCH_CACHE_LOCK = threading.Lock()
-_PROVIDER_STATES: dict[str, _ProviderState] = {}
-_PROVIDER_STATE_LOCK = threading.Lock()
 _SPOTIFY_TOKEN: _SpotifyToken | None = None
 _SPOTIFY_TOKEN_LOCK = threading.Lock()
 
@@ -123,6 +123,12 @@ def search_podcast_episodes(
 ) -> list[PodcastEpisodeSearchHit]:
     """Search for podcast episodes by free-text query.
 
+    Providers are queried concurrently under ``podcast_search_deadline_seconds``.
+    Collection stops early once ``limit`` hits score at least
+    ``podcast_search_early_return_min_score``; providers still running at that point
+    are abandoned. Results and provider circuit state are shared across workers
+    through Postgres.
+
     Args:
         query: Search query entered by the user.
         limit: Maximum number of episode matches to return.
@@ -140,56 +146,180 @@ def search_podcast_episodes(
         return cached
 
     provider_limit = max(requested_limit * 2, requested_limit)
-    provider_hits: list[PodcastEpisodeSearchHit] = []
-    for provider_name in PROVIDER_ORDER:
-        provider_hits.extend(_run_provider(provider_name, cleaned_query, provider_limit))
+    provider_hits, complete = _collect_provider_hits(
+        cleaned_query,
+        provider_limit=provider_limit,
+        requested_limit=requested_limit,
+    )
 
     ranked_hits = _rank_and_dedupe_hits(cleaned_query, provider_hits)[:requested_limit]
-    _write_cached_results(cleaned_query, requested_limit, ranked_hits)
+    if complete:
+        _write_cached_results(cleaned_query, requested_limit, ranked_hits)
     return ranked_hits
 
 
+def _collect_provider_hits(
+    query: str,
+    *,
+    provider_limit: int,
+    requested_limit: int,
+) -> tuple[list[PodcastEpisodeSearchHit], bool]:
+    """Fan out to every closed-circuit provider and gather hits until done or out of time.
+
+    Returns the collected hits and whether the result is cacheable: every provider
+    answered, or enough strong hits arrived to stop early.
+    """
+    settings = get_settings()
+    open_providers = _load_open_providers()
+    provider_names = [name for name in PROVIDER_ORDER if name not in open_providers]
+    for provider_name in open_providers:
+        logger.debug(
+            "Skipping provider due to open circuit",
+            extra={
+                "component": "podcast_search",
+                "operation": "provider_skip",
+                "context_data": {"provider": provider_name},
+            },
+        )
+    if not provider_names:
+        return [], False
+
+    provider_hits: list[PodcastEpisodeSearchHit] = []
+    executor = ThreadPoolExecutor(
+        max_workers=len(provider_names),
+        thread_name_prefix="podcast-search",
+    )
+    futures = {
+        executor.submit(_run_provider, provider_name, query, provider_limit): provider_name
+        for provider_name in provider_names
+    }
+    pending = set(futures)
+    complete = True
+    try:
+        for future in as_completed(futures, timeout=settings.podcast_search_deadline_seconds):
+            pending.discard(future)
+            provider_hits.extend(future.result())
+            if pending and _has_enough_strong_hits(query, provider_hits, requested_limit):
+                break
+    except FuturesTimeoutError:
+        complete = False
+        logger.info(
+            "Podcast search deadline reached before all providers answered",
+            extra={
+                "component": "podcast_search",
+                "operation": "provider_fanout",
+                "context_data": {
+                    "query": query,
+                    "pending_providers": sorted(futures[future] for future in pending),
+                    "deadline_seconds": settings.podcast_search_deadline_seconds,
+                },
+            },
+        )
+    finally:
+        # Late providers finish in the background and still update circuit state.
+        executor.shutdown(wait=False, cancel_futures=True)
+    return provider_hits, complete
+
+
+def _has_enough_strong_hits(
+    query: str,
+    hits: list[PodcastEpisodeSearchHit],
+    requested_limit: int,
+) -> bool:
+    min_score = get_settings().podcast_search_early_return_min_score
+    ranked_hits = _rank_and_dedupe_hits(query, hits)
+    strong_hits = [hit for hit in ranked_hits if (hit.score or 0.0) >= min_score]
+    return len(strong_hits) >= requested_limit
+
+
+def _search_cache_key(query: str, limit: int) -> str:
+    return hashlib.sha256(f"{query.lower()}::{limit}".encode()).hexdigest()
+
+
 def _read_cached_results(query: str, limit: int) -> list[PodcastEpisodeSearchHit] | None:
     settings = get_settings()
     ttl = settings.podcast_search_cache_ttl_seconds
     if ttl <= 0:
         return None
 
-    cache_key = f"{query.lower()}::{limit}"
+    cache_key = _search_cache_key(query, limit)
     now_epoch = time.time()
     with _SEARCH_CACHE_LOCK:
         cached = _SEARCH_CACHE.get(cache_key)
-        if not cached:
-            return None
-        cached_at, cached_hits = cached
-        if (now_epoch - cached_at) > ttl:
-            _SEARCH_CACHE.pop(cache_key, None)
-            return None
-        return list(cached_hits)
+        if cached and (now_epoch - cached[0]) <= ttl:
+            return list(cached[1])
+        _SEARCH_CACHE.pop(cache_key, None)
+
+    try:
+        with get_db() as db:
+            row = (
+                db.query(PodcastSearchCacheEntry)
+                .filter(
+                    PodcastSearchCacheEntry.cache_key == cache_key,
+                    PodcastSearchCacheEntry.expires_at > _utc_now(),
+                )
+                .one_or_none()
+            )
+            if row is None:
+                return None
+            stored_hits = [
+                PodcastEpisodeSearchHit(**hit) for hit in row.hits if isinstance(hit, dict)
+            ]
+            remaining_ttl = (row.expires_at - _utc_now()).total_seconds()
+    except (SQLAlchemyError, TypeError):
+        logger.warning(
+            "Failed to read shared podcast search cache",
+            exc_info=True,
+            extra={"component": "podcast_search", "operation": "cache_read"},
+        )
+        return None
+
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE[cache_key] = (now_epoch - max(ttl - remaining_ttl, 0.0), stored_hits)
+    return list(stored_hits)
 
 
 def _write_cached_results(query: str, limit: int, hits: list[PodcastEpisodeSearchHit]) -> None:
     settings = get_settings()
-    if settings.podcast_search_cache_ttl_seconds <= 0:
+    ttl = settings.podcast_search_cache_ttl_seconds
+    if ttl <= 0:
         return
 
-    cache_key = f"{query.lower()}::{limit}"
+    cache_key = _search_cache_key(query, limit)
     with _SEARCH_CACHE_LOCK:
         _SEARCH_CACHE[cache_key] = (time.time(), list(hits))
 
-
-def _run_provider(provider_name: str, query: str, limit: int) -> list[PodcastEpisodeSearchHit]:
-    if _is_provider_open(provider_name):
-        logger.debug(
-            "Skipping provider due to open circuit",
-            extra={
-                "component": "podcast_search",
-                "operation": "provider_skip",
-                "context_data": {"provider": provider_name},
-            },
+    now = _utc_now()
+    stmt = postgresql_insert(PodcastSearchCacheEntry).values(
+        cache_key=cache_key,
+        query=query[:500],
+        hits=[asdict(hit) for hit in hits],
+        expires_at=now + timedelta(seconds=ttl),
+        created_at=now,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PodcastSearchCacheEntry.cache_key],
+        set_={
+            "hits": stmt.excluded.hits,
+            "expires_at": stmt.excluded.expires_at,
+            "created_at": stmt.excluded.created_at,
+        },
+    )
+    try:
+        with get_db() as db:
+            db.execute(stmt)
+            db.query(PodcastSearchCacheEntry).filter(
+                PodcastSearchCacheEntry.expires_at <= now
+            ).delete(synchronize_session=False)
+    except SQLAlchemyError:
+        logger.warning(
+            "Failed to write shared podcast search cache",
+            exc_info=True,
+            extra={"component": "podcast_search", "operation": "cache_write"},
         )
-        return []
 
+
+def _run_provider(provider_name: str, query: str, limit: int) -> list[PodcastEpisodeSearchHit]:
     provider_map = {
         "listen_notes": _search_listen_notes,
         "spotify": _search_spotify,
@@ -219,44 +349,115 @@ def _run_provider(provider_name: str, query: str, limit: int) -> list[PodcastEpi
         return []
 
 
-def _is_provider_open(provider_name: str) -> bool:
-    with _PROVIDER_STATE_LOCK:
-        state = _PROVIDER_STATES.get(provider_name)
-        if not state or state.open_until is None:
-            return False
-        return state.open_until > datetime.now(UTC)
+def _load_open_providers() -> set[str]:
+    """Return providers whose shared circuit is currently open."""
+    try:
+        with get_db() as db:
+            rows = (
+                db.query(PodcastSearchProviderState.provider)
+                .filter(PodcastSearchProviderState.open_until > _utc_now())
+                .all()
+            )
+    except SQLAlchemyError:
+        logger.warning(
+            "Failed to load podcast provider circuit state; querying all providers",
+            exc_info=True,
+            extra={"component": "podcast_search", "operation": "provider_state_read"},
+        )
+        return set()
+    return {row.provider for row in rows}
 
 
 def _record_provider_success(provider_name: str) -> None:
-    with _PROVIDER_STATE_LOCK:
-        state = _PROVIDER_STATES.setdefault(provider_name, _ProviderState())
-        state.failures = 0
-        state.open_until = None
+    try:
+        with get_db() as db:
+            db.query(PodcastSearchProviderState).filter(
+                PodcastSearchProviderState.provider == provider_name,
+                or_(
+                    PodcastSearchProviderState.failures > 0,
+                    PodcastSearchProviderState.open_until.is_not(None),
+                ),
+            ).update(
+                {
+                    PodcastSearchProviderState.failures: 0,
+                    PodcastSearchProviderState.open_until: None,
+                    PodcastSearchProviderState.last_error: None,
+                    PodcastSearchProviderState.updated_at: _utc_now(),
+                },
+                synchronize_session=False,
+            )
+    except SQLAlchemyError:
+        logger.warning(
+            "Failed to reset podcast provider circuit state",
+            exc_info=True,
+            extra={
+                "component": "podcast_search",
+                "operation": "provider_state_write",
+                "context_data": {"provider": provider_name},
+            },
+        )
 
 
 def _record_provider_failure(provider_name: str, error: Exception) -> None:
     settings = get_settings()
     threshold = settings.podcast_search_circuit_breaker_failures
     cooldown_seconds = settings.podcast_search_circuit_breaker_cooldown_seconds
+    now = _utc_now()
+
+    stmt = postgresql_insert(PodcastSearchProviderState).values(
+        provider=provider_name,
+        failures=1,
+        open_until=now + timedelta(seconds=cooldown_seconds) if threshold <= 1 else None,
+        last_error=str(error)[:1000],
+        updated_at=now,
+    )
+    failures = PodcastSearchProviderState.failures + 1
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PodcastSearchProviderState.provider],
+        set_={
+            "failures": failures,
+            "open_until": case(
+                (failures >= threshold, now + timedelta(seconds=cooldown_seconds)),
+                else_=PodcastSearchProviderState.open_until,
+            ),
+            "last_error": stmt.excluded.last_error,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    ).returning(PodcastSearchProviderState.failures, PodcastSearchProviderState.open_until)
+
+    try:
+        with get_db() as db:
+            state = db.execute(stmt).one()
+    except SQLAlchemyError:
+        logger.warning(
+            "Failed to record podcast provider failure",
+            exc_info=True,
+            extra={
+                "component": "podcast_search",
+                "operation": "provider_state_write",
+                "context_data": {"provider": provider_name},
+            },
+        )
+        return
 
-    with _PROVIDER_STATE_LOCK:
-        state = _PROVIDER_STATES.setdefault(provider_name, _ProviderState())
-        state.failures += 1
-        if state.failures >= threshold:
-            state.open_until = datetime.now(UTC) + timedelta(seconds=cooldown_seconds)
-            logger.warning(
-                "Opening podcast provider circuit",
-                extra={
-                    "component": "podcast_search",
-                    "operation": "provider_circuit_open",
-                    "context_data": {
-                        "provider": provider_name,
-                        "failures": state.failures,
-                        "cooldown_seconds": cooldown_seconds,
-                        "error": str(error),
-                    },
+    if state.failures >= threshold and state.open_until is not None:
+        logger.warning(
+            "Opening podcast provider circuit",
+            extra={
+                "component": "podcast_search",
+                "operation": "provider_circuit_open",
+                "context_data": {
+                    "provider": provider_name,
+                    "failures": state.failures,
+                    "cooldown_seconds": cooldown_seconds,
+                    "error": str(error),
                 },
-            )
+            },
+        )
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
 
 
 def _rank_and_dedupe_hits(
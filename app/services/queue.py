@@ -1,8 +1,10 @@
 import json
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import and_, func, or_, select, text, update
+from sqlalchemy import and_, func, or_, select, text, true, update
 from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 
 from app.core.db import get_db
@@ -27,6 +29,34 @@ ACTIVE_TASK_STATUSES: tuple[str, str] = (
     TaskStatus.PROCESSING.value,
 )
 ACTIVE_DEDUPE_INDEX_WHERE = text("dedupe_key IS NOT NULL AND status IN ('pending', 'processing')")
+CLAIMED_TASK_COLUMNS = (
+    ProcessingTask.id,
+    ProcessingTask.task_type,
+    ProcessingTask.content_id,
+    ProcessingTask.payload,
+    ProcessingTask.retry_count,
+    ProcessingTask.status,
+    ProcessingTask.queue_name,
+    ProcessingTask.created_at,
+    ProcessingTask.available_at,
+    ProcessingTask.started_at,
+    ProcessingTask.completed_at,
+    ProcessingTask.locked_at,
+    ProcessingTask.locked_by,
+    ProcessingTask.lease_expires_at,
+)
+
+
+@dataclass(frozen=True)
+class TaskOutcome:
+    """Processing outcome for one claimed task, used by ``finalize_batch``."""
+
+    task_id: int
+    success: bool
+    error_message: str | None = None
+    retryable: bool = True
+    current_retry_count: int = 0
+    retry_delay_seconds: int | None = None
 
 
 def _utc_now() -> datetime:
@@ -128,6 +158,124 @@ def _claimable_task_filters(now: datetime):
     )
 
 
+def _apply_task_outcome(
+    task: ProcessingTask,
+    outcome: TaskOutcome,
+    *,
+    max_retries: int,
+    now: datetime,
+) -> dict[str, Any]:
+    """Apply one processing outcome to a task row and return the transition."""
+    should_retry = (
+        not outcome.success
+        and outcome.retryable
+        and outcome.current_retry_count < max(int(max_retries), 0)
+    )
+    resolved_delay_seconds = outcome.retry_delay_seconds if should_retry else None
+    persisted_retry_count = int(task.retry_count or 0)
+    base_retry_count = max(persisted_retry_count, int(outcome.current_retry_count or 0))
+
+    if outcome.success:
+        task.status = TaskStatus.COMPLETED.value
+        task.completed_at = now
+        task.error_message = None
+    elif should_retry:
+        task.status = TaskStatus.PENDING.value
+        task.retry_count = base_retry_count + 1
+        task.started_at = None
+        task.completed_at = None
+        task.available_at = now + timedelta(seconds=resolved_delay_seconds or 0)
+        task.error_message = outcome.error_message or "Task failed without error details"
+    else:
+        task.status = TaskStatus.FAILED.value
+        task.completed_at = now
+        task.error_message = outcome.error_message or "Task failed without error details"
+
+    _clear_task_lease(task)
+    return {
+        "task_type": task.task_type,
+        "queue_name": task.queue_name,
+        "content_id": task.content_id,
+        "error_message": task.error_message,
+        "status": task.status,
+        "retry_count": int(task.retry_count or 0),
+        "retry_delay_seconds": resolved_delay_seconds,
+        "available_at": task.available_at,
+    }
+
+
+def _log_task_transition(
+    task_id: int,
+    transition: dict[str, Any] | None,
+    *,
+    operation: str,
+) -> None:
+    """Emit the standard log for a finalized task transition."""
+    if transition is None:
+        logger.error(
+            "Task not found",
+            extra=build_log_extra(
+                component="queue",
+                operation=operation,
+                event_name="task.failed",
+                status="failed",
+                task_id=task_id,
+                context_data={"failure_class": "TaskNotFound"},
+            ),
+        )
+        return
+
+    if transition["status"] == TaskStatus.COMPLETED.value:
+        logger.info(
+            "Task completed",
+            extra=build_log_extra(
+                component="queue",
+                operation=operation,
+                event_name="task.completed",
+                status="completed",
+                task_id=task_id,
+                task_type=transition["task_type"],
+                queue_name=transition["queue_name"],
+                content_id=transition["content_id"],
+            ),
+        )
+    elif transition["status"] == TaskStatus.PENDING.value:
+        logger.info(
+            "Task retry scheduled",
+            extra=build_log_extra(
+                component="queue",
+                operation=operation,
+                event_name="task.retry_scheduled",
+                status="retry_scheduled",
+                task_id=task_id,
+                task_type=transition["task_type"],
+                queue_name=transition["queue_name"],
+                content_id=transition["content_id"],
+                context_data={
+                    "retry_count": transition["retry_count"],
+                    "delay_seconds": transition["retry_delay_seconds"],
+                    "error_message": transition["error_message"],
+                },
+            ),
+        )
+    else:
+        logger.error(
+            "Task failed",
+            extra=build_log_extra(
+                component="queue",
+                operation=operation,
+                event_name="task.failed",
+                status="failed",
+                item_id=task_id,
+                task_id=task_id,
+                task_type=transition["task_type"],
+                queue_name=transition["queue_name"],
+                content_id=transition["content_id"],
+                context_data={"error_message": transition["error_message"]},
+            ),
+        )
+
+
 class QueueService:
     """Simple database-backed task queue."""
 
@@ -169,7 +317,7 @@ class QueueService:
         if len(available_retry_counts) == 1:
             return available_retry_counts
 
-        cursor = self._retry_bucket_cursor.get(cursor_key, 0)
+        cursor = self._retry_bucket_cursor.get(cursor_key, 0) % len(available_retry_counts)
         ordered = available_retry_counts[cursor:] + available_retry_counts[:cursor]
         self._retry_bucket_cursor[cursor_key] = (cursor + 1) % len(available_retry_counts)
         return ordered
@@ -182,10 +330,14 @@ class QueueService:
         queue_name: TaskQueue | str | None = None,
         dedupe: bool | None = None,
         dedupe_key: str | None = None,
+        available_at: datetime | None = None,
     ) -> int:
         """
         Add a task to the queue.
 
+        ``available_at`` defers the task until that (naive UTC) time; by default it
+        is claimable immediately.
+
         Returns:
             Task ID
         """
@@ -216,7 +368,7 @@ class QueueService:
                         payload=task_payload,
                         status=TaskStatus.PENDING.value,
                         queue_name=target_queue,
-                        available_at=_utc_now(),
+                        available_at=available_at or _utc_now(),
                         dedupe_key=resolved_dedupe_key,
                     )
                     .on_conflict_do_nothing(
@@ -287,7 +439,7 @@ class QueueService:
                 payload=task_payload,
                 status=TaskStatus.PENDING.value,
                 queue_name=target_queue,
-                available_at=_utc_now(),
+                available_at=available_at or _utc_now(),
                 dedupe_key=resolved_dedupe_key,
             )
             db.add(task)
@@ -323,6 +475,99 @@ class QueueService:
             )
             return task_id
 
+    def enqueue_content_tasks(
+        self,
+        tasks: Sequence[tuple[TaskType, int]],
+    ) -> list[int]:
+        """
+        Add several content-scoped tasks with one multi-row insert.
+
+        Each ``(task_type, content_id)`` pair follows the task spec's default
+        dedupe rule; pairs that already have an active task are skipped.
+
+        Returns:
+            IDs of the newly inserted tasks
+        """
+        rows: list[dict[str, Any]] = []
+        seen_dedupe_keys: set[str] = set()
+        now = _utc_now()
+        for task_type, content_id in tasks:
+            task_spec = get_task_spec(task_type)
+            target_queue = task_spec.queue.value
+            task_payload = task_spec.normalize_payload(None)
+            dedupe_key = _build_dedupe_key(
+                task_type=task_type,
+                content_id=content_id,
+                payload=task_payload,
+                queue_name=target_queue,
+                should_dedupe=task_spec.dedupe_by_content,
+            )
+            if dedupe_key is not None:
+                if dedupe_key in seen_dedupe_keys:
+                    continue
+                seen_dedupe_keys.add(dedupe_key)
+            rows.append(
+                {
+                    "task_type": task_type.value,
+                    "content_id": content_id,
+                    "payload": task_payload,
+                    "status": TaskStatus.PENDING.value,
+                    "queue_name": target_queue,
+                    "available_at": now,
+                    "dedupe_key": dedupe_key,
+                }
+            )
+        if not rows:
+            return []
+
+        with get_db() as db:
+            inserted = (
+                db.execute(
+                    postgresql_insert(ProcessingTask)
+                    .values(rows)
+                    .on_conflict_do_nothing(
+                        index_elements=[ProcessingTask.dedupe_key],
+                        index_where=ACTIVE_DEDUPE_INDEX_WHERE,
+                    )
+                    .returning(
+                        ProcessingTask.id,
+                        ProcessingTask.task_type,
+                        ProcessingTask.queue_name,
+                        ProcessingTask.content_id,
+                    )
+                )
+                .mappings()
+                .all()
+            )
+            # One wake-up per queue is enough; workers poll for the actual rows.
+            for queue_name in sorted({row["queue_name"] for row in inserted}):
+                notification_payload = json.dumps(
+                    {
+                        "task_id": min(
+                            row["id"] for row in inserted if row["queue_name"] == queue_name
+                        ),
+                        "queue_name": queue_name,
+                    },
+                    separators=(",", ":"),
+                )
+                db.execute(select(func.pg_notify("processing_tasks", notification_payload)))
+
+        for row in inserted:
+            logger.info(
+                "Task enqueued",
+                extra=build_log_extra(
+                    component="queue",
+                    operation="enqueue_content_tasks",
+                    event_name="task.enqueued",
+                    status="completed",
+                    task_id=int(row["id"]),
+                    task_type=row["task_type"],
+                    queue_name=row["queue_name"],
+                    content_id=row["content_id"],
+                ),
+            )
+        return [int(row["id"]) for row in inserted]
+
     def dequeue(
         self,
         task_type: TaskType | None = None,
@@ -393,22 +638,7 @@ class QueueService:
                         locked_by=worker_id,
                         lease_expires_at=now + timedelta(seconds=_task_lease_seconds()),
                     )
-                    .returning(
-                        ProcessingTask.id,
-                        ProcessingTask.task_type,
-                        ProcessingTask.content_id,
-                        ProcessingTask.payload,
-                        ProcessingTask.retry_count,
-                        ProcessingTask.status,
-                        ProcessingTask.queue_name,
-                        ProcessingTask.created_at,
-                        ProcessingTask.available_at,
-                        ProcessingTask.started_at,
-                        ProcessingTask.completed_at,
-                        ProcessingTask.locked_at,
-                        ProcessingTask.locked_by,
-                        ProcessingTask.lease_expires_at,
-                    )
+                    .returning(*CLAIMED_TASK_COLUMNS)
                 )
                 task_row = db.execute(claim_stmt).mappings().first()
                 if task_row is None:
@@ -420,6 +650,141 @@ class QueueService:
 
             return None
 
+    def dequeue_batch(
+        self,
+        worker_id: str,
+        queue_name: TaskQueue | str | None,
+        max_tasks: int,
+        task_type: TaskType | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Claim up to ``max_tasks`` available tasks in a single statement.
+
+        Claims interleave retry buckets round-robin (oldest task of each bucket
+        first, starting from the rotating bucket cursor) so a deep backlog of
+        first attempts cannot starve retries, matching ``dequeue`` fairness.
+
+        Args:
+            worker_id: ID of the worker claiming the tasks
+            queue_name: Filter by queue partition (optional)
+            max_tasks: Maximum number of tasks to claim
+            task_type: Filter by task type (optional)
+
+        Returns:
+            Claimed task dictionaries, oldest first (empty when nothing is ready)
+        """
+        limit = int(max_tasks)
+        if limit <= 0:
+            return []
+
+        normalized_queue = self._normalize_queue_name(queue_name)
+        cursor_key = (
+            normalized_queue,
+            task_type.value if task_type is not None else None,
+        )
+        cursor = self._retry_bucket_cursor.get(cursor_key, 0)
+
+        with get_db() as db:
+            now = _utc_now()
+            task_order = func.coalesce(ProcessingTask.available_at, ProcessingTask.created_at)
+            retry_bucket = func.coalesce(ProcessingTask.retry_count, 0)
+            base_filters = [_claimable_task_filters(now)]
+            if task_type:
+                base_filters.append(ProcessingTask.task_type == task_type.value)
+            if normalized_queue:
+                base_filters.append(ProcessingTask.queue_name == normalized_queue)
+
+            # Position of each retry bucket in the rotation that starts at the cursor.
+            bucket_ordinal = func.row_number().over(order_by=retry_bucket) - 1
+            bucket_count = func.count().over()
+            buckets = (
+                select(
+                    retry_bucket.label("bucket"),
+                    (
+                        ((bucket_ordinal - cursor) % bucket_count + bucket_count) % bucket_count
+                    ).label("rotation"),
+                )
+                .where(*base_filters)
+                .group_by(retry_bucket)
+                .subquery("retry_buckets")
+            )
+            # Lock at most ``limit`` candidates per bucket; rows that are not picked
+            # are released when this statement's transaction commits.
+            candidates = (
+                select(
+                    ProcessingTask.id.label("id"),
+                    task_order.label("task_order"),
+                    ProcessingTask.created_at.label("created_at"),
+                )
+                .where(*base_filters, retry_bucket == buckets.c.bucket)
+                .order_by(
+                    task_order.asc(),
+                    ProcessingTask.created_at.asc(),
+                    ProcessingTask.id.asc(),
+                )
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+                .lateral("bucket_candidates")
+            )
+            ranked = (
+                select(
+                    candidates.c.id,
+                    candidates.c.task_order,
+                    func.row_number()
+                    .over(
+                        partition_by=buckets.c.bucket,
+                        order_by=(
+                            candidates.c.task_order.asc(),
+                            candidates.c.created_at.asc(),
+                            candidates.c.id.asc(),
+                        ),
+                    )
+                    .label("bucket_rank"),
+                    buckets.c.rotation,
+                )
+                .select_from(buckets.join(candidates, true()))
+                .subquery("ranked_candidates")
+            )
+            picked = select(
+                ranked.c.id,
+                func.row_number()
+                .over(
+                    order_by=(
+                        ranked.c.bucket_rank.asc(),
+                        ranked.c.rotation.asc(),
+                        ranked.c.task_order.asc(),
+                        ranked.c.id.asc(),
+                    )
+                )
+                .label("claim_order"),
+            ).subquery("picked_candidates")
+            claim_stmt = (
+                update(ProcessingTask)
+                .where(
+                    ProcessingTask.id.in_(select(picked.c.id).where(picked.c.claim_order <= limit))
+                )
+                .values(
+                    status=TaskStatus.PROCESSING.value,
+                    started_at=now,
+                    locked_at=now,
+                    locked_by=worker_id,
+                    lease_expires_at=now + timedelta(seconds=_task_lease_seconds()),
+                )
+                .returning(*CLAIMED_TASK_COLUMNS)
+            )
+            claimed = [dict(row) for row in db.execute(claim_stmt).mappings().all()]
+
+        if not claimed:
+            return []
+
+        # Mirror ``dequeue``: every non-empty claim advances the bucket rotation.
+        self._retry_bucket_cursor[cursor_key] = cursor + 1
+        claimed.sort(key=lambda task: (task["available_at"] or task["created_at"], task["id"]))
+        for task_data in claimed:
+            task_data["retry_count"] = int(task_data.get("retry_count") or 0)
+            _log_dequeued_task(task_data, worker_id=worker_id)
+        return claimed
+
     def renew_lease(
         self,
         task_id: int,
@@ -526,112 +891,58 @@ class QueueService:
         retry_delay_seconds: int | None = None,
     ) -> dict[str, Any] | None:
         """Persist one terminal or retry transition for a processed task."""
+        outcome = TaskOutcome(
+            task_id=task_id,
+            success=success,
+            error_message=error_message,
+            retryable=retryable,
+            current_retry_count=current_retry_count,
+            retry_delay_seconds=retry_delay_seconds,
+        )
         with get_db() as db:
-            should_retry = (
-                not success and retryable and current_retry_count < max(int(max_retries), 0)
-            )
-            resolved_delay_seconds = retry_delay_seconds if should_retry else None
             task = db.query(ProcessingTask).filter(ProcessingTask.id == task_id).first()
-            if not task:
-                transition = None
-            else:
-                now = _utc_now()
-                persisted_retry_count = int(task.retry_count or 0)
-                base_retry_count = max(persisted_retry_count, int(current_retry_count or 0))
+            transition = (
+                _apply_task_outcome(task, outcome, max_retries=max_retries, now=_utc_now())
+                if task
+                else None
+            )
 
-                if success:
-                    task.status = TaskStatus.COMPLETED.value
-                    task.completed_at = now
-                    task.error_message = None
-                elif should_retry:
-                    task.status = TaskStatus.PENDING.value
-                    task.retry_count = base_retry_count + 1
-                    task.started_at = None
-                    task.completed_at = None
-                    task.available_at = now + timedelta(seconds=resolved_delay_seconds or 0)
-                    task.error_message = error_message or "Task failed without error details"
-                else:
-                    task.status = TaskStatus.FAILED.value
-                    task.completed_at = now
-                    task.error_message = error_message or "Task failed without error details"
+        _log_task_transition(task_id, transition, operation="finalize_task")
+        return transition
 
-                _clear_task_lease(task)
-                transition = {
-                    "task_type": task.task_type,
-                    "queue_name": task.queue_name,
-                    "content_id": task.content_id,
-                    "error_message": task.error_message,
-                    "status": task.status,
-                    "retry_count": int(task.retry_count or 0),
-                    "retry_delay_seconds": resolved_delay_seconds,
-                    "available_at": task.available_at,
-                }
+    def finalize_batch(
+        self,
+        outcomes: Sequence[TaskOutcome],
+        *,
+        max_retries: int = 3,
+    ) -> dict[int, dict[str, Any] | None]:
+        """Persist transitions for several processed tasks in one transaction.
 
-            if transition is None:
-                logger.error(
-                    "Task not found",
-                    extra=build_log_extra(
-                        component="queue",
-                        operation="finalize_task",
-                        event_name="task.failed",
-                        status="failed",
-                        task_id=task_id,
-                        context_data={"failure_class": "TaskNotFound"},
-                    ),
-                )
-                return None
+        Each outcome follows the same rules as ``finalize_task``. Returns the
+        transition per task id, with ``None`` for tasks that no longer exist.
+        """
+        if not outcomes:
+            return {}
 
-            if transition["status"] == TaskStatus.COMPLETED.value:
-                logger.info(
-                    "Task completed",
-                    extra=build_log_extra(
-                        component="queue",
-                        operation="finalize_task",
-                        event_name="task.completed",
-                        status="completed",
-                        task_id=task_id,
-                        task_type=transition["task_type"],
-                        queue_name=transition["queue_name"],
-                        content_id=transition["content_id"],
-                    ),
-                )
-            elif transition["status"] == TaskStatus.PENDING.value:
-                logger.info(
-                    "Task retry scheduled",
-                    extra=build_log_extra(
-                        component="queue",
-                        operation="finalize_task",
-                        event_name="task.retry_scheduled",
-                        status="retry_scheduled",
-                        task_id=task_id,
-                        task_type=transition["task_type"],
-                        queue_name=transition["queue_name"],
-                        content_id=transition["content_id"],
-                        context_data={
-                            "retry_count": transition["retry_count"],
-                            "delay_seconds": transition["retry_delay_seconds"],
-                            "error_message": transition["error_message"],
-                        },
-                    ),
-                )
-            else:
-                logger.error(
-                    "Task failed",
-                    extra=build_log_extra(
-                        component="queue",
-                        operation="finalize_task",
-                        event_name="task.failed",
-                        status="failed",
-                        item_id=task_id,
-                        task_id=task_id,
-                        task_type=transition["task_type"],
-                        queue_name=transition["queue_name"],
-                        content_id=transition["content_id"],
-                        context_data={"error_message": transition["error_message"]},
-                    ),
+        with get_db() as db:
+            task_ids = [outcome.task_id for outcome in outcomes]
+            tasks_by_id = {
+                task.id: task
+                for task in db.query(ProcessingTask).filter(ProcessingTask.id.in_(task_ids)).all()
+            }
+            now = _utc_now()
+            transitions: dict[int, dict[str, Any] | None] = {}
+            for outcome in outcomes:
+                task = tasks_by_id.get(outcome.task_id)
+                transitions[outcome.task_id] = (
+                    _apply_task_outcome(task, outcome, max_retries=max_retries, now=now)
+                    if task
+                    else None
                 )
 
-            return transition
+        for task_id, transition in transitions.items():
+            _log_task_transition(task_id, transition, operation="finalize_batch")
+        return transitions
 
     def retry_task(self, task_id: int, delay_seconds: int = 60):
         """Retry a failed task after a delay."""
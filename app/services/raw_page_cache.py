@@ -0,0 +1,314 @@
+"""Short-lived on-disk cache of raw page responses shared across pipeline stages.
+
+A submitted URL is fetched by URL analysis, feed detection and HTML extraction (also
+used for news article enrichment) within seconds of each other. Each stage consults
+this cache before going to the network and stores what it fetched, so a page is
+usually downloaded once. Entries are keyed by the normalized URL plus the per-call
+request headers that change what a server returns, and bodies are stored once per
+SHA-256 digest so redirect aliases share a file. Every stage reads with its own
+maximum age; a periodic sweep drops expired entries and then the least recently
+used ones until the bodies fit the configured byte budget.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urldefrag
+
+import httpx
+
+from app.core.logging import get_logger
+from app.core.settings import get_settings
+from app.utils.url_utils import normalize_http_url
+
+logger = get_logger(__name__)
+
+STAGE_ANALYZE_URL = "analyze_url"
+STAGE_FEED_DETECTION = "feed_detection"
+STAGE_HTML_EXTRACTION = "html_extraction"
+
+# Oldest entry each stage accepts; ``raw_page_cache_ttl_seconds`` caps all of them.
+STAGE_MAX_AGE_SECONDS: dict[str, int] = {
+    STAGE_ANALYZE_URL: 300,
+    # Feed links in page heads change rarely.
+    STAGE_FEED_DETECTION: 3_600,
+    STAGE_HTML_EXTRACTION: 900,
+}
+DEFAULT_STAGE_MAX_AGE_SECONDS = 300
+
+KEY_HEADER_NAMES: tuple[str, ...] = ("accept", "accept-language")
+UNCACHEABLE_HEADER_NAMES: tuple[str, ...] = ("authorization", "cookie")
+DROPPED_RESPONSE_HEADER_NAMES: frozenset[str] = frozenset({"set-cookie"})
+MAX_BODY_BYTES = 5 * 1024 * 1024
+SWEEP_INTERVAL_SECONDS = 60.0
+TEMP_PREFIX = ".tmp-"
+
+_cache: RawPageCache | None = None
+_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """A stored response body with the response metadata stages need."""
+
+    url: str
+    final_url: str
+    status_code: int
+    headers: dict[str, str]
+    body: bytes
+    encoding: str
+    fetched_at: float
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("content-type", "")
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+
+def _cache_key(url: str, request_headers: dict[str, str] | None) -> str | None:
+    """Hash the normalized URL with response-shaping headers, or None if uncacheable."""
+    normalized = normalize_http_url(url)
+    if normalized is None:
+        return None
+    headers = {name.lower(): value.strip() for name, value in (request_headers or {}).items()}
+    if any(name in headers for name in UNCACHEABLE_HEADER_NAMES):
+        return None
+    parts = [urldefrag(normalized).url]
+    parts.extend(f"{name}:{headers.get(name, '')}" for name in KEY_HEADER_NAMES)
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=TEMP_PREFIX)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(temp_name, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(temp_name)
+        raise
+
+
+class RawPageCache:
+    """Content-addressed response store shared by every process on the host."""
+
+    def __init__(self, root: Path, *, ttl_seconds: int, max_bytes: int) -> None:
+        self.root = root
+        self.ttl_seconds = max(int(ttl_seconds), 0)
+        self.max_bytes = max(int(max_bytes), 0)
+        self._entries_dir = root / "entries"
+        self._bodies_dir = root / "bodies"
+        self._last_sweep = float("-inf")
+        self._sweep_lock = threading.Lock()
+
+    def max_age_for(self, stage: str) -> int:
+        """Return the freshness limit, in seconds, that ``stage`` reads with."""
+        stage_max_age = STAGE_MAX_AGE_SECONDS.get(stage, DEFAULT_STAGE_MAX_AGE_SECONDS)
+        return min(stage_max_age, self.ttl_seconds)
+
+    def get(
+        self,
+        url: str,
+        *,
+        stage: str,
+        request_headers: dict[str, str] | None = None,
+    ) -> CachedPage | None:
+        """Return a response for ``url`` fresh enough for ``stage``, if one is stored."""
+        key = _cache_key(url, request_headers)
+        if key is None:
+            return None
+        entry_path = self._entries_dir / f"{key}.json"
+        try:
+            entry = json.loads(entry_path.read_bytes())
+            fetched_at = float(entry["fetched_at"])
+            if time.time() - fetched_at > self.max_age_for(stage):
+                return None
+            body = (self._bodies_dir / entry["body_sha256"]).read_bytes()
+            page = CachedPage(
+                url=entry["url"],
+                final_url=entry["final_url"],
+                status_code=int(entry["status_code"]),
+                headers=dict(entry["headers"]),
+                body=body,
+                encoding=entry["encoding"],
+                fetched_at=fetched_at,
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        # Reads refresh the entry's position in the LRU order used by the sweep.
+        with suppress(OSError):
+            os.utime(entry_path)
+        logger.debug("Raw page cache hit for %s (stage=%s)", url, stage)
+        return page
+
+    def put(
+        self,
+        url: str,
+        *,
+        final_url: str,
+        status_code: int,
+        headers: dict[str, str],
+        body: bytes,
+        encoding: str,
+        request_headers: dict[str, str] | None = None,
+    ) -> None:
+        """Store a response under both the requested and the final URL."""
+        if not self.max_bytes or len(body) > MAX_BODY_BYTES:
+            return
+        keys = {_cache_key(candidate, request_headers) for candidate in (url, final_url)}
+        keys.discard(None)
+        if not keys:
+            return
+
+        digest = hashlib.sha256(body).hexdigest()
+        entry = json.dumps(
+            {
+                "url": url,
+                "final_url": final_url,
+                "status_code": status_code,
+                "headers": {
+                    name.lower(): value
+                    for name, value in headers.items()
+                    if name.lower() not in DROPPED_RESPONSE_HEADER_NAMES
+                },
+                "encoding": encoding,
+                "body_sha256": digest,
+                "fetched_at": time.time(),
+            }
+        ).encode("utf-8")
+        try:
+            self._bodies_dir.mkdir(parents=True, exist_ok=True)
+            self._entries_dir.mkdir(parents=True, exist_ok=True)
+            body_path = self._bodies_dir / digest
+            if body_path.exists():
+                # Keeps a concurrent sweep from treating the body as a fresh orphan.
+                os.utime(body_path)
+            else:
+                _atomic_write(body_path, body)
+            for key in keys:
+                _atomic_write(self._entries_dir / f"{key}.json", entry)
+        except OSError as exc:
+            logger.warning(
+                "Failed to store raw page for %s: %s",
+                url,
+                exc,
+                extra={
+                    "component": "raw_page_cache",
+                    "operation": "put",
+                    "context_data": {"url": url, "root": str(self.root)},
+                },
+            )
+            return
+        self._maybe_sweep()
+
+    def put_response(
+        self,
+        response: httpx.Response,
+        *,
+        url: str,
+        request_headers: dict[str, str] | None = None,
+    ) -> None:
+        """Store a successful ``httpx`` response fetched for ``url``."""
+        if not response.is_success:
+            return
+        self.put(
+            url,
+            final_url=str(response.url),
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            body=response.content,
+            encoding=response.encoding or "utf-8",
+            request_headers=request_headers,
+        )
+
+    def sweep(self) -> None:
+        """Drop expired entries, then least recently used ones over the byte budget."""
+        now = time.time()
+        entries: list[tuple[float, Path, str]] = []
+        for entry_path in self._entries_dir.glob("*.json"):
+            try:
+                last_used = entry_path.stat().st_mtime
+                entry = json.loads(entry_path.read_bytes())
+                digest = str(entry["body_sha256"])
+                expired = now - float(entry["fetched_at"]) > self.ttl_seconds
+            except (OSError, ValueError, KeyError, TypeError):
+                expired = True
+            if expired:
+                with suppress(OSError):
+                    entry_path.unlink()
+                continue
+            entries.append((last_used, entry_path, digest))
+
+        references: dict[str, int] = {}
+        for _last_used, _path, digest in entries:
+            references[digest] = references.get(digest, 0) + 1
+
+        body_sizes: dict[str, int] = {}
+        for body_path in self._bodies_dir.iterdir():
+            try:
+                stat = body_path.stat()
+            except OSError:
+                continue
+            # Bodies written since the entry scan may not have their entry yet.
+            if now - stat.st_mtime < SWEEP_INTERVAL_SECONDS:
+                continue
+            if body_path.name.startswith(TEMP_PREFIX) or body_path.name not in references:
+                with suppress(OSError):
+                    body_path.unlink()
+                continue
+            body_sizes[body_path.name] = stat.st_size
+
+        total_bytes = sum(body_sizes.values())
+        entries.sort()
+        for _last_used, entry_path, digest in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            with suppress(OSError):
+                entry_path.unlink()
+            references[digest] -= 1
+            if references[digest] == 0 and digest in body_sizes:
+                with suppress(OSError):
+                    (self._bodies_dir / digest).unlink()
+                total_bytes -= body_sizes.pop(digest)
+
+    def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep < SWEEP_INTERVAL_SECONDS:
+            return
+        if not self._sweep_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_sweep = now
+            self.sweep()
+        except OSError:
+            logger.debug("Raw page cache sweep failed (non-critical)", exc_info=True)
+        finally:
+            self._sweep_lock.release()
+
+
+def get_raw_page_cache() -> RawPageCache | None:
+    """Return the process-wide cache, or ``None`` when caching is disabled."""
+    global _cache
+    settings = get_settings()
+    if not settings.raw_page_cache_enabled or settings.raw_page_cache_max_bytes <= 0:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = RawPageCache(
+                settings.raw_page_cache_dir,
+                ttl_seconds=settings.raw_page_cache_ttl_seconds,
+                max_bytes=settings.raw_page_cache_max_bytes,
+            )
+        return _cache
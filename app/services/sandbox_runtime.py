@@ -4,15 +4,18 @@ from __future__ import annotations
 
 import re
 import shlex
-import shutil
-import subprocess
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
 from typing import Any
 
 from app.core.settings import get_settings
-from app.services.personal_markdown_library import get_personal_markdown_user_root
+from app.services.personal_library_index import INDEX_FILENAME, search_personal_library
+from app.services.personal_markdown_library import (
+    LOCK_FILENAME,
+    MANIFEST_FILENAME,
+    get_personal_markdown_user_root,
+)
 from app.services.vendor_costs import record_vendor_usage_out_of_band
 
 SEARCH_TOKEN_STOPWORDS = {
@@ -104,40 +107,7 @@ class LocalPersonalLibrarySandboxSession(PersonalLibrarySandboxSession):
         cleaned_query = query.strip()
         if not cleaned_query:
             return "Search query is empty."
-
-        rg_path = shutil.which("rg")
-        if rg_path is None:
-            return _python_search_fallback(
-                library_root=self.library_root,
-                query=cleaned_query,
-                glob=glob,
-                limit=limit,
-            )
-
-        result = subprocess.run(
-            [
-                rg_path,
-                "-n",
-                "-S",
-                "--glob",
-                glob,
-                "--max-count",
-                str(limit),
-                cleaned_query,
-                ".",
-            ],
-            cwd=self.library_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        stdout = (result.stdout or "").strip()
-        if stdout:
-            return stdout
-        stderr = (result.stderr or "").strip()
-        if result.returncode not in {0, 1} and stderr:
-            return f"Search failed: {stderr}"
-        return _python_search_fallback(
+        return _search_library_index(
             library_root=self.library_root,
             query=cleaned_query,
             glob=glob,
@@ -215,7 +185,10 @@ class E2BPersonalLibrarySandboxSession(PersonalLibrarySandboxSession):
         cleaned_query = query.strip()
         if not cleaned_query:
             return "Search query is empty."
-        return self._python_search_fallback(
+        # The hydrated sandbox mirrors ``local_root``, so rank against the host-side index
+        # instead of re-reading every file inside the sandbox.
+        return _search_library_index(
+            library_root=self.local_root,
             query=cleaned_query,
             glob=glob,
             limit=limit,
@@ -239,7 +212,9 @@ class E2BPersonalLibrarySandboxSession(PersonalLibrarySandboxSession):
         if not self.local_root.exists():
             return
         for path in sorted(self.local_root.rglob("*")):
-            if not path.is_file():
+            if not path.is_file() or path.name.startswith(
+                (MANIFEST_FILENAME, INDEX_FILENAME, LOCK_FILENAME)
+            ):
                 continue
             relative = path.relative_to(self.local_root).as_posix()
             destination = (self._library_root / relative).as_posix()
@@ -252,78 +227,6 @@ class E2BPersonalLibrarySandboxSession(PersonalLibrarySandboxSession):
         exit_code = int(getattr(result, "exit_code", getattr(result, "exitCode", 0)) or 0)
         return SandboxCommandOutput(stdout=stdout, stderr=stderr, exit_code=exit_code)
 
-    def _python_search_fallback(
-        self,
-        *,
-        query: str,
-        glob: str,
-        limit: int,
-    ) -> str:
-        search_terms = _extract_search_terms(query)
-        script = f"""
-import fnmatch
-import pathlib
-import re
-
-root = pathlib.Path({self._library_root.as_posix()!r})
-query = {query!r}.lower()
-search_terms = {search_terms!r}
-glob = {glob!r}
-limit = {int(limit)}
-candidates = []
-
-
-def score_text(text, path_weight):
-    lowered = text.lower()
-    score = 0
-    if query and query in lowered:
-        score += 12
-    score += sum(path_weight for term in search_terms if term in lowered)
-    return score
-
-for path in sorted(root.rglob('*')):
-    if not path.is_file():
-        continue
-    if not fnmatch.fnmatch(path.name, glob):
-        continue
-    relative_path = str(path.relative_to(root))
-    path_score = score_text(relative_path, 3)
-    line_hits = []
-    for line_number, line in enumerate(path.read_text(encoding='utf-8').splitlines(), start=1):
-        line_score = score_text(line, 1)
-        if line_score <= 0:
-            continue
-        line_hits.append((line_score, f"{{relative_path}}:{{line_number}}:{{line}}"))
-    if path_score <= 0 and not line_hits:
-        continue
-    line_hits.sort(key=lambda item: item[0], reverse=True)
-    rendered_hits = [hit for _, hit in line_hits[:3]]
-    if not rendered_hits:
-        rendered_hits = [f"{{relative_path}}:path-match"]
-    total_score = path_score + sum(score for score, _ in line_hits[:3])
-    candidates.append((total_score, relative_path, rendered_hits))
-
-rendered = []
-for _, _, hits in sorted(candidates, key=lambda item: (-item[0], item[1])):
-    for hit in hits:
-        rendered.append(hit)
-        if len(rendered) >= limit:
-            break
-    if len(rendered) >= limit:
-        break
-
-if rendered:
-    print("\\n".join(rendered))
-"""
-        command = f"python3 - <<'PY'\n{script}\nPY"
-        result = self._run_command(command)
-        stdout = result.stdout.strip()
-        if stdout:
-            return stdout
-        if result.stderr.strip():
-            return f"Search failed: {result.stderr.strip()}"
-        return "No matches found in the personal markdown library."
-
     def _resolve_sandbox_relative_path(self, relative_path: str) -> str:
         candidate = PurePosixPath(relative_path.strip() or ".")
         if candidate.is_absolute() or ".." in candidate.parts:
@@ -356,6 +259,34 @@ def _resolve_local_relative_path(library_root: Path, relative_path: str) -> Path
     return candidate
 
 
+def _search_library_index(
+    *,
+    library_root: Path,
+    query: str,
+    glob: str,
+    limit: int,
+) -> str:
+    search_terms = _extract_search_terms(query)
+    if not search_terms:
+        # Stopword-only queries carry no indexed terms; only a literal scan can match them.
+        return _python_search_fallback(
+            library_root=library_root,
+            query=query,
+            glob=glob,
+            limit=limit,
+        )
+    hits = search_personal_library(
+        library_root,
+        query=query,
+        terms=search_terms,
+        glob=glob,
+        limit=limit,
+    )
+    if not hits:
+        return "No matches found in the personal markdown library."
+    return "\n".join(hits)
+
+
 def _python_search_fallback(
     *,
     library_root: Path,
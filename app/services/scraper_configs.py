@@ -8,7 +8,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 from urllib.parse import urlparse
 
-from sqlalchemy import and_
+from sqlalchemy import and_, tuple_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -28,7 +28,8 @@ from app.models.schema import (
     ProcessingTask,
     UserScraperConfig,
 )
-from app.models.user import User
+from app.repositories.stat_counter_repository import apply_content_unread_deltas
+from app.services.news_feed import invalidate_news_visibility_descriptor
 from app.utils.dates import parse_date_with_tz
 
 logger = get_logger(__name__)
@@ -136,9 +137,15 @@ def _coerce_publication_date(content: Content) -> datetime:
     return datetime.now(UTC).replace(tzinfo=None)
 
 
-def _estimate_next_expected_at(
+def estimate_next_expected_at(
     publication_dates: list[datetime],
 ) -> tuple[datetime | None, float | None, int]:
+    """Predict a feed's next publication from its recent publication dates.
+
+    Returns:
+        ``(next_expected_at, average_interval_hours, interval_sample_size)``; the
+        first two are ``None`` when fewer than two distinct dates are known.
+    """
     unique_dates = sorted({value for value in publication_dates if value is not None}, reverse=True)
     if len(unique_dates) < 2:
         return None, None, 0
@@ -327,7 +334,7 @@ def get_scraper_config_stats(
             stats["processing_count"] += 1
 
     for _config_id, stats in stats_by_config.items():
-        next_expected_at, average_interval_hours, interval_sample_size = _estimate_next_expected_at(
+        next_expected_at, average_interval_hours, interval_sample_size = estimate_next_expected_at(
             stats.pop("_publication_dates")
         )
         stats["next_expected_at"] = next_expected_at
@@ -378,6 +385,7 @@ def create_user_scraper_config(
             "Scraper config already exists for this feed"
         ) from exc
 
+    invalidate_news_visibility_descriptor(user_id)
     db.refresh(record)
     return record
 
@@ -417,6 +425,7 @@ def update_user_scraper_config(
             "Scraper config already exists for this feed"
         ) from exc
 
+    invalidate_news_visibility_descriptor(user_id)
     db.refresh(record)
     return record
 
@@ -438,6 +447,7 @@ def delete_user_scraper_config(db: Session, user_id: int, config_id: int) -> Non
 
     db.delete(record)
     db.commit()
+    invalidate_news_visibility_descriptor(user_id)
 
 
 def build_feed_payloads(
@@ -463,6 +473,8 @@ def build_feed_payloads(
                 "limit": limit,
                 "user_id": config.user_id,
                 "config_id": config.id,
+                # Reactivated configs count as new subscriptions for conditional GETs.
+                "subscribed_at": config.updated_at or config.created_at,
             }
         )
     return feeds
@@ -474,33 +486,64 @@ def ensure_inbox_status(
     """Ensure a content_status row exists for this user/content."""
     if user_id is None:
         return False
-    if content_type and not should_add_to_inbox(content_type):
-        return False
+    return (user_id, content_id) in ensure_inbox_statuses(db, [(user_id, content_id, content_type)])
 
-    existing = (
-        db.query(ContentStatusEntry)
-        .filter(
-            and_(
-                ContentStatusEntry.user_id == user_id,
-                ContentStatusEntry.content_id == content_id,
-            )
-        )
-        .first()
-    )
-    if existing:
-        if existing.status == CONTENT_STATUS_DIGEST_SOURCE:
-            existing.status = CONTENT_STATUS_INBOX
-            return True
-        return False
 
-    db.add(
-        ContentStatusEntry(
+def ensure_inbox_statuses(
+    db: Session,
+    entries: Iterable[tuple[int | None, int, str | None]],
+) -> set[tuple[int, int]]:
+    """Ensure content_status rows for many ``(user_id, content_id, content_type)`` entries.
+
+    Follows the rules of ``ensure_inbox_status`` with one lookup for existing rows.
+    Returns the ``(user_id, content_id)`` pairs that gained or were promoted to an
+    inbox row.
+    """
+    wanted: dict[tuple[int, int], None] = {}
+    for user_id, content_id, content_type in entries:
+        if user_id is None:
+            continue
+        if content_type and not should_add_to_inbox(content_type):
+            continue
+        wanted[(user_id, content_id)] = None
+    if not wanted:
+        return set()
+
+    existing = {
+        (row.user_id, row.content_id): row
+        for row in db.query(ContentStatusEntry)
+        .filter(tuple_(ContentStatusEntry.user_id, ContentStatusEntry.content_id).in_(list(wanted)))
+        .all()
+    }
+    added: dict[int, list[int]] = defaultdict(list)
+    for user_id, content_id in wanted:
+        row = existing.get((user_id, content_id))
+        if row is None:
+            db.add(
+                ContentStatusEntry(
+                    user_id=user_id,
+                    content_id=content_id,
+                    status=CONTENT_STATUS_INBOX,
+                )
+            )
+        elif row.status == CONTENT_STATUS_DIGEST_SOURCE:
+            row.status = CONTENT_STATUS_INBOX
+        else:
+            continue
+        added[user_id].append(content_id)
+
+    # The counter query joins on inbox rows; make the pending ones visible to it.
+    if added:
+        db.flush()
+    for user_id, content_ids in added.items():
+        apply_content_unread_deltas(
+            db,
             user_id=user_id,
-            content_id=content_id,
-            status=CONTENT_STATUS_INBOX,
+            content_ids=content_ids,
+            delta=1,
+            require_unread=True,
         )
-    )
-    return True
+    return {(user_id, content_id) for user_id, ids in added.items() for content_id in ids}
 
 
 def should_add_to_inbox(content_type: str | None) -> bool:
@@ -508,9 +551,3 @@ def should_add_to_inbox(content_type: str | None) -> bool:
     if not content_type:
         return False
     return content_type in ("article", "podcast", "news", "unknown")
-
-
-def list_active_user_ids(db: Session) -> list[int]:
-    """Return active user ids for inbox backfills."""
-    rows = db.query(User.id).filter(User.is_active.is_(True)).all()
-    return [row[0] for row in rows]
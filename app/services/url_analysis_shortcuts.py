@@ -0,0 +1,184 @@
+"""Skip LLM URL analysis when the URL alone already settles the answer.
+
+Two sources settle it. Processing strategies whose URL match implies a content type
+(arXiv, PubMed, Hacker News items, PDFs, images) declare it through
+``analysis_content_type``. Past LLM analyses are also folded into per host and path
+shape records, and a well-observed shape whose recent analyses all agreed is trusted
+for later URLs. A sampled share of those hits still goes to the LLM so its result is
+recorded; otherwise a shape that changes what it publishes would never break its streak.
+
+Learned shortcuts only serve article outcomes without a media URL. Podcast and video
+analyses carry per-URL media links that an earlier result cannot supply. Every lookup
+is logged as a hit or miss so skip rates can be aggregated per source and host.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from urllib.parse import urlparse
+
+from sqlalchemy.orm import Session
+
+from app.core.logging import get_logger
+from app.core.settings import get_settings
+from app.models.internal.content_analyzer import ContentAnalysisResult
+from app.models.metadata import ContentType
+from app.processing_strategies.registry import StrategyRegistry, get_strategy_registry
+from app.repositories.url_analysis_pattern_repository import (
+    get_url_analysis_pattern,
+    record_url_analysis_observation,
+)
+from app.utils.url_utils import normalize_http_url
+
+logger = get_logger(__name__)
+
+PATH_SHAPE_MAX_SEGMENTS = 6
+PATH_SHAPE_MAX_CHARS = 255
+SLUG_MIN_CHARS = 25
+_NUMERIC_SEGMENT = re.compile(r"^\d+$")
+# Opaque identifiers: long alphanumeric tokens containing a digit (hashes, base62 ids).
+_ID_SEGMENT = re.compile(r"^(?=[a-z0-9]*\d)[a-z0-9]{8,}$")
+_EXTENSION = re.compile(r"(\.[a-z0-9]{1,5})$")
+
+
+@dataclass(frozen=True)
+class UrlAnalysisShortcut:
+    """Analysis outcome settled without the LLM."""
+
+    source: str
+    content_type: ContentType
+    platform: str | None = None
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def _segment_shape(segment: str) -> str:
+    lowered = segment.lower()
+    extension_match = _EXTENSION.search(lowered)
+    extension = extension_match.group(1) if extension_match else ""
+    stem = lowered[: len(lowered) - len(extension)] if extension else lowered
+    if _NUMERIC_SEGMENT.match(stem):
+        return "{n}" + extension
+    if _ID_SEGMENT.match(stem):
+        return "{id}" + extension
+    if "-" in stem or "_" in stem or len(stem) >= SLUG_MIN_CHARS:
+        return "{slug}" + extension
+    return lowered
+
+
+def url_path_shape(url: str) -> tuple[str, str] | None:
+    """Return ``(host, path shape)`` with ids, numbers and slugs replaced by placeholders.
+
+    ``https://www.example.com/2024/05/my-post`` becomes
+    ``("example.com", "/{n}/{n}/{slug}")``. Query strings are ignored.
+    """
+    normalized = normalize_http_url(url)
+    if normalized is None:
+        return None
+    parsed = urlparse(normalized)
+    host = (parsed.hostname or "").lower().removeprefix("www.")
+    if not host:
+        return None
+    segments = [segment for segment in parsed.path.split("/") if segment]
+    shaped = [_segment_shape(segment) for segment in segments[:PATH_SHAPE_MAX_SEGMENTS]]
+    if len(segments) > PATH_SHAPE_MAX_SEGMENTS:
+        shaped.append("*")
+    return host[:255], ("/" + "/".join(shaped))[:PATH_SHAPE_MAX_CHARS]
+
+
+def _record_lookup(url: str, *, outcome: str, source: str | None, reason: str | None) -> None:
+    """Log one shortcut lookup so hit rates can be aggregated per source and host."""
+    shape = url_path_shape(url)
+    logger.info(
+        "URL analysis shortcut %s for %s%s",
+        outcome,
+        url,
+        f" ({reason})" if reason else "",
+        extra={
+            "component": "url_analysis_shortcuts",
+            "operation": "url_analysis_shortcut",
+            "context_data": {
+                "outcome": outcome,
+                "source": source,
+                "reason": reason,
+                "host": shape[0] if shape else None,
+                "path_shape": shape[1] if shape else None,
+            },
+        },
+    )
+
+
+def _learned_shortcut(db: Session, url: str) -> tuple[UrlAnalysisShortcut | None, str]:
+    settings = get_settings()
+    min_streak = settings.url_analysis_pattern_min_streak
+    if min_streak <= 0:
+        return None, "disabled"
+    shape = url_path_shape(url)
+    if shape is None:
+        return None, "unparseable_url"
+    pattern = get_url_analysis_pattern(db, host=shape[0], path_shape=shape[1])
+    if pattern is None:
+        return None, "no_pattern"
+    if pattern.content_type != ContentType.ARTICLE.value or pattern.has_media_url:
+        return None, "media_outcome"
+    if pattern.streak < min_streak:
+        return None, "low_streak"
+    if pattern.observations < settings.url_analysis_pattern_min_observations:
+        return None, "few_observations"
+    max_age = timedelta(days=settings.url_analysis_pattern_max_age_days)
+    if pattern.updated_at is None or pattern.updated_at < _utcnow() - max_age:
+        return None, "stale"
+    if random.random() < settings.url_analysis_pattern_verify_rate:
+        return None, "verification_sample"
+    shortcut = UrlAnalysisShortcut(
+        source="learned",
+        content_type=ContentType.ARTICLE,
+        platform=pattern.platform,
+    )
+    return shortcut, f"streak={pattern.streak}"
+
+
+def find_url_analysis_shortcut(
+    db: Session,
+    url: str,
+    *,
+    strategy_registry: StrategyRegistry | None = None,
+) -> UrlAnalysisShortcut | None:
+    """Return the analysis outcome for ``url`` when it can be trusted without the LLM."""
+    registry = strategy_registry or get_strategy_registry()
+    strategy = registry.get_analysis_strategy(url)
+    if strategy is not None and strategy.analysis_content_type:
+        _record_lookup(url, outcome="hit", source="strategy", reason=type(strategy).__name__)
+        return UrlAnalysisShortcut(
+            source="strategy",
+            content_type=ContentType(strategy.analysis_content_type),
+            platform=strategy.analysis_platform,
+        )
+
+    shortcut, reason = _learned_shortcut(db, url)
+    _record_lookup(
+        url,
+        outcome="hit" if shortcut else "miss",
+        source=shortcut.source if shortcut else None,
+        reason=reason,
+    )
+    return shortcut
+
+
+def record_url_analysis(url: str, analysis: ContentAnalysisResult) -> None:
+    """Fold an LLM analysis of ``url`` into the learned pattern for its path shape."""
+    shape = url_path_shape(url)
+    if shape is None:
+        return
+    record_url_analysis_observation(
+        host=shape[0],
+        path_shape=shape[1],
+        content_type=analysis.content_type,
+        platform=analysis.platform[:50] if analysis.platform else None,
+        has_media_url=bool(analysis.media_url),
+    )
@@ -0,0 +1,170 @@
+"""Content-addressed object-storage cache for narration MP3 audio."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from app.core.logging import get_logger
+from app.core.settings import get_settings
+from app.services.gateways.object_storage_gateway import (
+    ObjectStorageGateway,
+    get_object_storage_gateway,
+)
+from app.services.voice.narration_tts import (
+    DigestNarrationTtsService,
+    get_digest_narration_tts_service,
+)
+
+logger = get_logger(__name__)
+
+NARRATION_AUDIO_PREFIX = "narration-audio"
+NARRATION_AUDIO_CONTENT_TYPE = "audio/mpeg"
+
+
+@dataclass(frozen=True)
+class CachedNarrationAudio:
+    """Stored narration audio object."""
+
+    key: str
+    size_bytes: int
+
+
+class NarrationAudioCache:
+    """Serve narration audio from storage, synthesizing and storing it on a miss.
+
+    Keys hash the normalized narration text together with every TTS setting that
+    changes the rendered bytes, so edited text or a new voice never hits stale audio.
+    """
+
+    def __init__(
+        self,
+        gateway: ObjectStorageGateway | None = None,
+        tts_service: DigestNarrationTtsService | None = None,
+    ) -> None:
+        self._gateway = gateway
+        self._tts_service = tts_service
+
+    @property
+    def tts_service(self) -> DigestNarrationTtsService:
+        return self._tts_service or get_digest_narration_tts_service()
+
+    def _storage(self) -> ObjectStorageGateway | None:
+        if self._gateway is not None:
+            return self._gateway
+        try:
+            return get_object_storage_gateway()
+        except ValueError:
+            logger.warning(
+                "Object storage unavailable; narration audio will not be cached",
+                extra={"component": "narration_audio_cache", "operation": "resolve_storage"},
+            )
+            return None
+
+    def cache_key(self, text: str) -> str:
+        """Return the storage key for ``text`` under the current TTS settings."""
+        settings = get_settings()
+        fingerprint = json.dumps(
+            {
+                "text": text.strip(),
+                "voice_id": settings.elevenlabs_tts_voice_id,
+                "model_id": settings.elevenlabs_digest_tts_model,
+                "output_format": settings.elevenlabs_digest_tts_output_format,
+                "speed": settings.elevenlabs_digest_tts_speed,
+            },
+            sort_keys=True,
+        )
+        digest = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+        return f"{NARRATION_AUDIO_PREFIX}/{digest[:2]}/{digest}.mp3"
+
+    def lookup(self, key: str) -> CachedNarrationAudio | None:
+        """Return the cached object for ``key`` when it exists and is non-empty."""
+        storage = self._storage()
+        if storage is None:
+            return None
+        try:
+            metadata = storage.head(key=key)
+        except Exception:  # noqa: BLE001
+            logger.warning(
+                "Narration audio cache lookup failed",
+                exc_info=True,
+                extra={
+                    "component": "narration_audio_cache",
+                    "operation": "lookup",
+                    "context_data": {"key": key},
+                },
+            )
+            return None
+        if metadata is None or not metadata.size_bytes:
+            return None
+        return CachedNarrationAudio(key=key, size_bytes=metadata.size_bytes)
+
+    def read(self, key: str, *, start: int | None = None, end: int | None = None) -> bytes:
+        """Return cached bytes, optionally limited to the inclusive range ``start``-``end``."""
+        storage = self._storage()
+        if storage is None:
+            raise RuntimeError("Narration audio storage is unavailable")
+        return storage.get_bytes(key=key, start=start, end=end)
+
+    def stream_and_store(
+        self,
+        *,
+        key: str,
+        text: str,
+        item_id: int | None = None,
+        user_id: int | None = None,
+    ) -> Iterator[bytes]:
+        """Start synthesis and return an iterator that stores the audio once complete.
+
+        The first chunk is generated before returning so configuration and vendor
+        failures raise here (``ValueError``/``RuntimeError``) instead of mid-response.
+        """
+        chunks = self.tts_service.stream_mp3(text=text, item_id=item_id, user_id=user_id)
+        first_chunk = next(chunks)
+        return self._tee_to_storage(key, first_chunk, chunks)
+
+    def _tee_to_storage(
+        self,
+        key: str,
+        first_chunk: bytes,
+        chunks: Iterator[bytes],
+    ) -> Iterator[bytes]:
+        audio = bytearray(first_chunk)
+        yield first_chunk
+        for chunk in chunks:
+            audio.extend(chunk)
+            yield chunk
+
+        storage = self._storage()
+        if storage is None:
+            return
+        try:
+            storage.put_bytes(
+                key=key,
+                data=bytes(audio),
+                content_type=NARRATION_AUDIO_CONTENT_TYPE,
+            )
+        except Exception:  # noqa: BLE001
+            logger.warning(
+                "Failed to store narration audio",
+                exc_info=True,
+                extra={
+                    "component": "narration_audio_cache",
+                    "operation": "store",
+                    "context_data": {"key": key, "audio_bytes": len(audio)},
+                },
+            )
+
+
+_narration_audio_cache: NarrationAudioCache | None = None
+
+
+def get_narration_audio_cache() -> NarrationAudioCache:
+    """Return the cached narration audio cache."""
+
+    global _narration_audio_cache
+    if _narration_audio_cache is None:
+        _narration_audio_cache = NarrationAudioCache()
+    return _narration_audio_cache
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from importlib.util import find_spec
 
 from app.core.logging import get_logger
@@ -45,6 +46,24 @@ class DigestNarrationTtsService:
             RuntimeError: If audio generation fails or returns empty audio.
         """
 
+        return b"".join(self.stream_mp3(text=text, item_id=item_id, user_id=user_id))
+
+    def stream_mp3(
+        self,
+        *,
+        text: str,
+        item_id: int | None = None,
+        user_id: int | None = None,
+    ) -> Iterator[bytes]:
+        """Yield MP3 narration chunks as ElevenLabs produces them.
+
+        Configuration is validated before the iterator is returned; generation errors
+        surface while iterating. Vendor usage is recorded when the stream ends.
+
+        Raises:
+            ValueError: If ElevenLabs is unavailable or required config is missing.
+        """
+
         normalized = text.strip()
         if not normalized:
             raise ValueError("Narration text is empty")
@@ -54,7 +73,16 @@ class DigestNarrationTtsService:
             raise ValueError("ElevenLabs TTS voice id is not configured")
         if find_spec("elevenlabs") is None or ElevenLabs is None or VoiceSettings is None:
             raise ValueError("ElevenLabs SDK is not installed")
+        return self._iter_audio_chunks(normalized, item_id=item_id, user_id=user_id)
 
+    def _iter_audio_chunks(
+        self,
+        normalized: str,
+        *,
+        item_id: int | None,
+        user_id: int | None,
+    ) -> Iterator[bytes]:
+        audio_size = 0
         try:
             client = ElevenLabs(api_key=self._settings.elevenlabs_api_key)
             audio_iterator = client.text_to_speech.convert(
@@ -64,10 +92,10 @@ class DigestNarrationTtsService:
                 output_format=self._settings.elevenlabs_digest_tts_output_format,
                 voice_settings=VoiceSettings(speed=self._settings.elevenlabs_digest_tts_speed),
             )
-            audio_bytes = bytearray()
             for chunk in audio_iterator:
                 if chunk:
-                    audio_bytes.extend(chunk)
+                    audio_size += len(chunk)
+                    yield bytes(chunk)
         except Exception as exc:  # noqa: BLE001
             logger.exception(
                 "Digest narration generation failed",
@@ -83,10 +111,27 @@ class DigestNarrationTtsService:
                 },
             )
             raise RuntimeError("Failed to generate digest narration audio") from exc
-
-        if not audio_bytes:
+        finally:
+            # ElevenLabs bills generated audio even when the listener disconnects early.
+            if audio_size:
+                self._record_usage(
+                    text_chars=len(normalized),
+                    audio_bytes=audio_size,
+                    item_id=item_id,
+                    user_id=user_id,
+                )
+
+        if not audio_size:
             raise RuntimeError("Digest narration audio was empty")
 
+    def _record_usage(
+        self,
+        *,
+        text_chars: int,
+        audio_bytes: int,
+        item_id: int | None,
+        user_id: int | None,
+    ) -> None:
         record_vendor_usage_out_of_band(
             provider="elevenlabs",
             model=self._settings.elevenlabs_digest_tts_model,
@@ -99,13 +144,11 @@ class DigestNarrationTtsService:
                 "target_id": item_id,
                 "voice_id": self._settings.elevenlabs_tts_voice_id,
                 "output_format": self._settings.elevenlabs_digest_tts_output_format,
-                "text_chars": len(normalized),
-                "audio_bytes": len(audio_bytes),
+                "text_chars": text_chars,
+                "audio_bytes": audio_bytes,
             },
         )
 
-        return bytes(audio_bytes)
-
 
 _digest_narration_tts_service: DigestNarrationTtsService | None = None
 
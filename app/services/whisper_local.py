@@ -1,6 +1,10 @@
 import os
+import wave
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 
+import numpy as np
 import torch
 import whisper
 
@@ -10,6 +14,90 @@ from app.core.settings import get_settings
 logger = get_logger(__name__)
 settings = get_settings()
 
+WHISPER_SAMPLE_RATE = 16_000
+# Tail of the previous segment fed to the next one so words split at a boundary and
+# names spelled earlier in the episode stay consistent.
+SEGMENT_PROMPT_CHARS = 200
+
+SegmentCallback = Callable[[int, str, str | None], None]
+
+
+def _is_mps_failure(error: Exception) -> bool:
+    error_msg = str(error).lower()
+    return "mps" in error_msg or "sparse" in error_msg or "_sparse_coo_tensor" in error_msg
+
+
+@contextmanager
+def _open_normalized_wav(audio_file_path: Path) -> Iterator[wave.Wave_read | None]:
+    """Open a 16 kHz mono 16-bit WAV for random access, yielding ``None`` otherwise."""
+    with ExitStack() as stack:
+        try:
+            reader = stack.enter_context(wave.open(str(audio_file_path), "rb"))
+        except (wave.Error, EOFError):
+            reader = None
+        if reader is not None and (
+            reader.getframerate() != WHISPER_SAMPLE_RATE
+            or reader.getnchannels() != 1
+            or reader.getsampwidth() != 2
+        ):
+            stack.close()
+            reader = None
+        yield reader
+
+
+def _read_wav_segment(reader: wave.Wave_read, *, index: int, segment_seconds: int) -> np.ndarray:
+    frames_per_segment = segment_seconds * WHISPER_SAMPLE_RATE
+    reader.setpos(index * frames_per_segment)
+    raw = reader.readframes(frames_per_segment)
+    return np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def count_audio_segments(audio_file_path: Path, *, segment_seconds: int) -> int | None:
+    """Return the segment count of a normalized WAV, or ``None`` for other formats."""
+    with _open_normalized_wav(audio_file_path) as reader:
+        if reader is None:
+            return None
+        frames_per_segment = segment_seconds * WHISPER_SAMPLE_RATE
+        return -(-reader.getnframes() // frames_per_segment)
+
+
+def read_audio_segment(audio_file_path: Path, *, index: int, segment_seconds: int) -> np.ndarray:
+    """Read one segment of a normalized WAV without decoding the rest of the file."""
+    with _open_normalized_wav(audio_file_path) as reader:
+        if reader is None:
+            raise ValueError(f"Not a normalized 16 kHz mono WAV: {audio_file_path}")
+        return _read_wav_segment(reader, index=index, segment_seconds=segment_seconds)
+
+
+def _iter_audio_segments(
+    audio_file_path: Path,
+    *,
+    segment_seconds: int,
+    start_index: int,
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Yield ``(index, samples)`` for fixed-length 16 kHz mono segments.
+
+    Normalized 16-bit mono WAV files are read one segment at a time so a multi-hour
+    episode never has to be decoded into memory at once. Anything else falls back to
+    Whisper's ffmpeg loader.
+    """
+    frames_per_segment = segment_seconds * WHISPER_SAMPLE_RATE
+    with _open_normalized_wav(audio_file_path) as reader:
+        if reader is not None:
+            total_frames = reader.getnframes()
+            index = start_index
+            while index * frames_per_segment < total_frames:
+                yield index, _read_wav_segment(reader, index=index, segment_seconds=segment_seconds)
+                index += 1
+            return
+
+    audio = whisper.load_audio(str(audio_file_path))
+    index = start_index
+    while index * frames_per_segment < len(audio):
+        start = index * frames_per_segment
+        yield index, audio[start : start + frames_per_segment]
+        index += 1
+
 
 class WhisperLocalTranscriptionService:
     """Local Whisper service for audio transcription using OpenAI's Whisper model."""
@@ -49,8 +137,7 @@ class WhisperLocalTranscriptionService:
                 self.model = whisper.load_model(self.model_name, device=self.device)
                 logger.info(f"Model loaded successfully on {self.device}")
             except (RuntimeError, NotImplementedError) as e:
-                error_msg = str(e).lower()
-                if "mps" in error_msg or "sparse" in error_msg or "_sparse_coo_tensor" in error_msg:
+                if _is_mps_failure(e):
                     logger.warning(
                         f"Failed to load model on {self.device}, falling back to CPU: {e}"
                     )
@@ -80,34 +167,7 @@ class WhisperLocalTranscriptionService:
             file_size_mb = os.path.getsize(audio_file_path) / (1024 * 1024)
             logger.info(f"Starting transcription of {audio_file_path} ({file_size_mb:.1f} MB)")
 
-            # Transcribe the audio
-            try:
-                result = self.model.transcribe(
-                    str(audio_file_path),
-                    fp16=self.device != "cpu",  # Use FP16 on GPU for faster inference
-                    language=None,  # Auto-detect language
-                    task="transcribe",  # Transcribe in original language
-                    verbose=False,
-                )
-            except (RuntimeError, NotImplementedError) as e:
-                error_msg = str(e).lower()
-                if "mps" in error_msg or "sparse" in error_msg or "_sparse_coo_tensor" in error_msg:
-                    logger.warning(f"MPS transcription failed, retrying with CPU: {e}")
-                    # Reload model on CPU
-                    self.cleanup_service()
-                    self.device = "cpu"
-                    self._load_model()
-                    # Retry transcription
-                    result = self.model.transcribe(
-                        str(audio_file_path),
-                        fp16=False,  # Disable FP16 on CPU
-                        language=None,
-                        task="transcribe",
-                        verbose=False,
-                    )
-                else:
-                    raise
-
+            result = self._run_transcribe(str(audio_file_path))
             transcript = result["text"].strip()
             detected_language = result.get("language", None)
 
@@ -122,6 +182,98 @@ class WhisperLocalTranscriptionService:
             logger.error(f"Error transcribing audio with local Whisper: {e}")
             raise
 
+    def transcribe_audio_chunked(
+        self,
+        audio_file_path: Path,
+        *,
+        segment_seconds: int,
+        completed_segments: list[str] | None = None,
+        language: str | None = None,
+        on_segment: SegmentCallback | None = None,
+    ) -> tuple[str, str | None]:
+        """Transcribe audio in fixed-length segments, resuming after completed ones.
+
+        Args:
+            audio_file_path: Path to the audio file to transcribe
+            segment_seconds: Length of each segment in seconds
+            completed_segments: Segment texts already transcribed by an earlier attempt
+            language: Language detected by an earlier attempt, if any
+            on_segment: Called with ``(index, text, language)`` after each new segment
+
+        Returns:
+            Tuple of (transcript, language_code)
+        """
+        if segment_seconds <= 0:
+            raise ValueError("segment_seconds must be positive")
+        if not audio_file_path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+
+        self._load_model()
+        segments = list(completed_segments or [])
+        detected_language = language
+        if segments:
+            logger.info(f"Resuming transcription of {audio_file_path} at segment {len(segments)}")
+
+        for index, samples in _iter_audio_segments(
+            audio_file_path,
+            segment_seconds=segment_seconds,
+            start_index=len(segments),
+        ):
+            previous_text = " ".join(segments)[-SEGMENT_PROMPT_CHARS:]
+            result = self._run_transcribe(
+                samples,
+                language=detected_language,
+                initial_prompt=previous_text or None,
+            )
+            text = result["text"].strip()
+            # Pin the language detected on the first segment; later segments are
+            # often music or silence and detect poorly on their own.
+            detected_language = detected_language or result.get("language")
+            segments.append(text)
+            if on_segment is not None:
+                on_segment(index, text, detected_language)
+
+        transcript = " ".join(segment for segment in segments if segment).strip()
+        logger.info(
+            f"Successfully transcribed {len(segments)} segments. "
+            f"Length: {len(transcript)} chars, Language: {detected_language}"
+        )
+        return transcript, detected_language
+
+    def _run_transcribe(
+        self,
+        audio: str | np.ndarray,
+        *,
+        language: str | None = None,
+        initial_prompt: str | None = None,
+    ) -> dict:
+        """Run Whisper on a path or sample array, retrying on CPU after MPS failures."""
+        try:
+            return self.model.transcribe(
+                audio,
+                fp16=self.device != "cpu",  # Use FP16 on GPU for faster inference
+                language=language,  # None auto-detects
+                task="transcribe",  # Transcribe in original language
+                initial_prompt=initial_prompt,
+                verbose=False,
+            )
+        except (RuntimeError, NotImplementedError) as e:
+            if not _is_mps_failure(e):
+                raise
+            logger.warning(f"MPS transcription failed, retrying with CPU: {e}")
+            # Reload model on CPU
+            self.cleanup_service()
+            self.device = "cpu"
+            self._load_model()
+            return self.model.transcribe(
+                audio,
+                fp16=False,  # Disable FP16 on CPU
+                language=language,
+                task="transcribe",
+                initial_prompt=initial_prompt,
+                verbose=False,
+            )
+
     def cleanup_service(self):
         """Clean up the model from memory."""
         if self.model is not None:
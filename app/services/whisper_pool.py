@@ -0,0 +1,249 @@
+"""Process pool that spreads Whisper segment transcription across CPU cores.
+
+Each pool process transcribes one segment at a time with its own Torch thread budget
+and CPU affinity. On Linux the pool is forked after the parent has loaded the model,
+so weights are shared copy-on-write. Elsewhere, processes are spawned and each one
+loads the model on its first segment.
+
+Forking is only safe before the parent has run any inference (OpenMP thread pools do
+not survive ``fork``), so MEDIA workers start the pool at processor startup through
+``warm_whisper_pool``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.sharedctypes import Synchronized
+from pathlib import Path
+
+import torch
+
+from app.core.logging import get_logger
+from app.core.settings import get_settings
+from app.services.whisper_local import (
+    SegmentCallback,
+    count_audio_segments,
+    get_whisper_local_service,
+    read_audio_segment,
+)
+
+logger = get_logger(__name__)
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+# Set once a pool breaks: the sequential fallback runs inference in this process,
+# after which forking a replacement pool is no longer safe.
+_pool_disabled = False
+
+
+def _available_cores() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _threads_per_process(processes: int) -> int:
+    configured = get_settings().whisper_pool_threads_per_process
+    if configured > 0:
+        return configured
+    return max(len(_available_cores()) // processes, 1)
+
+
+def _init_pool_process(counter: Synchronized, threads: int, cores: list[int]) -> None:
+    """Pin this process to its own slice of cores and size Torch's thread pools."""
+    with counter.get_lock():
+        slot = counter.value
+        counter.value += 1
+    slot_cores = cores[slot * threads : (slot + 1) * threads]
+    if slot_cores and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, slot_cores)
+        except OSError:
+            logger.debug("Could not set CPU affinity for whisper pool slot %s", slot)
+    torch.set_num_threads(threads)
+    # Already fixed for this process when it raises; intra-op threads are what matter here.
+    with contextlib.suppress(RuntimeError):
+        torch.set_num_interop_threads(1)
+
+
+def _transcribe_segment(
+    audio_file_path: str,
+    index: int,
+    segment_seconds: int,
+    language: str | None,
+) -> tuple[int, str, str | None]:
+    """Pool entry point: transcribe one segment with this process's model."""
+    service = get_whisper_local_service()
+    service._load_model()
+    samples = read_audio_segment(
+        Path(audio_file_path),
+        index=index,
+        segment_seconds=segment_seconds,
+    )
+    result = service._run_transcribe(samples, language=language)
+    return index, result["text"].strip(), language or result.get("language")
+
+
+def get_whisper_pool() -> ProcessPoolExecutor | None:
+    """Return the shared pool, creating it on first use, or ``None`` when disabled."""
+    global _pool
+    processes = get_settings().whisper_pool_processes
+    if processes <= 0:
+        return None
+    with _pool_lock:
+        if _pool is not None:
+            return _pool
+        if _pool_disabled:
+            return None
+        service = get_whisper_local_service()
+        if service.device != "cpu":
+            # One GPU is already saturated by a single process, and CUDA does not
+            # survive fork.
+            return None
+        threads = _threads_per_process(processes)
+        if sys.platform.startswith("linux"):
+            # Load before forking so every process shares the parent's weights.
+            service._load_model()
+            context = multiprocessing.get_context("fork")
+        else:
+            context = multiprocessing.get_context("spawn")
+        _pool = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=context,
+            initializer=_init_pool_process,
+            initargs=(context.Value("i", 0), threads, _available_cores()),
+        )
+        logger.info(
+            "Whisper pool started: processes=%s threads_per_process=%s start_method=%s",
+            processes,
+            threads,
+            context.get_start_method(),
+        )
+        return _pool
+
+
+def warm_whisper_pool() -> None:
+    """Start the pool and its processes before the worker runs any inference."""
+    pool = get_whisper_pool()
+    if pool is None:
+        return
+    processes = get_settings().whisper_pool_processes
+    # ProcessPoolExecutor starts processes lazily; a no-op per slot forks them all now.
+    for future in [pool.submit(os.getpid) for _ in range(processes)]:
+        future.result()
+
+
+def shutdown_whisper_pool() -> None:
+    """Stop the shared pool; the next call to ``get_whisper_pool`` starts a new one."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a pool whose process died and keep this process on the sequential path."""
+    global _pool, _pool_disabled
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+        _pool_disabled = True
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def transcribe_segments_in_pool(
+    audio_file_path: Path,
+    *,
+    segment_seconds: int,
+    completed_segments: list[str] | None = None,
+    language: str | None = None,
+    on_segment: SegmentCallback | None = None,
+) -> tuple[str, str | None]:
+    """Transcribe remaining segments across the pool, reporting them in order.
+
+    The first new segment runs alone when the language is not yet known, so every
+    other segment can be pinned to it. Segments finish out of order but
+    ``on_segment`` only sees the contiguous prefix, which keeps checkpoints
+    resumable. Parallel segments are not prompted with the previous segment's text.
+    Formats other than normalized WAV, and a disabled pool, fall back to the
+    sequential path. If a pool process dies (``BrokenProcessPool``) the pool is
+    discarded and the job resumes sequentially after the segments already reported.
+    """
+    pool = get_whisper_pool()
+    total = count_audio_segments(audio_file_path, segment_seconds=segment_seconds)
+    if pool is None or total is None:
+        return get_whisper_local_service().transcribe_audio_chunked(
+            audio_file_path,
+            segment_seconds=segment_seconds,
+            completed_segments=completed_segments,
+            language=language,
+            on_segment=on_segment,
+        )
+
+    segments = list(completed_segments or [])
+    finished: dict[int, str] = {}
+    detected_language = language
+
+    def _record(index: int, text: str) -> None:
+        finished[index] = text
+        while len(segments) in finished:
+            next_index = len(segments)
+            segments.append(finished.pop(next_index))
+            if on_segment is not None:
+                on_segment(next_index, segments[-1], detected_language)
+
+    path = str(audio_file_path)
+    try:
+        if detected_language is None and len(segments) < total:
+            index, text, detected_language = pool.submit(
+                _transcribe_segment, path, len(segments), segment_seconds, None
+            ).result()
+            _record(index, text)
+
+        futures: list[Future] = [
+            pool.submit(_transcribe_segment, path, index, segment_seconds, detected_language)
+            for index in range(len(segments), total)
+        ]
+        try:
+            for future in as_completed(futures):
+                index, text, _language = future.result()
+                _record(index, text)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    except BrokenProcessPool:
+        logger.warning(
+            "Whisper pool broke; transcribing the rest of %s sequentially",
+            audio_file_path,
+            exc_info=True,
+            extra={
+                "component": "whisper_pool",
+                "operation": "transcribe_segments",
+                "context_data": {"completed_segments": len(segments), "total": total},
+            },
+        )
+        _discard_broken_pool(pool)
+        return get_whisper_local_service().transcribe_audio_chunked(
+            audio_file_path,
+            segment_seconds=segment_seconds,
+            completed_segments=segments,
+            language=detected_language,
+            on_segment=on_segment,
+        )
+
+    transcript = " ".join(segment for segment in segments if segment).strip()
+    logger.info(
+        "Transcribed %s segments in whisper pool (%s chars, language=%s)",
+        len(segments),
+        len(transcript),
+        detected_language,
+    )
+    return transcript, detected_language
@@ -16,4 +16,5 @@ worker_slot="$2"
 exec python scripts/run_workers.py \
   --queue "${queue_name}" \
   --worker-slot "${worker_slot}" \
+  --concurrency "${WORKER_CONCURRENCY:-1}" \
   --stats-interval "${WORKER_STATS_INTERVAL:-60}"
@@ -0,0 +1,67 @@
+"""add persisted news item embeddings
+
+Revision ID: 20261016_01
+Revises: 20260419_01
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_01"
+down_revision: str | None = "20260419_01"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "news_item_embeddings",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("news_item_id", sa.Integer(), nullable=False),
+        sa.Column("view", sa.String(length=20), nullable=False),
+        sa.Column("model_name", sa.String(length=255), nullable=False),
+        sa.Column("text_sha256", sa.String(length=64), nullable=False),
+        sa.Column("dimensions", sa.Integer(), nullable=False),
+        sa.Column("vector", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "news_item_id",
+            "view",
+            "model_name",
+            "text_sha256",
+            name="uq_news_item_embeddings_item_view_model_text",
+        ),
+    )
+    op.create_index(
+        "idx_news_item_embeddings_model_view",
+        "news_item_embeddings",
+        ["model_name", "view", "news_item_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_news_item_embeddings_news_item_id"),
+        "news_item_embeddings",
+        ["news_item_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_news_item_embeddings_news_item_id"),
+        table_name="news_item_embeddings",
+    )
+    op.drop_index(
+        "idx_news_item_embeddings_model_view",
+        table_name="news_item_embeddings",
+    )
+    op.drop_table("news_item_embeddings")
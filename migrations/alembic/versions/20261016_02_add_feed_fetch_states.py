@@ -0,0 +1,47 @@
+"""add feed fetch states
+
+Revision ID: 20261016_02
+Revises: 20261016_01
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_02"
+down_revision: str | None = "20261016_01"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "feed_fetch_states",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("feed_url", sa.String(length=2048), nullable=False),
+        sa.Column("etag", sa.String(length=512), nullable=True),
+        sa.Column("last_modified", sa.String(length=128), nullable=True),
+        sa.Column("validators_saved_at", sa.DateTime(), nullable=True),
+        sa.Column("last_status_code", sa.Integer(), nullable=True),
+        sa.Column("last_fetched_at", sa.DateTime(), nullable=True),
+        sa.Column("last_changed_at", sa.DateTime(), nullable=True),
+        sa.Column("recent_published_at", sa.JSON(), nullable=True),
+        sa.Column("fetch_count", sa.Integer(), nullable=False),
+        sa.Column("not_modified_count", sa.Integer(), nullable=False),
+        sa.Column("consecutive_failures", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("feed_url"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("feed_fetch_states")
@@ -0,0 +1,37 @@
+"""add content cards
+
+Revision ID: 20261016_03
+Revises: 20261016_02
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_03"
+down_revision: str | None = "20261016_02"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "content_cards",
+        sa.Column("content_id", sa.Integer(), nullable=False),
+        sa.Column("card", sa.JSON(), nullable=False),
+        sa.Column("long_form_ready", sa.Boolean(), nullable=False),
+        sa.Column("projection_version", sa.Integer(), nullable=False),
+        sa.Column("source_updated_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("content_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("content_cards")
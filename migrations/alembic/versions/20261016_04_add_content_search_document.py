@@ -0,0 +1,92 @@
+"""Store the weighted content search document.
+
+Revision ID: 20261016_04
+Revises: 20261016_03
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "20261016_04"
+down_revision: str | None = "20261016_03"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX_NAME = "idx_contents_search_document"
+LEGACY_INDEX_NAME = "idx_contents_search_document_gin"
+SUMMARY_TITLE_TRGM_INDEX_NAME = "idx_contents_summary_title_trgm"
+SEARCH_DOCUMENT_SQL = """
+    setweight(to_tsvector('english', COALESCE(content_metadata -> 'summary' ->> 'title', '')), 'A')
+    || setweight(to_tsvector('english', COALESCE(title, '')), 'B')
+    || setweight(to_tsvector('english', COALESCE(source, '')), 'C')
+    || setweight(to_tsvector('english', COALESCE(search_text, '')), 'D')
+"""
+
+
+def upgrade() -> None:
+    """Add the generated search_document column and the search GIN indexes."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute(
+        text(
+            f"""
+            ALTER TABLE contents
+            ADD COLUMN IF NOT EXISTS search_document tsvector
+            GENERATED ALWAYS AS ({SEARCH_DOCUMENT_SQL}) STORED
+            """
+        )
+    )
+    op.execute(
+        text(
+            f"""
+            CREATE INDEX IF NOT EXISTS {INDEX_NAME}
+            ON contents
+            USING GIN (search_document)
+            """
+        )
+    )
+    # Summary titles get their own trigram index so typo matches avoid a table scan.
+    op.execute(
+        text(
+            f"""
+            CREATE INDEX IF NOT EXISTS {SUMMARY_TITLE_TRGM_INDEX_NAME}
+            ON contents
+            USING GIN ((COALESCE(content_metadata -> 'summary' ->> 'title', '')) gin_trgm_ops)
+            """
+        )
+    )
+    # The expression index never matched the four-part query document.
+    op.execute(text(f"DROP INDEX IF EXISTS {LEGACY_INDEX_NAME}"))
+
+
+def downgrade() -> None:
+    """Drop the stored search document and restore the expression index."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute(
+        text(
+            f"""
+            CREATE INDEX IF NOT EXISTS {LEGACY_INDEX_NAME}
+            ON contents
+            USING GIN (
+                (
+                    setweight(to_tsvector('english', COALESCE(title, '')), 'A')
+                    || setweight(to_tsvector('english', COALESCE(source, '')), 'B')
+                    || setweight(to_tsvector('english', COALESCE(search_text, '')), 'C')
+                )
+            )
+            """
+        )
+    )
+    op.execute(text(f"DROP INDEX IF EXISTS {SUMMARY_TITLE_TRGM_INDEX_NAME}"))
+    op.execute(text(f"DROP INDEX IF EXISTS {INDEX_NAME}"))
+    op.execute(text("ALTER TABLE contents DROP COLUMN IF EXISTS search_document"))
@@ -0,0 +1,53 @@
+"""add podcast search shared cache and provider state
+
+Revision ID: 20261016_05
+Revises: 20261016_04
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_05"
+down_revision: str | None = "20261016_04"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "podcast_search_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("query", sa.String(length=500), nullable=False),
+        sa.Column("hits", sa.JSON(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.create_index(
+        op.f("ix_podcast_search_cache_expires_at"),
+        "podcast_search_cache",
+        ["expires_at"],
+        unique=False,
+    )
+    op.create_table(
+        "podcast_search_provider_states",
+        sa.Column("provider", sa.String(length=50), nullable=False),
+        sa.Column("failures", sa.Integer(), nullable=False),
+        sa.Column("open_until", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("provider"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("podcast_search_provider_states")
+    op.drop_index(op.f("ix_podcast_search_cache_expires_at"), table_name="podcast_search_cache")
+    op.drop_table("podcast_search_cache")
@@ -0,0 +1,35 @@
+"""add persisted news reranker pair scores
+
+Revision ID: 20261016_06
+Revises: 20261016_05
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_06"
+down_revision: str | None = "20261016_05"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "news_reranker_scores",
+        sa.Column("pair_sha256", sa.String(length=64), nullable=False),
+        sa.Column("model_name", sa.String(length=255), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("pair_sha256"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("news_reranker_scores")
@@ -0,0 +1,43 @@
+"""add per-user stat counters
+
+Revision ID: 20261016_07
+Revises: 20261016_06
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_07"
+down_revision: str | None = "20261016_06"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_stat_counters",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("counter_key", sa.String(length=40), nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "counter_key"),
+    )
+    op.create_index(
+        op.f("ix_user_stat_counters_refreshed_at"),
+        "user_stat_counters",
+        ["refreshed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_user_stat_counters_refreshed_at"), table_name="user_stat_counters")
+    op.drop_table("user_stat_counters")
@@ -0,0 +1,46 @@
+"""add learned url analysis patterns
+
+Revision ID: 20261016_08
+Revises: 20261016_07
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_08"
+down_revision: str | None = "20261016_07"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "url_analysis_patterns",
+        sa.Column("host", sa.String(length=255), nullable=False),
+        sa.Column("path_shape", sa.String(length=255), nullable=False),
+        sa.Column("content_type", sa.String(length=20), nullable=False),
+        sa.Column("platform", sa.String(length=50), nullable=True),
+        sa.Column("has_media_url", sa.Boolean(), nullable=False),
+        sa.Column("streak", sa.Integer(), nullable=False),
+        sa.Column("observations", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("host", "path_shape"),
+    )
+    op.create_index(
+        op.f("ix_url_analysis_patterns_updated_at"),
+        "url_analysis_patterns",
+        ["updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_url_analysis_patterns_updated_at"), table_name="url_analysis_patterns")
+    op.drop_table("url_analysis_patterns")
@@ -0,0 +1,223 @@
+"""Compare news reranker precision variants on the title-clustering eval families.
+
+Builds same-event (positive) and different-event (negative) title pairs from the
+curated cases used by `run_title_clustering_eval.py`, scores them with the float
+reference path and each requested variant, and reports accuracy at the merge
+threshold, agreement with the reference, score drift, and throughput.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from itertools import combinations, islice
+from typing import Any, cast
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.logging import setup_logging
+from app.core.settings import get_settings
+from app.services.news_relations import reranker_candidate_text
+from app.services.news_reranker import (
+    DEFAULT_NEWS_RERANKER_INSTRUCTION,
+    _format_reranker_pair,
+    clear_news_reranker_cache,
+    score_news_reranker_pairs,
+)
+from tests.services.news_relation_cluster_cases import (
+    NEGATIVE_PRODUCTION_CLUSTER_CASES,
+    PRODUCTION_CLUSTER_CASES,
+)
+
+REFERENCE_VARIANT = "none"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark news reranker precision variants against the float path"
+    )
+    parser.add_argument(
+        "--variant",
+        action="append",
+        dest="variants",
+        choices=["int8"],
+        help="CPU quantization variant(s) to compare against float (default: int8)",
+    )
+    parser.add_argument(
+        "--max-pairs-per-case",
+        type=int,
+        default=12,
+        help="Cap on positive and on negative pairs drawn from each case",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Optional NEWS_LIST_RERANKER_BATCH_SIZE override",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit JSON instead of text",
+    )
+    return parser.parse_args()
+
+
+def _case_groups(case: dict[str, Any]) -> list[list[str]]:
+    raw_groups = case.get("groups")
+    if isinstance(raw_groups, list) and raw_groups:
+        return [[str(title) for title in group] for group in raw_groups]
+    return [[str(title) for title in case["titles"]]]
+
+
+def _build_pairs(max_pairs_per_case: int) -> list[tuple[str, bool]]:
+    all_cases = cast(
+        list[dict[str, Any]],
+        [*PRODUCTION_CLUSTER_CASES, *NEGATIVE_PRODUCTION_CLUSTER_CASES],
+    )
+    pairs: list[tuple[str, bool]] = []
+    for case in all_cases:
+        groups = _case_groups(case)
+        positives = ((left, right) for group in groups for left, right in combinations(group, 2))
+        negatives = (
+            (left, right)
+            for left_group, right_group in combinations(groups, 2)
+            for left in left_group
+            for right in right_group
+        )
+        for (left, right), expected in [
+            *((pair, True) for pair in islice(positives, max_pairs_per_case)),
+            *((pair, False) for pair in islice(negatives, max_pairs_per_case)),
+        ]:
+            formatted = _format_reranker_pair(
+                instruction=DEFAULT_NEWS_RERANKER_INSTRUCTION,
+                query=reranker_candidate_text(left),
+                document=reranker_candidate_text(right),
+            )
+            pairs.append((formatted, expected))
+    return pairs
+
+
+def _score_variant(
+    variant: str,
+    pairs: list[str],
+    *,
+    batch_size: int | None,
+) -> tuple[list[float], float]:
+    previous = {
+        "NEWS_LIST_RERANKER_CPU_QUANTIZATION": os.environ.get(
+            "NEWS_LIST_RERANKER_CPU_QUANTIZATION"
+        ),
+        "NEWS_LIST_RERANKER_BATCH_SIZE": os.environ.get("NEWS_LIST_RERANKER_BATCH_SIZE"),
+    }
+    os.environ["NEWS_LIST_RERANKER_CPU_QUANTIZATION"] = variant
+    if batch_size is not None:
+        os.environ["NEWS_LIST_RERANKER_BATCH_SIZE"] = str(batch_size)
+    get_settings.cache_clear()
+    clear_news_reranker_cache()
+    try:
+        # Load the model before timing so the throughput number covers scoring only.
+        score_news_reranker_pairs(pairs[:1])
+        started = time.perf_counter()
+        scores = score_news_reranker_pairs(pairs)
+        return scores, time.perf_counter() - started
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        get_settings.cache_clear()
+        clear_news_reranker_cache()
+
+
+def _summarize(
+    variant: str,
+    scores: list[float],
+    elapsed: float,
+    *,
+    expected: list[bool],
+    reference: list[float],
+    threshold: float,
+) -> dict[str, Any]:
+    decisions = [score >= threshold for score in scores]
+    reference_decisions = [score >= threshold for score in reference]
+    return {
+        "variant": variant,
+        "pair_count": len(scores),
+        "accuracy": sum(
+            decision == label for decision, label in zip(decisions, expected, strict=True)
+        )
+        / len(scores),
+        "agreement_with_reference": sum(
+            decision == reference_decision
+            for decision, reference_decision in zip(decisions, reference_decisions, strict=True)
+        )
+        / len(scores),
+        "mean_abs_score_diff": sum(
+            abs(score - reference_score)
+            for score, reference_score in zip(scores, reference, strict=True)
+        )
+        / len(scores),
+        "seconds": elapsed,
+        "pairs_per_second": len(scores) / elapsed if elapsed else 0.0,
+    }
+
+
+def main() -> int:
+    setup_logging()
+    args = _parse_args()
+    variants = args.variants or ["int8"]
+    labelled_pairs = _build_pairs(args.max_pairs_per_case)
+    pairs = [pair for pair, _expected in labelled_pairs]
+    expected = [label for _pair, label in labelled_pairs]
+    threshold = get_settings().news_list_reranker_similarity_threshold
+
+    reference, reference_elapsed = _score_variant(
+        REFERENCE_VARIANT,
+        pairs,
+        batch_size=args.batch_size,
+    )
+    summaries = [
+        _summarize(
+            "float",
+            reference,
+            reference_elapsed,
+            expected=expected,
+            reference=reference,
+            threshold=threshold,
+        )
+    ]
+    for variant in variants:
+        scores, elapsed = _score_variant(variant, pairs, batch_size=args.batch_size)
+        summaries.append(
+            _summarize(
+                variant,
+                scores,
+                elapsed,
+                expected=expected,
+                reference=reference,
+                threshold=threshold,
+            )
+        )
+
+    if args.json:
+        print(json.dumps({"threshold": threshold, "variants": summaries}, indent=2))
+        return 0
+
+    print(f"threshold={threshold:.2f} pairs={len(pairs)}")
+    for summary in summaries:
+        print(
+            f"{summary['variant']:>6} accuracy={summary['accuracy']:.3f} "
+            f"agreement={summary['agreement_with_reference']:.3f} "
+            f"mean_abs_diff={summary['mean_abs_score_diff']:.4f} "
+            f"pairs/s={summary['pairs_per_second']:.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,51 @@
+"""Recompute per-user badge counters that are past their max age.
+
+Usage:
+    python scripts/reconcile_stat_counters.py --limit 500
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from app.core.db import get_db
+from app.core.settings import get_settings
+from app.repositories.stat_counter_repository import list_stale_counter_user_ids
+from app.repositories.stats_repository import reconcile_stat_counters
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=500,
+        help="Maximum number of users to reconcile.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the reconciliation."""
+    args = parse_args()
+    if get_settings().stats_counter_max_age_seconds <= 0:
+        print("Stat counters are disabled (STATS_COUNTER_MAX_AGE_SECONDS=0).")
+        return 0
+
+    with get_db() as db:
+        user_ids = list_stale_counter_user_ids(db, limit=args.limit)
+    if not user_ids:
+        print("No stale stat counters found.")
+        return 0
+
+    for user_id in user_ids:
+        with get_db() as db:
+            reconcile_stat_counters(db, user_id=user_id)
+
+    print(f"Reconciled stat counters for {len(user_ids)} users.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
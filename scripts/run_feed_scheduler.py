@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Schedule per-feed scrape tasks based on each feed's observed cadence.
+Workers pick the deferred SCRAPE tasks up once they become available.
+"""
+
+import argparse
+import os
+import sys
+
+# Add parent directory so we can import from app
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.db import init_db
+from app.core.logging import get_logger, setup_logging
+from app.services.feed_scheduler import schedule_feed_scrapes
+
+logger = get_logger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Schedule adaptive per-feed scrapes")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    args = parser.parse_args()
+
+    setup_logging(level="DEBUG" if args.debug else "INFO")
+    init_db()
+
+    try:
+        plans = schedule_feed_scrapes()
+    except Exception as e:
+        logger.error(f"Feed scheduling failed: {e}", exc_info=True)
+        return 1
+
+    for plan in sorted(plans, key=lambda item: item.next_poll_at):
+        logger.debug(
+            "%s %s next poll at %s (interval %s)",
+            plan.scraper_type,
+            plan.feed_url,
+            plan.next_poll_at.isoformat(),
+            plan.interval,
+        )
+    logger.info("Scheduled %d feeds", len(plans))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
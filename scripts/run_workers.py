@@ -47,6 +47,12 @@ def main():
         default=1,
         help="Worker slot number for stable worker IDs",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of tasks to run in parallel in this process (default: 1)",
+    )
     args = parser.parse_args()
 
     # Setup logging
@@ -59,6 +65,7 @@ def main():
     logger.info("=" * 60)
     logger.info("Queue: %s", args.queue)
     logger.info("Worker slot: %s", args.worker_slot)
+    logger.info("Concurrency: %s", args.concurrency)
 
     # Initialize database
     logger.info("Initializing database...")
@@ -91,7 +98,11 @@ def main():
     logger.info("Press Ctrl+C to stop")
 
     logger.debug("Creating SequentialTaskProcessor instance...")
-    processor = SequentialTaskProcessor(queue_name=args.queue, worker_slot=args.worker_slot)
+    processor = SequentialTaskProcessor(
+        queue_name=args.queue,
+        worker_slot=args.worker_slot,
+        concurrency=args.concurrency,
+    )
     logger.debug("SequentialTaskProcessor instance created")
 
     # Start stats thread if enabled
@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session, sessionmaker
 
 import app.core.db as core_db
 from app.core.security import create_access_token
+from app.core.settings import get_settings
 from app.main import app
 from app.models.schema import (
     ChatSession,
@@ -27,10 +28,23 @@ from app.models.schema import (
     UserIntegrationConnection,
 )
 from app.models.user import User
+from app.services.news_feed import invalidate_news_visibility_descriptor
 from app.testing.postgres_harness import TemporaryPostgresHarness, create_temporary_postgres_harness
 from tests.support.fixture_files import load_json_fixture
 
 
+@pytest.fixture(autouse=True)
+def disable_raw_page_cache(monkeypatch):
+    """Keep tests from reading or writing pages cached in the local data directory."""
+    monkeypatch.setattr(get_settings(), "raw_page_cache_enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def disable_exa_search_cache(monkeypatch):
+    """Keep Exa search results cached by one test from answering another."""
+    monkeypatch.setattr(get_settings(), "exa_search_cache_ttl_seconds", 0)
+
+
 @pytest.fixture
 def postgres_harness() -> Iterator[TemporaryPostgresHarness]:
     """Create an isolated PostgreSQL harness and bind global DB access to it."""
@@ -40,11 +54,14 @@ def postgres_harness() -> Iterator[TemporaryPostgresHarness]:
 
     core_db._engine = harness.engine
     core_db._SessionLocal = harness.session_factory
+    # Cached per-user news visibility is keyed by user id, which restarts per database.
+    invalidate_news_visibility_descriptor()
     try:
         yield harness
     finally:
         core_db._engine = previous_engine
         core_db._SessionLocal = previous_session_local
+        invalidate_news_visibility_descriptor()
         harness.close()
 
 
@@ -81,9 +98,13 @@ def db(db_session_factory: sessionmaker):
 
 
 @pytest.fixture
-def vendor_usage_db(db_session_factory: sessionmaker, monkeypatch):
-    """Route out-of-band vendor usage writes to the current test database."""
-    from app.services import vendor_costs
+def route_get_db(db_session_factory: sessionmaker, monkeypatch):
+    """Return a helper that points a module's ``get_db`` at the current test database.
+
+    Each ``with get_db()`` block gets its own session that commits on success, like
+    the real out-of-band helper. The helper returns ``db_session_factory`` so tests
+    can open a session to inspect what was written.
+    """
 
     @contextmanager
     def _get_db():
@@ -97,7 +118,19 @@ def vendor_usage_db(db_session_factory: sessionmaker, monkeypatch):
         finally:
             session.close()
 
-    monkeypatch.setattr(vendor_costs, "get_db", _get_db)
+    def _route(module: Any) -> sessionmaker:
+        monkeypatch.setattr(module, "get_db", _get_db)
+        return db_session_factory
+
+    return _route
+
+
+@pytest.fixture
+def vendor_usage_db(route_get_db):
+    """Route out-of-band vendor usage writes to the current test database."""
+    from app.services import vendor_costs
+
+    route_get_db(vendor_costs)
 
 
 @pytest.fixture
@@ -0,0 +1,63 @@
+"""Tests for the process-wide pooled HTTP clients."""
+
+import httpx
+import pytest
+
+from app.http_client import pool
+
+
+@pytest.fixture(autouse=True)
+def reset_pool():
+    pool.close_shared_http_clients()
+    yield
+    pool.close_shared_http_clients()
+
+
+def test_shared_client_is_reused_per_verify_mode() -> None:
+    """Each SSL verification mode should get one long-lived client."""
+    verified = pool.get_shared_http_client()
+    unverified = pool.get_shared_http_client(verify=False)
+
+    assert pool.get_shared_http_client() is verified
+    assert pool.get_shared_http_client(verify=False) is unverified
+    assert verified is not unverified
+
+
+def test_close_shared_clients_rebuilds_on_next_use() -> None:
+    """Closed pooled clients should be replaced instead of handed out again."""
+    client = pool.get_shared_http_client()
+
+    pool.close_shared_http_clients()
+
+    assert client.is_closed
+    assert pool.get_shared_http_client() is not client
+
+
+def test_host_limited_transport_releases_slot_when_response_closes() -> None:
+    """A host slot should be held until the response body is closed."""
+    transport = pool._HostLimitedTransport(
+        httpx.MockTransport(lambda request: httpx.Response(200, text="ok")),
+        per_host_limit=1,
+    )
+    client = httpx.Client(transport=transport)
+
+    with client.stream("GET", "https://example.com/a") as response:
+        assert response.status_code == 200
+        assert not transport._slot("example.com").acquire(blocking=False)
+
+    assert client.get("https://example.com/b").text == "ok"
+    assert transport._slot("example.com").acquire(blocking=False)
+
+
+def test_shared_client_never_stores_response_cookies() -> None:
+    """Cookies set for one caller must not be replayed on another caller's request."""
+    client = pool.get_shared_http_client()
+    response = httpx.Response(
+        200,
+        headers={"set-cookie": "session=abc; Path=/"},
+        request=httpx.Request("GET", "https://example.com/login"),
+    )
+
+    client.cookies.extract_cookies(response)
+
+    assert len(client.cookies.jar) == 0
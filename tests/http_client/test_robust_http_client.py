@@ -22,7 +22,7 @@ def mock_settings(mocker):
 
 @pytest.fixture
 def mock_httpx_client(mocker):
-    """Patch internal httpx.Client constructor and return a mock instance."""
+    """Patch the shared pooled client accessor and return a mock instance."""
     client = MagicMock(spec=httpx.Client)
     client.is_closed = False
 
@@ -30,7 +30,10 @@ def mock_httpx_client(mocker):
         client.is_closed = True
 
     client.close.side_effect = _close
-    mocker.patch("app.http_client.robust_http_client.httpx.Client", return_value=client)
+    mocker.patch(
+        "app.http_client.robust_http_client.get_shared_http_client",
+        return_value=client,
+    )
     return client
 
 
@@ -189,12 +192,12 @@ def test_head_retries_hostname_mismatch_using_head(mock_httpx_client):
     client.close()
 
 
-def test_close_closes_underlying_httpx_client(mock_httpx_client):
-    """close() should close and reset underlying client reference."""
+def test_close_releases_shared_httpx_client(mock_httpx_client):
+    """close() should drop the pooled client reference without closing the shared pool."""
     client = RobustHttpClient()
     client.get("https://example.com")
 
     client.close()
 
-    mock_httpx_client.close.assert_called_once_with()
+    mock_httpx_client.close.assert_not_called()
     assert client._client is None
@@ -283,7 +283,7 @@ def test_subscribe_to_feed_from_article_page_uses_detected_feed_url_and_page_tit
     )
     monkeypatch.setattr(
         "app.pipeline.handlers.analyze_url.get_http_gateway",
-        lambda: SimpleNamespace(fetch_content=lambda _url: ("<html></html>", {})),
+        lambda: SimpleNamespace(fetch_content=lambda _url, **_kwargs: ("<html></html>", {})),
     )
     monkeypatch.setattr(
         "app.pipeline.handlers.analyze_url.detect_feeds_from_html",
@@ -4,7 +4,7 @@ from contextlib import contextmanager
 
 from app.models.metadata import ContentType
 from app.models.schema import Content
-from app.pipeline.podcast_workers import PodcastDownloadWorker
+from app.pipeline.podcast_workers import PodcastDownloadWorker, PodcastMediaWorker
 from app.services.apple_podcasts import ApplePodcastResolution
 from app.services.queue import TaskType
 
@@ -97,3 +97,69 @@ def test_apple_podcasts_resolution_fills_audio_url(db_session, mocker, tmp_path)
     assert metadata.get("episode_title") == "Episode Title"
 
     worker.queue_service.enqueue.assert_called_once_with(TaskType.TRANSCRIBE, content_id=content.id)
+
+
+def test_media_task_resumes_transcription_from_checkpoint(db_session, mocker, tmp_path):
+    audio_url = "https://example.com/episode.mp3"
+    content = Content(
+        content_type=ContentType.PODCAST.value,
+        url="https://example.com/episode",
+        title="Long Episode",
+        content_metadata={
+            "audio_url": audio_url,
+            "transcript_checkpoint": {
+                "audio_url": audio_url,
+                "segment_seconds": 600,
+                "language": "en",
+                "segments": ["first part."],
+            },
+        },
+    )
+    db_session.add(content)
+    db_session.commit()
+    db_session.refresh(content)
+
+    @contextmanager
+    def _get_db():
+        yield db_session
+
+    mocker.patch("app.pipeline.podcast_workers.get_db", _get_db)
+    mocker.patch("app.pipeline.podcast_workers.settings.whisper_segment_seconds", 600)
+    mocker.patch("app.pipeline.podcast_workers.get_queue_service", return_value=mocker.Mock())
+    worker = PodcastMediaWorker()
+    worker.scratch_root = tmp_path / "scratch"
+    audio_path = tmp_path / "episode.wav"
+    audio_path.write_bytes(b"audio-bytes")
+    mocker.patch.object(worker, "_download_to_scratch", return_value=audio_path)
+    mocker.patch.object(worker, "_normalize_audio_file", return_value=audio_path)
+    mocker.patch.object(worker.transcribe_worker, "_get_transcription_service")
+    checkpoints: list[list[str]] = []
+
+    def _fake_segments(  # noqa: ANN001
+        path,
+        *,
+        segment_seconds,
+        completed_segments,
+        language,
+        on_segment,
+    ):
+        assert completed_segments == ["first part."]
+        assert language == "en"
+        on_segment(1, "second part.", "en")
+        db_session.refresh(content)
+        checkpoints.append(content.content_metadata["transcript_checkpoint"]["segments"])
+        return "first part. second part.", "en"
+
+    mocker.patch(
+        "app.pipeline.podcast_workers.transcribe_audio_file_in_segments",
+        side_effect=_fake_segments,
+    )
+
+    assert worker.process_media_task(content.id) is True
+
+    assert checkpoints == [["first part.", "second part."]]
+    db_session.refresh(content)
+    metadata = content.content_metadata
+    assert metadata["transcript"] == "first part. second part."
+    assert "transcript_checkpoint" not in metadata
+    assert "transcript_checkpoint" not in metadata["processing"]
@@ -1,5 +1,7 @@
 """Tests for the sequential task processor."""
 
+import threading
+from contextlib import nullcontext
 from unittest.mock import Mock, patch
 
 import pytest
@@ -7,7 +9,7 @@ from sqlalchemy.exc import OperationalError
 
 from app.pipeline.sequential_task_processor import SequentialTaskProcessor, _psycopg_conninfo
 from app.pipeline.task_models import TaskEnvelope, TaskResult
-from app.services.queue import TaskType
+from app.services.queue import QueueService, TaskType
 
 
 @pytest.fixture
@@ -431,3 +433,134 @@ class TestSequentialTaskProcessor:
         mock_dispose.assert_called_once()
         mock_close_listener.assert_called()
         mock_sleep.assert_any_call(10.0)
+
+    def test_run_concurrent_executes_tasks_in_parallel(self, processor):
+        """Concurrent mode should have several claimed tasks in flight at once."""
+        tasks = [
+            {"id": task_id, "task_type": TaskType.SCRAPE.value, "retry_count": 0, "payload": {}}
+            for task_id in (1, 2, 3)
+        ]
+        processor.concurrency = 3
+        processor.queue_service.dequeue_batch.side_effect = [tasks, [], [], []]
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _process(_task):
+            barrier.wait()
+            return TaskResult.ok()
+
+        processor.process_task = Mock(side_effect=_process)
+        processor._idle_wait = Mock()
+
+        with patch("app.pipeline.sequential_task_processor.setup_logging"):
+            processor.run(max_tasks=3)
+
+        assert processor.process_task.call_count == 3
+        assert processor.queue_service.dequeue_batch.call_args_list[0].args[2] == 3
+        finalized_ids = {
+            call.args[0] for call in processor.queue_service.finalize_task.call_args_list
+        }
+        assert finalized_ids == {1, 2, 3}
+
+    def test_run_concurrent_drains_in_flight_tasks_on_shutdown(self, processor):
+        """A shutdown request stops claiming but lets running tasks finish."""
+        task_data = {"id": 7, "task_type": TaskType.SCRAPE.value, "retry_count": 0, "payload": {}}
+        started = threading.Event()
+        release = threading.Event()
+        processor.concurrency = 2
+
+        def mock_dequeue_batch(*args, **kwargs):
+            if processor.queue_service.dequeue_batch.call_count == 1:
+                return [task_data]
+            started.wait(timeout=5)
+            processor.running = False
+            release.set()
+            return []
+
+        def _process(_task):
+            started.set()
+            release.wait(timeout=5)
+            return TaskResult.ok()
+
+        processor.queue_service.dequeue_batch.side_effect = mock_dequeue_batch
+        processor.process_task = Mock(side_effect=_process)
+        processor._idle_wait = Mock()
+
+        with patch("app.pipeline.sequential_task_processor.setup_logging"):
+            processor.run()
+
+        processor.queue_service.finalize_task.assert_called_once()
+        assert processor.queue_service.finalize_task.call_args.args[0] == 7
+
+    def test_run_concurrent_keeps_engine_while_tasks_in_flight(self, processor):
+        """A DB error during a claim must not dispose connections other slots are using."""
+        task_data = {"id": 8, "task_type": TaskType.SCRAPE.value, "retry_count": 0, "payload": {}}
+        started = threading.Event()
+        release = threading.Event()
+        processor.concurrency = 2
+
+        def mock_dequeue_batch(*args, **kwargs):
+            call_count = processor.queue_service.dequeue_batch.call_count
+            if call_count == 1:
+                return [task_data]
+            if call_count == 2:
+                started.wait(timeout=5)
+                raise OperationalError(
+                    "SELECT processing_tasks.id",
+                    {},
+                    Exception("FATAL: the database system is in recovery mode"),
+                )
+            processor.running = False
+            release.set()
+            return []
+
+        def _process(_task):
+            started.set()
+            release.wait(timeout=5)
+            return TaskResult.ok()
+
+        processor.queue_service.dequeue_batch.side_effect = mock_dequeue_batch
+        processor.process_task = Mock(side_effect=_process)
+        processor._idle_wait = Mock()
+
+        with (
+            patch("app.pipeline.sequential_task_processor.setup_logging"),
+            patch("app.pipeline.sequential_task_processor.dispose_db_engine") as mock_dispose,
+            patch("time.sleep"),
+        ):
+            processor.run()
+
+        mock_dispose.assert_not_called()
+        processor.queue_service.finalize_task.assert_called_once()
+
+    def test_run_concurrent_finalizes_finished_tasks_in_one_batch(self, processor):
+        """Tasks finishing together are finalized with one finalize_batch call."""
+        tasks = [
+            {"id": task_id, "task_type": TaskType.SCRAPE.value, "retry_count": 0, "payload": {}}
+            for task_id in (1, 2, 3)
+        ]
+        processor.concurrency = 3
+        processor.queue_service = Mock(spec=QueueService)
+        processor.queue_service.dequeue_batch.side_effect = [tasks, [], [], []]
+        processor.queue_service.finalize_batch.side_effect = lambda outcomes, **_kwargs: {
+            outcome.task_id: {"status": "completed"} for outcome in outcomes
+        }
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _process(_task):
+            barrier.wait()
+            return TaskResult.ok()
+
+        processor.process_task = Mock(side_effect=_process)
+        processor._idle_wait = Mock()
+        processor._lease_heartbeat = Mock(return_value=nullcontext())
+
+        with patch("app.pipeline.sequential_task_processor.setup_logging"):
+            processor.run(max_tasks=3)
+
+        processor.queue_service.finalize_task.assert_not_called()
+        finalized_ids = [
+            outcome.task_id
+            for call in processor.queue_service.finalize_batch.call_args_list
+            for outcome in call.args[0]
+        ]
+        assert sorted(finalized_ids) == [1, 2, 3]
@@ -0,0 +1,96 @@
+"""Tests for the shared crawl4ai browser pool."""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.processing_strategies.browser_pool import BrowserPool
+
+
+class _FakeCrawler:
+    def __init__(self, registry: list["_FakeCrawler"]) -> None:
+        self.started = False
+        self.closed = False
+        self.ready = True
+        registry.append(self)
+
+    async def __aenter__(self) -> "_FakeCrawler":
+        self.started = True
+        return self
+
+    async def __aexit__(self, *_exc_info) -> None:
+        self.closed = True
+
+    async def arun(self, url: str, config=None):  # noqa: ANN001
+        del config
+        if url.endswith("/crash"):
+            raise RuntimeError("Target page, context or browser has been closed")
+        return url
+
+
+@pytest.fixture
+def crawlers():
+    return []
+
+
+def _pool(crawlers: list[_FakeCrawler], **overrides) -> BrowserPool:
+    options = {"max_pages": 2, "recycle_after_pages": 100, "max_rss_growth_mb": 0}
+    options.update(overrides)
+    return BrowserPool(crawler_factory=lambda: _FakeCrawler(crawlers), **options)
+
+
+def test_pool_reuses_one_browser_across_crawls(crawlers) -> None:
+    pool = _pool(crawlers)
+    try:
+        for index in range(3):
+            url = f"https://example.com/{index}"
+            assert pool.submit(lambda crawler, url=url: crawler.arun(url)).result(5) == url
+    finally:
+        pool.close()
+
+    assert len(crawlers) == 1
+    assert crawlers[0].closed
+
+
+def test_pool_recycles_after_page_budget_and_browser_failure(crawlers) -> None:
+    pool = _pool(crawlers, recycle_after_pages=2)
+    try:
+        for index in range(3):
+            url = f"https://e.com/{index}"
+            pool.submit(lambda crawler, url=url: crawler.arun(url)).result(5)
+        assert len(crawlers) == 2
+        assert crawlers[0].closed
+
+        with pytest.raises(RuntimeError):
+            pool.submit(lambda crawler: crawler.arun("https://e.com/crash")).result(5)
+        pool.submit(lambda crawler: crawler.arun("https://e.com/after")).result(5)
+        assert len(crawlers) == 3
+        assert crawlers[1].closed
+    finally:
+        pool.close()
+
+
+def test_pool_limits_concurrent_pages(crawlers) -> None:
+    pool = _pool(crawlers, max_pages=2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    async def _slow(crawler):  # noqa: ANN001
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        await asyncio.sleep(0.05)
+        with lock:
+            active -= 1
+        return crawler
+
+    try:
+        futures = [pool.submit(_slow) for _ in range(5)]
+        assert all(future.result(5) is crawlers[0] for future in futures)
+    finally:
+        pool.close()
+
+    assert peak == 2
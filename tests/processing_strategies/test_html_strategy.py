@@ -739,3 +739,109 @@ def test_prepare_for_llm_merges_table_markdown(html_strategy: HtmlProcessorStrat
 
     assert "## Extracted Tables" in prepared["content_to_summarize"]
     assert "| A |" in prepared["content_to_summarize"]
+
+
+def _static_response(url: str, html: str, content_type: str = "text/html") -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={"Content-Type": content_type},
+        text=html,
+        request=httpx.Request("GET", url),
+    )
+
+
+def test_extract_data_uses_static_tier_for_server_rendered_html(
+    html_strategy: HtmlProcessorStrategy,
+    mock_http_client: MagicMock,
+):
+    """Complete server-rendered pages are extracted without launching a browser."""
+    url = "https://example.com/post"
+    paragraphs = "".join(
+        f"<p>Paragraph {index} explains the server-rendered article body in detail.</p>"
+        for index in range(20)
+    )
+    html = (
+        "<html><head><title>Static Post</title></head>"
+        f"<body><article><h1>Static Post</h1>{paragraphs}</article></body></html>"
+    )
+    mock_http_client.get.return_value = _static_response(url, html)
+
+    with patch("app.processing_strategies.html_strategy.AsyncWebCrawler") as mock_crawler_class:
+        extracted_data = html_strategy.extract_data("", url)
+
+    mock_crawler_class.assert_not_called()
+    assert extracted_data["extraction_tier"] == "static"
+    assert extracted_data["title"] == "Static Post"
+    assert "Paragraph 19" in extracted_data["text_content"]
+    assert extracted_data["source"] == "example.com"
+
+
+def test_extract_data_escalates_access_gate_to_browser(
+    html_strategy: HtmlProcessorStrategy,
+    mock_http_client: MagicMock,
+):
+    """Challenge pages from the static fetch fall through to crawl4ai."""
+    url = "https://example.com/gated"
+    mock_http_client.get.return_value = _static_response(
+        url,
+        "<html><head><title>Just a moment...</title></head>"
+        "<body><div class='cf-challenge'>Checking your browser</div></body></html>",
+    )
+
+    mock_result = MagicMock()
+    mock_result.success = True
+    mock_result.metadata = {"title": "Test Article Title"}
+    mock_result.url = url
+    mock_result.cleaned_html = "<html>...</html>"
+    mock_result.markdown = MagicMock(raw_markdown=SAMPLE_EXTRACTED_MARKDOWN)
+    mock_crawler = AsyncMock()
+    mock_crawler.arun = AsyncMock(return_value=mock_result)
+    mock_crawler.__aenter__ = AsyncMock(return_value=mock_crawler)
+    mock_crawler.__aexit__ = AsyncMock(return_value=None)
+
+    with patch(
+        "app.processing_strategies.html_strategy.AsyncWebCrawler", return_value=mock_crawler
+    ):
+        extracted_data = html_strategy.extract_data("", url)
+
+    mock_crawler.arun.assert_called_once()
+    assert extracted_data["extraction_tier"] == "browser"
+    assert extracted_data["title"] == "Test Article Title"
+
+
+def test_extract_data_escalates_static_tier_errors_to_browser(
+    html_strategy: HtmlProcessorStrategy,
+    mock_http_client: MagicMock,
+):
+    """Unexpected static-tier failures fall through to crawl4ai instead of failing."""
+    url = "https://example.com/odd-markup"
+    mock_http_client.get.return_value = _static_response(
+        url, "<html><body><p>Body</p></body></html>"
+    )
+
+    mock_result = MagicMock()
+    mock_result.success = True
+    mock_result.metadata = {"title": "Test Article Title"}
+    mock_result.url = url
+    mock_result.cleaned_html = "<html>...</html>"
+    mock_result.markdown = MagicMock(raw_markdown=SAMPLE_EXTRACTED_MARKDOWN)
+    mock_crawler = AsyncMock()
+    mock_crawler.arun = AsyncMock(return_value=mock_result)
+    mock_crawler.__aenter__ = AsyncMock(return_value=mock_crawler)
+    mock_crawler.__aexit__ = AsyncMock(return_value=None)
+
+    with (
+        patch(
+            "app.processing_strategies.html_strategy.trafilatura.extract",
+            side_effect=ValueError("lxml parser error"),
+        ),
+        patch(
+            "app.processing_strategies.html_strategy.AsyncWebCrawler",
+            return_value=mock_crawler,
+        ),
+    ):
+        extracted_data = html_strategy.extract_data("", url)
+
+    mock_crawler.arun.assert_called_once()
+    assert extracted_data["extraction_tier"] == "browser"
+    assert extracted_data["title"] == "Test Article Title"
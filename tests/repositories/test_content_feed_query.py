@@ -0,0 +1,49 @@
+"""Tests for shared user feed query visibility rules."""
+
+from __future__ import annotations
+
+from app.models.contracts import ContentStatus, ContentType
+from app.models.schema import Content, ContentStatusEntry
+from app.repositories.content_feed_query import build_user_feed_query
+
+
+def _add_content(db_session, *, url: str, content_type: ContentType) -> Content:
+    content = Content(
+        url=url,
+        title=url.rsplit("/", 1)[-1],
+        content_type=content_type.value,
+        status=ContentStatus.COMPLETED.value,
+        content_metadata={},
+    )
+    db_session.add(content)
+    db_session.commit()
+    db_session.refresh(content)
+    return content
+
+
+def test_inbox_feed_shows_global_news_without_per_user_rows(db_session, test_user) -> None:
+    """Global news is delivered by visibility rule, not content_status fan-out."""
+    news = _add_content(db_session, url="https://example.com/news", content_type=ContentType.NEWS)
+    article = _add_content(
+        db_session,
+        url="https://example.com/article",
+        content_type=ContentType.ARTICLE,
+    )
+    other_article = _add_content(
+        db_session,
+        url="https://example.com/other-article",
+        content_type=ContentType.ARTICLE,
+    )
+    db_session.add(ContentStatusEntry(user_id=test_user.id, content_id=article.id, status="inbox"))
+    db_session.commit()
+
+    visible_ids = {row[0].id for row in build_user_feed_query(db_session, test_user.id).all()}
+
+    assert visible_ids == {news.id, article.id}
+    assert other_article.id not in visible_ids
+    assert (
+        db_session.query(ContentStatusEntry)
+        .filter(ContentStatusEntry.content_id == news.id)
+        .count()
+        == 0
+    )
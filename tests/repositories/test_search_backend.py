@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 from app.models.contracts import ContentStatus, ContentType
 from app.models.schema import Content, ContentStatusEntry
 from app.repositories.search_repository import (
+    search_content,
     search_content_page,
 )
 
@@ -132,3 +133,57 @@ def test_postgres_search_matches_summary_title_metadata(db_session, test_user) -
 
     assert rows
     assert rows[0][0].id == metadata_match.id
+
+
+def test_postgres_search_estimated_count_never_undercounts_rows(db_session, test_user) -> None:
+    """Planner-estimated totals should still cover every returned row."""
+    for index in range(3):
+        _add_inbox_content(
+            db_session,
+            test_user.id,
+            title=f"Quantum networking update {index}",
+            search_text="entanglement routing",
+        )
+
+    rows, total = search_content(
+        db_session,
+        user_id=test_user.id,
+        query_text="quantum networking",
+        limit=10,
+        count_mode="estimated",
+    )
+    exact_rows, exact_total = search_content(
+        db_session,
+        user_id=test_user.id,
+        query_text="quantum networking",
+        limit=10,
+    )
+
+    assert len(rows) == 3
+    assert exact_total == 3
+    assert [row[0].id for row in rows] == [row[0].id for row in exact_rows]
+    assert total >= len(rows)
+
+
+def test_postgres_search_matches_typo_in_source(db_session, test_user) -> None:
+    """Source names are matched through their own trigram branch."""
+    source_match = _add_inbox_content(
+        db_session,
+        test_user.id,
+        title="Weekly digest",
+        search_text="brief update",
+    )
+    source_match.source = "Stratechery"
+    db_session.commit()
+
+    rows = search_content_page(
+        db_session,
+        user_id=test_user.id,
+        query_text="stratechry",
+        content_type="all",
+        cursor=(None, None, None),
+        limit=10,
+        offset=0,
+    )
+
+    assert [row[0].id for row in rows] == [source_match.id]
@@ -0,0 +1,112 @@
+"""Tests for incrementally maintained per-user unread counters."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.contracts import ContentStatus, ContentType
+from app.models.schema import Content, ContentStatusEntry, UserStatCounter
+from app.repositories import read_status_repository, stat_counter_repository, stats_repository
+from app.services.scraper_configs import ensure_inbox_statuses
+
+
+@pytest.fixture
+def counter_db(route_get_db):
+    """Route out-of-band counter writes to the current test database."""
+    return route_get_db(stat_counter_repository)
+
+
+def _add_inbox_article(db_session, *, user_id: int, url: str) -> Content:
+    content = Content(
+        url=url,
+        title=url.rsplit("/", 1)[-1],
+        content_type=ContentType.ARTICLE.value,
+        status=ContentStatus.COMPLETED.value,
+        content_metadata={},
+    )
+    db_session.add(content)
+    db_session.commit()
+    db_session.refresh(content)
+    db_session.add(ContentStatusEntry(user_id=user_id, content_id=content.id, status="inbox"))
+    db_session.commit()
+    return content
+
+
+def _counter_values(db_session, *, user_id: int) -> dict[str, int]:
+    db_session.expire_all()
+    rows = db_session.query(UserStatCounter).filter(UserStatCounter.user_id == user_id).all()
+    return {row.counter_key: row.value for row in rows}
+
+
+def test_unread_counters_are_stored_and_adjusted_by_read_state(
+    db_session,
+    test_user,
+    counter_db,
+) -> None:
+    first = _add_inbox_article(db_session, user_id=test_user.id, url="https://example.com/one")
+    _add_inbox_article(db_session, user_id=test_user.id, url="https://example.com/two")
+
+    counts = stats_repository.get_unread_counts(db_session, user_id=test_user.id)
+    assert counts["article"] == 2
+    stored = _counter_values(db_session, user_id=test_user.id)
+    assert stored[stat_counter_repository.UNREAD_ARTICLE_COUNTER] == 2
+
+    read_status_repository.mark_content_as_read(db_session, first.id, test_user.id)
+    stored = _counter_values(db_session, user_id=test_user.id)
+    assert stored[stat_counter_repository.UNREAD_ARTICLE_COUNTER] == 1
+
+    # Marking an already-read item again must not decrement twice.
+    read_status_repository.mark_content_as_read(db_session, first.id, test_user.id)
+    assert stats_repository.get_unread_counts(db_session, user_id=test_user.id)["article"] == 1
+
+    assert read_status_repository.mark_content_as_unread(db_session, first.id, test_user.id)
+    stored = _counter_values(db_session, user_id=test_user.id)
+    assert stored[stat_counter_repository.UNREAD_ARTICLE_COUNTER] == 2
+
+
+def test_inbox_insertions_increment_unread_counters(
+    db_session,
+    test_user,
+    counter_db,
+) -> None:
+    _add_inbox_article(db_session, user_id=test_user.id, url="https://example.com/one")
+    assert stats_repository.get_unread_counts(db_session, user_id=test_user.id)["article"] == 1
+    content = Content(
+        url="https://example.com/two",
+        title="two",
+        content_type=ContentType.ARTICLE.value,
+        status=ContentStatus.COMPLETED.value,
+        content_metadata={},
+    )
+    db_session.add(content)
+    db_session.commit()
+    db_session.refresh(content)
+
+    # Production sessions do not autoflush, so pending inbox rows must be flushed
+    # before the counter query can see them.
+    session = sessionmaker(bind=db_session.get_bind(), autoflush=False)()
+    try:
+        added = ensure_inbox_statuses(session, [(test_user.id, content.id, "article")])
+        session.commit()
+    finally:
+        session.close()
+
+    assert added == {(test_user.id, content.id)}
+    stored = _counter_values(db_session, user_id=test_user.id)
+    assert stored[stat_counter_repository.UNREAD_ARTICLE_COUNTER] == 2
+
+
+def test_clear_read_status_drops_counters_for_recompute(
+    db_session,
+    test_user,
+    counter_db,
+) -> None:
+    content = _add_inbox_article(db_session, user_id=test_user.id, url="https://example.com/a")
+    read_status_repository.mark_content_as_read(db_session, content.id, test_user.id)
+    assert stats_repository.get_unread_counts(db_session, user_id=test_user.id)["article"] == 0
+
+    read_status_repository.clear_read_status(db_session, test_user.id)
+
+    assert _counter_values(db_session, user_id=test_user.id) == {}
+    assert stats_repository.get_unread_counts(db_session, user_id=test_user.id)["article"] == 1
@@ -6,6 +6,8 @@ from urllib.parse import parse_qs, unquote_plus, urlparse
 
 from app.models.schema import Content
 from app.queries.get_content_body import MAX_CONTENT_BODY_RESPONSE_CHARS, TRUNCATED_BODY_NOTICE
+from app.services.gateways.object_storage_gateway import LocalObjectStorageGateway
+from app.services.voice.narration_audio_cache import NarrationAudioCache
 
 
 def _get_display_title(fixture_data: dict) -> str:
@@ -112,28 +114,34 @@ def test_content_narration_returns_audio_bytes(
     create_sample_content,
     sample_article_long,
     monkeypatch,
+    tmp_path,
 ) -> None:
     """Unified narration endpoint should stream audio when audio is requested."""
 
     content = create_sample_content(sample_article_long)
-    captured: dict[str, object] = {}
+    captured: dict[str, object] = {"calls": 0}
 
     class _FakeTtsService:
-        def synthesize_mp3(
+        def stream_mp3(
             self,
             *,
             text: str,
             item_id: int | None = None,
             user_id: int | None = None,
-        ) -> bytes:
+        ):
+            captured["calls"] = int(captured["calls"]) + 1
             captured["text"] = text
             captured["item_id"] = item_id
             captured["user_id"] = user_id
-            return b"fake-content-mp3"
+            return iter([b"fake-content", b"-mp3"])
 
+    audio_cache = NarrationAudioCache(
+        gateway=LocalObjectStorageGateway(root_dir=tmp_path),
+        tts_service=_FakeTtsService(),
+    )
     monkeypatch.setattr(
-        "app.routers.api.narration.get_digest_narration_tts_service",
-        lambda: _FakeTtsService(),
+        "app.routers.api.narration.get_narration_audio_cache",
+        lambda: audio_cache,
     )
 
     response = client.get(
@@ -148,6 +156,21 @@ def test_content_narration_returns_audio_bytes(
     assert captured["user_id"] is not None
     assert "Here is the full summary for" in str(captured["text"])
 
+    cached_response = client.get(
+        f"/api/content/narration/content/{content.id}",
+        headers={"Accept": "audio/mpeg"},
+    )
+    ranged_response = client.get(
+        f"/api/content/narration/content/{content.id}",
+        headers={"Accept": "audio/mpeg", "Range": "bytes=5-11"},
+    )
+
+    assert cached_response.content == b"fake-content-mp3"
+    assert ranged_response.status_code == 206
+    assert ranged_response.content == b"content"
+    assert ranged_response.headers["content-range"] == "bytes 5-11/16"
+    assert captured["calls"] == 1
+
 
 def test_content_body_requires_visible_content(
     client,
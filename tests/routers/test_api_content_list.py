@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 
 from app.models.metadata import ContentStatus, ContentType
-from app.models.schema import Content, ContentStatusEntry
+from app.models.schema import Content, ContentCard, ContentStatusEntry
 
 
 def _build_summary(title: str) -> dict[str, object]:
@@ -341,7 +341,7 @@ def test_list_uses_fallback_summary_when_domain_content_build_fails(
         raise ValueError("invalid content metadata")
 
     monkeypatch.setattr(
-        "app.queries.list_content_cards.content_to_domain",
+        "app.queries.content_card_projection.content_to_domain",
         _raise_build_error,
     )
 
@@ -404,7 +404,7 @@ def test_search_skips_invalid_content_rows_when_domain_content_build_fails(
         raise ValueError("invalid content metadata")
 
     monkeypatch.setattr(
-        "app.queries.search_content_cards.content_to_domain",
+        "app.queries.content_card_projection.content_to_domain",
         _raise_build_error,
     )
 
@@ -414,3 +414,91 @@ def test_search_skips_invalid_content_rows_when_domain_content_build_fails(
     payload = response.json()
     assert payload["contents"] == []
     assert payload["meta"]["total"] == 0
+
+
+def test_list_serves_cards_from_projection_until_content_changes(
+    client,
+    db_session,
+    test_user,
+) -> None:
+    article = Content(
+        url="https://example.com/projected",
+        content_type=ContentType.ARTICLE.value,
+        status=ContentStatus.COMPLETED.value,
+        content_metadata={
+            "summary": _build_summary("Projected Article"),
+            "summary_kind": "long_structured",
+            "summary_version": 1,
+        },
+    )
+    db_session.add(article)
+    db_session.commit()
+    db_session.refresh(article)
+    _add_inbox_status(db_session, test_user.id, article.id)
+    db_session.commit()
+
+    response = client.get("/api/content/", params={"content_type": "article"})
+    assert response.status_code == 200
+
+    card = db_session.query(ContentCard).filter(ContentCard.content_id == article.id).one()
+    assert card.source_updated_at == article.updated_at
+    assert "is_read" not in card.card
+    card.card = {**card.card, "title": "Served From Projection"}
+    db_session.commit()
+
+    response = client.get("/api/content/", params={"content_type": "article"})
+    item = next(item for item in response.json()["contents"] if item["id"] == article.id)
+    assert item["title"] == "Served From Projection"
+    assert item["is_read"] is False
+
+    article.content_metadata = {
+        **article.content_metadata,
+        "image_generated_at": "2026-01-01T00:00:00Z",
+    }
+    db_session.commit()
+
+    response = client.get("/api/content/", params={"content_type": "article"})
+    item = next(item for item in response.json()["contents"] if item["id"] == article.id)
+    assert item["title"] != "Served From Projection"
+    assert item["image_url"] == f"/static/images/content/{article.id}.png"
+
+
+def test_list_rebuilds_cards_from_older_projection_version(
+    client,
+    db_session,
+    test_user,
+    monkeypatch,
+) -> None:
+    article = Content(
+        url="https://example.com/projected-version",
+        content_type=ContentType.ARTICLE.value,
+        status=ContentStatus.COMPLETED.value,
+        content_metadata={
+            "summary": _build_summary("Versioned Article"),
+            "summary_kind": "long_structured",
+            "summary_version": 1,
+        },
+    )
+    db_session.add(article)
+    db_session.commit()
+    db_session.refresh(article)
+    _add_inbox_status(db_session, test_user.id, article.id)
+    db_session.commit()
+
+    client.get("/api/content/", params={"content_type": "article"})
+    card = db_session.query(ContentCard).filter(ContentCard.content_id == article.id).one()
+    card.card = {**card.card, "title": "Old Projection"}
+    db_session.commit()
+
+    monkeypatch.setattr(
+        "app.queries.content_card_projection.CONTENT_CARD_PROJECTION_VERSION",
+        card.projection_version + 1,
+    )
+    response = client.get("/api/content/", params={"content_type": "article"})
+    item = next(item for item in response.json()["contents"] if item["id"] == article.id)
+    assert item["title"] != "Old Projection"
+
+    db_session.expire_all()
+    card = db_session.query(ContentCard).filter(ContentCard.content_id == article.id).one()
+    assert card.projection_version == 2
+    assert card.card["title"] != "Old Projection"
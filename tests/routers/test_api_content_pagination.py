@@ -327,17 +327,17 @@ class TestSearchEndpointPagination:
         monkeypatch,
     ):
         """Search should keep returning valid rows when one result is malformed."""
-        from app.queries import search_content_cards
+        from app.queries import content_card_projection
 
         broken_id = sample_contents[0].id
-        original_content_to_domain = search_content_cards.content_to_domain
+        original_content_to_domain = content_card_projection.content_to_domain
 
         def _content_to_domain(content):
             if content.id == broken_id:
                 raise ValueError("invalid content metadata")
             return original_content_to_domain(content)
 
-        monkeypatch.setattr(search_content_cards, "content_to_domain", _content_to_domain)
+        monkeypatch.setattr(content_card_projection, "content_to_domain", _content_to_domain)
 
         response = client.get("/api/content/search", params={"q": "Test", "limit": 50})
         assert response.status_code == 200
@@ -0,0 +1,194 @@
+"""Tests for the shared conditional-GET feed fetcher."""
+
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock, patch
+
+import feedparser
+
+from app.models.metadata import ContentType
+from app.models.schema import FeedFetchState
+from app.scraping import base
+from app.scraping.base import BaseScraper
+from app.scraping.feed_fetcher import FeedFetchResult, commit_feed_validators, fetch_feeds
+
+
+def _feed_response(
+    *,
+    status: int,
+    etag: str | None = None,
+    modified: str | None = None,
+    entries: list | None = None,
+):
+    response = feedparser.FeedParserDict(
+        status=status,
+        feed=feedparser.FeedParserDict(title="Feed"),
+        entries=entries or [],
+        bozo=0,
+    )
+    if etag is not None:
+        response["etag"] = etag
+    if modified is not None:
+        response["modified"] = modified
+    return response
+
+
+class _FeedScraper(BaseScraper):
+    def __init__(self, results: dict[str, FeedFetchResult], items: list[dict]):
+        super().__init__("FeedTest")
+        self.queue_service = Mock()
+        self._results = results
+        self._items = items
+
+    def scrape(self) -> list[dict]:
+        self._pending_feed_results = dict(self._results)
+        return self._items
+
+
+def test_fetch_feeds_sends_committed_validators_and_skips_not_modified(db_session):
+    """Validators are replayed only once committed, and a 304 yields no parsed feed."""
+    feed_url = "https://example.com/feed.xml"
+    calls: list[dict] = []
+
+    def _parse(url, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            return _feed_response(
+                status=200,
+                etag='"v1"',
+                modified="Wed, 14 Oct 2026 10:00:00 GMT",
+                entries=[
+                    feedparser.FeedParserDict(published_parsed=(2026, 10, 13, 9, 0, 0)),
+                    feedparser.FeedParserDict(published_parsed=(2026, 10, 14, 9, 0, 0)),
+                ],
+            )
+        return _feed_response(status=304)
+
+    with patch("app.scraping.feed_fetcher.feedparser.parse", side_effect=_parse):
+        first = fetch_feeds([feed_url])[feed_url]
+        state = db_session.query(FeedFetchState).filter(FeedFetchState.feed_url == feed_url).one()
+        assert state.etag is None
+
+        commit_feed_validators([first])
+        second = fetch_feeds([feed_url, feed_url])[feed_url]
+
+    assert first.feed_or_raise() is not None
+    assert calls[0] == {"etag": None, "modified": None}
+    assert calls[1] == {"etag": '"v1"', "modified": "Wed, 14 Oct 2026 10:00:00 GMT"}
+    assert len(calls) == 2
+    assert second.not_modified is True
+    assert second.feed_or_raise() is None
+
+    db_session.expire_all()
+    state = db_session.query(FeedFetchState).filter(FeedFetchState.feed_url == feed_url).one()
+    assert state.etag == '"v1"'
+    assert state.recent_published_at == ["2026-10-14T09:00:00", "2026-10-13T09:00:00"]
+    assert state.fetch_count == 2
+    assert state.not_modified_count == 1
+    assert state.last_status_code == 304
+    assert state.consecutive_failures == 0
+
+
+def test_fetch_feeds_skips_validators_for_new_subscribers(db_session):
+    """A subscription added after validators were committed gets a full response."""
+    feed_url = "https://example.com/new-subscriber.xml"
+    db_session.add(
+        FeedFetchState(
+            feed_url=feed_url,
+            etag='"v1"',
+            validators_saved_at=datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=1),
+            fetch_count=1,
+            not_modified_count=0,
+            consecutive_failures=0,
+        )
+    )
+    db_session.commit()
+    calls: list[dict] = []
+
+    def _parse(url, **kwargs):
+        calls.append(kwargs)
+        return _feed_response(status=200, etag='"v2"')
+
+    subscribed_at = datetime.now(UTC).replace(tzinfo=None)
+    with patch("app.scraping.feed_fetcher.feedparser.parse", side_effect=_parse):
+        fetch_feeds([feed_url])
+        fetch_feeds([feed_url], subscribed_at={feed_url: subscribed_at})
+
+    assert calls == [
+        {"etag": '"v1"', "modified": None},
+        {"etag": None, "modified": None},
+    ]
+
+
+def test_fetch_feeds_records_errors_and_limits_per_host_concurrency(db_session):
+    """Fetch errors are surfaced per feed and one host never exceeds its slot limit."""
+    active_by_host: dict[str, int] = {}
+    peak_by_host: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def _parse(url, **kwargs):
+        host = url.split("/")[2]
+        with lock:
+            active_by_host[host] = active_by_host.get(host, 0) + 1
+            peak_by_host[host] = max(peak_by_host.get(host, 0), active_by_host[host])
+        time.sleep(0.05)
+        with lock:
+            active_by_host[host] -= 1
+        if url.endswith("broken"):
+            raise OSError("connection reset")
+        return _feed_response(status=200)
+
+    urls = [f"https://same.example.com/feed-{index}" for index in range(4)]
+    urls.append("https://other.example.com/broken")
+    with patch("app.scraping.feed_fetcher.feedparser.parse", side_effect=_parse):
+        results = fetch_feeds(urls, max_workers=4, per_host_limit=1)
+
+    assert peak_by_host["same.example.com"] == 1
+    assert isinstance(results["https://other.example.com/broken"].error, OSError)
+    failed_state = (
+        db_session.query(FeedFetchState)
+        .filter(FeedFetchState.feed_url == "https://other.example.com/broken")
+        .one()
+    )
+    assert failed_state.consecutive_failures == 1
+    assert failed_state.last_error == "connection reset"
+
+
+def test_run_with_stats_keeps_validators_only_for_feeds_with_failed_items(
+    route_get_db,
+    monkeypatch,
+):
+    """An unsaved item holds back its own feed's validators, not the whole run's."""
+    route_get_db(base)
+    committed: list[str] = []
+    monkeypatch.setattr(
+        base,
+        "commit_feed_validators",
+        lambda results: committed.extend(result.feed_url for result in results),
+    )
+    good_feed = "https://good.example.com/feed.xml"
+    bad_feed = "https://bad.example.com/feed.xml"
+    items = [
+        {
+            "url": "https://good.example.com/posts/first-post",
+            "title": "First post",
+            "content_type": ContentType.ARTICLE,
+            "metadata": {"feed_url": good_feed, "source": "Good"},
+        },
+        {
+            "url": "not a url",
+            "title": "Broken entry",
+            "content_type": ContentType.ARTICLE,
+            "metadata": {"feed_url": bad_feed, "source": "Bad"},
+        },
+    ]
+    scraper = _FeedScraper(
+        {url: FeedFetchResult(feed_url=url, etag='"v1"') for url in (good_feed, bad_feed)},
+        items,
+    )
+
+    stats = scraper.run_with_stats()
+
+    assert (stats.saved, stats.errors) == (1, 1)
+    assert committed == [good_feed]
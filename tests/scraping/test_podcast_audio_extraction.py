@@ -176,7 +176,7 @@ class TestPodcastAudioExtraction:
         mock_feed.feed = {"title": "Lenny's Podcast"}
 
         with (
-            patch("app.scraping.podcast_unified.feedparser.parse", return_value=mock_feed),
+            patch("app.scraping.feed_fetcher.feedparser.parse", return_value=mock_feed),
             patch.object(
                 PodcastUnifiedScraper,
                 "_load_podcast_feeds",
@@ -343,7 +343,7 @@ class TestPodcastIntegration:
         mock_feed.feed = {"title": "Test Feed"}
 
         with (
-            patch("app.scraping.podcast_unified.feedparser.parse", return_value=mock_feed),
+            patch("app.scraping.feed_fetcher.feedparser.parse", return_value=mock_feed),
             patch.object(
                 PodcastUnifiedScraper,
                 "_load_podcast_feeds",
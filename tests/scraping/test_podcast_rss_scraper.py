@@ -113,3 +113,61 @@ def test_existing_news_entries_are_not_reenqueued():
 
     assert stats["duplicates"] == 1
     queue_service.enqueue.assert_not_called()
+
+
+def test_save_items_bulk_inserts_new_rows_and_batches_enqueue(db_session):
+    """New items are inserted set-based and enqueued with one batch call."""
+    from app.models.schema import Content, ContentStatusEntry
+    from app.services.queue import TaskType
+
+    existing = Content(
+        content_type=ContentType.PODCAST.value,
+        url="https://example.com/existing",
+        status=ContentStatus.COMPLETED.value,
+        content_metadata={},
+    )
+    db_session.add(existing)
+    db_session.commit()
+    queue_service = Mock()
+
+    @contextmanager
+    def _db_context():
+        yield db_session
+
+    items = [
+        _build_item("https://example.com/ep1", user_id=7),
+        _build_item("https://example.com/existing", user_id=7),
+        _build_item("https://example.com/ep2"),
+        _build_item("https://example.com/ep1"),
+        _build_item("not-a-url"),
+    ]
+    with (
+        patch("app.scraping.base.get_db", _db_context),
+        patch("app.scraping.base.get_queue_service", return_value=queue_service),
+    ):
+        scraper = PodcastUnifiedScraper()
+        stats = scraper._save_items_with_stats(items)
+
+    assert stats["saved"] == 2
+    assert stats["duplicates"] == 2
+    assert stats["errors"] == 1
+    assert stats["error_details"] == ["Invalid URL: not-a-url"]
+
+    saved = {
+        content.url: content
+        for content in db_session.query(Content).filter(Content.id != existing.id).all()
+    }
+    assert set(saved) == {"https://example.com/ep1", "https://example.com/ep2"}
+    assert saved["https://example.com/ep1"].source == "Test Podcast"
+    queue_service.enqueue.assert_not_called()
+    queue_service.enqueue_content_tasks.assert_called_once_with(
+        [
+            (TaskType.PROCESS_CONTENT, saved["https://example.com/ep1"].id),
+            (TaskType.PROCESS_CONTENT, saved["https://example.com/ep2"].id),
+        ]
+    )
+    inbox_content_ids = {
+        row.content_id
+        for row in db_session.query(ContentStatusEntry).filter(ContentStatusEntry.user_id == 7)
+    }
+    assert inbox_content_ids == {saved["https://example.com/ep1"].id, existing.id}
@@ -58,7 +58,7 @@ def mock_podcast_config():
 class TestPodcastScraperIntegration:
     """Test integration between podcast scraper and unified system."""
 
-    @patch("app.scraping.podcast_unified.feedparser.parse")
+    @patch("app.scraping.feed_fetcher.feedparser.parse")
     @patch("app.scraping.base.get_db")
     @patch("app.scraping.base.get_queue_service")
     def test_podcast_scraper_creates_correct_content(
@@ -136,7 +136,7 @@ class TestPodcastScraperIntegration:
         queue_service.enqueue.assert_any_call(TaskType.PROCESS_CONTENT, content_id=1)
         queue_service.enqueue.assert_any_call(TaskType.PROCESS_CONTENT, content_id=2)
 
-    @patch("app.scraping.podcast_unified.feedparser.parse")
+    @patch("app.scraping.feed_fetcher.feedparser.parse")
     @patch("app.scraping.base.get_db")
     @patch("app.scraping.base.get_queue_service")
     def test_podcast_scraper_skips_existing_urls(
@@ -188,7 +188,7 @@ class TestPodcastScraperIntegration:
         assert len(added_contents) == 1
         assert added_contents[0].url == "https://example.com/episodes/2"
 
-    @patch("app.scraping.podcast_unified.feedparser.parse")
+    @patch("app.scraping.feed_fetcher.feedparser.parse")
     def test_podcast_scraper_summarizes_missing_audio_entries(
         self,
         mock_feedparser,
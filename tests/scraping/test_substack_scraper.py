@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -7,6 +8,7 @@ import pytest
 from app.models.metadata import ContentType
 from app.models.schema import Content, ContentStatus
 from app.scraping.substack_unified import SubstackScraper, load_substack_feeds
+from app.services.queue import TaskType
 
 # Sample YAML content
 SAMPLE_YAML = """
@@ -210,9 +212,17 @@ def test_scrape_handles_missing_link(mock_feedparser_parse, mock_db_session, moc
         assert len(items) == 0
 
 
-def test_run_saves_to_database(mock_db_session, mock_queue_service):
+def test_run_saves_to_database(db_session, mock_queue_service):
     """Test that run() saves items to database and queues tasks."""
-    with patch('app.scraping.substack_unified.feedparser.parse') as mock_feedparser_parse:
+
+    @contextmanager
+    def _db_context():
+        yield db_session
+
+    with (
+        patch('app.scraping.base.get_db', _db_context),
+        patch('app.scraping.substack_unified.feedparser.parse') as mock_feedparser_parse,
+    ):
         # Mock feedparser results
         mock_feed_result = MagicMock()
         mock_feed_result.bozo = 0
@@ -232,25 +242,21 @@ def test_run_saves_to_database(mock_db_session, mock_queue_service):
             scraper = SubstackScraper()
             saved_count = scraper.run()
 
-            # Verify item was saved
-            assert saved_count == 1
-            
-            # Verify database operations
-            mock_db_session.add.assert_called_once()
-            mock_db_session.commit.assert_called_once()
-            mock_db_session.refresh.assert_called_once()
-            
-            # Verify the created content object
-            created_content = mock_db_session.add.call_args[0][0]
-            assert isinstance(created_content, Content)
-            assert created_content.content_type == ContentType.ARTICLE.value
-            assert created_content.url == 'https://test.com/article'
-            assert created_content.title == 'Test Article'
-            assert created_content.source == 'Test Feed'  # Verify source field is set
-            assert created_content.status == ContentStatus.NEW.value
-            
-            # Verify task was queued
-            mock_queue_service.enqueue.assert_called_once()
+    # Verify item was saved
+    assert saved_count == 1
+
+    # Verify the created content row
+    created_content = db_session.query(Content).one()
+    assert created_content.content_type == ContentType.ARTICLE.value
+    assert created_content.url == 'https://test.com/article'
+    assert created_content.title == 'Test Article'
+    assert created_content.source == 'Test Feed'  # Verify source field is set
+    assert created_content.status == ContentStatus.NEW.value
+
+    # Verify task was queued in one batch
+    mock_queue_service.enqueue_content_tasks.assert_called_once_with(
+        [(TaskType.PROCESS_CONTENT, created_content.id)]
+    )
 
 
 def test_run_skips_existing_urls(mock_db_session, mock_queue_service):
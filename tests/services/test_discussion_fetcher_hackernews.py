@@ -0,0 +1,129 @@
+"""Hacker News comment tree fetching tests for discussion fetcher."""
+
+from __future__ import annotations
+
+import json
+import re
+
+import httpx
+import pytest
+
+from app.services import discussion_fetcher
+
+STORY_URL = "https://news.ycombinator.com/item?id=1"
+TREE_URL = "https://hn-tree.test/items/{item_id}"
+
+# Story 1 -> comments 2, 3; 2 -> 4, 5; 3 -> 6 (deleted); 4 -> 7.
+HN_ITEMS: dict[int, dict] = {
+    1: {"id": 1, "type": "story", "kids": [2, 3], "descendants": 6},
+    2: {"id": 2, "type": "comment", "by": "a", "text": "two", "time": 1, "kids": [4, 5]},
+    3: {"id": 3, "type": "comment", "by": "b", "text": "three", "time": 2, "kids": [6]},
+    4: {"id": 4, "type": "comment", "by": "c", "text": "four", "time": 3, "kids": [7]},
+    5: {"id": 5, "type": "comment", "by": "d", "text": "five", "time": 4},
+    6: {"id": 6, "type": "comment", "deleted": True},
+    7: {"id": 7, "type": "comment", "by": "e", "text": "seven", "time": 5},
+}
+
+
+def _tree_node(item_id: int) -> dict:
+    item = HN_ITEMS[item_id]
+    return {
+        "id": item_id,
+        "type": item["type"],
+        "author": item.get("by"),
+        "text": item.get("text"),
+        "created_at_i": item.get("time"),
+        "children": [_tree_node(kid) for kid in item.get("kids", [])],
+    }
+
+
+class LocalHackerNews:
+    """Local stand-in for the HN item API and a whole-tree endpoint."""
+
+    def __init__(self, *, tree_status: int = 200) -> None:
+        self.tree_status = tree_status
+        self.requests: list[str] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(str(request.url))
+        if request.url.host == "hn-tree.test":
+            if self.tree_status != 200:
+                return httpx.Response(self.tree_status)
+            item_id = int(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json=_tree_node(item_id))
+
+        match = re.search(r"/item/(\d+)\.json$", request.url.path)
+        assert match is not None
+        return httpx.Response(200, text=json.dumps(HN_ITEMS.get(int(match.group(1)))))
+
+    def client(self) -> httpx.Client:
+        return httpx.Client(transport=httpx.MockTransport(self.handle))
+
+
+@pytest.fixture
+def local_hn(monkeypatch) -> LocalHackerNews:
+    server = LocalHackerNews()
+    monkeypatch.setattr(discussion_fetcher, "_get_hn_http_client", server.client)
+    monkeypatch.setattr(discussion_fetcher.settings, "hn_discussion_fetch_concurrency", 4)
+    monkeypatch.setattr(discussion_fetcher.settings, "hn_comment_tree_url", None)
+    return server
+
+
+def _comment_rows(
+    result: discussion_fetcher.DiscussionPayload,
+) -> list[tuple[str, str | None, int]]:
+    return [
+        (item["comment_id"], item["parent_id"], item["depth"])
+        for item in result.payload["comments"]
+    ]
+
+
+def test_build_hackernews_payload_keeps_breadth_first_order(local_hn) -> None:
+    result = discussion_fetcher._build_hackernews_payload(STORY_URL, comment_cap=500)
+
+    assert result.status == "completed"
+    assert _comment_rows(result) == [
+        ("2", None, 0),
+        ("3", None, 0),
+        ("4", "2", 1),
+        ("5", "2", 1),
+        ("7", "4", 2),
+    ]
+    assert result.payload["stats"]["total_seen"] == 6
+    assert result.payload["stats"]["cap_reached"] is False
+    assert len(local_hn.requests) == 7
+
+
+def test_build_hackernews_payload_respects_comment_cap(local_hn) -> None:
+    result = discussion_fetcher._build_hackernews_payload(STORY_URL, comment_cap=3)
+
+    assert _comment_rows(result) == [("2", None, 0), ("3", None, 0), ("4", "2", 1)]
+    assert result.payload["stats"]["cap_reached"] is True
+    assert result.payload["stats"]["fetched_count"] == 3
+
+
+def test_build_hackernews_payload_uses_single_tree_request(local_hn, monkeypatch) -> None:
+    monkeypatch.setattr(discussion_fetcher.settings, "hn_comment_tree_url", TREE_URL)
+
+    result = discussion_fetcher._build_hackernews_payload(STORY_URL, comment_cap=500)
+
+    assert local_hn.requests == ["https://hn-tree.test/items/1"]
+    assert _comment_rows(result) == [
+        ("2", None, 0),
+        ("3", None, 0),
+        ("4", "2", 1),
+        ("5", "2", 1),
+        ("7", "4", 2),
+    ]
+    assert result.payload["stats"]["declared_comment_count"] == 6
+
+
+def test_build_hackernews_payload_falls_back_when_tree_fetch_fails(local_hn, monkeypatch) -> None:
+    monkeypatch.setattr(discussion_fetcher.settings, "hn_comment_tree_url", TREE_URL)
+    local_hn.tree_status = 503
+
+    result = discussion_fetcher._build_hackernews_payload(STORY_URL, comment_cap=500)
+
+    assert len(_comment_rows(result)) == 5
+    assert local_hn.requests[0] == "https://hn-tree.test/items/1"
+    assert len(local_hn.requests) == 8
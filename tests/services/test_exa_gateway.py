@@ -0,0 +1,82 @@
+"""Tests for the shared Exa search gateway."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.services.exa_client import ExaRequestError, ExaSearchResult
+from app.services.gateways import exa_gateway
+from app.services.gateways.exa_gateway import ExaGateway
+
+
+@pytest.fixture
+def exa_calls(monkeypatch) -> list[dict]:
+    """Record real Exa requests made by the gateway."""
+    calls: list[dict] = []
+
+    def fake_exa_search(query: str, **kwargs) -> list[ExaSearchResult]:
+        calls.append({"query": query, **kwargs})
+        return [ExaSearchResult(title=query, url=f"https://example.com/{len(calls)}")]
+
+    monkeypatch.setattr(exa_gateway, "exa_search", fake_exa_search)
+    monkeypatch.setattr(exa_gateway, "get_exa_client", object)
+    monkeypatch.setattr(exa_gateway.get_settings(), "exa_search_cache_ttl_seconds", 60)
+    return calls
+
+
+def test_search_reuses_cached_results_per_options(exa_calls) -> None:
+    gateway = ExaGateway(requests_per_second=0)
+
+    first = gateway.search("ai agents", num_results=3)
+    assert gateway.search("ai  agents", num_results=3) == first
+    gateway.search("ai agents", num_results=3, category="news")
+    gateway.search("ai agents", num_results=5)
+
+    assert len(exa_calls) == 3
+    assert exa_calls[0]["raise_on_error"] is True
+
+    gateway.clear_cache()
+    gateway.search("ai agents", num_results=3)
+    assert len(exa_calls) == 4
+
+
+def test_search_many_coalesces_in_flight_requests(monkeypatch) -> None:
+    release = threading.Event()
+    calls: list[str] = []
+
+    def slow_exa_search(query: str, **_kwargs) -> list[ExaSearchResult]:
+        calls.append(query)
+        release.wait(timeout=5)
+        return [ExaSearchResult(title=query, url=f"https://example.com/{query}")]
+
+    monkeypatch.setattr(exa_gateway, "exa_search", slow_exa_search)
+    monkeypatch.setattr(exa_gateway, "get_exa_client", object)
+    gateway = ExaGateway(max_concurrent_requests=4, requests_per_second=0)
+
+    timer = threading.Timer(0.2, release.set)
+    timer.start()
+    results = gateway.search_many(["alpha", "beta", "alpha", "alpha"], num_results=2)
+    timer.join()
+
+    assert sorted(calls) == ["alpha", "beta"]
+    assert [batch[0].title for batch in results] == ["alpha", "beta", "alpha", "alpha"]
+
+
+def test_failed_searches_are_not_cached(monkeypatch) -> None:
+    attempts: list[str] = []
+
+    def failing_exa_search(query: str, **_kwargs) -> list[ExaSearchResult]:
+        attempts.append(query)
+        raise ExaRequestError("boom")
+
+    monkeypatch.setattr(exa_gateway, "exa_search", failing_exa_search)
+    monkeypatch.setattr(exa_gateway, "get_exa_client", object)
+    monkeypatch.setattr(exa_gateway.get_settings(), "exa_search_cache_ttl_seconds", 60)
+    gateway = ExaGateway(requests_per_second=0)
+
+    assert gateway.search("ai agents") == []
+    with pytest.raises(ExaRequestError):
+        gateway.search("ai agents", raise_on_error=True)
+    assert len(attempts) == 2
@@ -0,0 +1,131 @@
+"""Tests for adaptive per-feed scrape scheduling."""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from app.models.schema import FeedFetchState, ProcessingTask, UserScraperConfig
+from app.services.feed_scheduler import (
+    compute_poll_interval,
+    plan_next_poll,
+    schedule_feed_scrapes,
+)
+from app.services.queue import TaskStatus, TaskType
+
+NOW = datetime(2026, 10, 16, 12, 0, 0)
+
+
+def _patch_db(monkeypatch, db_session) -> None:
+    @contextmanager
+    def _get_db_override():
+        try:
+            yield db_session
+            db_session.commit()
+        except Exception:
+            db_session.rollback()
+            raise
+
+    monkeypatch.setattr("app.services.queue.get_db", _get_db_override)
+    monkeypatch.setattr("app.services.feed_scheduler.get_db", _get_db_override)
+
+
+def test_compute_poll_interval_follows_cadence_304_rate_and_failures():
+    """Fast feeds poll often; unchanged and failing feeds back off within bounds."""
+    hourly = compute_poll_interval(average_interval_hours=1.0)
+    daily = compute_poll_interval(average_interval_hours=24.0)
+    mostly_unchanged = compute_poll_interval(
+        average_interval_hours=24.0, fetch_count=10, not_modified_count=10
+    )
+    failing = compute_poll_interval(average_interval_hours=24.0, consecutive_failures=3)
+
+    assert hourly == timedelta(minutes=15)
+    assert daily == timedelta(hours=6)
+    assert mostly_unchanged == timedelta(hours=12)
+    assert failing == timedelta(hours=24)
+    assert compute_poll_interval(average_interval_hours=0.01) == timedelta(minutes=10)
+    assert compute_poll_interval(average_interval_hours=None) == timedelta(minutes=60)
+
+
+def test_plan_next_poll_pulls_forward_to_expected_publication():
+    """An unchecked predicted publication pulls the next poll forward."""
+    last_fetched_at = NOW - timedelta(minutes=30)
+
+    assert plan_next_poll(
+        now=NOW,
+        interval=timedelta(hours=6),
+        last_fetched_at=last_fetched_at,
+        next_expected_at=NOW + timedelta(hours=1),
+    ) == NOW + timedelta(hours=1)
+    # A prediction that was already checked (stale feed) does not keep polling hot.
+    assert plan_next_poll(
+        now=NOW,
+        interval=timedelta(hours=6),
+        last_fetched_at=last_fetched_at,
+        next_expected_at=NOW - timedelta(hours=1),
+    ) == last_fetched_at + timedelta(hours=6)
+    assert (
+        plan_next_poll(
+            now=NOW,
+            interval=timedelta(hours=6),
+            last_fetched_at=None,
+            next_expected_at=None,
+        )
+        == NOW
+    )
+
+
+def test_schedule_feed_scrapes_enqueues_one_deferred_task_per_feed(
+    db_session, monkeypatch, test_user
+):
+    """Each active feed gets one pending SCRAPE task timed from its history."""
+    _patch_db(monkeypatch, db_session)
+    feed_url = "https://example.substack.com/feed"
+    new_feed_url = "https://example.com/podcast.xml"
+    db_session.add_all(
+        [
+            UserScraperConfig(
+                user_id=test_user.id,
+                scraper_type="substack",
+                feed_url=feed_url,
+                config={"feed_url": feed_url},
+            ),
+            UserScraperConfig(
+                user_id=test_user.id,
+                scraper_type="podcast_rss",
+                feed_url=new_feed_url,
+                config={"feed_url": new_feed_url},
+            ),
+            FeedFetchState(
+                feed_url=feed_url,
+                last_fetched_at=NOW - timedelta(hours=1),
+                recent_published_at=[
+                    (NOW - timedelta(days=days, hours=12)).isoformat() for days in range(1, 4)
+                ],
+                fetch_count=2,
+                not_modified_count=0,
+                consecutive_failures=0,
+            ),
+        ]
+    )
+    db_session.commit()
+
+    plans = schedule_feed_scrapes(now=NOW)
+    schedule_feed_scrapes(now=NOW)
+
+    next_poll_by_url = {plan.feed_url: plan.next_poll_at for plan in plans}
+    # Daily cadence -> 6 hour interval from the last fetch.
+    assert next_poll_by_url[feed_url] == NOW + timedelta(hours=5)
+    # Never fetched -> poll now.
+    assert next_poll_by_url[new_feed_url] == NOW
+
+    tasks = (
+        db_session.query(ProcessingTask)
+        .filter(ProcessingTask.task_type == TaskType.SCRAPE.value)
+        .order_by(ProcessingTask.id)
+        .all()
+    )
+    assert len(tasks) == 2
+    assert all(task.status == TaskStatus.PENDING.value for task in tasks)
+    payload_by_url = {task.payload["feed_urls"][0]: task for task in tasks}
+    assert payload_by_url[feed_url].payload["sources"] == ["Substack"]
+    assert payload_by_url[feed_url].available_at == NOW + timedelta(hours=5)
+    assert payload_by_url[new_feed_url].payload["sources"] == ["Podcast"]
@@ -34,7 +34,9 @@ def test_http_gateway_forwards_calls_and_close():
     assert gateway.robust_get("https://example.com", follow_redirects=False) is robust_response
     assert gateway.robust_head("https://example.com") is robust_response
 
-    http_service.fetch_content.assert_called_once_with("https://example.com", headers=None)
+    http_service.fetch_content.assert_called_once_with(
+        "https://example.com", headers=None, cache_stage=None
+    )
     http_service.fetch.assert_called_once_with("https://example.com", headers=None)
     http_service.head.assert_called_once_with(
         "https://example.com",
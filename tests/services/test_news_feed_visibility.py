@@ -15,6 +15,8 @@ from app.models.contracts import NewsItemStatus, NewsItemVisibilityScope
 from app.models.schema import NewsItem, UserScraperConfig
 from app.services.news_feed import (
     count_unread_news_items,
+    get_news_visibility_descriptor,
+    invalidate_news_visibility_descriptor,
     list_visible_news_items,
 )
 
@@ -88,6 +90,8 @@ def _add_aggregator_subscription(
     )
     db_session.add(row)
     db_session.commit()
+    # Direct inserts bypass the scraper-config service, which normally invalidates.
+    invalidate_news_visibility_descriptor(user_id)
     return row
 
 
@@ -206,3 +210,35 @@ def test_visibility_paginates_all_visible_feed_items(
     # Most-recent-first: pagination reaches the oldest visible item.
     assert fetched_titles[0] == f"Story {item_count - 1}"
     assert fetched_titles[-1] == "Story 0"
+
+
+def test_visibility_descriptor_is_cached_until_scraper_config_changes(
+    db_session, test_user, monkeypatch
+) -> None:
+    from app.services import news_feed
+    from app.services.scraper_configs import delete_user_scraper_config
+
+    user_id = test_user.id
+    assert user_id is not None
+    subscription = _add_aggregator_subscription(db_session, user_id=user_id, key="hackernews")
+
+    lookups: list[int] = []
+    original_lookup = news_feed._user_aggregator_subscriptions
+
+    def _counting_lookup(db, *, user_id: int) -> dict[str, list[str]]:
+        lookups.append(user_id)
+        return original_lookup(db, user_id=user_id)
+
+    monkeypatch.setattr(news_feed, "_user_aggregator_subscriptions", _counting_lookup)
+
+    first = get_news_visibility_descriptor(db_session, user_id=user_id)
+    count_unread_news_items(db_session, user_id=user_id)
+    list_visible_news_items(db_session, user_id=user_id, read_filter="all", cursor=None, limit=5)
+    assert first.aggregator_selections == {"hackernews": []}
+    assert lookups == [user_id]
+
+    assert subscription.id is not None
+    delete_user_scraper_config(db_session, user_id, subscription.id)
+
+    assert get_news_visibility_descriptor(db_session, user_id=user_id).aggregator_selections == {}
+    assert lookups == [user_id, user_id]
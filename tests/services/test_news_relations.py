@@ -9,7 +9,7 @@ import numpy as np
 import pytest
 
 from app.core.settings import get_settings
-from app.models.schema import NewsItem, NewsItemReadStatus
+from app.models.schema import NewsItem, NewsItemEmbedding, NewsItemReadStatus
 from app.services.news_feed import count_unread_news_items
 from app.services.news_relations import (
     SEMANTIC_PREFILTER_MAX_CANDIDATES,
@@ -826,3 +826,106 @@ def test_reconcile_news_item_relation_caps_semantic_prefilter_candidates(
 
     assert call_lengths
     assert max(call_lengths) == SEMANTIC_PREFILTER_MAX_CANDIDATES + 1
+
+
+def test_reconcile_news_item_relation_reuses_stored_candidate_vectors(
+    db_session,
+    monkeypatch,
+) -> None:
+    calls: list[list[str]] = []
+    text_slots: dict[str, int] = {}
+
+    def fake_encode(texts: list[str]) -> np.ndarray:
+        calls.append(list(texts))
+        vectors = np.zeros((len(texts), 32), dtype=float)
+        for row, text in enumerate(texts):
+            vectors[row, text_slots.setdefault(text, len(text_slots))] = 1.0
+        return vectors
+
+    monkeypatch.setattr("app.services.news_relations.encode_news_texts", fake_encode)
+
+    first = _news_item(
+        db_session,
+        ingest_key="stored-first",
+        source_external_id="900",
+        title="OpenAI coding agent launch report",
+        story_url="https://example.com/story-900",
+    )
+    second = _news_item(
+        db_session,
+        ingest_key="stored-second",
+        source_external_id="901",
+        title="OpenAI coding agent pricing details",
+        story_url="https://example.com/story-901",
+    )
+    reconcile_news_item_relation(db_session, news_item_id=_require_id(second.id))
+    assert any(len(texts) > 1 for texts in calls)
+
+    third = _news_item(
+        db_session,
+        ingest_key="stored-third",
+        source_external_id="902",
+        title="OpenAI coding agent enterprise rollout",
+        story_url="https://example.com/story-902",
+    )
+    calls.clear()
+    reconcile_news_item_relation(db_session, news_item_id=_require_id(third.id))
+    db_session.commit()
+
+    db_session.refresh(third)
+    assert third.representative_news_item_id is None
+    assert calls
+    assert all(len(texts) == 1 for texts in calls)
+    stored_item_ids = {
+        row.news_item_id
+        for row in db_session.query(NewsItemEmbedding).filter(NewsItemEmbedding.view == "title")
+    }
+    assert stored_item_ids == {
+        _require_id(first.id),
+        _require_id(second.id),
+        _require_id(third.id),
+    }
+
+
+def test_reconcile_news_item_relation_replaces_vectors_after_shape_change(
+    db_session,
+    monkeypatch,
+) -> None:
+    width = {"value": 32}
+    calls: list[list[str]] = []
+    text_slots: dict[str, int] = {}
+
+    def fake_encode(texts: list[str]) -> np.ndarray:
+        calls.append(list(texts))
+        vectors = np.zeros((len(texts), width["value"]), dtype=float)
+        for row, text in enumerate(texts):
+            vectors[row, text_slots.setdefault(text, len(text_slots)) % width["value"]] = 1.0
+        return vectors
+
+    monkeypatch.setattr("app.services.news_relations.encode_news_texts", fake_encode)
+
+    _news_item(
+        db_session,
+        ingest_key="reshape-first",
+        source_external_id="910",
+        title="OpenAI coding agent launch report",
+        story_url="https://example.com/story-910",
+    )
+    second = _news_item(
+        db_session,
+        ingest_key="reshape-second",
+        source_external_id="911",
+        title="OpenAI coding agent pricing details",
+        story_url="https://example.com/story-911",
+    )
+    reconcile_news_item_relation(db_session, news_item_id=_require_id(second.id))
+
+    width["value"] = 16
+    reconcile_news_item_relation(db_session, news_item_id=_require_id(second.id))
+    db_session.commit()
+    assert {row.dimensions for row in db_session.query(NewsItemEmbedding)} == {16}
+
+    calls.clear()
+    reconcile_news_item_relation(db_session, news_item_id=_require_id(second.id))
+    assert calls
+    assert all(len(texts) == 1 for texts in calls)
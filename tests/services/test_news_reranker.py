@@ -0,0 +1,96 @@
+"""Tests for cached and coalesced news reranker scoring."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from app.models.schema import NewsRerankerScore
+from app.services import news_reranker
+
+
+@pytest.fixture
+def reranker_db(route_get_db, monkeypatch):
+    """Route persisted score reads and writes to the current test database."""
+    session_factory = route_get_db(news_reranker)
+    monkeypatch.setattr(news_reranker, "resolve_transformer_device", lambda _device: "cpu")
+    news_reranker.clear_news_reranker_cache()
+    yield session_factory
+    news_reranker.clear_news_reranker_cache()
+
+
+def test_rerank_news_documents_reuses_memory_and_persisted_scores(
+    monkeypatch,
+    reranker_db,
+) -> None:
+    scored_batches: list[list[str]] = []
+
+    def _fake_score(pairs: list[str]) -> list[float]:
+        scored_batches.append(list(pairs))
+        return [0.25 if "second" in pair else 0.75 for pair in pairs]
+
+    monkeypatch.setattr(news_reranker, "score_news_reranker_pairs", _fake_score)
+
+    first = news_reranker.rerank_news_documents(
+        query="Title: launch",
+        documents=["Title: first", "Title: second", "Title: first"],
+    )
+    assert first == [0.75, 0.25, 0.75]
+    assert len(scored_batches) == 1
+    assert len(scored_batches[0]) == 2
+
+    news_reranker.rerank_news_documents(query="Title: launch", documents=["Title: second"])
+    assert len(scored_batches) == 1
+
+    news_reranker.clear_news_reranker_cache()
+    persisted = news_reranker.rerank_news_documents(
+        query="Title: launch",
+        documents=["Title: first"],
+    )
+    assert persisted == [0.75]
+    assert len(scored_batches) == 1
+    with reranker_db() as session:
+        assert session.query(NewsRerankerScore).count() == 2
+
+
+def test_rerank_coalescer_merges_concurrent_requests(monkeypatch) -> None:
+    batch_sizes: list[int] = []
+    leader_started = threading.Event()
+    release_leader = threading.Event()
+
+    def _fake_score(pairs: list[str]) -> list[float]:
+        batch_sizes.append(len(pairs))
+        if len(batch_sizes) == 1:
+            leader_started.set()
+            release_leader.wait(timeout=5)
+        return [float(len(pair)) for pair in pairs]
+
+    monkeypatch.setattr(news_reranker, "score_news_reranker_pairs", _fake_score)
+    coalescer = news_reranker._RerankCoalescer()
+    results: dict[str, list[float]] = {}
+
+    def _run(name: str, pairs: list[str]) -> None:
+        results[name] = coalescer.score(pairs)
+
+    leader = threading.Thread(target=_run, args=("leader", ["a"]))
+    leader.start()
+    assert leader_started.wait(timeout=5)
+    followers = [
+        threading.Thread(target=_run, args=(f"follower-{index}", ["bb", "ccc"]))
+        for index in range(3)
+    ]
+    for follower in followers:
+        follower.start()
+    deadline = time.monotonic() + 5
+    while len(coalescer._pending) < len(followers) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release_leader.set()
+    for thread in [leader, *followers]:
+        thread.join(timeout=5)
+
+    assert results["leader"] == [1.0]
+    assert all(results[f"follower-{index}"] == [2.0, 3.0] for index in range(3))
+    assert batch_sizes[0] == 1
+    assert sum(batch_sizes[1:]) == 2
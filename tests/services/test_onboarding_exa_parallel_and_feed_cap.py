@@ -91,7 +91,8 @@ def test_run_discovery_exa_queries_uses_query_metadata(monkeypatch) -> None:
             )
         ]
 
-    monkeypatch.setattr("app.services.onboarding.exa_search", fake_exa_search)
+    monkeypatch.setattr("app.services.gateways.exa_gateway.exa_search", fake_exa_search)
+    monkeypatch.setattr("app.services.gateways.exa_gateway.get_exa_client", object)
 
     queries = ["whales feed", "parks feed", "legaltech feed"]
     results = _run_discovery_exa_queries(
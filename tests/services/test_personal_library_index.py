@@ -0,0 +1,90 @@
+"""Tests for the persistent personal library search index."""
+
+from pathlib import Path
+
+from app.services.personal_library_index import (
+    INDEX_FILENAME,
+    load_personal_library_index,
+    search_personal_library,
+    update_personal_library_index,
+)
+from app.services.sandbox_runtime import LocalPersonalLibrarySandboxSession
+
+
+def _write(root: Path, relative_path: str, text: str) -> Path:
+    path = root / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_search_builds_index_once_and_ranks_best_file_first(tmp_path: Path) -> None:
+    _write(tmp_path, "articles/kubernetes-notes__c1.md", "# Notes\nKubernetes scheduling tips\n")
+    _write(tmp_path, "articles/cooking__c2.md", "Pasta recipe\nNothing about clusters\n")
+    _write(tmp_path, "articles/ops__c3.md", "Mentions kubernetes once\n")
+
+    hits = search_personal_library(
+        tmp_path,
+        query="kubernetes scheduling",
+        terms=["kubernetes", "scheduling"],
+    )
+
+    assert (tmp_path / INDEX_FILENAME).exists()
+    assert hits == [
+        "articles/kubernetes-notes__c1.md:2:Kubernetes scheduling tips",
+        "articles/ops__c3.md:1:Mentions kubernetes once",
+    ]
+
+
+def test_update_applies_writes_and_removals_incrementally(tmp_path: Path) -> None:
+    first = _write(tmp_path, "a/first__c1.md", "alpha topic\n")
+    load_personal_library_index(tmp_path)
+
+    first.unlink()
+    second = _write(tmp_path, "a/second__c2.md", "alpha topic again\n")
+    update_personal_library_index(tmp_path, written=[second], removed=[first])
+
+    assert sorted(load_personal_library_index(tmp_path).files) == ["a/second__c2.md"]
+    assert search_personal_library(tmp_path, query="alpha", terms=["alpha"]) == [
+        "a/second__c2.md:1:alpha topic again"
+    ]
+
+
+def test_local_sandbox_search_drops_files_deleted_since_indexing(tmp_path: Path) -> None:
+    _write(tmp_path, "a/keep__c1.md", "retrieval augmented generation\n")
+    stale = _write(tmp_path, "a/stale__c2.md", "retrieval notes\n")
+    session = LocalPersonalLibrarySandboxSession(library_root=tmp_path)
+    session.search_files(query="retrieval")
+
+    stale.unlink()
+
+    assert session.search_files(query="retrieval") == (
+        "a/keep__c1.md:1:retrieval augmented generation"
+    )
+    assert "a/stale__c2.md" not in load_personal_library_index(tmp_path).files
+
+
+def test_search_matches_query_terms_as_prefixes(tmp_path: Path) -> None:
+    _write(tmp_path, "a/vectors__c1.md", "Notes\nText embeddings for retrieval\n")
+    _write(tmp_path, "a/embed__c2.md", "How to embed a video\n")
+
+    hits = search_personal_library(tmp_path, query="embed", terms=["embed"])
+
+    assert hits == [
+        "a/embed__c2.md:1:How to embed a video",
+        "a/vectors__c1.md:2:Text embeddings for retrieval",
+    ]
+
+
+def test_update_does_not_mutate_index_held_by_readers(tmp_path: Path) -> None:
+    _write(tmp_path, "a/first__c1.md", "alpha topic\n")
+    reader_index = load_personal_library_index(tmp_path)
+
+    second = _write(tmp_path, "a/second__c2.md", "beta topic\n")
+    update_personal_library_index(tmp_path, written=[second])
+
+    assert sorted(reader_index.files) == ["a/first__c1.md"]
+    assert sorted(load_personal_library_index(tmp_path).files) == [
+        "a/first__c1.md",
+        "a/second__c2.md",
+    ]
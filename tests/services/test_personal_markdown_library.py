@@ -1,5 +1,7 @@
 """Tests for the per-user personal markdown library."""
 
+import json
+import threading
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -11,6 +13,7 @@ from app.services.content_bodies import ContentBodyFormat, ContentBodyVariant
 from app.services.gateways import object_storage_gateway
 from app.services.personal_markdown_library import (
     _resolve_saved_at,
+    _save_manifest,
     collect_personal_markdown_documents_for_user,
     get_personal_markdown_user_root,
     sync_personal_markdown_for_content,
@@ -349,3 +352,71 @@ def test_collect_personal_markdown_documents_supports_mixed_types_and_reasons(
     assert "- saved_to_knowledge" in article_document.text
     assert "- chatted" in podcast_document.text
     assert "source: BG2 Pod" in podcast_document.text
+
+
+def test_sync_personal_markdown_library_only_rewrites_changed_content(
+    db_session,
+    test_user,
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    _enable_personal_markdown(monkeypatch, tmp_path)
+
+    article = _make_content()
+    podcast = _make_podcast_content()
+    _persist_content(db_session, article, podcast)
+    article_id = _require_id(article.id)
+    podcast_id = _require_id(podcast.id)
+    user_id = _require_id(test_user.id)
+
+    knowledge_repository.save_to_knowledge(db_session, article_id, user_id)
+    knowledge_repository.save_to_knowledge(db_session, podcast_id, user_id)
+
+    first = sync_personal_markdown_library_for_user(db_session, user_id=user_id)
+    assert first.written_files
+    assert (get_personal_markdown_user_root(user_id) / ".manifest.json").exists()
+
+    unchanged = sync_personal_markdown_library_for_user(db_session, user_id=user_id)
+    assert unchanged.written_files == []
+    assert unchanged.deleted_files == []
+
+    article.title = "How Agents Really Work"
+    db_session.commit()
+
+    changed = sync_personal_markdown_library_for_user(db_session, user_id=user_id)
+    assert {path.name for path in changed.written_files} == {
+        f"how-agents-really-work__2026-04-03__source__c{article_id}.md",
+        f"how-agents-really-work__2026-04-03__summary__c{article_id}.md",
+    }
+    assert not list(get_personal_markdown_user_root(user_id).rglob("how-agents-work__*"))
+
+    podcast_file = next(path for path in first.written_files if f"__c{podcast_id}" in path.name)
+    podcast_file.unlink()
+
+    repaired = sync_personal_markdown_library_for_user(db_session, user_id=user_id)
+    assert podcast_file in repaired.written_files
+    assert all(f"__c{podcast_id}" in path.name for path in repaired.written_files)
+
+
+def test_save_manifest_uses_unique_temp_files_across_threads(tmp_path: Path) -> None:
+    """Concurrent manifest writers in one process never share a temp file."""
+    barrier = threading.Barrier(4)
+    errors: list[BaseException] = []
+
+    def _write(content_id: int) -> None:
+        barrier.wait()
+        try:
+            for _ in range(20):
+                _save_manifest(tmp_path, {content_id: {"checksum": str(content_id), "files": []}})
+        except BaseException as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_write, args=(content_id,)) for content_id in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(json.loads((tmp_path / ".manifest.json").read_text())["contents"]) == 1
+    assert list(tmp_path.glob("*.tmp")) == []
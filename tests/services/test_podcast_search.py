@@ -1,9 +1,23 @@
 from __future__ import annotations
 
-from app.models.schema import VendorUsageRecord
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.schema import PodcastSearchProviderState, VendorUsageRecord
 from app.services.podcast_search import PodcastEpisodeSearchHit, search_podcast_episodes
 
 
+@pytest.fixture
+def podcast_search_db(route_get_db):
+    """Route shared cache and circuit-state writes to the current test database."""
+    from app.services import podcast_search
+
+    route_get_db(podcast_search)
+    podcast_search._SEARCH_CACHE.clear()
+
+
 def _build_hit(
     *,
     title: str,
@@ -25,11 +39,10 @@ def _build_hit(
     )
 
 
-def test_search_podcast_episodes_merges_and_dedupes(monkeypatch):
+def test_search_podcast_episodes_merges_and_dedupes(monkeypatch, podcast_search_db):
     from app.services import podcast_search
 
-    podcast_search._SEARCH_CACHE.clear()
-    podcast_search._PROVIDER_STATES.clear()
+    del podcast_search_db
 
     monkeypatch.setattr(
         podcast_search,
@@ -89,11 +102,10 @@ def test_search_podcast_episodes_merges_and_dedupes(monkeypatch):
     assert hits[1].provider == "spotify"
 
 
-def test_search_podcast_episodes_short_query_returns_empty(monkeypatch):
+def test_search_podcast_episodes_short_query_returns_empty(monkeypatch, podcast_search_db):
     from app.services import podcast_search
 
-    podcast_search._SEARCH_CACHE.clear()
-    podcast_search._PROVIDER_STATES.clear()
+    del podcast_search_db
 
     called = False
 
@@ -114,6 +126,77 @@ def test_search_podcast_episodes_short_query_returns_empty(monkeypatch):
     assert called is False
 
 
+def test_search_podcast_episodes_returns_at_deadline_and_shares_cache(
+    monkeypatch,
+    db_session,
+    podcast_search_db,
+):
+    from app.services import podcast_search
+
+    del podcast_search_db
+    release_slow_provider = threading.Event()
+    calls: list[str] = []
+
+    def _fast_provider(_query: str, _limit: int):
+        calls.append("listen_notes")
+        return [
+            _build_hit(
+                title="Deadline episode",
+                url="https://example.fm/episodes/deadline",
+                provider="listen_notes",
+                score=0.95,
+            )
+        ]
+
+    def _slow_provider(_query: str, _limit: int):
+        release_slow_provider.wait(timeout=5)
+        return []
+
+    def _failing_provider(_query: str, _limit: int):
+        raise RuntimeError("provider down")
+
+    monkeypatch.setattr(podcast_search, "_search_listen_notes", _fast_provider)
+    monkeypatch.setattr(podcast_search, "_search_spotify", _slow_provider)
+    monkeypatch.setattr(podcast_search, "_search_apple_itunes", _failing_provider)
+    monkeypatch.setattr(podcast_search, "_search_podcast_index", lambda _query, _limit: [])
+    monkeypatch.setattr(podcast_search, "_search_exa", lambda _query, _limit: [])
+    real_settings = podcast_search.get_settings()
+    monkeypatch.setattr(
+        podcast_search,
+        "get_settings",
+        lambda: SimpleNamespace(
+            **{
+                name: getattr(real_settings, name)
+                for name in (
+                    "podcast_search_cache_ttl_seconds",
+                    "podcast_search_circuit_breaker_failures",
+                    "podcast_search_circuit_breaker_cooldown_seconds",
+                    "podcast_search_early_return_min_score",
+                )
+            },
+            podcast_search_deadline_seconds=0.2,
+        ),
+    )
+
+    try:
+        hits = search_podcast_episodes("deadline episode", limit=5)
+    finally:
+        release_slow_provider.set()
+
+    assert [hit.provider for hit in hits] == ["listen_notes"]
+    state = db_session.get(PodcastSearchProviderState, "apple_itunes")
+    assert state is not None
+    assert state.failures == 1
+
+    monkeypatch.setattr(podcast_search, "_search_spotify", lambda _query, _limit: [])
+    search_podcast_episodes("deadline episode", limit=5)
+    podcast_search._SEARCH_CACHE.clear()
+    cached_hits = search_podcast_episodes("deadline episode", limit=5)
+
+    assert [hit.episode_url for hit in cached_hits] == ["https://example.fm/episodes/deadline"]
+    assert calls == ["listen_notes", "listen_notes"]
+
+
 def test_search_listen_notes_records_vendor_usage(
     db_session,
     vendor_usage_db,
@@ -7,7 +7,7 @@ from types import SimpleNamespace
 import pytest
 
 from app.models.schema import ProcessingTask
-from app.services.queue import QueueService, TaskQueue, TaskStatus, TaskType
+from app.services.queue import QueueService, TaskOutcome, TaskQueue, TaskStatus, TaskType
 
 
 def _patch_db(monkeypatch, db_session) -> QueueService:
@@ -523,3 +523,128 @@ def test_dequeue_rotates_retry_buckets(db_session, monkeypatch):
     assert second is not None
     assert first["id"] == retry_zero_oldest.id
     assert second["id"] == retry_one_task.id
+
+
+def test_dequeue_batch_interleaves_retry_buckets(db_session, monkeypatch):
+    """Batch claims take the oldest task of each retry bucket before seconds."""
+    queue = _patch_db(monkeypatch, db_session)
+    now = datetime.now(UTC).replace(tzinfo=None)
+
+    def _pending(retry_count: int, minutes_ago: int) -> ProcessingTask:
+        return ProcessingTask(
+            task_type=TaskType.SUMMARIZE.value,
+            status=TaskStatus.PENDING.value,
+            payload={},
+            queue_name=TaskQueue.CONTENT.value,
+            retry_count=retry_count,
+            created_at=now - timedelta(minutes=minutes_ago),
+            available_at=now - timedelta(minutes=minutes_ago),
+        )
+
+    first_attempts = [_pending(0, minutes) for minutes in (30, 25, 20, 15)]
+    retry = _pending(2, 1)
+    other_queue = ProcessingTask(
+        task_type=TaskType.SCRAPE.value,
+        status=TaskStatus.PENDING.value,
+        payload={},
+        queue_name=TaskQueue.ONBOARDING.value,
+        created_at=now - timedelta(hours=1),
+    )
+    db_session.add_all([*first_attempts, retry, other_queue])
+    db_session.commit()
+
+    claimed = queue.dequeue_batch("worker-a", TaskQueue.CONTENT, 3)
+
+    assert [task["id"] for task in claimed] == [
+        first_attempts[0].id,
+        first_attempts[1].id,
+        retry.id,
+    ]
+    for task in claimed:
+        assert task["status"] == TaskStatus.PROCESSING.value
+        assert task["locked_by"] == "worker-a"
+        assert task["lease_expires_at"] is not None
+
+    remaining = queue.dequeue_batch("worker-b", TaskQueue.CONTENT, 10)
+    assert [task["id"] for task in remaining] == [first_attempts[2].id, first_attempts[3].id]
+    assert queue.dequeue_batch("worker-c", TaskQueue.CONTENT, 10) == []
+
+
+def test_finalize_batch_applies_each_outcome(db_session, monkeypatch):
+    """Batch finalization completes, retries, and fails tasks in one transaction."""
+    queue = _patch_db(monkeypatch, db_session)
+    tasks = [
+        ProcessingTask(
+            task_type=TaskType.SUMMARIZE.value,
+            payload={},
+            status=TaskStatus.PROCESSING.value,
+            queue_name=TaskQueue.CONTENT.value,
+            retry_count=retry_count,
+            locked_by="worker-a",
+        )
+        for retry_count in (0, 0, 3)
+    ]
+    db_session.add_all(tasks)
+    db_session.commit()
+    succeeded, retried, exhausted = tasks
+
+    transitions = queue.finalize_batch(
+        [
+            TaskOutcome(task_id=succeeded.id, success=True),
+            TaskOutcome(
+                task_id=retried.id,
+                success=False,
+                error_message="timeout",
+                retry_delay_seconds=60,
+            ),
+            TaskOutcome(
+                task_id=exhausted.id,
+                success=False,
+                error_message="still broken",
+                current_retry_count=3,
+            ),
+            TaskOutcome(task_id=999_999, success=True),
+        ],
+        max_retries=3,
+    )
+
+    for task in tasks:
+        db_session.refresh(task)
+        assert task.locked_by is None
+    assert succeeded.status == TaskStatus.COMPLETED.value
+    assert retried.status == TaskStatus.PENDING.value
+    assert retried.retry_count == 1
+    assert retried.error_message == "timeout"
+    assert exhausted.status == TaskStatus.FAILED.value
+    assert transitions[retried.id]["retry_delay_seconds"] == 60
+    assert transitions[999_999] is None
+
+
+def test_enqueue_content_tasks_inserts_batch_and_skips_active_duplicates(db_session, monkeypatch):
+    """Batch enqueue inserts one row per new task and respects content dedupe."""
+    queue = _patch_db(monkeypatch, db_session)
+    existing_task_id = queue.enqueue(TaskType.PROCESS_CONTENT, content_id=1)
+
+    task_ids = queue.enqueue_content_tasks(
+        [
+            (TaskType.PROCESS_CONTENT, 1),
+            (TaskType.PROCESS_CONTENT, 2),
+            (TaskType.PROCESS_CONTENT, 2),
+            (TaskType.FETCH_DISCUSSION, 2),
+        ]
+    )
+
+    assert len(task_ids) == 2
+    assert existing_task_id not in task_ids
+    rows = (
+        db_session.query(ProcessingTask)
+        .filter(ProcessingTask.id.in_(task_ids))
+        .order_by(ProcessingTask.id)
+        .all()
+    )
+    assert [(row.task_type, row.content_id) for row in rows] == [
+        (TaskType.PROCESS_CONTENT.value, 2),
+        (TaskType.FETCH_DISCUSSION.value, 2),
+    ]
+    assert all(row.status == TaskStatus.PENDING.value for row in rows)
+    assert all(row.queue_name == TaskQueue.CONTENT.value for row in rows)
@@ -0,0 +1,97 @@
+"""Tests for the cross-stage raw page cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import httpx
+
+from app.services import raw_page_cache
+from app.services.raw_page_cache import RawPageCache
+
+
+def _html_response(url: str, body: str, *, final_url: str | None = None) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={"content-type": "text/html; charset=utf-8", "set-cookie": "session=1"},
+        content=body.encode("utf-8"),
+        request=httpx.Request("GET", final_url or url),
+    )
+
+
+def _age_entries(cache: RawPageCache, seconds: float) -> None:
+    for entry_path in (cache.root / "entries").glob("*.json"):
+        entry = json.loads(entry_path.read_text())
+        entry["fetched_at"] -= seconds
+        entry_path.write_text(json.dumps(entry))
+
+
+def test_cached_page_is_shared_across_redirect_aliases(tmp_path) -> None:
+    cache = RawPageCache(tmp_path, ttl_seconds=3_600, max_bytes=1_000_000)
+    response = _html_response(
+        "http://example.com/post#top",
+        "<html>Story</html>",
+        final_url="https://www.example.com/post",
+    )
+
+    cache.put_response(response, url="http://example.com/post#top")
+
+    page = cache.get("https://example.com/post", stage=raw_page_cache.STAGE_ANALYZE_URL)
+    assert page is not None
+    assert page.text == "<html>Story</html>"
+    assert page.final_url == "https://www.example.com/post"
+    assert "set-cookie" not in page.headers
+    alias = cache.get("https://www.example.com/post", stage=raw_page_cache.STAGE_FEED_DETECTION)
+    assert alias is not None
+    assert len(list((tmp_path / "bodies").iterdir())) == 1
+
+
+def test_stages_apply_their_own_freshness(tmp_path) -> None:
+    cache = RawPageCache(tmp_path, ttl_seconds=3_600, max_bytes=1_000_000)
+    url = "https://example.com/a"
+    cache.put_response(_html_response(url, "<html>A</html>"), url=url)
+
+    _age_entries(cache, raw_page_cache.STAGE_MAX_AGE_SECONDS["html_extraction"] + 1)
+
+    assert cache.get(url, stage=raw_page_cache.STAGE_HTML_EXTRACTION) is None
+    assert cache.get(url, stage=raw_page_cache.STAGE_FEED_DETECTION) is not None
+
+
+def test_credentialed_requests_bypass_cache(tmp_path) -> None:
+    cache = RawPageCache(tmp_path, ttl_seconds=3_600, max_bytes=1_000_000)
+    url = "https://example.com/private"
+
+    cache.put_response(
+        _html_response(url, "<html>Mine</html>"),
+        url=url,
+        request_headers={"Cookie": "session=1"},
+    )
+
+    assert cache.get(url, stage=raw_page_cache.STAGE_ANALYZE_URL) is None
+    assert not (tmp_path / "entries").exists()
+
+
+def test_sweep_evicts_least_recently_used_pages_over_budget(tmp_path) -> None:
+    cache = RawPageCache(tmp_path, ttl_seconds=3_600, max_bytes=250)
+    for name in ("old", "used", "new"):
+        url = f"https://example.com/{name}"
+        cache.put_response(_html_response(url, name * 40), url=url)
+
+    past = time.time() - 2 * raw_page_cache.SWEEP_INTERVAL_SECONDS
+    for index, path in enumerate(sorted((tmp_path / "bodies").iterdir())):
+        os.utime(path, (past + index, past + index))
+    for name, offset in (("old", 0), ("used", 1), ("new", 2)):
+        key = raw_page_cache._cache_key(f"https://example.com/{name}", None)
+        entry_path = tmp_path / "entries" / f"{key}.json"
+        os.utime(entry_path, (past + offset, past + offset))
+    # Reading "old" makes it more recently used than "used".
+    assert cache.get("https://example.com/old", stage=raw_page_cache.STAGE_ANALYZE_URL)
+
+    cache.sweep()
+
+    assert cache.get("https://example.com/used", stage=raw_page_cache.STAGE_ANALYZE_URL) is None
+    assert cache.get("https://example.com/old", stage=raw_page_cache.STAGE_ANALYZE_URL)
+    assert cache.get("https://example.com/new", stage=raw_page_cache.STAGE_ANALYZE_URL)
+    assert len(list((tmp_path / "bodies").iterdir())) == 2
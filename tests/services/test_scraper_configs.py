@@ -1,6 +1,7 @@
 from app.models.metadata import ContentStatus, ContentType
 from app.models.schema import Content, ContentStatusEntry
-from app.services.scraper_configs import ensure_inbox_status
+from app.constants import CONTENT_STATUS_DIGEST_SOURCE
+from app.services.scraper_configs import ensure_inbox_status, ensure_inbox_statuses
 
 
 def test_ensure_inbox_status_allows_news(db_session, test_user) -> None:
@@ -34,3 +35,50 @@ def test_ensure_inbox_status_allows_news(db_session, test_user) -> None:
         .first()
     )
     assert status_row is not None
+
+
+def test_ensure_inbox_statuses_adds_and_promotes_in_one_pass(db_session, test_user) -> None:
+    contents = [
+        Content(
+            url=f"https://example.com/batch-{index}",
+            content_type=ContentType.ARTICLE.value,
+            status=ContentStatus.COMPLETED.value,
+            content_metadata={},
+        )
+        for index in range(3)
+    ]
+    db_session.add_all(contents)
+    db_session.commit()
+    inbox, digest, new = (content.id for content in contents)
+    db_session.add_all(
+        [
+            ContentStatusEntry(user_id=test_user.id, content_id=inbox, status="inbox"),
+            ContentStatusEntry(
+                user_id=test_user.id,
+                content_id=digest,
+                status=CONTENT_STATUS_DIGEST_SOURCE,
+            ),
+        ]
+    )
+    db_session.commit()
+
+    added = ensure_inbox_statuses(
+        db_session,
+        [
+            (test_user.id, inbox, "article"),
+            (test_user.id, digest, "article"),
+            (test_user.id, new, "article"),
+            (test_user.id, new, "article"),
+            (None, new, "article"),
+        ],
+    )
+    db_session.commit()
+
+    assert added == {(test_user.id, digest), (test_user.id, new)}
+    statuses = {
+        row.content_id: row.status
+        for row in db_session.query(ContentStatusEntry).filter(
+            ContentStatusEntry.user_id == test_user.id
+        )
+    }
+    assert statuses == {inbox: "inbox", digest: "inbox", new: "inbox"}
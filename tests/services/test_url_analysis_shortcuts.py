@@ -0,0 +1,174 @@
+"""Tests for skipping LLM URL analysis on settled URLs."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.internal.content_analyzer import ContentAnalysisOutput, ContentAnalysisResult
+from app.models.metadata import ContentStatus, ContentType
+from app.models.schema import Content, UrlAnalysisPattern
+from app.pipeline.handlers import analyze_url
+from app.pipeline.handlers.analyze_url import UrlAnalysisFlow
+from app.processing_strategies.registry import StrategyRegistry
+from app.repositories import url_analysis_pattern_repository
+from app.services import url_analysis_shortcuts
+from app.services.url_analysis_shortcuts import (
+    find_url_analysis_shortcut,
+    record_url_analysis,
+    url_path_shape,
+)
+
+
+@pytest.fixture
+def pattern_db(route_get_db):
+    """Route out-of-band pattern writes to the current test database."""
+    return route_get_db(url_analysis_pattern_repository)
+
+
+@pytest.fixture(scope="module")
+def strategy_registry() -> StrategyRegistry:
+    return StrategyRegistry()
+
+
+def _analysis(url: str, **overrides) -> ContentAnalysisResult:
+    fields = {"original_url": url, "content_type": "article", "platform": "substack"}
+    fields.update(overrides)
+    return ContentAnalysisResult(**fields)
+
+
+def _content(db_session, url: str) -> Content:
+    content = Content(
+        content_type=ContentType.ARTICLE.value,
+        url=url,
+        status=ContentStatus.NEW.value,
+        content_metadata={},
+    )
+    db_session.add(content)
+    db_session.commit()
+    db_session.refresh(content)
+    return content
+
+
+def test_url_path_shape_collapses_ids_and_slugs() -> None:
+    assert url_path_shape("https://www.example.com/2024/05/my-first-post") == (
+        "example.com",
+        "/{n}/{n}/{slug}",
+    )
+    assert url_path_shape("https://writer.substack.com/p/why-this-matters?utm=x") == (
+        "writer.substack.com",
+        "/p/{slug}",
+    )
+    assert url_path_shape("https://example.com/posts/a1b2c3d4e5.html") == (
+        "example.com",
+        "/posts/{id}.html",
+    )
+
+
+def test_strategy_match_settles_analysis(db_session, strategy_registry) -> None:
+    shortcut = find_url_analysis_shortcut(
+        db_session,
+        "https://news.ycombinator.com/item?id=123",
+        strategy_registry=strategy_registry,
+    )
+
+    assert shortcut is not None
+    assert shortcut.source == "strategy"
+    assert shortcut.content_type == ContentType.ARTICLE
+    assert shortcut.platform == "hackernews"
+    assert (
+        find_url_analysis_shortcut(
+            db_session,
+            "https://example.com/some-post",
+            strategy_registry=strategy_registry,
+        )
+        is None
+    )
+
+
+def test_learned_shortcut_needs_an_agreeing_streak(
+    db_session,
+    pattern_db,
+    strategy_registry,
+    monkeypatch,
+) -> None:
+    settings = url_analysis_shortcuts.get_settings()
+    monkeypatch.setattr(settings, "url_analysis_pattern_min_streak", 2)
+    monkeypatch.setattr(settings, "url_analysis_pattern_min_observations", 4)
+    monkeypatch.setattr(settings, "url_analysis_pattern_verify_rate", 0.0)
+    target = "https://writer.substack.com/p/next-post"
+
+    record_url_analysis("https://writer.substack.com/p/first-post", _analysis("a"))
+    record_url_analysis(
+        "https://writer.substack.com/p/episode-one",
+        _analysis("b", content_type="podcast", media_url="https://cdn.example.com/1.mp3"),
+    )
+    record_url_analysis("https://writer.substack.com/p/second-post", _analysis("c"))
+    assert (
+        find_url_analysis_shortcut(db_session, target, strategy_registry=strategy_registry)
+        is None
+    )
+
+    record_url_analysis("https://writer.substack.com/p/third-post", _analysis("d"))
+    shortcut = find_url_analysis_shortcut(db_session, target, strategy_registry=strategy_registry)
+
+    assert shortcut is not None
+    assert shortcut.source == "learned"
+    assert shortcut.platform == "substack"
+
+    db_session.expire_all()
+    pattern = db_session.query(UrlAnalysisPattern).one()
+    assert (pattern.streak, pattern.observations) == (2, 4)
+    pattern.updated_at -= timedelta(days=365)
+    db_session.commit()
+    assert (
+        find_url_analysis_shortcut(db_session, target, strategy_registry=strategy_registry)
+        is None
+    )
+
+
+def test_sampled_verification_breaks_streak_when_articles_turn_into_a_podcast(
+    db_session,
+    pattern_db,
+    monkeypatch,
+) -> None:
+    settings = url_analysis_shortcuts.get_settings()
+    monkeypatch.setattr(settings, "url_analysis_pattern_min_streak", 3)
+    monkeypatch.setattr(settings, "url_analysis_pattern_min_observations", 3)
+    monkeypatch.setattr(settings, "url_analysis_pattern_verify_rate", 0.0)
+    for slug in ("first-post", "second-post", "third-post"):
+        record_url_analysis(f"https://writer.substack.com/p/{slug}", _analysis(slug))
+
+    llm_calls: list[str] = []
+
+    def _analyze_url(url: str, **_kwargs) -> ContentAnalysisOutput:
+        llm_calls.append(url)
+        return ContentAnalysisOutput(
+            analysis=_analysis(
+                url, content_type="podcast", media_url="https://cdn.example.com/1.mp3"
+            )
+        )
+
+    monkeypatch.setattr(
+        analyze_url, "get_llm_gateway", lambda: SimpleNamespace(analyze_url=_analyze_url)
+    )
+    flow = UrlAnalysisFlow()
+
+    article = _content(db_session, "https://writer.substack.com/p/fourth-post")
+    flow.run(db_session, article, {}, article.url, None)
+    assert llm_calls == []
+    assert article.content_type == ContentType.ARTICLE.value
+
+    monkeypatch.setattr(settings, "url_analysis_pattern_verify_rate", 1.0)
+    episode = _content(db_session, "https://writer.substack.com/p/episode-one")
+    flow.run(db_session, episode, {}, episode.url, None)
+
+    assert llm_calls == [episode.url]
+    assert episode.content_type == ContentType.PODCAST.value
+    assert episode.content_metadata["audio_url"] == "https://cdn.example.com/1.mp3"
+
+    db_session.expire_all()
+    pattern = db_session.query(UrlAnalysisPattern).one()
+    assert (pattern.content_type, pattern.streak, pattern.observations) == ("podcast", 1, 4)
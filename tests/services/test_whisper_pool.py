@@ -0,0 +1,134 @@
+"""Tests for parallel whisper segment transcription."""
+
+from __future__ import annotations
+
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.services import whisper_local, whisper_pool
+
+
+def _write_wav(path: Path, *, seconds: float) -> Path:
+    frames = np.zeros(int(seconds * whisper_local.WHISPER_SAMPLE_RATE), dtype=np.int16)
+    with wave.open(str(path), "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(whisper_local.WHISPER_SAMPLE_RATE)
+        writer.writeframes(frames.tobytes())
+    return path
+
+
+def test_wav_segments_are_read_individually(tmp_path) -> None:
+    audio_path = _write_wav(tmp_path / "episode.wav", seconds=2.5)
+
+    assert whisper_local.count_audio_segments(audio_path, segment_seconds=1) == 3
+    last = whisper_local.read_audio_segment(audio_path, index=2, segment_seconds=1)
+    assert last.dtype == np.float32
+    assert len(last) == whisper_local.WHISPER_SAMPLE_RATE // 2
+
+
+def test_pool_reports_segments_in_order_and_pins_language(monkeypatch, tmp_path) -> None:
+    audio_path = _write_wav(tmp_path / "episode.wav", seconds=4)
+    languages: list[str | None] = []
+
+    def _fake_segment(path, index, segment_seconds, language):  # noqa: ANN001
+        languages.append(language)
+        # Later segments finish first to exercise in-order checkpointing.
+        time.sleep(0.05 * (4 - index))
+        return index, f"segment {index}", language or "en"
+
+    executor = ThreadPoolExecutor(max_workers=3)
+    monkeypatch.setattr(whisper_pool, "get_whisper_pool", lambda: executor)
+    monkeypatch.setattr(whisper_pool, "_transcribe_segment", _fake_segment)
+    reported: list[tuple[int, str, str | None]] = []
+
+    try:
+        transcript, language = whisper_pool.transcribe_segments_in_pool(
+            audio_path,
+            segment_seconds=1,
+            completed_segments=[],
+            on_segment=lambda index, text, lang: reported.append((index, text, lang)),
+        )
+    finally:
+        executor.shutdown(wait=True)
+
+    assert transcript == "segment 0 segment 1 segment 2 segment 3"
+    assert language == "en"
+    assert [index for index, _text, _lang in reported] == [0, 1, 2, 3]
+    assert languages[0] is None
+    assert set(languages[1:]) == {"en"}
+
+
+def test_pool_resumes_after_completed_segments(monkeypatch, tmp_path) -> None:
+    audio_path = _write_wav(tmp_path / "episode.wav", seconds=3)
+    submitted: list[int] = []
+
+    def _fake_segment(path, index, segment_seconds, language):  # noqa: ANN001
+        submitted.append(index)
+        return index, f"segment {index}", language
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(whisper_pool, "get_whisper_pool", lambda: executor)
+    monkeypatch.setattr(whisper_pool, "_transcribe_segment", _fake_segment)
+
+    try:
+        transcript, _language = whisper_pool.transcribe_segments_in_pool(
+            audio_path,
+            segment_seconds=1,
+            completed_segments=["segment 0", "segment 1"],
+            language="de",
+        )
+    finally:
+        executor.shutdown(wait=True)
+
+    assert submitted == [2]
+    assert transcript == "segment 0 segment 1 segment 2"
+
+
+def test_broken_pool_is_discarded_and_job_finishes_sequentially(monkeypatch, tmp_path) -> None:
+    audio_path = _write_wav(tmp_path / "episode.wav", seconds=3)
+
+    class _BrokenPool:
+        shutdown_calls = 0
+
+        def submit(self, *_args, **_kwargs):  # noqa: ANN002, ANN003
+            raise BrokenProcessPool("worker died")
+
+        def shutdown(self, **_kwargs) -> None:  # noqa: ANN003
+            self.shutdown_calls += 1
+
+    broken = _BrokenPool()
+    sequential_calls: list[dict] = []
+
+    def _transcribe_audio_chunked(path, **kwargs):  # noqa: ANN001, ANN003
+        sequential_calls.append({"path": path, **kwargs})
+        return "segment 0 segment 1 segment 2", kwargs["language"]
+
+    monkeypatch.setattr(whisper_pool, "_pool", broken)
+    monkeypatch.setattr(whisper_pool, "_pool_disabled", False)
+    monkeypatch.setattr(whisper_pool, "get_whisper_pool", lambda: broken)
+    monkeypatch.setattr(
+        whisper_pool,
+        "get_whisper_local_service",
+        lambda: SimpleNamespace(transcribe_audio_chunked=_transcribe_audio_chunked),
+    )
+
+    transcript, language = whisper_pool.transcribe_segments_in_pool(
+        audio_path,
+        segment_seconds=1,
+        completed_segments=["segment 0"],
+        language="en",
+    )
+
+    assert transcript == "segment 0 segment 1 segment 2"
+    assert language == "en"
+    assert sequential_calls[0]["completed_segments"] == ["segment 0"]
+    assert whisper_pool._pool is None
+    assert whisper_pool._pool_disabled is True
+    assert broken.shutdown_calls == 1